@@ -0,0 +1,16 @@
+"""
+Benchmarks of the venue-scale workflows of openreview-py.
+
+The workflows run against :class:`openreview.testing.FakeOpenReviewAPI` seeded with a synthetic venue, so they measure
+the client side of the scripts: the requests they send, the time they take and the memory they use. Run them with::
+
+    python -m benchmarks run --scale 1k --output results.json
+
+and compare two runs, e.g. of the base and head of a pull request, with::
+
+    python -m benchmarks compare base.json head.json
+"""
+from .scales import SCALES
+from .measure import measure
+from .workflows import WORKFLOWS, BenchmarkContext, run_benchmarks
+from .compare import compare_results, format_comparison
@@ -0,0 +1,60 @@
+import argparse
+import json
+import sys
+
+from .compare import compare_results, format_comparison
+from .scales import SCALES
+from .workflows import WORKFLOWS, run_benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmarks of the venue-scale workflows of openreview-py')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Seed a synthetic venue and measure the workflows')
+    run_parser.add_argument('--scale', choices=list(SCALES), default='tiny', help='Size of the synthetic venue')
+    run_parser.add_argument('--workflow', dest='workflows', action='append', choices=list(WORKFLOWS), help='Workflow to run, can be repeated. All the workflows by default')
+    run_parser.add_argument('--papers', type=int, help='Number of submissions, overrides the scale')
+    run_parser.add_argument('--reviewers', type=int, help='Number of reviewers, overrides the scale')
+    run_parser.add_argument('--reviews-per-paper', type=int, help='Number of reviews of every submission, overrides the scale')
+    run_parser.add_argument('--score-rows', type=int, help='Number of score rows, overrides the scale')
+    run_parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic venue')
+    run_parser.add_argument('--allocations', action='store_true', help='Measure the allocated memory in a second, traced run of every workflow')
+    run_parser.add_argument('--verbose', action='store_true', help='Show the output of the workflows')
+    run_parser.add_argument('--output', help='JSON file where the results are written, standard output by default')
+
+    compare_parser = commands.add_parser('compare', help='Compare the results of two runs')
+    compare_parser.add_argument('base', help='Results of the reference run')
+    compare_parser.add_argument('head', help='Results of the run to compare')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='Relative increase reported as a regression, 0.1 by default')
+    compare_parser.add_argument('--fail-on-regression', action='store_true', help='Exit with status 1 if a regression is found')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_benchmarks(scale=args.scale, workflows=args.workflows, allocations=args.allocations, verbose=args.verbose,
+            papers=args.papers, reviewers=args.reviewers, reviews_per_paper=args.reviews_per_paper, score_rows=args.score_rows, seed=args.seed)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+        else:
+            json.dump(results, sys.stdout, indent=2)
+            print()
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+    for results in (base, head):
+        metadata = results['metadata']
+        print(f'{metadata.get("commit") or "unknown commit"} {metadata["date"]}: {metadata["scale"]} {metadata["parameters"]}')
+    if base['metadata']['parameters'] != head['metadata']['parameters']:
+        print('Warning: the runs used different parameters')
+    rows = compare_results(base, head, threshold=args.threshold)
+    print(format_comparison(rows))
+    return 1 if args.fail_on_regression and any(row['regression'] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
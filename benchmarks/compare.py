@@ -0,0 +1,67 @@
+## Metrics compared between two runs and the smallest increase that is not noise, a larger value is worse for all of them
+METRICS = {
+    'wall_seconds': 0.05,
+    'cpu_seconds': 0.05,
+    'requests': 0,
+    'peak_rss_mb': 5,
+    'rss_increase_mb': 5,
+    'allocated_peak_mb': 1,
+    'allocated_retained_mb': 1
+}
+
+
+def compare_results(base, head, threshold=0.1):
+    """
+    Compares the results of two benchmark runs workflow by workflow.
+
+    :param base: Results of the reference run, as returned by :func:`run_benchmarks`
+    :type base: dict
+    :param head: Results of the run to compare
+    :type head: dict
+    :param threshold: Relative increase of a metric that is reported as a regression, e.g. 0.1 for 10%. Increases
+        smaller than the noise of the metric, e.g. 50ms of wall time, are not reported.
+    :type threshold: float, optional
+
+    :return: One row per workflow and metric measured in both runs, with the keys ``workflow``, ``metric``, ``base``,
+        ``head``, ``ratio`` and ``regression``
+    :rtype: list[dict]
+    """
+    rows = []
+    for workflow, head_result in head['results'].items():
+        base_result = base['results'].get(workflow)
+        if base_result is None:
+            continue
+        for metric, noise in METRICS.items():
+            base_value = base_result.get(metric)
+            head_value = head_result.get(metric)
+            if base_value is None or head_value is None:
+                continue
+            ratio = head_value / base_value if base_value else (1.0 if not head_value else float('inf'))
+            rows.append({
+                'workflow': workflow,
+                'metric': metric,
+                'base': base_value,
+                'head': head_value,
+                'ratio': round(ratio, 3),
+                'regression': ratio > 1 + threshold and head_value - base_value > noise
+            })
+    return rows
+
+
+def format_comparison(rows):
+    """
+    Formats the rows of :func:`compare_results` as a text table.
+
+    :param rows: Rows of the comparison
+    :type rows: list[dict]
+
+    :return: The table
+    :rtype: str
+    """
+    header = ('workflow', 'metric', 'base', 'head', 'change')
+    lines = [header]
+    for row in rows:
+        change = 'n/a' if row['ratio'] == float('inf') else f'{(row["ratio"] - 1) * 100:+.1f}%'
+        lines.append((row['workflow'], row['metric'], str(row['base']), str(row['head']), change + (' REGRESSION' if row['regression'] else '')))
+    widths = [max(len(line[index]) for line in lines) for index in range(len(header))]
+    return '\n'.join('  '.join(value.ljust(width) for value, width in zip(line, widths)).rstrip() for line in lines)
@@ -0,0 +1,114 @@
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+MB = 1024 * 1024
+
+
+def get_rss():
+    """
+    Returns the resident set size of the process in bytes, or None if it can not be read.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+def get_max_rss():
+    """
+    Returns the peak resident set size of the process since it started in bytes.
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    ## Kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class RSSSampler(object):
+    """
+    Samples the resident set size in a background thread to get the peak of a single workflow, the peak reported
+    by ``getrusage`` is the peak of the whole process. Falls back to ``getrusage`` where ``/proc`` is not available.
+
+    :param interval: Seconds between samples
+    :type interval: float, optional
+    """
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.start = None
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start = self.peak = get_rss()
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self.peak = max(self.peak, get_rss())
+        else:
+            self.start, self.peak = None, get_max_rss()
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, get_rss())
+
+
+def measure(workflow, api, allocations=False):
+    """
+    Runs a workflow once and returns its wall and CPU time, the requests it sent to the fake API and its peak memory.
+    With ``allocations`` the workflow is run a second time with :mod:`tracemalloc` enabled, tracing slows the
+    workflow down so its time is not mixed with the time of the first run.
+
+    :param workflow: Function that runs the workflow
+    :type workflow: callable
+    :param api: Fake API the workflow sends its requests to
+    :type api: openreview.testing.FakeOpenReviewAPI
+    :param allocations: Whether to measure the memory allocated by the workflow
+    :type allocations: bool, optional
+
+    :return: Measurements of the workflow
+    :rtype: dict
+    """
+    gc.collect()
+    requests_before = Counter(api.requests)
+    with RSSSampler() as rss:
+        start_time = time.perf_counter()
+        start_cpu = time.process_time()
+        workflow()
+        wall_seconds = time.perf_counter() - start_time
+        cpu_seconds = time.process_time() - start_cpu
+
+    requests = api.requests - requests_before
+    result = {
+        'wall_seconds': round(wall_seconds, 4),
+        'cpu_seconds': round(cpu_seconds, 4),
+        'requests': sum(requests.values()),
+        'requests_by_endpoint': dict(requests.most_common()),
+        'peak_rss_mb': round(rss.peak / MB, 2),
+        'rss_increase_mb': round((rss.peak - rss.start) / MB, 2) if rss.start is not None else None
+    }
+
+    if allocations:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            workflow()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result['allocated_peak_mb'] = round(peak / MB, 2)
+        result['allocated_retained_mb'] = round(current / MB, 2)
+
+    return result
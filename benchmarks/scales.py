@@ -0,0 +1,28 @@
+## Sizes of the synthetic venues. The score rows are streamed to _build_note_scores and the fake API only counts the
+## posted score Edges, so 10M rows do not need 10M Edges in memory.
+SCALES = {
+    'tiny': {
+        'papers': 50,
+        'reviewers': 100,
+        'reviews_per_paper': 3,
+        'score_rows': 10000
+    },
+    '1k': {
+        'papers': 1000,
+        'reviewers': 5000,
+        'reviews_per_paper': 3,
+        'score_rows': 1000000
+    },
+    '10k': {
+        'papers': 10000,
+        'reviewers': 20000,
+        'reviews_per_paper': 3,
+        'score_rows': 5000000
+    },
+    '30k': {
+        'papers': 30000,
+        'reviewers': 20000,
+        'reviews_per_paper': 3,
+        'score_rows': 10000000
+    }
+}
@@ -0,0 +1,214 @@
+import contextlib
+import datetime
+import os
+import platform
+import subprocess
+import sys
+
+import openreview
+from openreview import tools
+from openreview.testing import FakeOpenReviewAPI, seed_venue
+from openreview.testing.synthetic import letters
+
+from .measure import measure
+from .scales import SCALES
+
+
+## With 1000 institutions and 3 authors per paper, about 0.3% of the reviewers have a conflict with every paper
+INSTITUTIONS = tuple(f'university-{letters(index).lower()}.edu' for index in range(1000))
+
+
+class BenchmarkContext(object):
+    """
+    Fake API seeded with a synthetic venue and the objects the workflows share. Building the context is not measured.
+
+    :param papers: Number of submissions
+    :type papers: int
+    :param reviewers: Number of reviewers
+    :type reviewers: int
+    :param reviews_per_paper: Number of reviewers assigned to and reviews of every submission
+    :type reviews_per_paper: int
+    :param score_rows: Number of rows of the scores posted by ``build_note_scores``
+    :type score_rows: int
+    :param seed: Seed of the synthetic venue
+    :type seed: int, optional
+    """
+    def __init__(self, papers, reviewers, reviews_per_paper, score_rows, seed=0):
+        self.papers = papers
+        self.reviewers = reviewers
+        self.score_rows = score_rows
+        self.api = FakeOpenReviewAPI()
+        self.synthetic = seed_venue(self.api, papers=papers, reviewers=reviewers, scores_per_paper=0, reviews_per_paper=reviews_per_paper, decisions=True, institutions=INSTITUTIONS, seed=seed)
+        self.score_id = f'{self.synthetic.reviewers_id}/-/Synthetic_Score'
+        self.api.discard_edges.add(self.score_id)
+        self.client = self.api.client()
+        self.venue = self.synthetic.get_venue(self.client)
+        self._matching = None
+        self._submissions = None
+        self._reviewer_profiles = None
+
+    @property
+    def matching(self):
+        if self._matching is None:
+            self._matching = openreview.venue.matching.Matching(self.venue, self.client.get_group(self.synthetic.reviewers_id))
+        return self._matching
+
+    @property
+    def submissions(self):
+        if self._submissions is None:
+            self._submissions = self.venue.get_submissions(sort='number:asc')
+        return self._submissions
+
+    @property
+    def reviewer_profiles(self):
+        if self._reviewer_profiles is None:
+            self._reviewer_profiles = tools.get_profiles(self.client, self.synthetic.reviewers, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
+        return self._reviewer_profiles
+
+    def iter_score_rows(self):
+        ## CSV like rows, every submission is scored by a window of consecutive reviewers
+        submissions = self.synthetic.submissions
+        reviewers = self.synthetic.reviewers
+        per_paper = -(-self.score_rows // len(submissions))
+        rows = 0
+        for index, note_id in enumerate(submissions):
+            for offset in range(min(per_paper, self.score_rows - rows)):
+                reviewer = reviewers[(index * 7 + offset) % len(reviewers)]
+                yield [note_id, reviewer, str(((index + 1) * (offset + 3) % 997) / 997)]
+            rows += min(per_paper, self.score_rows - rows)
+
+
+## Every workflow receives the context, prepares what it needs and returns the function that is measured
+
+def get_profiles(context):
+    reviewers = context.synthetic.reviewers
+    return lambda: tools.get_profiles(context.client, reviewers, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
+
+def build_note_conflicts(context):
+    matching, submissions, user_profiles = context.matching, context.submissions, context.reviewer_profiles
+    return lambda: matching._build_note_conflicts(submissions, user_profiles, tools.get_profile_info, None)
+
+def find_conflicts(context):
+    ## Only the indexed search is measured, the conflict info of the authors and the reviewers is extracted beforehand
+    policy = tools.get_conflict_policy('default')
+    author_profiles = tools.get_profiles(context.client, context.synthetic.authors, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
+    author_info_by_id = { profile.id: policy(profile) for profile in author_profiles }
+    submissions_info = [tools.merge_profile_info([author_info_by_id[authorid] for authorid in note.content['authorids']['value']]) for note in context.submissions]
+    users_info = [policy(profile) for profile in context.reviewer_profiles]
+    return lambda: tools.find_conflicts(submissions_info, users_info)
+
+def build_note_scores(context):
+    matching, submissions = context.matching, context.submissions
+    return lambda: matching._build_note_scores(context.score_id, context.iter_score_rows, submissions)
+
+def _load_models(context, edge_class, note_class):
+    ## score_rows Edges and a tenth as many Notes, e.g. 1M Edges and 100k Notes at the 1k scale. The JSON of every
+    ## object is built just before it is parsed, so the memory measured is the memory of the objects
+    submissions, reviewers = context.synthetic.submissions, context.synthetic.reviewers
+    venue_id, score_id, submission_id = context.synthetic.venue_id, context.score_id, context.synthetic.submission_id
+    def edge_json(index):
+        return { 'id': f'edge{index}', 'invitation': score_id, 'domain': venue_id, 'head': submissions[index % len(submissions)], 'tail': reviewers[index % len(reviewers)],
+            'weight': (index % 100) / 100, 'readers': [venue_id], 'writers': [venue_id], 'signatures': [venue_id], 'nonreaders': [], 'cdate': 1700000000000, 'tcdate': 1700000000000, 'tmdate': 1700000000000 }
+    def note_json(index):
+        return { 'id': f'note{index}', 'number': index, 'invitations': [submission_id], 'domain': venue_id, 'forum': f'note{index}', 'readers': ['everyone'], 'writers': [venue_id],
+            'signatures': [venue_id], 'content': { 'title': { 'value': f'Paper {index}' } }, 'cdate': 1700000000000, 'tcdate': 1700000000000, 'tmdate': 1700000000000 }
+    def load():
+        edges = [edge_class.from_json(edge_json(index)) for index in range(context.score_rows)]
+        notes = [note_class.from_json(note_json(index)) for index in range(context.score_rows // 10)]
+        return len(edges) + len(notes)
+    return load
+
+def load_models(context):
+    return _load_models(context, openreview.api.Edge, openreview.api.Note)
+
+def load_compact_models(context):
+    return _load_models(context, openreview.api.CompactEdge, openreview.api.CompactNote)
+
+def compute_reviewers_stats(context):
+    return context.venue.compute_reviewers_stats
+
+def post_decision_stage(context):
+    return context.venue.post_decision_stage
+
+WORKFLOWS = {
+    'get_profiles': get_profiles,
+    'build_note_conflicts': build_note_conflicts,
+    'find_conflicts': find_conflicts,
+    'build_note_scores': build_note_scores,
+    'load_models': load_models,
+    'load_compact_models': load_compact_models,
+    'compute_reviewers_stats': compute_reviewers_stats,
+    'post_decision_stage': post_decision_stage
+}
+
+
+def get_metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(__file__), capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'openreview': getattr(openreview, '__version__', None)
+    }
+
+
+def run_benchmarks(scale='tiny', workflows=None, allocations=False, verbose=False, log=sys.stderr, **overrides):
+    """
+    Seeds a synthetic venue and measures the workflows against it.
+
+    :param scale: Name of one of the :data:`SCALES`
+    :type scale: str, optional
+    :param workflows: Names of the :data:`WORKFLOWS` to run, all of them if None. They run in the given order.
+    :type workflows: list[str], optional
+    :param allocations: Whether to measure the memory allocated by every workflow in a second, traced run
+    :type allocations: bool, optional
+    :param verbose: Whether to show the output and progress bars of the workflows
+    :type verbose: bool, optional
+    :param log: Stream where the progress of the benchmarks is written, None to hide it
+    :type log: file, optional
+    :param overrides: Sizes that replace the ones of the scale, e.g. ``papers=500``
+    :type overrides: int
+
+    :return: The metadata, the parameters and the results of the run, by workflow
+    :rtype: dict
+    """
+    if scale not in SCALES:
+        raise ValueError(f'Unknown scale {scale}, available scales: {", ".join(SCALES)}')
+    names = list(WORKFLOWS) if workflows is None else list(workflows)
+    unknown = [name for name in names if name not in WORKFLOWS]
+    if unknown:
+        raise ValueError(f'Unknown workflows {", ".join(unknown)}, available workflows: {", ".join(WORKFLOWS)}')
+    parameters = dict(SCALES[scale], **{ key: value for key, value in overrides.items() if value is not None })
+
+    ## log is bound before the output of the workflows is redirected, so the progress stays visible
+    def progress(message):
+        if log:
+            print(message, file=log, flush=True)
+
+    quiet = contextlib.ExitStack()
+    if not verbose:
+        devnull = quiet.enter_context(open(os.devnull, 'w'))
+        quiet.enter_context(contextlib.redirect_stdout(devnull))
+        quiet.enter_context(contextlib.redirect_stderr(devnull))
+
+    results = {}
+    try:
+        progress(f'Seeding the {scale} venue: {parameters}')
+        with quiet:
+            context = BenchmarkContext(**parameters)
+            for name in names:
+                workflow = WORKFLOWS[name](context)
+                progress(f'Running {name}')
+                results[name] = measure(workflow, context.api, allocations=allocations)
+                progress(f'  {results[name]["wall_seconds"]}s, {results[name]["requests"]} requests, {results[name]["peak_rss_mb"]} MB peak RSS')
+    finally:
+        tools.clear_shared_clients()
+
+    return {
+        'metadata': dict(get_metadata(), scale=scale, parameters=parameters, allocations=allocations),
+        'results': results
+    }
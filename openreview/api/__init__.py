@@ -5,4 +5,9 @@ from .client import Invitation
 from .client import Edge
 from .client import Group
 from .client import Tag
+from .async_client import AsyncOpenReviewClient
+from .edge_frame import EdgeFrame
+from .compact import CompactNote, CompactEdge, CompactTag, CompactGroup, CompactProfile
+from .lazy_note import LazyNote
+from .domain_context import DomainContext
 from .iThenticate_client import iThenticateClient
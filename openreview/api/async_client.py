@@ -0,0 +1,691 @@
+#!/usr/bin/python
+from __future__ import absolute_import, division, print_function, unicode_literals
+import asyncio
+import os
+import sys
+from importlib.metadata import version as get_package_version, PackageNotFoundError
+
+from .. import tools
+from ..openreview import Profile
+from ..openreview import OpenReviewException
+from .client import Note, Edge, Group, Invitation
+
+RETRY_STATUSES = frozenset([ 429, 500, 502, 503, 504 ])
+RETRY_METHODS = frozenset([ 'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS' ])
+
+## Query parameters whose name in the API differs from the keyword argument
+PARAM_NAMES = {
+    'external_id': 'externalId',
+    'paper_hash': 'paperhash',
+    'parent_invitations': 'parentInvitations',
+    'transitive_members': 'transitiveMembers',
+    'with_count': 'count',
+    'groupby': 'groupBy',
+    'min_sdate': 'minsdate'
+}
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError('AsyncOpenReviewClient requires aiohttp, install it with: pip install "openreview-py[async]"')
+    return aiohttp
+
+def _build_params(**filters):
+    ## Drops unset filters, renames them to the API names and returns the query as a list of pairs,
+    ## lists are sent as repeated keys like requests does
+    query = []
+    for name, value in filters.items():
+        if value is None:
+            continue
+        if name == 'content':
+            for key, content_value in value.items():
+                query.append(('content.' + key, content_value))
+            continue
+        query.append((PARAM_NAMES.get(name, name), value))
+
+    params = []
+    for name, value in query:
+        value = tools.format_params(value)
+        for item in (value if isinstance(value, (list, tuple)) else [value]):
+            params.append((name, str(item)))
+    return params
+
+
+class AsyncOpenReviewClient(object):
+    """
+    asyncio client for the OpenReview API v2. It exposes the most used read and write methods of
+    :class:`openreview.api.OpenReviewClient` as coroutines so batch jobs can keep hundreds of requests in flight
+    from a single thread. All the requests share one connection pool and the number of requests in flight is
+    bounded by a semaphore, so the coroutines can be scheduled with ``asyncio.gather`` without throttling them by hand.
+
+    Requires the optional ``aiohttp`` dependency: ``pip install "openreview-py[async]"``.
+
+    :param baseurl: URL to the host, example: https://api2.openreview.net. If none is provided, it defaults to the environment variable `OPENREVIEW_API_BASEURL_V2`
+    :type baseurl: str, optional
+    :param username: OpenReview username. If none is provided, it defaults to the environment variable `OPENREVIEW_USERNAME`. The user is logged in when the client is entered with ``async with``
+    :type username: str, optional
+    :param password: OpenReview password. If none is provided, it defaults to the environment variable `OPENREVIEW_PASSWORD`
+    :type password: str, optional
+    :param token: Session token. This token can be provided instead of the username and password if the user had already logged in
+    :type token: str, optional
+    :param tokenExpiresIn: Time in seconds before the token expires
+    :type tokenExpiresIn: int, optional
+    :param max_concurrency: Maximum number of requests in flight, it is also the size of the connection pool
+    :type max_concurrency: int, optional
+    :param limit_per_host: Maximum number of connections to the same host, by default there is no limit besides ``max_concurrency``
+    :type limit_per_host: int, optional
+    :param timeout: Total timeout in seconds of each request
+    :type timeout: int, optional
+    :param retries: Number of times a request failing with a connection error or a 429, 500, 502, 503 or 504 status is retried. POST requests are only retried on 429.
+    :type retries: int, optional
+
+    Example:
+
+    >>> async def post_decisions(decisions):
+    ...     async with openreview.api.AsyncOpenReviewClient(token=token) as client:
+    ...         await asyncio.gather(*[client.post_note_edit(invitation=invitation, signatures=signatures, note=note) for invitation, signatures, note in decisions])
+    """
+    def __init__(self, baseurl=None, username=None, password=None, token=None, tokenExpiresIn=None, max_concurrency=100, limit_per_host=None, timeout=300, retries=8):
+        self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_API_BASEURL_V2', 'http://localhost:3001')
+        if any(url in self.baseurl for url in tools.V1_REMOTE_URLS):
+            raise OpenReviewException('Please use the OpenReview API v2 baseurl for the AsyncOpenReviewClient')
+        self.login_url = self.baseurl + '/login'
+        self.groups_url = self.baseurl + '/groups'
+        self.invitations_url = self.baseurl + '/invitations'
+        self.notes_url = self.baseurl + '/notes'
+        self.edges_url = self.baseurl + '/edges'
+        self.bulk_edges_url = self.baseurl + '/edges/bulk'
+        self.edges_count_url = self.baseurl + '/edges/count'
+        self.profiles_url = self.baseurl + '/profiles'
+        self.profiles_search_url = self.baseurl + '/profiles/search'
+        self.process_logs_url = self.baseurl + '/logs/process'
+        self.note_edits_url = self.baseurl + '/notes/edits'
+        self.invitation_edits_url = self.baseurl + '/invitations/edits'
+        self.group_edits_url = self.baseurl + '/groups/edits'
+        self.groups_members_cache_url = self.baseurl + '/groups/members/cache'
+
+        try:
+            package_version = get_package_version('openreview-py')
+        except PackageNotFoundError:
+            package_version = 'unknown'
+        python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        self.user_agent = f"openreview-py/{package_version} (Python/{python_version})"
+
+        self.limit = 1000
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = 1
+        self.backoff_max = 120
+        self.token = token.replace('Bearer ', '') if token else None
+        self.username = username if username else os.environ.get('OPENREVIEW_USERNAME')
+        self.password = password if password else os.environ.get('OPENREVIEW_PASSWORD')
+        self.token_expires_in = tokenExpiresIn
+        self.profile = None
+        self.headers = {
+            'User-Agent': self.user_agent,
+            'Accept': 'application/json'
+        }
+        if self.token:
+            self.headers['Authorization'] = 'Bearer ' + self.token
+
+        self._aiohttp = _import_aiohttp()
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        if not self.token and (self.username or self.password):
+            await self.login_user(self.username, self.password, expiresIn=self.token_expires_in)
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the connection pool. A new pool is opened if the client is used again.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    ## PRIVATE FUNCTIONS
+
+    def __get_session(self):
+        ## The session and the semaphore are created on first use so they are bound to the running event loop
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.limit_per_host or 0)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    def __retry_delay(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return min(self.backoff_factor * (2 ** attempt), self.backoff_max)
+
+    async def __request(self, method, url, params=None, json=None):
+        session = self.__get_session()
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    async with session.request(method, url, params=params, json=json, headers=self.headers) as response:
+                        if response.status in RETRY_STATUSES and attempt < self.retries and (method in RETRY_METHODS or response.status == 429):
+                            delay = self.__retry_delay(attempt, response.headers.get('Retry-After'))
+                            print(f"Retrying request: {method} {url}, status: {response.status}")
+                        else:
+                            return await self.__handle_response(response)
+            except (self._aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                if attempt >= self.retries or method not in RETRY_METHODS:
+                    raise
+                delay = self.__retry_delay(attempt)
+                print(f"Retrying request: {method} {url}, error: {error}")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def __handle_response(self, response):
+        if response.status < 400:
+            return await response.json(content_type=None)
+        if 'application/json' in response.headers.get('Content-Type', ''):
+            error = await response.json(content_type=None)
+        else:
+            text = await response.text()
+            error = {
+                'name': 'Error',
+                'message': text if text else response.reason
+            }
+        raise OpenReviewException(error)
+
+    async def __await_process(self, edit_id):
+        process_logs = await self.get_process_logs(id=edit_id)
+        if not process_logs:
+            return
+
+        for i in range(1200):
+            if process_logs[0]['status'] == 'ok':
+                return
+            elif process_logs[0]['status'] == 'error':
+                raise OpenReviewException(process_logs[0].get('log', 'No log available'))
+
+            await asyncio.sleep(0.5)
+            process_logs = await self.get_process_logs(id=edit_id)
+
+        raise OpenReviewException("Process timed out")
+
+    async def __iter_pages(self, url, key, params, cursor='after'):
+        ## Yields the pages of a query, the next page is requested while the current one is being consumed
+        limit = self.limit
+        offset = 0
+        page_params = params + [('limit', str(limit))]
+        if cursor == 'after':
+            page_params.append(('sort', 'id'))
+        else:
+            page_params.append(('offset', '0'))
+        next_page = asyncio.ensure_future(self.__request('GET', url, params=page_params))
+        try:
+            while next_page is not None:
+                batch = (await next_page)[key]
+                next_page = None
+                if len(batch) == limit:
+                    if cursor == 'after':
+                        page_params = [p for p in page_params if p[0] != 'after'] + [('after', batch[-1]['id'])]
+                    else:
+                        offset += limit
+                        page_params = [p for p in page_params if p[0] != 'offset'] + [('offset', str(offset))]
+                    next_page = asyncio.ensure_future(self.__request('GET', url, params=page_params))
+                yield batch
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    ## PUBLIC FUNCTIONS
+
+    async def login_user(self, username=None, password=None, expiresIn=None):
+        """
+        Logs in a registered user. Accounts with multi-factor authentication enabled must log in with
+        :class:`openreview.api.OpenReviewClient` and pass the token to this client.
+
+        :param username: OpenReview username
+        :type username: str, optional
+        :param password: OpenReview password
+        :type password: str, optional
+
+        :return: Dictionary containing user information and the authentication token
+        :rtype: dict
+        """
+        response = await self.__request('POST', self.login_url, json={ 'id': username, 'password': password, 'expiresIn': expiresIn })
+        if response.get('mfaPending'):
+            raise OpenReviewException('Multi-factor authentication is not supported by the AsyncOpenReviewClient, log in with OpenReviewClient and use its token')
+        self.token = str(response['token'])
+        self.profile = Profile(id=response['user']['profile']['id'])
+        self.headers['Authorization'] = 'Bearer ' + self.token
+        self.user = response['user']
+        return response
+
+    async def get_group(self, id, details=None):
+        """
+        Get a single Group by id if available
+
+        :param id: id of the group
+        :type id: str
+
+        :return: Dictionary with the group information
+        :rtype: Group
+        """
+        response = await self.__request('GET', self.groups_url, params=_build_params(id=id, details=details))
+        group = Group.from_json(response['groups'][0])
+
+        if group.anonids:
+            anon_prefix = (group.id[:-1] if group.id.endswith('s') else group.id) + '_'
+            members_by_anonid = { g.id:g.members[0] for g in await self.get_groups(prefix=anon_prefix) if g.members }
+            members = []
+            anon_members = []
+            for member in group.members:
+                if member in members_by_anonid:
+                    anon_members.append(member)
+                    members.append(members_by_anonid[member])
+                else:
+                    members.append(member)
+            group.anon_members = anon_members
+            group.members = members
+        return group
+
+    async def get_groups(self, id=None, invitation=None, prefix=None, member=None, members=None, signatory=None, web=None, limit=None, offset=None, after=None, sort=None, with_count=None, domain=None):
+        """
+        Gets list of Group objects based on the filters provided. Same parameters as :meth:`openreview.api.OpenReviewClient.get_groups`.
+
+        :return: List of Groups, or a tuple ``(list[Group], int)`` when ``with_count`` is True and ``offset`` is None
+        :rtype: list[Group]
+        """
+        params = _build_params(id=id, invitation=invitation, prefix=prefix, member=member, members=members, signatory=signatory, web=web, limit=limit, offset=offset, after=after, sort=sort, with_count=with_count, domain=domain)
+        response = await self.__request('GET', self.groups_url, params=params)
+        groups = [Group.from_json(g) for g in response['groups']]
+
+        if with_count and offset is None:
+            return groups, response['count']
+
+        return groups
+
+    async def get_all_groups(self, id=None, invitation=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None, sort=None):
+        """
+        Gets the list of all the Groups matching the filters provided using server-side streaming.
+
+        :return: List of Groups
+        :rtype: list[Group]
+        """
+        params = _build_params(id=id, invitation=invitation, parent=parent, prefix=prefix, member=member, members=members, domain=domain, signatory=signatory, web=web, sort=sort, stream=True)
+        response = await self.__request('GET', self.groups_url, params=params)
+        return [Group.from_json(g) for g in response['groups']]
+
+    async def iter_groups(self, id=None, invitation=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None):
+        """
+        Async generator over all the Groups matching the filters provided. The Groups are paginated with ``after`` cursors,
+        the next page is requested while the current one is consumed.
+
+        :return: Async iterator over Groups sorted by id
+        :rtype: AsyncIterator[Group]
+
+        Example:
+
+        >>> async for group in client.iter_groups(prefix='ICML.cc/2024/Conference/Submission'):
+        ...     print(group.id)
+        """
+        params = _build_params(id=id, invitation=invitation, parent=parent, prefix=prefix, member=member, members=members, domain=domain, signatory=signatory, web=web)
+        async for batch in self.__iter_pages(self.groups_url, 'groups', params):
+            for g in batch:
+                yield Group.from_json(g)
+
+    async def get_invitation(self, id):
+        """
+        Get a single invitation by id if available
+
+        :param id: id of the invitation
+        :type id: str
+
+        :return: Invitation matching the passed id
+        :rtype: Invitation
+        """
+        response = await self.__request('GET', self.invitations_url, params=_build_params(id=id))
+        return Invitation.from_json(response['invitations'][0])
+
+    async def get_invitations(self, id=None, ids=None, invitation=None, prefix=None, invitee=None, replytoNote=None, replyForum=None, replyto=None, signature=None, note=None, tags=None, minduedate=None, duedate=None, pastdue=None, details=None, domain=None, type=None, expired=None, trash=None, sort=None, limit=None, offset=None, after=None, with_count=None):
+        """
+        Gets list of Invitation objects based on the filters provided. Same parameters as :meth:`openreview.api.OpenReviewClient.get_invitations`.
+
+        :return: List of Invitations, or a tuple ``(list[Invitation], int)`` when ``with_count`` is True and ``offset`` is None
+        :rtype: list[Invitation]
+        """
+        params = _build_params(id=id, ids=ids, invitation=invitation, prefix=prefix, invitee=invitee, replytoNote=replytoNote, replyForum=replyForum, replyto=replyto, signature=signature, note=note, tags=tags, minduedate=minduedate, duedate=duedate, pastdue=pastdue, details=details, domain=domain, type=type, expired=expired, trash=trash, sort=sort, limit=limit, offset=offset, after=after, with_count=with_count)
+        response = await self.__request('GET', self.invitations_url, params=params)
+        invitations = [Invitation.from_json(i) for i in response['invitations']]
+
+        if with_count and offset is None:
+            return invitations, response['count']
+
+        return invitations
+
+    async def get_note(self, id, details=None):
+        """
+        Get a single Note by id if available
+
+        :param id: id of the note
+        :type id: str
+
+        :return: Note matching the passed id
+        :rtype: Note
+        """
+        response = await self.__request('GET', self.notes_url, params=_build_params(id=id, details=details))
+        return Note.from_json(response['notes'][0])
+
+    async def get_notes(self, id=None, external_id=None, paperhash=None, forum=None, invitation=None, parent_invitations=None, replyto=None, tauthor=None, signature=None, transitive_members=None, signatures=None, writer=None, trash=None, number=None, content=None, limit=None, offset=None, after=None, mintcdate=None, domain=None, paper_hash=None, details=None, sort=None, with_count=None, stream=None, select=None):
+        """
+        Gets list of Note objects based on the filters provided. Same parameters as :meth:`openreview.api.OpenReviewClient.get_notes`.
+
+        :return: List of Notes, or a tuple ``(list[Note], int)`` when ``with_count`` is True and ``offset`` is None
+        :rtype: list[Note]
+        """
+        params = _build_params(id=id, external_id=external_id, paperhash=paperhash, forum=forum, invitation=invitation, parent_invitations=parent_invitations, replyto=replyto, tauthor=tauthor, signature=signature, transitive_members=transitive_members, signatures=signatures, writer=writer, trash=True if trash else None, number=number, content=content, limit=limit, offset=offset, after=after, mintcdate=mintcdate, domain=domain, paper_hash=paper_hash, details=details, sort=sort, with_count=with_count, stream=stream, select=select)
+        response = await self.__request('GET', self.notes_url, params=params)
+        notes = [Note.from_json(n) for n in response['notes']]
+
+        if with_count and offset is None:
+            return notes, response['count']
+
+        return notes
+
+    async def get_all_notes(self, id=None, paperhash=None, forum=None, invitation=None, parent_invitations=None, replyto=None, signature=None, transitive_members=None, signatures=None, writer=None, trash=None, number=None, content=None, mintcdate=None, details=None, select=None, domain=None):
+        """
+        Gets the list of all the Notes matching the filters provided. Without ``details`` the Notes are requested with
+        server-side streaming, otherwise they are paginated with ``after`` cursors.
+
+        :return: List of Notes
+        :rtype: list[Note]
+        """
+        filters = dict(id=id, paperhash=paperhash, forum=forum, invitation=invitation, parent_invitations=parent_invitations, replyto=replyto, signature=signature, transitive_members=transitive_members, signatures=signatures, writer=writer, trash=True if trash else None, number=number, content=content, mintcdate=mintcdate, details=details, select=select, domain=domain)
+        if details is None:
+            return await self.get_notes(stream=True, **filters)
+        return [note async for note in self.iter_notes(**filters)]
+
+    async def iter_notes(self, id=None, paperhash=None, forum=None, invitation=None, parent_invitations=None, replyto=None, signature=None, transitive_members=None, signatures=None, writer=None, trash=None, number=None, content=None, mintcdate=None, details=None, select=None, domain=None):
+        """
+        Async generator over all the Notes matching the filters provided. The Notes are paginated with ``after`` cursors,
+        the next page is requested while the current one is consumed.
+
+        :return: Async iterator over Notes sorted by id
+        :rtype: AsyncIterator[Note]
+
+        Example:
+
+        >>> async for submission in client.iter_notes(invitation='ICML.cc/2024/Conference/-/Submission'):
+        ...     print(submission.number)
+        """
+        params = _build_params(id=id, paperhash=paperhash, forum=forum, invitation=invitation, parent_invitations=parent_invitations, replyto=replyto, signature=signature, transitive_members=transitive_members, signatures=signatures, writer=writer, trash=True if trash else None, number=number, content=content, mintcdate=mintcdate, details=details, select=select, domain=domain)
+        async for batch in self.__iter_pages(self.notes_url, 'notes', params):
+            for n in batch:
+                yield Note.from_json(n)
+
+    async def get_edges(self, id=None, invitation=None, head=None, tail=None, label=None, limit=None, offset=None, with_count=None, trash=None, select=None, stream=None, domain=None):
+        """
+        Gets a list of Edge objects based on the filters provided. Same parameters as :meth:`openreview.api.OpenReviewClient.get_edges`.
+
+        :return: List of Edges, or a tuple ``(list[Edge], int)`` when ``with_count`` is True and ``offset`` is None
+        :rtype: list[Edge]
+        """
+        params = _build_params(id=id, invitation=invitation, head=head, tail=tail, label=label, limit=limit, offset=offset, trash=trash, select=select, stream=stream, with_count=with_count, domain=domain)
+        response = await self.__request('GET', self.edges_url, params=params)
+        edges = [Edge.from_json(e) for e in response['edges']]
+
+        if with_count and offset is None:
+            return edges, response['count']
+
+        return edges
+
+    async def get_all_edges(self, id=None, invitation=None, head=None, tail=None, label=None, trash=None, select=None, domain=None):
+        """
+        Gets the list of all the Edges matching the filters provided using server-side streaming.
+
+        :return: List of Edges
+        :rtype: list[Edge]
+        """
+        return await self.get_edges(id=id, invitation=invitation, head=head, tail=tail, label=label, trash=trash, select=select, domain=domain, stream=True)
+
+    async def iter_edges(self, id=None, invitation=None, head=None, tail=None, label=None, trash=None, select=None, domain=None):
+        """
+        Async generator over all the Edges matching the filters provided. The Edges are paginated with ``offset``,
+        the next page is requested while the current one is consumed.
+
+        :return: Async iterator over Edges
+        :rtype: AsyncIterator[Edge]
+        """
+        params = _build_params(id=id, invitation=invitation, head=head, tail=tail, label=label, trash=trash, select=select, domain=domain)
+        async for batch in self.__iter_pages(self.edges_url, 'edges', params, cursor='offset'):
+            for e in batch:
+                yield Edge.from_json(e)
+
+    async def get_edges_count(self, id=None, invitation=None, head=None, tail=None, label=None, domain=None):
+        """
+        Returns the count of Edge objects matching the filters provided.
+
+        :return: Number of Edges matching the filters
+        :rtype: int
+        """
+        if domain is None and invitation is not None:
+            try:
+                domain = (await self.get_invitation(invitation)).domain
+            except OpenReviewException:
+                pass
+        params = _build_params(id=id, invitation=invitation, head=head, tail=tail, label=label, domain=domain)
+        response = await self.__request('GET', self.edges_count_url, params=params)
+        return response['count']
+
+    async def get_grouped_edges(self, invitation=None, head=None, tail=None, label=None, groupby='head', select=None, limit=None, offset=None, trash=None, domain=None):
+        """
+        Gets Edges grouped by a specified field. Same parameters as :meth:`openreview.api.OpenReviewClient.get_grouped_edges`.
+
+        :return: List of grouped edge dictionaries, each containing ``id`` and ``values`` keys
+        :rtype: list[dict]
+        """
+        params = _build_params(invitation=invitation, head=head, tail=tail, label=label, groupby=groupby, select=select, limit=limit, offset=offset, trash=trash, domain=domain)
+        response = await self.__request('GET', self.edges_url, params=params)
+        return response['groupedEdges']
+
+    async def post_edge(self, edge):
+        """
+        Posts a single Edge.
+
+        :param edge: Edge to post
+        :type edge: Edge
+
+        :return: The posted Edge
+        :rtype: Edge
+        """
+        response = await self.__request('POST', self.edges_url, json=edge.to_json())
+        return Edge.from_json(response)
+
+    async def post_edges(self, edges):
+        """
+        Posts the list of Edges in a single request.
+
+        :param edges: Edges to post
+        :type edges: list[Edge]
+
+        :return: The posted Edges updated with their ids
+        :rtype: list[Edge]
+        """
+        response = await self.__request('POST', self.bulk_edges_url, json=[edge.to_json() for edge in edges])
+        return [Edge.from_json(edge) for edge in response]
+
+    async def get_profile(self, email_or_id=None):
+        """
+        Get a single Profile by id or email, if available. If no id or email is given, the profile of the logged in user is returned.
+
+        :param email_or_id: e-mail or id of the profile
+        :type email_or_id: str, optional
+
+        :return: Profile
+        :rtype: Profile
+        """
+        params = []
+        if email_or_id:
+            params = _build_params(id=email_or_id) if email_or_id.startswith('~') else _build_params(email=email_or_id.lower())
+        response = await self.__request('GET', self.profiles_url, params=params)
+        profiles = response['profiles']
+        if profiles:
+            return Profile.from_json(profiles[0])
+        raise OpenReviewException(['Profile Not Found'])
+
+    async def search_profiles(self, confirmedEmails=None, emails=None, ids=None, term=None, first=None, middle=None, last=None, fullname=None, relation=None, use_ES=False):
+        """
+        Gets a list of profiles using either their ids or corresponding emails. Same parameters and return values as
+        :meth:`openreview.api.OpenReviewClient.search_profiles`, the batches of ids or emails are requested concurrently.
+
+        :return: List of profiles, if emails is present then a dictionary of { emails: profiles } is returned. If confirmedEmails is present then a dictionary of { confirmedEmails: profile } is returned
+        :rtype: list[Profile]
+        """
+        async def search(key, values):
+            batches = [values[i:i + 1000] for i in range(0, len(values), 1000)]
+            responses = await asyncio.gather(*[self.__request('POST', self.profiles_search_url, json={ key: batch }) for batch in batches])
+            return [p for response in responses for p in response['profiles']]
+
+        es = 'true' if use_ES else 'false'
+
+        if term:
+            response = await self.__request('GET', self.profiles_search_url, params=_build_params(term=term, es=es))
+            return [Profile.from_json(p) for p in response['profiles']]
+
+        if fullname:
+            response = await self.__request('GET', self.profiles_search_url, params=_build_params(fullname=fullname, es=es))
+            return [Profile.from_json(p) for p in response['profiles']]
+
+        if emails:
+            profiles_by_email = {}
+            for p in await search('emails', [email.lower() for email in emails]):
+                profiles_by_email.setdefault(p['email'], []).append(Profile.from_json(p))
+            return profiles_by_email
+
+        if confirmedEmails:
+            profiles_by_email = {}
+            for p in await search('confirmedEmails', [email.lower() for email in confirmedEmails]):
+                for email in p.get('confirmedEmails', p['content'].get('emailsConfirmed', [])):
+                    profiles_by_email[email] = Profile.from_json(p)
+            return profiles_by_email
+
+        if ids:
+            return [Profile.from_json(p) for p in await search('ids', list(ids))]
+
+        if first or middle or last:
+            response = await self.__request('GET', self.profiles_url, params=_build_params(first=first, middle=middle, last=last, es=es))
+            return [Profile.from_json(p) for p in response['profiles']]
+
+        if relation:
+            response = await self.__request('GET', self.profiles_url, params=_build_params(relation=relation))
+            return [Profile.from_json(p) for p in response['profiles']]
+
+        return []
+
+    async def get_process_logs(self, id=None, invitation=None, status=None, min_sdate=None):
+        """
+        Retrieves process function execution logs. **Only for Super User.**
+
+        :return: List of process log entry dictionaries
+        :rtype: list[dict]
+        """
+        response = await self.__request('GET', self.process_logs_url, params=_build_params(id=id, invitation=invitation, status=status, min_sdate=min_sdate))
+        return response['logs']
+
+    async def post_note_edit(self, invitation, signatures, note=None, readers=None, writers=None, nonreaders=None, content=None, await_process=False):
+        """
+        Creates or updates a Note via the edit system. Same parameters as :meth:`openreview.api.OpenReviewClient.post_note_edit`.
+
+        :return: Dictionary containing the posted edit
+        :rtype: dict
+        """
+        edit_json = {
+            'invitation': invitation,
+            'note': note.to_json() if note else {}
+        }
+        for key, value in (('signatures', signatures), ('readers', readers), ('writers', writers), ('nonreaders', nonreaders), ('content', content)):
+            if value is not None:
+                edit_json[key] = value
+
+        response = await self.__request('POST', self.note_edits_url, json=edit_json)
+
+        if await_process:
+            await self.__await_process(response['id'])
+
+        return response
+
+    async def post_group_edit(self, invitation, signatures=None, group=None, readers=None, writers=None, content=None, replacement=None, await_process=False, flush_members_cache=True):
+        """
+        Creates or updates a Group via the edit system. Same parameters as :meth:`openreview.api.OpenReviewClient.post_group_edit`,
+        the members cache of the added and removed members is flushed before returning.
+
+        :return: Dictionary containing the posted edit
+        :rtype: dict
+        """
+        edit_json = {
+            'invitation': invitation
+        }
+        if group is not None:
+            edit_json['group'] = group.to_json()
+        for key, value in (('signatures', signatures), ('readers', readers), ('writers', writers), ('content', content), ('replacement', replacement)):
+            if value is not None:
+                edit_json[key] = value
+
+        response = await self.__request('POST', self.group_edits_url, json=edit_json)
+
+        members = response.get('group', {}).get('members')
+        if flush_members_cache and response['domain'] in response['signatures']:
+            members_to_flush = []
+            if isinstance(members, dict):
+                members_to_flush = members.get('add', []) + members.get('remove', [])
+            if isinstance(members, list):
+                members_to_flush = members
+            await asyncio.gather(*[self.flush_members_cache(member) for member in set(members_to_flush)])
+
+        if await_process:
+            await self.__await_process(response['id'])
+
+        return response
+
+    async def post_invitation_edit(self, invitations, readers=None, writers=None, signatures=None, invitation=None, content=None, replacement=None, domain=None, await_process=False):
+        """
+        Creates or updates an Invitation via the edit system. Same parameters as :meth:`openreview.api.OpenReviewClient.post_invitation_edit`.
+
+        :return: Dictionary containing the posted edit
+        :rtype: dict
+        """
+        edit_json = {}
+        for key, value in (('invitations', invitations), ('readers', readers), ('writers', writers), ('signatures', signatures), ('content', content), ('replacement', replacement), ('domain', domain)):
+            if value is not None:
+                edit_json[key] = value
+        if invitation is not None:
+            edit_json['invitation'] = invitation.to_json()
+
+        response = await self.__request('POST', self.invitation_edits_url, json=edit_json)
+
+        if await_process:
+            await self.__await_process(response['id'])
+
+        return response
+
+    async def flush_members_cache(self, group_id=None):
+        """
+        Flushes the members cache of a group.
+
+        :param group_id: id of the group whose cache is flushed
+        :type group_id: str, optional
+
+        :return: Dictionary with the response of the server
+        :rtype: dict
+        """
+        if not group_id:
+            return
+        return await self.__request('DELETE', self.groups_members_cache_url + '/' + group_id.replace('/', '%2F'))
@@ -17,6 +17,9 @@ import pprint
 import os
 import re
 import time
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 import jwt
 import json
 import csv
@@ -25,11 +28,19 @@ from ..openreview import OpenReviewException
 from ..openreview import MfaRequiredException
 from .. import tools
 from .. import mfa
+from ..messages import get_failures_exception
 
 class LogRetry(Retry):
      
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, telemetry=None, **kwargs):
         super().__init__(*args, **kwargs)   
+        self.telemetry = telemetry
+
+    def new(self, **kwargs):
+        # Retry creates a new object on every increment, the telemetry has to be passed along
+        retry = super().new(**kwargs)
+        retry.telemetry = self.telemetry
+        return retry
 
     def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
         # Log retry information before calling the parent class method
@@ -43,6 +54,9 @@ class LogRetry(Retry):
                 response_string = response.reason
         print(f"Retrying request: {method} {url}, response: {response_string}, error: {error}")
 
+        if self.telemetry is not None:
+            self.telemetry.record_retry(method, url, status=response.status if response is not None else None, retry_after=self.get_retry_after(response) if response is not None else None)
+
         # Call the parent class method to perform the actual retry increment
         return super().increment(method=method, url=url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
     
@@ -59,8 +73,14 @@ class OpenReviewClient(object):
     :type token: str, optional
     :param expiresIn: Time in seconds before the token expires. If none is set the value will be set automatically to one hour. The max value that it can be set to is 1 week.
     :type expiresIn: number, optional
+    :param pool_connections: Number of connection pools to cache. If none is set, it defaults to :data:`openreview.tools.HTTP_POOL_CONNECTIONS`
+    :type pool_connections: int, optional
+    :param pool_maxsize: Maximum number of connections kept open per host, it should be at least the number of threads sharing the client. If none is set, it defaults to :data:`openreview.tools.HTTP_POOL_MAXSIZE`
+    :type pool_maxsize: int, optional
+    :param telemetry: Collects metrics of the requests sent by the client, see :meth:`set_telemetry`. If none is set and the environment variable `OPENREVIEW_TELEMETRY` is `1`, the shared :func:`openreview.tools.get_default_telemetry` is used
+    :type telemetry: RequestTelemetry, optional
     """
-    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None):
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, pool_connections=None, pool_maxsize=None, telemetry=None):
         self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_API_BASEURL_V2', 'http://localhost:3001')
         if any(url in self.baseurl for url in tools.V1_REMOTE_URLS):
             correct_baseurl = tools.get_base_urls(self)[1]
@@ -116,6 +136,17 @@ class OpenReviewClient(object):
         self.user_agent = f"openreview-py/{package_version} (Python/{python_version})"
 
         self.limit = 1000
+        self.stream_chunk_size = 64 * 1024
+        self.members_cache_flush_workers = 8
+        self._members_cache_lock = threading.Lock()
+        self._members_cache_deferred = 0
+        self._members_cache_queue = {}
+        self._groups_metadata = {}
+        self.response_cache = None
+        ## Opt in: a read that joins a request started before one of its own edits gets the object before the edit
+        self.coalesce_requests = False
+        self._models = { 'Note': Note, 'Edge': Edge, 'Group': Group, 'Tag': Tag, 'Profile': Profile }
+        self.single_flight = tools.SingleFlight()
         self.token = token.replace('Bearer ', '') if token else None
         self.profile = None
         self.headers = {
@@ -133,9 +164,16 @@ class OpenReviewClient(object):
             respect_retry_after_header=True
         )
         self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_connections or tools.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or tools.HTTP_POOL_MAXSIZE
+        )
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
+        self._retry_strategy = retry_strategy
+        self.telemetry = None
+        self.set_telemetry(telemetry or tools.get_default_telemetry())
 
         if self.token:
             self.headers['Authorization'] = 'Bearer ' + self.token
@@ -255,6 +293,73 @@ class OpenReviewClient(object):
 
         raise OpenReviewException("Process timed out")
 
+    def __coalesce(self, key, function):
+        ## Concurrent identical reads share a single request
+        if not self.coalesce_requests:
+            return function()
+        return self.single_flight.do(key + (self.token,), function)
+
+    def __lazy_note_class(self):
+        from .lazy_note import LazyNote
+        return LazyNote
+
+    def __get_by_id(self, url, kind, id, details=None):
+        return self.__coalesce((url, id, details), lambda: self.__get_by_id_uncoalesced(url, kind, id, details))
+
+    def __get_by_id_uncoalesced(self, url, kind, id, details=None):
+        ## GET of a single object by id, revalidated against the response cache when it is enabled
+        params = {'id': id, 'details': details}
+        cache = self.response_cache
+        if cache is None:
+            response = self.session.get(url, params = params, headers = self.headers)
+            response = self.__handle_response(response)
+            return response.json()[kind][0]
+
+        key = (kind, id, details, self.token)
+        entry, fresh, generation = cache.lookup(key)
+        if fresh:
+            return json.loads(entry['body'])[kind][0]
+
+        headers = self.headers
+        if entry is not None and entry['etag']:
+            headers = dict(self.headers, **{ 'If-None-Match': entry['etag'] })
+        response = self.session.get(url, params = params, headers = headers)
+        if response.status_code == 304 and entry is not None:
+            cache.mark_revalidated(key)
+            return json.loads(entry['body'])[kind][0]
+
+        response = self.__handle_response(response)
+        result = response.json()[kind][0]
+        cache.store(key, response.content, etag=response.headers.get('ETag'), tmdate=result.get('tmdate'), generation=generation)
+        return result
+
+    def __invalidate_cache(self, *edit_jsons, object_ids=None):
+        ## Removes from the response cache the notes, groups and invitations modified by the posted edits or deleted by id
+        if self.response_cache is None:
+            return
+        object_ids = list(object_ids or [])
+        for edit_json in edit_jsons:
+            for kind in ('note', 'group', 'invitation'):
+                item = edit_json.get(kind)
+                if isinstance(item, dict) and item.get('id'):
+                    object_ids.append(item['id'])
+        self.response_cache.invalidate(object_ids)
+
+    def __invalidate_groups_metadata(self, edit_json):
+        ## The metadata used by bulk_update_memberships is kept when the edit only changes the members of the group
+        group = edit_json.get('group')
+        if isinstance(group, dict) and group.get('id') and (set(group) - {'id', 'members'} or edit_json.get('replacement')):
+            self._groups_metadata.pop(group['id'], None)
+
+    def __iter_stream(self, url, params, key, raw=False):
+        response = self.session.get(url, params=tools.format_params(params), headers=self.headers, stream=True)
+        response = self.__handle_response(response)
+        try:
+            for item in tools.iter_json_array(response.iter_content(chunk_size=self.stream_chunk_size), key, raw=raw):
+                yield item
+        finally:
+            response.close()
+
     def get_invitation_date_process_job(self, job_id):
         response = self.session.get(self.baseurl + '/jobs/queues/pyDateProcessQueueMQ/' + job_id.replace('/', '%2F'), params = {}, headers = self.headers)
         response = self.__handle_response(response)
@@ -453,8 +558,126 @@ class OpenReviewClient(object):
         response = self.session.delete(self.groups_members_cache_url + '/' + group_id, params= {}, headers=self.headers)
         response = self.__handle_response(response)
         return response.json()
-        
+
+    def flush_members_caches(self, group_ids, max_workers=None):
+        """
+        Flushes the members cache for several groups. Each group is flushed once, and up to ``max_workers`` requests are sent at the same time.
+
+        :param group_ids: ids of the groups to flush the cache for
+        :type group_ids: list[str]
+        :param max_workers: Maximum number of concurrent requests, defaults to ``members_cache_flush_workers``
+        :type max_workers: int, optional
+        """
+        group_ids = [group_id for group_id in dict.fromkeys(group_ids) if group_id]
+        if len(group_ids) <= 1:
+            for group_id in group_ids:
+                self.flush_members_cache(group_id)
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers or self.members_cache_flush_workers, len(group_ids))) as executor:
+            list(executor.map(self.flush_members_cache, group_ids))
+
+    @contextlib.contextmanager
+    def deferred_cache_flush(self):
+        """
+        Defers the members cache flushes of the group edits posted inside the block, e.g. by :meth:`add_members_to_group`, and flushes
+        them when the block exits, each member once and concurrently. Group edits posted by other threads using the same client while the
+        block is open are deferred too. Blocks can be nested, the caches are flushed when the outermost block exits, even if it raises an
+        exception. Until then, the members caches of the edited members may be stale.
+
+        Example:
+
+        >>> with client.deferred_cache_flush():
+        ...     for paper_group_id, reviewers in assignments.items():
+        ...         client.add_members_to_group(paper_group_id, reviewers)
+        """
+        with self._members_cache_lock:
+            self._members_cache_deferred += 1
+        try:
+            yield self
+        finally:
+            with self._members_cache_lock:
+                self._members_cache_deferred -= 1
+                group_ids = []
+                if not self._members_cache_deferred:
+                    group_ids = list(self._members_cache_queue)
+                    self._members_cache_queue = {}
+            self.flush_members_caches(group_ids)
+
+    def __flush_members_cache_later(self, group_ids):
+        with self._members_cache_lock:
+            if self._members_cache_deferred:
+                self._members_cache_queue.update(dict.fromkeys(group_ids))
+                return
+        self.flush_members_caches(group_ids)
+
     
+    def set_response_cache(self, cache):
+        """
+        Enables the response cache of :meth:`get_invitation`, :meth:`get_group` and :meth:`get_note`. Pass None to disable it.
+
+        :param cache: Response cache, e.g. :class:`openreview.tools.ResponseCache`
+        :type cache: ResponseCache
+        """
+        self.response_cache = cache
+
+    def get_response_cache(self):
+        """
+        Returns the response cache used by the client, None if it is not enabled.
+
+        :return: Response cache
+        :rtype: ResponseCache
+        """
+        return self.response_cache
+
+    def set_telemetry(self, telemetry):
+        """
+        Records the latency, size, status and retries of every request sent by the client in the given telemetry. Pass None to stop recording.
+
+        :param telemetry: Request telemetry, e.g. :class:`openreview.tools.RequestTelemetry`
+        :type telemetry: RequestTelemetry
+
+        :return: The telemetry
+        :rtype: RequestTelemetry
+        """
+        hooks = self.session.hooks['response']
+        if self.telemetry is not None and self.telemetry.response_hook in hooks:
+            hooks.remove(self.telemetry.response_hook)
+        if telemetry is not None:
+            hooks.append(telemetry.response_hook)
+        self._retry_strategy.telemetry = telemetry
+        self.telemetry = telemetry
+        return telemetry
+
+    def get_telemetry(self):
+        """
+        Returns the telemetry used by the client, None if it is not enabled.
+
+        :return: Request telemetry
+        :rtype: RequestTelemetry
+        """
+        return self.telemetry
+
+    def use_compact_models(self, enabled=True):
+        """
+        Makes the client return the ``__slots__`` based :class:`openreview.api.CompactNote`, :class:`~openreview.api.CompactEdge`,
+        :class:`~openreview.api.CompactTag`, :class:`~openreview.api.CompactGroup` and :class:`~openreview.api.CompactProfile`
+        instead of Note, Edge, Tag, Group and Profile objects. The compact objects have the same attributes and methods and use
+        a fraction of the memory, but new attributes can not be added to them.
+
+        :param enabled: If False, the client returns the regular objects again
+        :type enabled: bool, optional
+
+        Example:
+
+        >>> client.use_compact_models()
+        >>> submissions = client.get_all_notes(invitation='ICML.cc/2024/Conference/-/Submission', details='replies')
+        """
+        if enabled:
+            from .compact import COMPACT_MODELS
+            self._models = dict(COMPACT_MODELS)
+        else:
+            self._models = { 'Note': Note, 'Edge': Edge, 'Group': Group, 'Tag': Tag, 'Profile': Profile }
+
     def get_activatable(self, token = None):
         response = self.session.get(self.baseurl + '/activatable/' + token, params = {}, headers = self.headers)
         response = self.__handle_response(response)
@@ -502,10 +725,8 @@ class OpenReviewClient(object):
 
         >>> group = client.get_group('your-email@domain.com')
         """
-        response = self.session.get(self.groups_url, params = {'id':id, 'details': details}, headers = self.headers)
-        response = self.__handle_response(response)
-        g = response.json()['groups'][0]
-        group = Group.from_json(g)
+        g = self.__get_by_id(self.groups_url, 'groups', id, details)
+        group = self._models['Group'].from_json(g)
 
         if group.anonids:
             anon_prefix = (group.id[:-1] if group.id.endswith('s') else group.id) + '_'
@@ -532,9 +753,7 @@ class OpenReviewClient(object):
         :return: Invitation matching the passed id
         :rtype: Invitation
         """
-        response = self.session.get(self.invitations_url, params = {'id': id}, headers = self.headers)
-        response = self.__handle_response(response)
-        i = response.json()['invitations'][0]
+        i = self.__get_by_id(self.invitations_url, 'invitations', id)
         return Invitation.from_json(i)
 
     def get_note(self, id, details=None):
@@ -547,10 +766,8 @@ class OpenReviewClient(object):
         :return: Note matching the passed id
         :rtype: Note
         """
-        response = self.session.get(self.notes_url, params = {'id':id, 'details': details}, headers = self.headers)
-        response = self.__handle_response(response)
-        n = response.json()['notes'][0]
-        return Note.from_json(n)
+        n = self.__get_by_id(self.notes_url, 'notes', id, details)
+        return self._models['Note'].from_json(n)
 
     def get_tag(self, id):
         """
@@ -565,7 +782,7 @@ class OpenReviewClient(object):
         response = self.session.get(self.tags_url, params = {'id': id}, headers = self.headers)
         response = self.__handle_response(response)
         t = response.json()['tags'][0]
-        return Tag.from_json(t)
+        return self._models['Tag'].from_json(t)
 
     def get_edge(self, id, trash=False):
         """
@@ -581,7 +798,7 @@ class OpenReviewClient(object):
         response = self.__handle_response(response)
         edges = response.json()['edges']
         if edges:
-            return Edge.from_json(edges[0])
+            return self._models['Edge'].from_json(edges[0])
         else:
             raise OpenReviewException('Edge not found')
 
@@ -604,11 +821,14 @@ class OpenReviewClient(object):
                 att = 'email'
                 email_or_id = email_or_id.lower()
             params[att] = email_or_id
-        response = self.session.get(self.profiles_url, params=tools.format_params(params), headers = self.headers)
-        response = self.__handle_response(response)
-        profiles = response.json()['profiles']
+        def get_profiles():
+            response = self.session.get(self.profiles_url, params=tools.format_params(params), headers = self.headers)
+            response = self.__handle_response(response)
+            return response.json()['profiles']
+
+        profiles = self.__coalesce((self.profiles_url, tuple(params.items())), get_profiles)
         if profiles:
-            return Profile.from_json(profiles[0])
+            return self._models['Profile'].from_json(profiles[0])
         else:
             raise OpenReviewException(['Profile Not Found'])
 
@@ -648,7 +868,7 @@ class OpenReviewClient(object):
 
         response = self.session.get(self.profiles_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
-        return [Profile.from_json(p) for p in response.json()['profiles']]
+        return [self._models['Profile'].from_json(p) for p in response.json()['profiles']]
     
     def search_profiles(self, confirmedEmails = None, emails = None, ids = None, term = None, first = None, middle = None, last = None, fullname=None, relation=None, use_ES = False):
         """
@@ -688,12 +908,12 @@ class OpenReviewClient(object):
         if term:
             response = self.session.get(self.profiles_search_url, params = { 'term': term, 'es': 'true' if use_ES else 'false' }, headers = self.headers)
             response = self.__handle_response(response)
-            return [Profile.from_json(p) for p in response.json()['profiles']]
+            return [self._models['Profile'].from_json(p) for p in response.json()['profiles']]
         
         if fullname:
             response = self.session.get(self.profiles_search_url, params = { 'fullname': fullname, 'es': 'true' if use_ES else 'false' }, headers = self.headers)
             response = self.__handle_response(response)
-            return [Profile.from_json(p) for p in response.json()['profiles']]
+            return [self._models['Profile'].from_json(p) for p in response.json()['profiles']]
 
         if emails:
             emails = [email.lower() for email in emails]
@@ -707,7 +927,7 @@ class OpenReviewClient(object):
             for p in full_response:
                 if p['email'] not in profiles_by_email:
                     profiles_by_email[p['email']] = []
-                profiles_by_email[p['email']].append(Profile.from_json(p))
+                profiles_by_email[p['email']].append(self._models['Profile'].from_json(p))
             return profiles_by_email
 
         if confirmedEmails:
@@ -722,7 +942,7 @@ class OpenReviewClient(object):
             for p in full_response:
                 profile_confirmed_emails = p.get('confirmedEmails', p['content'].get('emailsConfirmed', []))
                 for email in profile_confirmed_emails:
-                    profiles_by_email[email] = Profile.from_json(p)
+                    profiles_by_email[email] = self._models['Profile'].from_json(p)
             return profiles_by_email
 
         if ids:
@@ -732,17 +952,17 @@ class OpenReviewClient(object):
                 response = self.__handle_response(response)
                 full_response.extend(response.json()['profiles'])
 
-            return [Profile.from_json(p) for p in full_response]
+            return [self._models['Profile'].from_json(p) for p in full_response]
 
         if first or middle or last:
             response = self.session.get(self.profiles_url, params = {'first': first, 'middle': middle, 'last': last, 'es': 'true' if use_ES else 'false'}, headers = self.headers)
             response = self.__handle_response(response)
-            return [Profile.from_json(p) for p in response.json()['profiles']]
+            return [self._models['Profile'].from_json(p) for p in response.json()['profiles']]
 
         if relation:
             response = self.session.get(self.profiles_url, params = {'relation': relation }, headers = self.headers)
             response = self.__handle_response(response)
-            return [Profile.from_json(p) for p in response.json()['profiles']]
+            return [self._models['Profile'].from_json(p) for p in response.json()['profiles']]
         
         return []
 
@@ -987,7 +1207,7 @@ class OpenReviewClient(object):
             headers = self.headers)
 
         response = self.__handle_response(response)
-        return Profile.from_json(response.json())
+        return self._models['Profile'].from_json(response.json())
 
     def rename_domain(self, old_domain, new_domain, request_form, additional_renames=None):
         """
@@ -1035,7 +1255,7 @@ class OpenReviewClient(object):
             headers = self.headers)
 
         response = self.__handle_response(response)
-        return Profile.from_json(response.json())        
+        return self._models['Profile'].from_json(response.json())        
 
     def merge_profiles(self, profileTo, profileFrom):
         """
@@ -1058,7 +1278,7 @@ class OpenReviewClient(object):
             headers = self.headers)
 
         response = self.__handle_response(response)
-        return Profile.from_json(response.json())
+        return self._models['Profile'].from_json(response.json())
     
     def moderate_profile(self, profile_id, decision, reason=None):
         """
@@ -1087,7 +1307,7 @@ class OpenReviewClient(object):
             headers = self.headers)
 
         response = self.__handle_response(response)
-        return Profile.from_json(response.json())
+        return self._models['Profile'].from_json(response.json())
 
     def update_relation_readers(self, update):
         """
@@ -1162,12 +1382,16 @@ class OpenReviewClient(object):
         if domain is not None:
             params['domain'] = domain
 
-        response = self.session.get(self.groups_url, params=tools.format_params(params), headers = self.headers)
-        response = self.__handle_response(response)
-        groups = [Group.from_json(g) for g in response.json()['groups']]
+        def get_groups():
+            response = self.session.get(self.groups_url, params=tools.format_params(params), headers = self.headers)
+            response = self.__handle_response(response)
+            return response.json()
+
+        response_json = self.__coalesce((self.groups_url, repr(sorted(params.items()))), get_groups)
+        groups = [self._models['Group'].from_json(g) for g in response_json['groups']]
 
         if with_count and params.get('offset') is None:
-            return groups, response.json()['count']
+            return groups, response_json['count']
 
         return groups
 
@@ -1227,6 +1451,62 @@ class OpenReviewClient(object):
 
         return self.get_groups(**params)
 
+    def iter_groups(self, id=None, invitation=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None, sort=None):
+        """
+        Returns an iterator over all the Groups matching the filters provided. Unlike :meth:`get_all_groups`, the streamed response is parsed incrementally and the Groups are yielded one at a time, so memory usage does not grow with the number of results.
+
+        :param id: id of the Group
+        :type id: str, optional
+        :param parent: id of the parent Group
+        :type parent: str, optional
+        :param prefix: Prefix that matches several Group ids
+        :type prefix: str, optional
+        :param member: Groups that that are transitive members of the member value
+        :type member: str, optional
+        :param members: Groups that contain the value members in the members field
+        :type members: str, optional
+        :param domain: Venue domain ID; improves query efficiency when the caller is a venue organizer.
+        :type domain: str, optional
+        :param signatory: Groups that contain this signatory
+        :type signatory: str, optional
+        :param web: Groups that contain a web field value
+        :type web: bool, optional
+
+        :return: Iterator over Groups
+        :rtype: Iterator[Group]
+
+        Example:
+
+        >>> for group in client.iter_groups(prefix='ICML.cc/2024/Conference/Submission'):
+        ...     print(group.id)
+        """
+        params = {
+            'stream': True
+        }
+        if id is not None:
+            params['id'] = id
+        if invitation is not None:
+            params['invitation'] = invitation
+        if parent is not None:
+            params['parent'] = parent
+        if prefix is not None:
+            params['prefix'] = prefix
+        if member is not None:
+            params['member'] = member
+        if members is not None:
+            params['members'] = members
+        if signatory is not None:
+            params['signatory'] = signatory
+        if domain is not None:
+            params['domain'] = domain
+        if web is not None:
+            params['web'] = web
+        if sort is not None:
+            params['sort'] = sort
+
+        for g in self.__iter_stream(self.groups_url, params, 'groups'):
+            yield self._models['Group'].from_json(g)
+
     def get_invitations(self,
         id = None,
         ids = None,
@@ -1530,7 +1810,9 @@ class OpenReviewClient(object):
             details = None,
             sort = None,
             with_count=None,
-            stream=None
+            stream=None,
+            select=None,
+            lazy=False
             ):
         """
         Gets list of Note objects based on the filters provided. The Notes that will be returned match all the criteria passed in the parameters.
@@ -1578,6 +1860,10 @@ class OpenReviewClient(object):
         :type details: optional
         :param sort: Sorts the output by field depending on the string passed. Possible values: number, cdate, ddate, tcdate, tmdate, replyCount (Invitation id needed in the invitation field).
         :type sort: str, optional
+        :param select: Comma separated list of fields to include in each Note, e.g. ``id,content.title``.
+        :type select: str, optional
+        :param lazy: If True, returns :class:`LazyNote` views that are not copied into Note objects and index their replies by invitation.
+        :type lazy: bool, optional
 
         :return: List of Notes
         :rtype: list[Note]
@@ -1634,11 +1920,14 @@ class OpenReviewClient(object):
             params['count'] = with_count
         if stream is not None:
             params['stream'] = stream
+        if select is not None:
+            params['select'] = select
 
         response = self.session.get(self.notes_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        notes = [Note.from_json(n) for n in response.json()['notes']]
+        note_class = self.__lazy_note_class() if lazy else self._models['Note']
+        notes = [note_class.from_json(n) for n in response.json()['notes']]
 
         if with_count and params.get('offset') is None:
             return notes, response.json()['count']
@@ -1662,7 +1951,8 @@ class OpenReviewClient(object):
             details = None,
             select = None,
             sort = None,
-            domain=None
+            domain=None,
+            lazy=False
             ):
         """
         Gets list of Note objects based on the filters provided. The Notes that will be returned match all the criteria passed in the parameters.
@@ -1705,6 +1995,8 @@ class OpenReviewClient(object):
         :type details: optional
         :param sort: Sorts the output by field depending on the string passed. Possible values: number, cdate, ddate, tcdate, tmdate, replyCount (Invitation id needed in the invitation field).
         :type sort: str, optional
+        :param lazy: If True, returns :class:`LazyNote` views that are not copied into Note objects and index their replies by invitation.
+        :type lazy: bool, optional
 
         :return: List of Notes
         :rtype: list[Note]
@@ -1747,6 +2039,8 @@ class OpenReviewClient(object):
             params['sort'] = sort
         if domain is not None:
             params['domain'] = domain
+        if lazy:
+            params['lazy'] = True
 
         if 'details' not in params:
             params['stream'] = True
@@ -1776,7 +2070,135 @@ class OpenReviewClient(object):
                 return sorted(results, key=sort_key, reverse=reverse)
             return results
         
-        return list(tools.efficient_iterget(self.get_notes, desc='Getting V2 Notes', **params))
+        return tools.concurrent_cursor_get(self.get_notes, desc='Getting V2 Notes', **params)
+
+    def iter_notes(self, id = None,
+            paperhash = None,
+            forum = None,
+            invitation = None,
+            parent_invitations = None,
+            replyto = None,
+            signature = None,
+            transitive_members = None,
+            signatures = None,
+            writer = None,
+            trash = None,
+            number = None,
+            content = None,
+            mintcdate = None,
+            details = None,
+            select = None,
+            domain = None,
+            lazy = False
+            ):
+        """
+        Returns an iterator over all the Notes matching the filters provided. Unlike :meth:`get_all_notes`, the Notes are yielded one at a time:
+        without ``details`` the streamed response is parsed incrementally, and with ``details`` the Notes are paginated with ``after`` cursors
+        keeping a single page in memory. The Notes are returned in the order sent by the server.
+
+        :param id: a Note ID. If provided, returns Notes whose ID matches the given ID.
+        :type id: str, optional
+        :param paperhash: A "paperhash" for a note. If provided, returns Notes whose paperhash matches this argument.
+        :type paperhash: str, optional
+        :param forum: A Note ID. If provided, returns Notes whose forum matches the given ID.
+        :type forum: str, optional
+        :param invitation: An Invitation ID. If provided, returns Notes whose "invitation" field is this Invitation ID.
+        :type invitation: str, optional
+        :param parent_invitations: An Invitation ID. If provided, returns Notes whose parentInvitations field contains the given Invitation ID.
+        :type parent_invitations: str, optional
+        :param replyto: A Note ID. If provided, returns Notes whose replyto field matches the given ID.
+        :type replyto: str, optional
+        :param signature: A Group ID. If provided, returns Notes whose signatures field contains the given Group ID.
+        :type signature: str, optional
+        :param transitive_members: If true, returns Notes whose tauthor field is a transitive member of the Group represented by the given Group ID.
+        :type transitive_members: bool, optional
+        :param signatures: Group IDs. If provided, returns Notes whose signatures field contains the given Group IDs.
+        :type signatures: list[str], optional
+        :param writer: A Group ID. If provided, returns Notes whose writers field contains the given Group ID.
+        :type writer: str, optional
+        :param trash: If True, includes Notes that have been deleted
+        :type trash: bool, optional
+        :param number: If present, includes Notes whose number field equals the given integer.
+        :type number: int, optional
+        :param content: If present, includes Notes whose each key is present in the content field and it is equals the given value.
+        :type content: dict, optional
+        :param mintcdate: Represents an Epoch time timestamp, in milliseconds. If provided, returns Notes whose tcdate is at least equal to the value of mintcdate.
+        :type mintcdate: int, optional
+        :param details: Comma separated list of details to include in each Note, e.g. ``replies``.
+        :type details: str, optional
+        :param select: Comma separated list of fields to include in each Note.
+        :type select: str, optional
+        :param domain: If provided, returns Notes whose domain field matches the given domain.
+        :type domain: str, optional
+        :param lazy: If True, yields :class:`LazyNote` views. The streamed Notes are kept as JSON text and only decoded when accessed.
+        :type lazy: bool, optional
+
+        :return: Iterator over Notes
+        :rtype: Iterator[Note]
+
+        Example:
+
+        >>> for submission in client.iter_notes(invitation='ICML.cc/2024/Conference/-/Submission'):
+        ...     print(submission.number)
+        """
+        params = {}
+        if id is not None:
+            params['id'] = id
+        if paperhash is not None:
+            params['paperhash'] = paperhash
+        if forum is not None:
+            params['forum'] = forum
+        if invitation is not None:
+            params['invitation'] = invitation
+        if parent_invitations is not None:
+            params['parentInvitations'] = parent_invitations
+        if replyto is not None:
+            params['replyto'] = replyto
+        if signature is not None:
+            params['signature'] = signature
+        if transitive_members is not None:
+            params['transitiveMembers'] = transitive_members
+        if signatures is not None:
+            params['signatures'] = signatures
+        if writer is not None:
+            params['writer'] = writer
+        if trash == True:
+            params['trash'] = True
+        if number is not None:
+            params['number'] = number
+        if content is not None:
+            for k in content:
+                params['content.' + k] = content[k]
+        if mintcdate is not None:
+            params['mintcdate'] = mintcdate
+        if select is not None:
+            params['select'] = select
+        if domain is not None:
+            params['domain'] = domain
+
+        if details is not None:
+            params['details'] = details
+            params['sort'] = 'id'
+            params['limit'] = self.limit
+            while True:
+                response = self.session.get(self.notes_url, params=tools.format_params(params), headers = self.headers)
+                response = self.__handle_response(response)
+                batch = response.json()['notes']
+                note_class = self.__lazy_note_class() if lazy else self._models['Note']
+                for n in batch:
+                    yield note_class.from_json(n)
+                if len(batch) < params['limit']:
+                    return
+                params['after'] = batch[-1]['id']
+
+        params['stream'] = True
+        if lazy:
+            LazyNote = self.__lazy_note_class()
+            for raw in self.__iter_stream(self.notes_url, params, 'notes', raw=True):
+                yield LazyNote.from_raw(raw)
+            return
+        for n in self.__iter_stream(self.notes_url, params, 'notes'):
+            yield self._models['Note'].from_json(n)
 
     def get_note_edit(self, id, trash=None):
         """
@@ -1895,7 +2317,7 @@ class OpenReviewClient(object):
         response = self.session.post(self.tags_url, json = tag.to_json(), headers = self.headers)
         response = self.__handle_response(response)
 
-        return Tag.from_json(response.json())
+        return self._models['Tag'].from_json(response.json())
     
     def post_tags(self, tags):
         '''
@@ -1905,7 +2327,7 @@ class OpenReviewClient(object):
         response = self.session.post(self.bulk_tags_url, json = send_json, headers = self.headers)
         response = self.__handle_response(response)
         received_json_array = response.json()
-        tag_objects = [Tag.from_json(tag) for tag in received_json_array]
+        tag_objects = [self._models['Tag'].from_json(tag) for tag in received_json_array]
         return tag_objects
     
     def rename_tags(self, current_id, new_id):
@@ -1999,7 +2421,7 @@ class OpenReviewClient(object):
         response = self.session.get(self.tags_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        tags = [Tag.from_json(t) for t in response.json()['tags']]
+        tags = [self._models['Tag'].from_json(t) for t in response.json()['tags']]
         if with_count and params.get('offset') is None:
             return tags, response.json()['count']
 
@@ -2034,6 +2456,48 @@ class OpenReviewClient(object):
 
         return self.get_tags(**params)
 
+    def iter_tags(self, id = None, invitation = None, parent_invitations = None, forum = None, note = None, profile = None, signature = None, tag = None, domain=None):
+        """
+        Returns an iterator over all the Tags matching the filters provided. Unlike :meth:`get_all_tags`, the streamed response is parsed incrementally and the Tags are yielded one at a time.
+
+        :param id: A Tag ID. If provided, returns Tags whose ID matches the given ID.
+        :type id: str, optional
+        :param invitation: An Invitation ID. If provided, returns Tags whose "invitation" field is this Invitation ID.
+        :type invitation: str, optional
+        :param parent_invitations: A list of parent Invitation IDs to filter Tags by.
+        :type parent_invitations: list[str], optional
+        :param forum: A Note ID. If provided, returns Tags whose forum matches the given ID.
+        :type forum: str, optional
+        :param note: A Note ID. If provided, returns Tags whose ``note`` field matches.
+        :type note: str, optional
+        :param profile: A Profile ID. If provided, returns Tags associated with this profile.
+        :type profile: str, optional
+        :param signature: A group ID. If provided, returns Tags signed by this group.
+        :type signature: str, optional
+        :param tag: Tag value to filter by.
+        :type tag: str, optional
+        :param domain: Venue domain ID; improves query efficiency when the caller is a venue organizer.
+        :type domain: str, optional
+
+        :return: Iterator over Tags
+        :rtype: Iterator[Tag]
+        """
+        params = {
+            'id': id,
+            'invitation': invitation,
+            'parentInvitations': parent_invitations,
+            'forum': forum,
+            'note': note,
+            'profile': profile,
+            'signature': signature,
+            'tag': tag,
+            'domain': domain,
+            'stream': True
+        }
+
+        for t in self.__iter_stream(self.tags_url, params, 'tags'):
+            yield self._models['Tag'].from_json(t)
+
     def get_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None, select=None, stream=None, domain=None):
         """Get a list of Edge objects based on the filters provided.
 
@@ -2091,7 +2555,7 @@ class OpenReviewClient(object):
         response = self.session.get(self.edges_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        edges = [Edge.from_json(e) for e in response.json()['edges']]
+        edges = [self._models['Edge'].from_json(e) for e in response.json()['edges']]
 
         if with_count and params.get('offset') is None:
             return edges, response.json()['count']
@@ -2138,6 +2602,102 @@ class OpenReviewClient(object):
 
         return self.get_edges(**params)
 
+    def iter_edges(self, id = None, invitation = None, head = None, tail = None, label = None, trash=None, select=None, domain=None):
+        """Return an iterator over all the Edge objects matching the filters.
+
+        Unlike :meth:`get_all_edges`, the streamed response is parsed
+        incrementally and the Edges are yielded one at a time, so invitations
+        with millions of Edges (e.g. affinity scores) can be processed in
+        bounded memory.
+
+        :param id: An Edge ID. If provided, returns the Edge whose ID matches.
+        :type id: str, optional
+        :param invitation: An Invitation ID. If provided, returns Edges whose ``invitation`` field matches.
+        :type invitation: str, optional
+        :param head: ID of the Edge head entity.
+        :type head: str, optional
+        :param tail: ID of the Edge tail entity.
+        :type tail: str, optional
+        :param label: Label value to filter Edges by.
+        :type label: str, optional
+        :param trash: If True, includes soft-deleted Edges in the results.
+        :type trash: bool, optional
+        :param select: Comma-separated list of fields to include in the response.
+        :type select: str, optional
+        :param domain: Venue domain ID; improves query efficiency when the caller is a venue organizer.
+        :type domain: str, optional
+
+        :return: Iterator over the matching Edge objects.
+        :rtype: Iterator[Edge]
+
+        Example:
+
+        >>> for edge in client.iter_edges(invitation='ICML.cc/2024/Conference/Reviewers/-/Affinity_Score'):
+        ...     print(edge.head, edge.tail, edge.weight)
+        """
+        params = {
+            'id': id,
+            'invitation': invitation,
+            'head': head,
+            'tail': tail,
+            'label': label,
+            'trash': trash,
+            'select': select,
+            'domain': domain,
+            'stream': True
+        }
+
+        for e in self.__iter_stream(self.edges_url, params, 'edges'):
+            yield self._models['Edge'].from_json(e)
+
+    def get_edges_frame(self, invitation=None, head=None, tail=None, label=None, trash=None, select='head,tail,weight,label', domain=None):
+        """Get all the Edges matching the filters as a columnar :class:`openreview.api.EdgeFrame`.
+
+        The streamed response is decoded incrementally and appended to the frame
+        without building :class:`Edge` objects, so millions of Edges (e.g.
+        affinity scores or conflicts) can be loaded and aggregated with a fraction
+        of the memory used by :meth:`get_all_edges`.
+
+        :param invitation: Invitation ID. If provided, returns Edges whose ``invitation`` field is this Invitation ID.
+        :type invitation: str, optional
+        :param head: Head ID. If provided, returns Edges whose ``head`` field matches.
+        :type head: str, optional
+        :param tail: Tail ID. If provided, returns Edges whose ``tail`` field matches.
+        :type tail: str, optional
+        :param label: Label value. If provided, returns Edges whose ``label`` field matches.
+        :type label: str, optional
+        :param trash: If True, includes Edges that have been deleted.
+        :type trash: bool, optional
+        :param select: Comma separated list of fields to get for each Edge. Add ``id`` to keep the Edge ids and ``invitation`` when the query matches several invitations.
+        :type select: str, optional
+        :param domain: Domain ID. If provided, restricts results to Edges in that domain.
+        :type domain: str, optional
+
+        :return: EdgeFrame with the matching Edges
+        :rtype: EdgeFrame
+
+        Example:
+
+        >>> bids = client.get_edges_frame(invitation='ICML.cc/2024/Conference/Reviewers/-/Bid')
+        >>> bids.count_by('tail')
+        """
+        from .edge_frame import EdgeFrame
+
+        params = {
+            'invitation': invitation,
+            'head': head,
+            'tail': tail,
+            'label': label,
+            'trash': trash,
+            'select': select,
+            'domain': domain,
+            'stream': True
+        }
+
+        frame = EdgeFrame(invitation=invitation)
+        frame.extend_json(self.__iter_stream(self.edges_url, params, 'edges'))
+        return frame
+
     def get_edges_count(self, id=None, invitation=None, head=None, tail=None, label=None, domain=None):
         """Return the count of Edge objects matching the filters provided.
 
@@ -2244,7 +2804,7 @@ class OpenReviewClient(object):
         response = self.session.get(self.edges_archive, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        edges = [Edge.from_json(e) for e in response.json()['edges']]
+        edges = [self._models['Edge'].from_json(e) for e in response.json()['edges']]
 
         return edges
     
@@ -2264,7 +2824,7 @@ class OpenReviewClient(object):
         response = self.session.post(self.edges_url, json = edge.to_json(), headers = self.headers)
         response = self.__handle_response(response)
 
-        return Edge.from_json(response.json())
+        return self._models['Edge'].from_json(response.json())
 
     def post_edges (self, edges):
         '''
@@ -2274,7 +2834,7 @@ class OpenReviewClient(object):
         response = self.session.post(self.bulk_edges_url, json = send_json, headers = self.headers)
         response = self.__handle_response(response)
         received_json_array = response.json()
-        edge_objects = [Edge.from_json(edge) for edge in received_json_array]
+        edge_objects = [self._models['Edge'].from_json(edge) for edge in received_json_array]
         return edge_objects
 
     def rename_edges(self, current_id, new_id):
@@ -2302,7 +2862,7 @@ class OpenReviewClient(object):
         response = self.__handle_response(response)
         #print('RESPONSE: ', response.json())
         received_json_array = response.json()
-        edge_objects = [Edge.from_json(edge) for edge in received_json_array]
+        edge_objects = [self._models['Edge'].from_json(edge) for edge in received_json_array]
         return edge_objects
 
     def post_venue(self, venue):
@@ -2419,6 +2979,7 @@ class OpenReviewClient(object):
         """
         response = self.session.delete(self.notes_url, json = {'id': note_id}, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache(object_ids=[note_id])
         return response.json()
 
     def delete_profile_reference(self, reference_id):
@@ -2448,6 +3009,8 @@ class OpenReviewClient(object):
         """
         response = self.session.delete(self.groups_url, json = {'id': group_id}, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache(object_ids=[group_id])
+        self._groups_metadata.pop(group_id, None)
         return response.json()
 
     def delete_institution(self, institution_id):
@@ -2476,6 +3039,7 @@ class OpenReviewClient(object):
         """
         response = self.session.delete(self.invitations_url, json = {'id': invitation_id}, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache(object_ids=[invitation_id])
         return response.json()
 
     def post_message(self, subject, recipients, message, invitation=None, signature=None, ignoreRecipients=None, sender=None, replyTo=None, parentGroup=None, use_job=None):
@@ -2540,6 +3104,14 @@ class OpenReviewClient(object):
         if parentGroup:
             recipients = self.get_group(parentGroup).transform_to_anon_ids(recipients)
 
+        json = self.__message_json(subject, recipients, message, invitation=invitation, signature=signature, ignoreRecipients=ignoreRecipients, sender=sender, replyTo=replyTo, parentGroup=parentGroup, use_job=use_job)
+
+        response = self.session.post(self.messages_requests_url, json = json, headers = self.headers)
+        response = self.__handle_response(response)
+
+        return response.json()
+
+    def __message_json(self, subject, recipients, message, invitation=None, signature=None, ignoreRecipients=None, sender=None, replyTo=None, parentGroup=None, use_job=None):
         json = {
             'groups': recipients,
             'subject': subject ,
@@ -2568,11 +3140,76 @@ class OpenReviewClient(object):
         if use_job is not None:
             json['useJob'] = use_job
 
-        response = self.session.post(self.messages_requests_url, json = json, headers = self.headers)
-        response = self.__handle_response(response)
+        return json
+
+    def post_messages_bulk(self, messages, max_workers=None, use_job=None, raise_on_error=False):
+        """
+        Posts several messages concurrently, e.g. the notifications of all the submissions of a venue. Messages that only differ
+        in their recipients are merged and posted once, and the parent group of the messages that have one is fetched once for
+        all of them. A message that fails does not stop the others, its error is returned instead of its response.
+
+        :param messages: Messages to post, each one a dictionary with the arguments of :meth:`post_message`, e.g.
+            ``{'subject': 'Decision', 'recipients': ['Venue/Submission1/Authors'], 'message': 'Hi {{fullname}},...'}``
+        :type messages: list[dict]
+        :param max_workers: Maximum number of concurrent requests, defaults to min(16, cpu_count() * 5)
+        :type max_workers: int, optional
+        :param use_job: If set, whether the messages without a ``use_job`` value are sent using the job queue
+        :type use_job: bool, optional
+        :param raise_on_error: If True, an OpenReviewException listing the failed messages is raised after all the messages are posted
+        :type raise_on_error: bool, optional
+
+        :return: One result per message, in the same order, with the ``response`` of the request that posted it or the ``error`` if it failed
+        :rtype: list[dict]
+        """
+        results = [{ 'response': None, 'error': None } for _ in messages]
+        parent_group_ids = set(message.get('parentGroup') for message in messages if message.get('parentGroup'))
+        parent_groups = {}
+        for parent_group_id in parent_group_ids:
+            try:
+                parent_groups[parent_group_id] = self.get_group(parent_group_id)
+            except Exception as error:
+                parent_groups[parent_group_id] = error
+
+        ## Requests by the JSON of the message without its recipients
+        requests = {}
+        for index, message in enumerate(messages):
+            try:
+                message = dict(message)
+                if use_job is not None and message.get('use_job') is None:
+                    message['use_job'] = use_job
+                recipients = list(message.pop('recipients'))
+                parent_group = parent_groups.get(message.get('parentGroup'))
+                if isinstance(parent_group, Exception):
+                    raise parent_group
+                if parent_group:
+                    recipients = parent_group.transform_to_anon_ids(recipients)
+                message_json = self.__message_json(message.pop('subject'), [], message.pop('message'), **message)
+            except Exception as error:
+                results[index]['error'] = str(error)
+                continue
+            request = requests.setdefault(json.dumps(message_json, sort_keys=True), { 'json': message_json, 'recipients': {}, 'indexes': [] })
+            request['recipients'].update(dict.fromkeys(recipients))
+            request['indexes'].append(index)
+
+        def post_request(request):
+            try:
+                response = self.session.post(self.messages_requests_url, json = dict(request['json'], groups=list(request['recipients'])), headers = self.headers)
+                return self.__handle_response(response).json(), None
+            except Exception as error:
+                return None, str(error)
+
+        requests = list(requests.values())
+        if requests:
+            for request, (response, error) in zip(requests, tools.concurrent_requests(post_request, requests, desc='post_messages_bulk', max_workers=max_workers)):
+                for index in request['indexes']:
+                    results[index] = { 'response': response, 'error': error }
+
+        if raise_on_error:
+            failures = [dict(result, message=message) for message, result in zip(messages, results) if result['error']]
+            if failures:
+                raise get_failures_exception(failures, len(messages))
+        return results
 
-        return response.json()
-    
     def get_message_requests(self, id=None, invitation=None):
         """
         Posts a message to the recipients and consequently sends them emails
@@ -2697,6 +3334,66 @@ class OpenReviewClient(object):
         if member_type == list:
             return remove_member(group, members)
 
+    def bulk_update_memberships(self, updates, groups=None, max_workers=None, refetch=False):
+        """
+        Adds and removes members of several groups. The domain and signatures of each group are read from a cache of group
+        metadata, so groups are only fetched the first time they are updated, unless their members need to be anonymized.
+        The edits are posted concurrently and the members caches are flushed once at the end, see :meth:`deferred_cache_flush`.
+        The removals of a group are posted before its additions.
+
+        :param updates: Members to add and remove by group id, e.g. ``{'Venue/Paper1/Reviewers': {'add': ['~User_11'], 'remove': ['~User_21']}}``
+        :type updates: dict
+        :param groups: Groups already loaded by the caller, used to fill the group metadata cache
+        :type groups: list[Group], optional
+        :param max_workers: Maximum number of concurrent requests, defaults to min(16, cpu_count() * 5)
+        :type max_workers: int, optional
+        :param refetch: If True, each group is fetched again after the update and included in the result
+        :type refetch: bool, optional
+
+        :return: Dictionary by group id with the ``added`` and ``removed`` members, the ``group`` if ``refetch`` is True, and the ``error`` if the update failed
+        :rtype: dict
+        """
+        for group in groups or []:
+            self._groups_metadata[group.id] = { 'domain': group.domain, 'signatures': group.signatures, 'anonids': group.anonids }
+
+        def update_group(item):
+            group_id, members = item
+            to_add = list(dict.fromkeys(members.get('add') or []))
+            to_remove = list(dict.fromkeys(members.get('remove') or []))
+            summary = { 'added': [], 'removed': [], 'group': None, 'error': None }
+            try:
+                metadata = self._groups_metadata.get(group_id)
+                if metadata is None or (to_remove and metadata['anonids']):
+                    group = self.get_group(group_id)
+                    metadata = self._groups_metadata[group_id] = { 'domain': group.domain, 'signatures': group.signatures, 'anonids': group.anonids }
+                    if to_remove:
+                        to_remove = group.transform_to_anon_ids(to_remove)
+
+                for operation, group_members in [('remove', to_remove), ('add', to_add)]:
+                    if group_members:
+                        self.post_group_edit(invitation = f'{metadata["domain"]}/-/Edit',
+                            signatures = metadata['signatures'],
+                            group = Group(
+                                id = group_id,
+                                members = {
+                                    operation: group_members
+                                }
+                            ),
+                            readers=metadata['signatures'],
+                            writers=metadata['signatures']
+                        )
+                        summary['removed' if operation == 'remove' else 'added'] = group_members
+
+                if refetch:
+                    summary['group'] = self.get_group(group_id)
+            except Exception as error:
+                summary['error'] = str(error)
+            return group_id, summary
+
+        with self.deferred_cache_flush():
+            results = tools.concurrent_requests(update_group, list(updates.items()), desc='bulk_update_memberships', max_workers=max_workers)
+        return dict(results)
+
     def search_notes(self, term, content = 'all', group = 'all', source='all', limit = None, offset = None):
         """
         Searches notes based on term, content, group and source as the criteria. Unlike :meth:`~openreview.Client.get_notes`, this method uses Elasticsearch to retrieve the Notes
@@ -2731,12 +3428,12 @@ class OpenReviewClient(object):
 
         response = self.session.get(self.notes_url + '/search', params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
-        return [Note.from_json(n) for n in response.json()['notes']]
+        return [self._models['Note'].from_json(n) for n in response.json()['notes']]
 
     def get_notes_by_ids(self, ids):
         response = self.session.post(self.notes_url + '/search', json = { 'ids': ids }, headers = self.headers)
         response = self.__handle_response(response)
-        return [Note.from_json(n) for n in response.json()['notes']]
+        return [self._models['Note'].from_json(n) for n in response.json()['notes']]
 
     def get_tildeusername(self, fullname):
         """
@@ -2868,6 +3565,7 @@ class OpenReviewClient(object):
 
         response = self.session.post(self.invitation_edits_url, json = edit_json, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache(edit_json, response.json())
 
         if await_process:
             self.__await_process(response.json()['id'])
@@ -2923,6 +3621,7 @@ class OpenReviewClient(object):
 
         response = self.session.post(self.note_edits_url, json = edit_json, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache(edit_json, response.json())
 
         if await_process:
             self.__await_process(response.json()['id'])
@@ -2936,6 +3635,7 @@ class OpenReviewClient(object):
         edit is validated against the specified invitation's schema. When the edit
         modifies group members and the signature matches the domain, the members
         cache is automatically flushed unless ``flush_members_cache`` is False.
+        Inside a :meth:`deferred_cache_flush` block the flush is deferred until the block exits.
 
         :param invitation: Invitation ID that defines the schema and permissions for this edit.
         :type invitation: str
@@ -2983,6 +3683,8 @@ class OpenReviewClient(object):
 
         response = self.session.post(self.group_edits_url, json = edit_json, headers = self.headers)
         response = self.__handle_response(response)
+        self.__invalidate_cache(edit_json, response.json())
+        self.__invalidate_groups_metadata(edit_json)
 
         posted_edit = response.json()
         members = posted_edit.get('group', {}).get('members')
@@ -2990,16 +3692,10 @@ class OpenReviewClient(object):
             if flush_members_cache:
                 members_to_flush = []
                 if isinstance(members, dict):
-                    if 'add' in members:
-                        for member in members['add']:
-                            members_to_flush.append(member)
-                    elif 'remove' in members:
-                        for member in members['remove']:
-                            members_to_flush.append(member)
+                    members_to_flush = members.get('add', []) + members.get('remove', [])
                 if isinstance(members, list):
                     members_to_flush = members
-                for member in members_to_flush:
-                    self.flush_members_cache(member)
+                self.__flush_members_cache_later(members_to_flush)
 
         if await_process:
             self.__await_process(response.json()['id'])
@@ -3030,6 +3726,8 @@ class OpenReviewClient(object):
             response = self.session.post(self.invitation_edits_url, json = edit_json, headers = self.headers)
 
         response = self.__handle_response(response)
+        self.__invalidate_cache(edit_json, response.json())
+        self.__invalidate_groups_metadata(edit_json)
 
         return response.json()
 
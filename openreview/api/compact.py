@@ -0,0 +1,63 @@
+#!/usr/bin/python
+from __future__ import absolute_import, division, print_function, unicode_literals
+import inspect
+import pprint
+
+from .client import Note, Edge, Tag, Group
+from ..openreview import Profile
+
+## Attributes set outside of __init__ that the compact classes must be able to store
+EXTRA_ATTRIBUTES = {
+    'Group': ('anon_members',),
+    'Profile': ('tauthor', 'state')
+}
+
+def _instance_attributes(model_class):
+    ## Creates an instance with all the parameters set to None to find the attributes set by __init__
+    parameters = [p for name, p in inspect.signature(model_class.__init__).parameters.items() if name != 'self']
+    required = { p.name: None for p in parameters if p.default is inspect.Parameter.empty and p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY) }
+    attributes = list(vars(model_class(**required)))
+    for name in EXTRA_ATTRIBUTES.get(model_class.__name__, ()):
+        if name not in attributes:
+            attributes.append(name)
+    return tuple(attributes)
+
+def _items(self):
+    return { name: getattr(self, name) for name in self.__slots__ if hasattr(self, name) }
+
+def _repr(self):
+    content = ','.join([("%s = %r" % (attr, value)) for attr, value in _items(self).items()])
+    return self.__class__.__name__ + '(' + content + ')'
+
+def _str(self):
+    pp = pprint.PrettyPrinter()
+    return pp.pformat(_items(self))
+
+def _compact_class(model_class):
+    ## Builds a class with the same methods as model_class whose instances store their attributes in __slots__ instead of a __dict__
+    namespace = { name: value for name, value in vars(model_class).items() if name not in ('__dict__', '__weakref__') }
+    namespace.update({
+        '__slots__': _instance_attributes(model_class),
+        '__module__': __name__,
+        '__qualname__': 'Compact' + model_class.__name__,
+        '__doc__': f'Memory efficient version of :class:`{model_class.__module__}.{model_class.__name__}` that stores its attributes in ``__slots__``. '
+            'It has the same methods and ``to_json``/``from_json`` format, but attributes not defined by the original class can not be added to its instances.',
+        '__repr__': _repr,
+        '__str__': _str,
+        'to_dict': _items
+    })
+    return type('Compact' + model_class.__name__, (object,), namespace)
+
+CompactNote = _compact_class(Note)
+CompactEdge = _compact_class(Edge)
+CompactTag = _compact_class(Tag)
+CompactGroup = _compact_class(Group)
+CompactProfile = _compact_class(Profile)
+
+COMPACT_MODELS = {
+    'Note': CompactNote,
+    'Edge': CompactEdge,
+    'Tag': CompactTag,
+    'Group': CompactGroup,
+    'Profile': CompactProfile
+}
@@ -0,0 +1,144 @@
+#!/usr/bin/python
+from __future__ import absolute_import, division, print_function, unicode_literals
+from concurrent.futures import ThreadPoolExecutor
+
+def _content_property(field_name, doc):
+    return property(lambda self: self.domain.get_content_value(field_name), doc=doc)
+
+class DomainContext(object):
+    """
+    The objects most process functions load before doing any work: the domain Group of the venue, the parent Invitation
+    of the Invitation that runs the process and the forum Note of the edit. :meth:`load` gets them with concurrent requests
+    instead of one after the other, and the standard content fields of the domain Group are available as attributes.
+
+    When the client has a response cache, see :meth:`openreview.api.OpenReviewClient.set_response_cache`, the domain Group
+    and the parent Invitation, that rarely change, are revalidated instead of downloaded again.
+
+    Process functions run with :func:`openreview.tools.run_process_script` receive the context in their ``context``
+    argument when they declare it. Declare it with a default of None so the function can also be called without it.
+
+    :param domain: Domain Group of the venue
+    :type domain: Group
+    :param parent_invitation: Parent Invitation of the Invitation that runs the process
+    :type parent_invitation: Invitation, optional
+    :param forum: Forum Note of the edit
+    :type forum: Note, optional
+
+    Example:
+
+    >>> def process(client, edit, invitation, context=None):
+    >>>     context = context or openreview.api.DomainContext.load(client, edit, invitation)
+    >>>     submission = context.forum
+    >>>     paper_reviewers_id = context.get_committee_id(context.reviewers_name, submission.number)
+    """
+    def __init__(self, domain, parent_invitation=None, forum=None):
+        self.domain = domain
+        self.parent_invitation = parent_invitation
+        self.forum = forum
+
+    @classmethod
+    def load(cls, client, edit=None, invitation=None, parent_invitation=True, forum=True):
+        """
+        Gets the domain Group, the parent Invitation and the forum Note of an edit at the same time.
+
+        :param client: Client used to get the objects
+        :type client: OpenReviewClient
+        :param edit: Edit that runs the process, its domain and the forum of its Note are used
+        :type edit: Edit, optional
+        :param invitation: Invitation that runs the process, its domain is used when there is no edit, e.g. in date processes
+        :type invitation: Invitation, optional
+        :param parent_invitation: Whether to get the first of the ``invitations`` of the Invitation. If that Invitation
+            was already fetched, pass it instead and it is not requested again.
+        :type parent_invitation: bool or Invitation, optional
+        :param forum: Whether to get the forum Note of the edit
+        :type forum: bool, optional
+
+        :return: The context of the edit
+        :rtype: DomainContext
+        """
+        domain_id = getattr(edit, 'domain', None) or getattr(invitation, 'domain', None)
+        if not domain_id:
+            raise ValueError('The edit or the invitation must have a domain')
+        requests = { 'domain': (client.get_group, domain_id) }
+        loaded = {}
+        parent_invitation_ids = getattr(invitation, 'invitations', None) if parent_invitation else None
+        if parent_invitation_ids:
+            if getattr(parent_invitation, 'id', None) == parent_invitation_ids[0]:
+                loaded['parent_invitation'] = parent_invitation
+            else:
+                requests['parent_invitation'] = (client.get_invitation, parent_invitation_ids[0])
+        note = getattr(edit, 'note', None)
+        forum_id = getattr(note, 'forum', None) or getattr(note, 'id', None)
+        if forum and forum_id:
+            requests['forum'] = (client.get_note, forum_id)
+
+        if len(requests) == 1:
+            return cls(client.get_group(domain_id), **loaded)
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            futures = { name: executor.submit(function, id) for name, (function, id) in requests.items() }
+            return cls(**loaded, **{ name: future.result() for name, future in futures.items() })
+
+    @property
+    def venue_id(self):
+        """Id of the venue, the id of the domain Group"""
+        return self.domain.id
+
+    def get(self, field_name, default_value=None):
+        """
+        Returns the value of a content field of the domain Group.
+
+        :param field_name: Name of the field
+        :type field_name: str
+        :param default_value: Value returned when the field is not set
+        :type default_value: any, optional
+        """
+        return self.domain.get_content_value(field_name, default_value)
+
+    def get_paper_group_id(self, number):
+        """
+        Returns the id of the Group of a submission, e.g. ``ICML.cc/2025/Conference/Submission5``.
+
+        :param number: Number of the submission
+        :type number: int
+        """
+        return f'{self.venue_id}/{self.submission_name}{number}'
+
+    def get_committee_id(self, name, number=None):
+        """
+        Returns the id of a committee of the venue, or of a submission when its number is passed, e.g.
+        ``get_committee_id(context.reviewers_name, 5)``.
+
+        :param name: Name of the committee, e.g. the value of ``reviewers_name``
+        :type name: str
+        :param number: Number of the submission
+        :type number: int, optional
+        """
+        return f'{self.get_paper_group_id(number)}/{name}' if number is not None else f'{self.venue_id}/{name}'
+
+    meta_invitation_id = _content_property('meta_invitation_id', 'Id of the meta invitation of the venue')
+    short_name = _content_property('subtitle', 'Short name of the venue, used in the email subjects')
+    title = _content_property('title', 'Full name of the venue')
+    contact = _content_property('contact', 'Contact email of the venue')
+    message_sender = _content_property('message_sender', 'Sender of the venue emails')
+    request_form_id = _content_property('request_form_id', 'Id of the venue request form')
+    submission_id = _content_property('submission_id', 'Id of the submission Invitation')
+    submission_name = _content_property('submission_name', 'Name of the submissions, e.g. Submission')
+    submission_venue_id = _content_property('submission_venue_id', 'Venue id of the active submissions')
+    program_chairs_id = _content_property('program_chairs_id', 'Id of the program chairs Group')
+    authors_id = _content_property('authors_id', 'Id of the authors Group')
+    authors_name = _content_property('authors_name', 'Name of the authors committee, e.g. Authors')
+    reviewers_id = _content_property('reviewers_id', 'Id of the reviewers Group')
+    reviewers_name = _content_property('reviewers_name', 'Name of the reviewers committee, e.g. Reviewers')
+    reviewers_anon_name = _content_property('reviewers_anon_name', 'Prefix of the anonymous reviewer Groups, e.g. Reviewer_')
+    reviewers_submitted_name = _content_property('reviewers_submitted_name', 'Name of the Group of the reviewers that submitted their review')
+    area_chairs_id = _content_property('area_chairs_id', 'Id of the area chairs Group, None if the venue has no area chairs')
+    area_chairs_name = _content_property('area_chairs_name', 'Name of the area chairs committee')
+    senior_area_chairs_id = _content_property('senior_area_chairs_id', 'Id of the senior area chairs Group, None if the venue has no senior area chairs')
+    senior_area_chairs_name = _content_property('senior_area_chairs_name', 'Name of the senior area chairs committee')
+    ethics_chairs_id = _content_property('ethics_chairs_id', 'Id of the ethics chairs Group')
+    ethics_reviewers_id = _content_property('ethics_reviewers_id', 'Id of the ethics reviewers Group')
+    review_name = _content_property('review_name', 'Name of the review Invitations')
+    decision_name = _content_property('decision_name', 'Name of the decision Invitations')
+
+    def __repr__(self):
+        return f'DomainContext(venue_id={self.venue_id!r}, parent_invitation={getattr(self.parent_invitation, "id", None)!r}, forum={getattr(self.forum, "id", None)!r})'
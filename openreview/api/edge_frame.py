@@ -0,0 +1,341 @@
+#!/usr/bin/python
+from __future__ import absolute_import, division, print_function, unicode_literals
+from array import array
+from collections import Counter
+import math
+
+from .client import Edge
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class _Values(object):
+    ## Table of interned strings, each distinct value is stored once and referenced by its position
+    __slots__ = ('values', 'index')
+
+    def __init__(self, values=None):
+        self.values = list(values or [])
+        self.index = { value: position for position, value in enumerate(self.values) }
+
+    def get_code(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.index[value] = code
+            self.values.append(value)
+        return code
+
+
+class EdgeFrame(object):
+    """
+    Columnar container of Edges. Heads, tails, labels and invitations are interned: each distinct string is stored once and every
+    Edge keeps integer codes in ``array('i')`` columns, and the weights are stored in an ``array('d')`` column where missing
+    weights are NaN. Each Edge takes 24 bytes plus its share of the string tables, instead of several hundred bytes as an :class:`Edge` object.
+    :meth:`weights_array` returns the weights as a NumPy array without copying them when NumPy is installed.
+
+    EdgeFrames are returned by :meth:`openreview.api.OpenReviewClient.get_edges_frame` and can be built with :meth:`from_json` or :meth:`from_edges`.
+
+    Example:
+
+    >>> scores = client.get_edges_frame(invitation='ICML.cc/2024/Conference/Reviewers/-/Affinity_Score')
+    >>> top_scores = scores.filter(min_weight=0.9)
+    >>> reviewers_by_paper = { head: frame.tails() for head, frame in top_scores.groupby('head').items() }
+    """
+    COLUMNS = ('head', 'tail', 'label', 'invitation')
+
+    def __init__(self, invitation=None):
+        self.invitation = invitation
+        self._values = { column: _Values() for column in self.COLUMNS }
+        self._codes = { column: array('i') for column in self.COLUMNS }
+        self._weights = array('d')
+        self._ids = None
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __iter__(self):
+        return self.to_edges()
+
+    def __repr__(self):
+        return f'EdgeFrame(invitation={self.invitation!r}, edges={len(self)}, heads={len(self._values["head"].values)}, tails={len(self._values["tail"].values)})'
+
+    def append(self, head, tail, weight=None, label=None, invitation=None, id=None):
+        """
+        Adds an Edge to the frame.
+
+        :param head: Head of the Edge
+        :type head: str
+        :param tail: Tail of the Edge
+        :type tail: str
+        :param weight: Weight of the Edge
+        :type weight: float, optional
+        :param label: Label of the Edge
+        :type label: str, optional
+        :param invitation: Invitation of the Edge, if None the invitation of the frame is used
+        :type invitation: str, optional
+        :param id: Id of the Edge, ids are only stored if the first appended Edge has one
+        :type id: str, optional
+        """
+        if len(self._weights) == 0 and id is not None:
+            self._ids = []
+        self._codes['head'].append(self._values['head'].get_code(head))
+        self._codes['tail'].append(self._values['tail'].get_code(tail))
+        self._codes['label'].append(-1 if label is None else self._values['label'].get_code(label))
+        self._codes['invitation'].append(-1 if invitation is None else self._values['invitation'].get_code(invitation))
+        self._weights.append(math.nan if weight is None else weight)
+        if self._ids is not None:
+            self._ids.append(id)
+
+    def extend_json(self, edges_json):
+        """
+        Adds Edges in JSON format, e.g. the items of a streamed ``/edges`` response.
+
+        :param edges_json: Iterable of Edge dictionaries
+        :type edges_json: iterable[dict]
+        """
+        append = self.append
+        for e in edges_json:
+            append(e['head'], e['tail'], e.get('weight'), e.get('label'), e.get('invitation'), e.get('id'))
+
+    @classmethod
+    def from_json(cls, edges_json, invitation=None):
+        """
+        Builds an EdgeFrame from Edges in JSON format.
+
+        :param edges_json: Iterable of Edge dictionaries
+        :type edges_json: iterable[dict]
+        :param invitation: Invitation used for the Edges without one
+        :type invitation: str, optional
+
+        :return: The EdgeFrame
+        :rtype: EdgeFrame
+        """
+        frame = cls(invitation=invitation)
+        frame.extend_json(edges_json)
+        return frame
+
+    @classmethod
+    def from_edges(cls, edges, invitation=None):
+        """
+        Builds an EdgeFrame from Edge objects.
+
+        :param edges: Iterable of Edges
+        :type edges: iterable[Edge]
+        :param invitation: Invitation used for the Edges without one
+        :type invitation: str, optional
+
+        :return: The EdgeFrame
+        :rtype: EdgeFrame
+        """
+        frame = cls(invitation=invitation)
+        for edge in edges:
+            frame.append(edge.head, edge.tail, edge.weight, edge.label, edge.invitation, edge.id)
+        return frame
+
+    def __value(self, column, code):
+        if code < 0:
+            return self.invitation if column == 'invitation' else None
+        return self._values[column].values[code]
+
+    def __weight(self, position):
+        weight = self._weights[position]
+        return None if math.isnan(weight) else weight
+
+    def __subset(self, positions):
+        ## The subset shares the string tables of this frame
+        frame = EdgeFrame(invitation=self.invitation)
+        frame._values = self._values
+        for column in self.COLUMNS:
+            codes = self._codes[column]
+            frame._codes[column] = array('i', [codes[position] for position in positions])
+        weights = self._weights
+        frame._weights = array('d', [weights[position] for position in positions])
+        if self._ids is not None:
+            frame._ids = [self._ids[position] for position in positions]
+        return frame
+
+    def column(self, name):
+        """
+        Returns the values of a column.
+
+        :param name: One of ``head``, ``tail``, ``label``, ``invitation``, ``weight`` or ``id``
+        :type name: str
+
+        :return: List of values, one per Edge
+        :rtype: list
+        """
+        if name == 'weight':
+            return [self.__weight(position) for position in range(len(self))]
+        if name == 'id':
+            return list(self._ids) if self._ids is not None else [None] * len(self)
+        if name in ('label', 'invitation'):
+            return [self.__value(name, code) for code in self._codes[name]]
+        values = self._values[name].values
+        return [values[code] for code in self._codes[name]]
+
+    def heads(self):
+        """
+        :return: Head of every Edge
+        :rtype: list[str]
+        """
+        return self.column('head')
+
+    def tails(self):
+        """
+        :return: Tail of every Edge
+        :rtype: list[str]
+        """
+        return self.column('tail')
+
+    def weights(self):
+        """
+        :return: Weight column, missing weights are NaN
+        :rtype: array
+        """
+        return self._weights
+
+    def weights_array(self):
+        """
+        Returns the weights as a NumPy array sharing the memory of the weight column. Requires NumPy.
+
+        :return: Weights, missing weights are NaN
+        :rtype: numpy.ndarray
+        """
+        if numpy is None:
+            raise ImportError('weights_array requires numpy, use weights() to get the array.array column')
+        return numpy.frombuffer(self._weights, dtype=numpy.float64)
+
+    def count_by(self, column='head'):
+        """
+        Counts the Edges by the values of a column.
+
+        :param column: ``head``, ``tail``, ``label`` or ``invitation``
+        :type column: str
+
+        :return: Dictionary of number of Edges by value
+        :rtype: dict
+        """
+        return { self.__value(column, code): count for code, count in Counter(self._codes[column]).items() }
+
+    def sum_by(self, column='head'):
+        """
+        Sums the weights of the Edges by the values of a column, missing weights are ignored.
+
+        :param column: ``head``, ``tail``, ``label`` or ``invitation``
+        :type column: str
+
+        :return: Dictionary of total weight by value
+        :rtype: dict
+        """
+        totals = {}
+        weights = self._weights
+        for position, code in enumerate(self._codes[column]):
+            weight = weights[position]
+            if weight == weight:
+                totals[code] = totals.get(code, 0.0) + weight
+        return { self.__value(column, code): total for code, total in totals.items() }
+
+    def groupby(self, column='head'):
+        """
+        Groups the Edges by the values of a column.
+
+        :param column: ``head``, ``tail``, ``label`` or ``invitation``
+        :type column: str
+
+        :return: Dictionary of EdgeFrames by value, the Edges keep their order
+        :rtype: dict
+        """
+        positions_by_code = {}
+        for position, code in enumerate(self._codes[column]):
+            positions_by_code.setdefault(code, []).append(position)
+        return { self.__value(column, code): self.__subset(positions) for code, positions in positions_by_code.items() }
+
+    def filter(self, predicate=None, head=None, tail=None, label=None, min_weight=None, max_weight=None):
+        """
+        Returns the Edges matching all the given conditions.
+
+        :param predicate: Function receiving ``(head, tail, weight, label)`` that returns True for the Edges to keep
+        :type predicate: function, optional
+        :param head: Head or collection of heads to keep
+        :type head: str | collection, optional
+        :param tail: Tail or collection of tails to keep
+        :type tail: str | collection, optional
+        :param label: Label or collection of labels to keep
+        :type label: str | collection, optional
+        :param min_weight: Minimum weight, Edges without weight are removed
+        :type min_weight: float, optional
+        :param max_weight: Maximum weight, Edges without weight are removed
+        :type max_weight: float, optional
+
+        :return: New EdgeFrame with the matching Edges
+        :rtype: EdgeFrame
+        """
+        def allowed_codes(column, values):
+            if values is None:
+                return None
+            values = [values] if isinstance(values, str) else values
+            index = self._values[column].index
+            return set(index[value] for value in values if value in index)
+
+        conditions = [(self._codes[column], codes) for column, codes in (('head', allowed_codes('head', head)), ('tail', allowed_codes('tail', tail)), ('label', allowed_codes('label', label))) if codes is not None]
+        weights = self._weights
+        positions = []
+        for position in range(len(self)):
+            if any(codes[position] not in allowed for codes, allowed in conditions):
+                continue
+            weight = weights[position]
+            if min_weight is not None and not weight >= min_weight:
+                continue
+            if max_weight is not None and not weight <= max_weight:
+                continue
+            if predicate is not None:
+                edge_head, edge_tail, edge_weight, edge_label = self.row(position)
+                if not predicate(edge_head, edge_tail, edge_weight, edge_label):
+                    continue
+            positions.append(position)
+        return self.__subset(positions)
+
+    def row(self, position):
+        """
+        :return: Tuple ``(head, tail, weight, label)`` of the Edge in the given position
+        :rtype: tuple
+        """
+        return (
+            self._values['head'].values[self._codes['head'][position]],
+            self._values['tail'].values[self._codes['tail'][position]],
+            self.__weight(position),
+            self.__value('label', self._codes['label'][position])
+        )
+
+    def rows(self):
+        """
+        :return: Iterator over the ``(head, tail, weight, label)`` tuples of the Edges
+        :rtype: Iterator[tuple]
+        """
+        for position in range(len(self)):
+            yield self.row(position)
+
+    def to_edges(self, **fields):
+        """
+        Returns an iterator of :class:`Edge` objects, e.g. to post them with :func:`openreview.tools.post_bulk_edges`.
+
+        :param fields: Fields set in every Edge, e.g. ``readers``, ``writers`` or ``signatures``
+        :type fields: dict, optional
+
+        :return: Iterator over the Edges
+        :rtype: Iterator[Edge]
+        """
+        invitation = fields.pop('invitation', None)
+        for position in range(len(self)):
+            head, tail, weight, label = self.row(position)
+            yield Edge(
+                id=self._ids[position] if self._ids is not None else None,
+                invitation=invitation or self.__value('invitation', self._codes['invitation'][position]),
+                head=head,
+                tail=tail,
+                weight=weight,
+                label=label,
+                **fields
+            )
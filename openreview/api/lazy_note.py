@@ -0,0 +1,145 @@
+#!/usr/bin/python
+from __future__ import absolute_import, division, print_function, unicode_literals
+import json
+import types
+
+from .client import Note
+
+## Note attributes whose key in the JSON representation is different
+JSON_KEYS = {
+    'external_ids': 'externalIds',
+    'parent_invitations': 'parentInvitations'
+}
+
+NOTE_ATTRIBUTES = frozenset([
+    'id', 'external_id', 'external_ids', 'number', 'cdate', 'pdate', 'odate', 'mdate', 'tcdate', 'tmdate', 'ddate', 'content',
+    'forum', 'replyto', 'readers', 'nonreaders', 'signatures', 'writers', 'details', 'invitations', 'parent_invitations', 'domain', 'license'
+])
+
+class LazyNote(object):
+    """
+    Read-optimized view of a Note. It keeps the Note in its JSON form, either the raw text received from the API or the decoded
+    dictionary, and only decodes it when an attribute is accessed. No fields are copied into a :class:`Note` object, and the
+    replies in ``details`` are indexed by invitation on the first call to :meth:`get_replies`, so looking up the reply of a given
+    invitation, e.g. the decision of a submission, does not scan all the replies.
+
+    A LazyNote has the same attributes and methods as :class:`Note`, e.g. ``note.content``, ``note.number`` or ``note.to_json()``.
+    Use :meth:`to_note` to get a regular Note.
+
+    LazyNotes are returned by :meth:`openreview.api.OpenReviewClient.get_notes`, :meth:`~openreview.api.OpenReviewClient.get_all_notes`
+    and :meth:`~openreview.api.OpenReviewClient.iter_notes` when ``lazy=True``.
+
+    Example:
+
+    >>> submissions = client.get_all_notes(invitation='ICML.cc/2024/Conference/-/Submission', details='directReplies', lazy=True)
+    >>> decision = submissions[0].get_reply(f'ICML.cc/2024/Conference/Submission{submissions[0].number}/-/Decision')
+    """
+    __slots__ = ('_raw', '_json', '_replies_index')
+
+    def __init__(self, note_json=None, raw=None):
+        object.__setattr__(self, '_raw', raw)
+        object.__setattr__(self, '_json', note_json)
+        object.__setattr__(self, '_replies_index', None)
+
+    @classmethod
+    def from_json(cls, n):
+        """
+        Creates a LazyNote from a decoded Note dictionary. The dictionary is used as is, not copied.
+
+        :param n: Note dictionary
+        :type n: dict
+
+        :return: LazyNote
+        :rtype: LazyNote
+        """
+        return cls(note_json=n)
+
+    @classmethod
+    def from_raw(cls, raw):
+        """
+        Creates a LazyNote from the JSON text of a Note, the text is decoded when an attribute is accessed.
+
+        :param raw: JSON text of the Note
+        :type raw: str | bytes
+
+        :return: LazyNote
+        :rtype: LazyNote
+        """
+        return cls(raw=raw)
+
+    def _decoded(self):
+        note_json = self._json
+        if note_json is None:
+            note_json = json.loads(self._raw)
+            object.__setattr__(self, '_json', note_json)
+            object.__setattr__(self, '_raw', None)
+        return note_json
+
+    def __getattr__(self, name):
+        if name in NOTE_ATTRIBUTES:
+            return self._decoded().get(JSON_KEYS.get(name, name))
+        member = Note.__dict__.get(name)
+        if isinstance(member, property):
+            return member.fget(self)
+        if isinstance(member, types.FunctionType) and not name.startswith('__'):
+            return types.MethodType(member, self)
+        raise AttributeError(f"'LazyNote' object has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        if name not in NOTE_ATTRIBUTES:
+            raise AttributeError(f"'LazyNote' object has no attribute '{name}'")
+        self._decoded()[JSON_KEYS.get(name, name)] = value
+        if name == 'details':
+            object.__setattr__(self, '_replies_index', None)
+
+    def __getstate__(self):
+        return (self._raw, self._json)
+
+    def __setstate__(self, state):
+        self.__init__(note_json=state[1], raw=state[0])
+
+    def __repr__(self):
+        return f'LazyNote(id={self.id!r}, number={self.number!r})'
+
+    def get_replies(self, invitation=None):
+        """
+        Returns the replies of the Note included in ``details``, from ``directReplies`` or ``replies``.
+
+        :param invitation: Invitation id. If provided, only the replies whose invitations include it are returned.
+        :type invitation: str, optional
+
+        :return: List of reply dictionaries
+        :rtype: list[dict]
+        """
+        details = self.details or {}
+        replies = details.get('directReplies', details.get('replies', []))
+        if invitation is None:
+            return list(replies)
+        index = self._replies_index
+        if index is None:
+            index = {}
+            for reply in replies:
+                for reply_invitation in reply.get('invitations', []):
+                    index.setdefault(reply_invitation, []).append(reply)
+            object.__setattr__(self, '_replies_index', index)
+        return list(index.get(invitation, []))
+
+    def get_reply(self, invitation):
+        """
+        Returns the first reply of the Note posted with the given invitation.
+
+        :param invitation: Invitation id
+        :type invitation: str
+
+        :return: Reply dictionary or None if there is no reply with that invitation
+        :rtype: dict
+        """
+        replies = self.get_replies(invitation)
+        return replies[0] if replies else None
+
+    def to_note(self):
+        """
+        :return: A regular Note with the same fields
+        :rtype: Note
+        """
+        return Note.from_json(self._decoded())
@@ -983,8 +983,8 @@ class ARR(object):
     def send_decision_notifications(self, decision_options, messages):
         return self.venue.send_decision_notifications(decision_options,  messages)
 
-    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None):
-        return self.venue.setup_committee_matching(committee_id, compute_affinity_scores, compute_conflicts, compute_conflicts_n_years, alternate_matching_group, submission_track)
+    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None, conflict_workers=None):
+        return self.venue.setup_committee_matching(committee_id, compute_affinity_scores, compute_conflicts, compute_conflicts_n_years, alternate_matching_group, submission_track, conflict_workers=conflict_workers)
 
     def set_assignments(self, assignment_title, committee_id, enable_reviewer_reassignment=False, overwrite=False):
         return self.venue.set_assignments(assignment_title,  committee_id, enable_reviewer_reassignment, overwrite)
@@ -995,8 +995,8 @@ class ARR(object):
     def setup_assignment_recruitment(self, committee_id, hash_seed, due_date, assignment_title=None, invitation_labels={}, email_template=None):
         return self.venue.setup_assignment_recruitment(committee_id,  hash_seed,  due_date, assignment_title, invitation_labels, email_template)
 
-    def set_track_sac_assignments(self, track_sac_file, conflict_policy=None, conflict_n_years=None, track_ac_file=None):
-        return self.venue.set_track_sac_assignments(track_sac_file, conflict_policy, conflict_n_years, track_ac_file)
+    def set_track_sac_assignments(self, track_sac_file, conflict_policy=None, conflict_n_years=None, track_ac_file=None, conflict_workers=None):
+        return self.venue.set_track_sac_assignments(track_sac_file, conflict_policy, conflict_n_years, track_ac_file, conflict_workers=conflict_workers)
 
     def set_SAC_ethics_review_process(self, sac_ethics_flag_duedate=None):
         return self.venue.set_SAC_ethics_review_process(sac_ethics_flag_duedate)
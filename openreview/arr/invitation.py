@@ -32,27 +32,21 @@ class InvitationBuilder(object):
         self.update_date_string = "#{4/mdate} + " + str(self.update_wait_time)
         self.venue_invitation_builder = openreview.venue.InvitationBuilder(venue)
         self.invitation_edit_process = '''def process(client, invitation):
-    meta_invitation = client.get_invitation("''' + self.venue.get_meta_invitation_id() + '''")
-    script = meta_invitation.content["invitation_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, "''' + self.venue.get_meta_invitation_id() + '''", "invitation_edit_script", funcs, client, invitation)
 '''
 
         self.group_edit_process = '''def process(client, invitation):
-    meta_invitation = client.get_invitation("''' + self.venue.get_meta_invitation_id() + '''")
-    script = meta_invitation.content["group_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, "''' + self.venue.get_meta_invitation_id() + '''", "group_edit_script", funcs, client, invitation)
 '''
 
     # Non-blocking custom stage with process/pre-process arguments
@@ -465,13 +459,10 @@ class InvitationBuilder(object):
                     'invitees': [venue_id, self.venue.get_authors_id(number='${3/content/noteNumber/value}')],
                     'cdate': revision_cdate,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['revision_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'revision_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'ddate': {
@@ -507,13 +498,10 @@ class InvitationBuilder(object):
 
         if revision_stage.preprocess_path:
             invitation.edit['invitation']['preprocess'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['revision_preprocess_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'revision_preprocess_script', funcs, client, edit, invitation)
 '''
             invitation.content['revision_preprocess_script'] = {'value': self.get_process_content(revision_stage.preprocess_path)}
 
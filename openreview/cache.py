@@ -0,0 +1,626 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import linecache
+import sqlite3
+import threading
+import time
+
+import openreview
+
+
+class ProfileCache(object):
+    """
+    In-memory LRU cache of Profiles used by :func:`openreview.tools.get_profiles` to avoid fetching the same Profiles
+    several times during a run. A Profile can be looked up by any of its tilde ids or confirmed emails. Every lookup
+    returns a new Profile object, so callers can modify the returned Profiles without changing the cached copies.
+
+    :param maxsize: Maximum number of Profiles kept in the cache, the least recently used Profiles are evicted first
+    :type maxsize: int, optional
+    :param ttl: Time in seconds a cached Profile is considered valid. If None, the Profiles never expire.
+    :type ttl: int, optional
+
+    Example:
+
+    >>> openreview.tools.set_profile_cache(openreview.tools.ProfileCache(ttl=3600))
+    >>> profiles = openreview.tools.get_profiles(client, reviewer_ids)
+    >>> openreview.tools.get_profile_cache().stats()
+    {'hits': 0, 'misses': 2000, 'size': 2000}
+    """
+    def __init__(self, maxsize=100000, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._profiles = OrderedDict()
+        self._aliases = {}
+        self._keys_by_id = {}
+
+    @staticmethod
+    def get_keys(profile):
+        """
+        Returns the keys a Profile can be looked up with: its id, the usernames of its names and its confirmed emails.
+
+        :param profile: Profile to get the keys from
+        :type profile: Profile
+
+        :return: List of keys
+        :rtype: list[str]
+        """
+        content = profile.content or {}
+        keys = [profile.id]
+        keys.extend(name['username'] for name in content.get('names', []) if name.get('username'))
+        keys.extend(email.lower() for email in content.get('emailsConfirmed', []))
+        return keys
+
+    def _resolve(self, key):
+        return self._aliases.get(key)
+
+    def _load(self, profile_id):
+        entry = self._profiles.get(profile_id)
+        if entry is None:
+            return None
+        expires, data = entry
+        if expires is not None and expires < time.time():
+            del self._profiles[profile_id]
+            return None
+        self._profiles.move_to_end(profile_id)
+        return data
+
+    def _store(self, profile_id, keys, data, expires):
+        self._profiles[profile_id] = (expires, data)
+        self._profiles.move_to_end(profile_id)
+        for key in keys:
+            self._aliases[key] = profile_id
+        self._keys_by_id.setdefault(profile_id, set()).update(keys)
+        while len(self._profiles) > self.maxsize:
+            evicted_id, _ = self._profiles.popitem(last=False)
+            for key in self._keys_by_id.pop(evicted_id, []):
+                if self._aliases.get(key) == evicted_id:
+                    del self._aliases[key]
+
+    def _size(self):
+        return len(self._profiles)
+
+    def _clear(self):
+        self._profiles.clear()
+        self._aliases.clear()
+        self._keys_by_id.clear()
+
+    def get_many(self, keys):
+        """
+        Looks up Profiles by tilde id or email. Keys resolving to the same Profile get the same Profile object.
+
+        :param keys: Tilde ids or emails
+        :type keys: list[str]
+
+        :return: Dictionary of found Profiles by key, keys not found in the cache are not included
+        :rtype: dict
+        """
+        found = {}
+        decoded = {}
+        with self._lock:
+            for key in keys:
+                lookup_key = key if key.startswith('~') else key.lower()
+                profile_id = self._resolve(lookup_key)
+                data = self._load(profile_id) if profile_id else None
+                if data is None:
+                    self.misses += 1
+                    continue
+                self.hits += 1
+                if profile_id not in decoded:
+                    decoded[profile_id] = openreview.Profile(**json.loads(data))
+                found[key] = decoded[profile_id]
+        return found
+
+    def get(self, key):
+        """
+        Looks up a single Profile by tilde id or email.
+
+        :param key: Tilde id or email
+        :type key: str
+
+        :return: The cached Profile or None if it is not in the cache
+        :rtype: Profile
+        """
+        return self.get_many([key]).get(key)
+
+    def put(self, profile):
+        """
+        Adds a Profile to the cache. Profiles without an id, like the placeholders created for emails without a Profile, are ignored.
+
+        :param profile: Profile to add
+        :type profile: Profile
+        """
+        if not profile.id or not profile.id.startswith('~'):
+            return
+        data = json.dumps(profile.to_dict() if hasattr(profile, '__slots__') else vars(profile))
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._store(profile.id, self.get_keys(profile), data, expires)
+
+    def put_many(self, profiles):
+        """
+        Adds several Profiles to the cache.
+
+        :param profiles: Profiles to add
+        :type profiles: list[Profile]
+        """
+        for profile in profiles:
+            self.put(profile)
+
+    def clear(self):
+        """
+        Removes all the Profiles from the cache and resets the counters.
+        """
+        with self._lock:
+            self._clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        :return: Dictionary with the number of hits, misses and cached Profiles
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': self._size()
+            }
+
+
+class SQLiteProfileCache(ProfileCache):
+    """
+    Profile cache stored in a SQLite database, so cached Profiles can be shared between runs and processes.
+    It has the same interface as :class:`ProfileCache`.
+
+    :param path: Path to the SQLite database file
+    :type path: str
+    :param maxsize: Maximum number of Profiles kept in the cache, the least recently used Profiles are evicted first
+    :type maxsize: int, optional
+    :param ttl: Time in seconds a cached Profile is considered valid. If None, the Profiles never expire.
+    :type ttl: int, optional
+    """
+    def __init__(self, path, maxsize=1000000, ttl=24 * 3600):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS profiles (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL, accessed REAL NOT NULL)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS aliases (key TEXT PRIMARY KEY, id TEXT NOT NULL)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS profiles_accessed ON profiles (accessed)')
+
+    def _resolve(self, key):
+        row = self._connection.execute('SELECT id FROM aliases WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _load(self, profile_id):
+        row = self._connection.execute('SELECT data, expires FROM profiles WHERE id = ?', (profile_id,)).fetchone()
+        if row is None:
+            return None
+        data, expires = row
+        with self._connection:
+            if expires is not None and expires < time.time():
+                self._connection.execute('DELETE FROM profiles WHERE id = ?', (profile_id,))
+                self._connection.execute('DELETE FROM aliases WHERE id = ?', (profile_id,))
+                return None
+            self._connection.execute('UPDATE profiles SET accessed = ? WHERE id = ?', (time.time(), profile_id))
+        return data
+
+    def _store(self, profile_id, keys, data, expires):
+        with self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO profiles (id, data, expires, accessed) VALUES (?, ?, ?, ?)', (profile_id, data, expires, time.time()))
+            self._connection.executemany('INSERT OR REPLACE INTO aliases (key, id) VALUES (?, ?)', [(key, profile_id) for key in keys])
+            overflow = self._size() - self.maxsize
+            if overflow > 0:
+                evicted_ids = [(row[0],) for row in self._connection.execute('SELECT id FROM profiles ORDER BY accessed LIMIT ?', (overflow,))]
+                self._connection.executemany('DELETE FROM profiles WHERE id = ?', evicted_ids)
+                self._connection.executemany('DELETE FROM aliases WHERE id = ?', evicted_ids)
+
+    def _size(self):
+        return self._connection.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+
+    def _clear(self):
+        with self._connection:
+            self._connection.execute('DELETE FROM profiles')
+            self._connection.execute('DELETE FROM aliases')
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        self._connection.close()
+
+
+class ResponseCache(object):
+    """
+    Cache of the responses of :meth:`openreview.api.OpenReviewClient.get_invitation`, :meth:`~openreview.api.OpenReviewClient.get_group`
+    and :meth:`~openreview.api.OpenReviewClient.get_note`. Cached responses are revalidated with a conditional GET: the request is sent
+    with the ``ETag`` of the cached response and a ``304 Not Modified`` answer is served from the cache without transferring the object
+    again. Responses younger than ``max_age`` seconds are served without contacting the server. The entries of the objects modified by
+    the client's own ``post_*_edit`` and ``delete_*`` calls are removed, and a response is never replaced by one with an older ``tmdate``.
+
+    The raw response body is cached, so every lookup builds new objects and callers can modify them freely. The token is part of the
+    key, so the same cache can be shared by clients of different users.
+
+    :param maxsize: Maximum number of responses kept in the cache, the least recently used responses are evicted first
+    :type maxsize: int, optional
+    :param max_age: Time in seconds a cached response is served without revalidation. With the default of 0 every lookup is revalidated,
+        set it only when the objects are not modified by other users or process functions while the client runs.
+    :type max_age: int, optional
+
+    Example:
+
+    >>> client.set_response_cache(openreview.tools.ResponseCache())
+    >>> client.get_group(venue_id)
+    >>> client.get_response_cache().stats()
+    {'hits': 0, 'revalidated': 0, 'misses': 1, 'invalidated': 0, 'size': 1, 'hit_rate': 0.0}
+    """
+    def __init__(self, maxsize=10000, max_age=0):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.invalidated = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._keys_by_id = {}
+        ## Generation of the last invalidation of each object, bounded like the entries. The generation of the objects
+        ## that are not tracked is the newest generation dropped, so a dropped object never goes back to an older one
+        self._generations = OrderedDict()
+        self._clock = 0
+        self._dropped_generation = 0
+
+    def lookup(self, key):
+        """
+        Returns the cached entry of a request and whether it can be served without revalidation.
+
+        :param key: Request key, a tuple whose second element is the id of the requested object
+        :type key: tuple
+
+        :return: Tuple ``(entry, fresh, generation)``. The entry is a dictionary with the ``body``, ``etag`` and ``tmdate`` of the
+            response or None, the generation must be passed to :meth:`store`
+        :rtype: tuple
+        """
+        with self._lock:
+            generation = self._generations.get(key[1], self._dropped_generation)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False, generation
+            self._entries.move_to_end(key)
+            fresh = self.max_age > 0 and time.time() - entry['stored'] < self.max_age
+            if fresh:
+                self.hits += 1
+            return entry, fresh, generation
+
+    def mark_revalidated(self, key):
+        """
+        Records that the server confirmed the cached response of a request is still valid.
+
+        :param key: Request key
+        :type key: tuple
+        """
+        with self._lock:
+            self.revalidated += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry['stored'] = time.time()
+
+    def store(self, key, body, etag=None, tmdate=None, generation=0):
+        """
+        Stores the response of a request. The response is discarded if the object was invalidated after the request was sent,
+        or if the cached response has a newer ``tmdate``.
+
+        :param key: Request key
+        :type key: tuple
+        :param body: Raw JSON body of the response
+        :type body: bytes
+        :param etag: ``ETag`` header of the response
+        :type etag: str, optional
+        :param tmdate: ``tmdate`` of the returned object
+        :type tmdate: int, optional
+        :param generation: Generation returned by :meth:`lookup` before sending the request
+        :type generation: int, optional
+        """
+        object_id = key[1]
+        with self._lock:
+            self.misses += 1
+            if self._generations.get(object_id, self._dropped_generation) != generation:
+                return
+            current = self._entries.get(key)
+            if current is not None and tmdate is not None and (current['tmdate'] or 0) > tmdate:
+                return
+            self._entries[key] = { 'body': body, 'etag': etag, 'tmdate': tmdate, 'stored': time.time() }
+            self._entries.move_to_end(key)
+            self._keys_by_id.setdefault(object_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                evicted_key, _ = self._entries.popitem(last=False)
+                keys = self._keys_by_id.get(evicted_key[1])
+                if keys is not None:
+                    keys.discard(evicted_key)
+                    if not keys:
+                        del self._keys_by_id[evicted_key[1]]
+
+    def invalidate(self, object_ids):
+        """
+        Removes the cached responses of the given objects.
+
+        :param object_ids: Ids of the invitations, groups or notes to invalidate
+        :type object_ids: list[str]
+        """
+        with self._lock:
+            for object_id in object_ids:
+                if not object_id:
+                    continue
+                self._clock += 1
+                self._generations[object_id] = self._clock
+                self._generations.move_to_end(object_id)
+                for key in self._keys_by_id.pop(object_id, []):
+                    if self._entries.pop(key, None) is not None:
+                        self.invalidated += 1
+            while len(self._generations) > self.maxsize:
+                _, dropped = self._generations.popitem(last=False)
+                self._dropped_generation = max(self._dropped_generation, dropped)
+
+    def clear(self):
+        """
+        Removes all the cached responses and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+            self._generations.clear()
+            self._dropped_generation = self._clock
+            self.hits = 0
+            self.revalidated = 0
+            self.misses = 0
+            self.invalidated = 0
+
+    def stats(self):
+        """
+        Returns the cache counters. Hits are responses served without contacting the server, revalidated responses were confirmed
+        by the server with a ``304 Not Modified`` answer.
+
+        :return: Dictionary with the number of hits, revalidated responses, misses, invalidated responses, cached responses and the hit rate
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self.hits + self.revalidated + self.misses
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'invalidated': self.invalidated,
+                'size': len(self._entries),
+                'hit_rate': (self.hits + self.revalidated) / lookups if lookups else 0.0
+            }
+
+
+
+class ScriptCache(object):
+    """
+    Cache of the scripts that process functions load from their meta invitation. The process functions generated by the
+    invitation builders fetch the meta invitation and run the script stored in one of its content fields every time they
+    fire, see :func:`openreview.tools.run_process_script`. The cache keeps the compiled code objects keyed by the hash of
+    the script, and by the id, ``tmdate`` and field of the meta invitation so unchanged scripts are not hashed either,
+    so a script is only parsed again when it changes.
+
+    Meta invitations younger than ``max_age`` seconds are served without fetching them again. With the default of 0
+    the meta invitation is fetched every time and an updated script is used as soon as it is posted.
+
+    The source of the compiled scripts is registered in :mod:`linecache` so the tracebacks of the process functions
+    show the lines of the script.
+
+    :param maxsize: Maximum number of compiled scripts and meta invitations kept, the least recently used are evicted first
+    :type maxsize: int, optional
+    :param max_age: Time in seconds a fetched meta invitation is used without fetching it again
+    :type max_age: int, optional
+
+    Example:
+
+    >>> funcs = { 'openreview': openreview }
+    >>> openreview.tools.run_process_script(client, invitation.invitations[0], 'review_process_script', funcs, client, edit, invitation)
+    >>> openreview.tools.get_script_cache().stats()
+    {'hits': 0, 'misses': 1, 'invitation_hits': 0, 'size': 1, 'hit_rate': 0.0}
+    """
+    def __init__(self, maxsize=512, max_age=0):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.invitation_hits = 0
+        self._lock = threading.Lock()
+        self._code = OrderedDict()
+        self._digests = OrderedDict()
+        self._invitations = OrderedDict()
+
+    @staticmethod
+    def _evict(entries, maxsize):
+        while len(entries) > maxsize:
+            entries.popitem(last=False)
+
+    def _evict_code(self, maxsize):
+        ## The source of an evicted script is removed from linecache too
+        while len(self._code) > maxsize:
+            _, code = self._code.popitem(last=False)
+            linecache.cache.pop(code.co_filename, None)
+
+    def get_invitation(self, client, invitation_id):
+        """
+        Returns a meta invitation, from the cache if it was fetched less than ``max_age`` seconds ago.
+
+        :param client: Client used to fetch the meta invitation
+        :type client: OpenReviewClient
+        :param invitation_id: Id of the meta invitation
+        :type invitation_id: str
+
+        :return: The meta invitation
+        :rtype: Invitation
+        """
+        key = (client.baseurl, invitation_id)
+        if self.max_age > 0:
+            with self._lock:
+                entry = self._invitations.get(key)
+                if entry and time.time() - entry[0] < self.max_age:
+                    self._invitations.move_to_end(key)
+                    self.invitation_hits += 1
+                    return entry[1]
+        invitation = client.get_invitation(invitation_id)
+        if self.max_age > 0:
+            with self._lock:
+                self._invitations[key] = (time.time(), invitation)
+                self._evict(self._invitations, self.maxsize)
+        return invitation
+
+    def compile(self, script, filename='<process>', version=None):
+        """
+        Returns the code object of a script, compiling it only if it is not cached.
+
+        :param script: Source of the script
+        :type script: str
+        :param filename: Name of the script shown in the tracebacks
+        :type filename: str, optional
+        :param version: Key that identifies this version of the script, e.g. the id, ``tmdate`` and field of the meta
+            invitation. When it is known the script is not hashed.
+        :type version: tuple, optional
+
+        :return: Compiled script
+        :rtype: code
+        """
+        with self._lock:
+            digest = self._digests.get(version) if version else None
+            code = self._code.get(digest) if digest else None
+            if code is not None:
+                self._code.move_to_end(digest)
+                self.hits += 1
+                return code
+        digest = hashlib.sha256(script.encode('utf-8')).hexdigest()
+        with self._lock:
+            code = self._code.get(digest)
+            if code is not None:
+                self._code.move_to_end(digest)
+                self.hits += 1
+        if code is None:
+            filename = f'<{filename}:{digest[:12]}>'
+            code = compile(script, filename, 'exec')
+            linecache.cache[filename] = (len(script), None, script.splitlines(True), filename)
+            with self._lock:
+                self.misses += 1
+                self._code[digest] = code
+                self._evict_code(self.maxsize)
+        if version:
+            with self._lock:
+                self._digests[version] = digest
+                self._evict(self._digests, self.maxsize)
+        return code
+
+    def clear(self):
+        """
+        Removes all the cached scripts and meta invitations and resets the counters.
+        """
+        with self._lock:
+            self._evict_code(0)
+            self._digests.clear()
+            self._invitations.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invitation_hits = 0
+
+    def stats(self):
+        """
+        Returns the cache counters. Hits are scripts that were not compiled again, invitation hits are meta invitations
+        served without fetching them.
+
+        :return: Dictionary with the number of hits, misses, invitation hits, compiled scripts and the hit rate
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invitation_hits': self.invitation_hits,
+                'size': len(self._code),
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight, other threads calling :meth:`do` with the same key
+    wait for it and receive a copy of its result, or its exception, instead of repeating the call. Used by
+    :class:`openreview.api.OpenReviewClient` so that worker threads issuing the same GET at the same time share one request.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, function):
+        """
+        Calls ``function`` unless a call with the same key is already in flight, in which case it waits for that call.
+
+        :param key: Key identifying identical calls
+        :type key: tuple
+        :param function: Function without arguments that performs the call
+        :type function: function
+
+        :return: Result of the call. The threads that waited get a deep copy, so every caller can modify its result.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._in_flight.get(key)
+            if call is None:
+                call = { 'event': threading.Event(), 'waiters': 0, 'result': None, 'error': None }
+                self._in_flight[key] = call
+                leader = True
+            else:
+                call['waiters'] += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call['event'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return copy.deepcopy(call['result'])
+
+        result = None
+        try:
+            result = function()
+            return result
+        except BaseException as error:
+            call['error'] = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                waiters = call['waiters']
+            if waiters and call['error'] is None:
+                ## the waiters copy a snapshot taken before the leader returns and can modify its own result
+                call['result'] = copy.deepcopy(result)
+            call['event'].set()
+
+    def stats(self):
+        """
+        Returns the counters of the calls.
+
+        :return: Dictionary with the number of calls, coalesced calls and calls in flight
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._in_flight)
+            }
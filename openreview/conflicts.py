@@ -0,0 +1,568 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import inspect
+import os
+import pickle
+import threading
+
+import openreview
+
+# Default number of processes used by ConflictComputer, 1 computes the conflicts in the current process
+CONFLICT_WORKERS = int(os.environ.get('OPENREVIEW_CONFLICT_WORKERS', 1))
+
+
+def merge_profile_info(profiles_info):
+    """
+    Merges the conflict info of several Profiles, for example the authors of a submission, into a single set of tokens.
+
+    :param profiles_info: Conflict info returned by one of the conflict policies, e.g. :func:`openreview.tools.get_profile_info`
+    :type profiles_info: list[dict]
+
+    :return: Dictionary with the sets of ids, domains, emails, relations and publications
+    :rtype: dict
+    """
+    merged = {
+        'ids': set(),
+        'domains': set(),
+        'emails': set(),
+        'relations': set(),
+        'publications': set()
+    }
+    for info in profiles_info:
+        merged['ids'].add(info['id'])
+        merged['domains'].update(info['domains'])
+        merged['emails'].update(info.get('emails', []))
+        merged['relations'].update(info['relations'])
+        merged['publications'].update(info['publications'])
+    return merged
+
+
+COMMON_DOMAINS = frozenset(['gmail.com', 'qq.com', '126.com', '163.com',
+    'outlook.com', 'hotmail.com', 'yahoo.com', 'foxmail.com', 'aol.com', 'msn.com', 'ymail.com', 'googlemail.com', 'live.com',
+    'independent-researcher.org'])
+
+
+class ProfileInfo(object):
+    """
+    Immutable conflict info of a Profile. It can be read like the dictionaries returned by the conflict policies, e.g.
+    ``info['domains']``.
+
+    :param id: Profile id
+    :type id: str
+    :param domains: Domains and subdomains of the Profile
+    :type domains: frozenset
+    :param emails: Emails of the Profile
+    :type emails: frozenset
+    :param relations: Ids of the relations of the Profile
+    :type relations: frozenset
+    :param publications: Ids of the publications of the Profile
+    :type publications: frozenset
+    """
+    __slots__ = ('id', 'domains', 'emails', 'relations', 'publications')
+
+    def __init__(self, id, domains=(), emails=(), relations=(), publications=()):
+        object.__setattr__(self, 'id', id)
+        object.__setattr__(self, 'domains', frozenset(domains))
+        object.__setattr__(self, 'emails', frozenset(emails))
+        object.__setattr__(self, 'relations', frozenset(relations))
+        object.__setattr__(self, 'publications', frozenset(publications))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ProfileInfo is immutable')
+
+    def __reduce__(self):
+        return (ProfileInfo, (self.id, self.domains, self.emails, self.relations, self.publications))
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __eq__(self, other):
+        if not isinstance(other, ProfileInfo):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.id, self.domains, self.emails, self.relations, self.publications))
+
+    def __repr__(self):
+        return 'ProfileInfo(' + ', '.join(f'{key}={getattr(self, key)!r}' for key in self.__slots__) + ')'
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self):
+        return list(self.__slots__)
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.__slots__]
+
+    def to_json(self):
+        """
+        Converts the ProfileInfo to a dictionary of lists.
+
+        :return: Dictionary with the id, domains, emails, relations and publications
+        :rtype: dict
+        """
+        return { key: getattr(self, key) if key == 'id' else sorted(getattr(self, key)) for key in self.__slots__ }
+
+
+def compact_profile_info(info):
+    """
+    Converts the conflict info of a Profile to a compact form that is cheap to send to other processes.
+
+    :param info: Conflict info returned by one of the conflict policies
+    :type info: dict
+
+    :return: Immutable conflict info
+    :rtype: ProfileInfo
+    """
+    if isinstance(info, ProfileInfo):
+        return info
+    return ProfileInfo(info['id'], info['domains'], info.get('emails', []), info['relations'], info['publications'])
+
+
+class ConflictPolicy(object):
+    """
+    Extracts the conflict info of Profiles with a policy function like :func:`openreview.tools.get_profile_info`.
+    The signature of the function is inspected once, the domains are expanded with their subdomains and the common
+    email providers are removed. The results are cached per Profile id and version, number of years and venue id, so
+    getting the info of the same Profile again, e.g. for every submission of an author, does not run the policy again.
+    Profiles changed locally keep their version, use :meth:`run` or :meth:`clear_cache` to get their new info.
+
+    :param function: Policy function, it receives the Profile, the number of years and optionally the ``submission_venueid``
+    :type function: function
+    :param name: Name of the policy
+    :type name: str, optional
+    :param maxsize: Maximum number of cached results
+    :type maxsize: int, optional
+
+    Example:
+
+    >>> policy = openreview.tools.register_conflict_policy('Strict', get_strict_profile_info)
+    >>> policy(profile, 3)['domains']
+    frozenset({'umass.edu'})
+    """
+    def __init__(self, function, name=None, maxsize=100000):
+        self.function = function
+        self.name = name or getattr(function, '__name__', repr(function))
+        self.maxsize = maxsize
+        self.with_submission_venueid = 'submission_venueid' in inspect.getfullargspec(function).args
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return { 'function': self.function, 'name': self.name, 'maxsize': self.maxsize }
+
+    def __setstate__(self, state):
+        self.__init__(state['function'], name=state['name'], maxsize=state['maxsize'])
+
+    def __repr__(self):
+        return f'ConflictPolicy({self.name})'
+
+    def _get_cache_key(self, profile, n_years, submission_venueid):
+        ## Only Profiles loaded from the server have a version, Profiles built locally are not cached
+        if not profile.tmdate:
+            return None
+        return (profile.id, profile.tmdate, n_years, submission_venueid)
+
+    def run(self, profile, n_years=None, submission_venueid=None):
+        """
+        Runs the policy function without the cache.
+
+        :return: Dictionary returned by the policy function, with the expanded domains as a list
+        :rtype: dict
+        """
+        if self.with_submission_venueid:
+            result = self.function(profile, n_years, submission_venueid)
+        else:
+            result = self.function(profile, n_years)
+        return dict(result, domains=list(set(openreview.tools.subdomains_many(result['domains'])) - COMMON_DOMAINS))
+
+    def __call__(self, profile, n_years=None, submission_venueid=None):
+        key = self._get_cache_key(profile, n_years, submission_venueid)
+        if key is not None:
+            with self._lock:
+                info = self._cache.get(key)
+                if info is not None:
+                    self._cache.move_to_end(key)
+                    return info
+
+        result = self.run(profile, n_years, submission_venueid)
+        info = ProfileInfo(result['id'], result['domains'], result.get('emails', []), result['relations'], result['publications'])
+
+        if key is not None:
+            with self._lock:
+                self._cache[key] = info
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return info
+
+    def clear_cache(self):
+        """
+        Removes all the cached results.
+        """
+        with self._lock:
+            self._cache.clear()
+
+
+_policies = {}
+_policies_lock = threading.RLock()
+
+def register_conflict_policy(name, function):
+    """
+    Registers a policy function so it can be used by name, e.g. in :func:`openreview.tools.get_conflicts` or :class:`ConflictComputer`.
+
+    :param name: Name of the policy
+    :type name: str
+    :param function: Policy function, see :class:`ConflictPolicy`
+    :type function: function
+
+    :return: The registered policy
+    :rtype: ConflictPolicy
+    """
+    policy = ConflictPolicy(function, name=name)
+    with _policies_lock:
+        _policies[name] = policy
+        _policies[function] = policy
+    return policy
+
+def get_conflict_policy(policy='default'):
+    """
+    Gets a registered policy. The built-in policies are 'default', 'NeurIPS' and 'Comprehensive'. Functions that are
+    not registered get a new policy that is not kept, so its cache lives as long as the caller uses it; register the
+    function with :func:`register_conflict_policy` to share the cache between callers.
+
+    :param policy: Name of the policy, policy function or policy
+    :type policy: str or function or ConflictPolicy, optional
+
+    :return: The policy
+    :rtype: ConflictPolicy
+    """
+    if isinstance(policy, ConflictPolicy):
+        return policy
+    with _policies_lock:
+        if 'default' not in _policies:
+            register_conflict_policy('default', openreview.tools.get_profile_info)
+            register_conflict_policy('NeurIPS', openreview.tools.get_neurips_profile_info)
+            register_conflict_policy('Comprehensive', openreview.tools.get_comprehensive_profile_info)
+        if policy in _policies:
+            return _policies[policy]
+        if not callable(policy):
+            return _policies['default']
+    return ConflictPolicy(policy)
+
+
+def get_conflict_details(authors_info, user_info, compare_emails=False):
+    """
+    Gets the tokens that make a user be in conflict with a group of authors.
+
+    :param authors_info: Merged conflict info of the authors, as returned by :func:`merge_profile_info`
+    :type authors_info: dict
+    :param user_info: Conflict info of the user
+    :type user_info: dict
+    :param compare_emails: If True, the emails shared by the user and the authors are conflicts too
+    :type compare_emails: bool, optional
+
+    :return: Sorted list of conflicts
+    :rtype: list[str]
+    """
+    conflicts = set()
+    conflicts.update(authors_info['ids'].intersection([user_info['id']]))
+    conflicts.update(authors_info['domains'].intersection(user_info['domains']))
+    conflicts.update(authors_info['relations'].intersection([user_info['id']]))
+    conflicts.update(authors_info['ids'].intersection(user_info['relations']))
+    if compare_emails:
+        conflicts.update(authors_info['emails'].intersection(user_info.get('emails', [])))
+    conflicts.update(authors_info['publications'].intersection(user_info['publications']))
+    return sorted(conflicts)
+
+
+class ConflictIndex(object):
+    """
+    Inverted index from the ids, domains, relations and publications of a list of users to their position in the list.
+    It finds the users in conflict with a group of authors with one lookup per author token, instead of intersecting
+    the author tokens with the info of every user.
+
+    A user is in conflict with the authors when:
+
+    - the user is one of the authors
+    - the user shares a domain with any of the authors
+    - the user is a relation of any of the authors
+    - any of the authors is a relation of the user
+    - the user shares a publication with any of the authors
+    - the user shares an email with any of the authors, only if ``compare_emails`` is True
+
+    :param users_info: Conflict info of the users, as returned by one of the conflict policies
+    :type users_info: list[dict]
+    :param compare_emails: If True, the users sharing an email with the authors are in conflict too
+    :type compare_emails: bool, optional
+
+    Example:
+
+    >>> index = openreview.tools.ConflictIndex(reviewers_info)
+    >>> index.find(openreview.tools.merge_profile_info(authors_info))
+    [0, 12, 37]
+    """
+    def __init__(self, users_info, compare_emails=False):
+        self.users_info = list(users_info)
+        self.compare_emails = compare_emails
+        self._by_id = defaultdict(list)
+        self._by_domain = defaultdict(list)
+        self._by_email = defaultdict(list)
+        self._by_relation = defaultdict(list)
+        self._by_publication = defaultdict(list)
+
+        for position, info in enumerate(self.users_info):
+            self._by_id[info['id']].append(position)
+            for domain in set(info['domains']):
+                self._by_domain[domain].append(position)
+            if compare_emails:
+                for email in set(info.get('emails', [])):
+                    self._by_email[email].append(position)
+            for relation in set(info['relations']):
+                self._by_relation[relation].append(position)
+            for publication in set(info['publications']):
+                self._by_publication[publication].append(position)
+
+    def __len__(self):
+        return len(self.users_info)
+
+    def find(self, authors_info):
+        """
+        Finds the users in conflict with a group of authors.
+
+        :param authors_info: Merged conflict info of the authors, as returned by :func:`merge_profile_info`
+        :type authors_info: dict
+
+        :return: Sorted positions of the users in conflict
+        :rtype: list[int]
+        """
+        positions = set()
+        for token in authors_info['ids'] | authors_info['relations']:
+            positions.update(self._by_id.get(token, ()))
+        for token in authors_info['ids']:
+            positions.update(self._by_relation.get(token, ()))
+        for token in authors_info['domains']:
+            positions.update(self._by_domain.get(token, ()))
+        for token in authors_info['publications']:
+            positions.update(self._by_publication.get(token, ()))
+        if self.compare_emails:
+            for token in authors_info.get('emails', ()):
+                positions.update(self._by_email.get(token, ()))
+        return sorted(positions)
+
+
+class _ConflictFinder(object):
+
+    def __init__(self, users_info, sacs_by_ac=None, sac_info_by_id=None, pcs_by_sac=None, pc_info_by_id=None, compare_emails=False):
+        self.compare_emails = compare_emails
+        self.users_index = ConflictIndex(users_info, compare_emails=compare_emails)
+        self.sacs_by_ac = sacs_by_ac or {}
+        self.pcs_by_sac = pcs_by_sac or {}
+        self.sac_info_by_id = sac_info_by_id or {}
+        self.pc_info_by_id = pc_info_by_id or {}
+
+        self.sac_ids = list(self.sac_info_by_id.keys())
+        self.sacs_index = ConflictIndex([self.sac_info_by_id[sac_id] for sac_id in self.sac_ids], compare_emails=compare_emails) if self.sacs_by_ac else None
+        self.pc_ids = list(self.pc_info_by_id.keys())
+        self.pcs_index = ConflictIndex([self.pc_info_by_id[pc_id] for pc_id in self.pc_ids], compare_emails=compare_emails) if self.sacs_by_ac and self.pcs_by_sac else None
+
+        ## Area Chair positions by assigned Senior Area Chair and by Program Chair assigned to those Senior Area Chairs
+        self.acs_by_sac = defaultdict(set)
+        self.acs_by_pc = defaultdict(set)
+        for position, info in enumerate(self.users_index.users_info):
+            for sac in self.sacs_by_ac.get(info['id'], []):
+                self.acs_by_sac[sac].add(position)
+                if self.pcs_by_sac.get(sac) is not None:
+                    self.acs_by_pc[self.pcs_by_sac[sac]].add(position)
+
+    def find(self, submission_info):
+        positions = set(self.users_index.find(submission_info))
+        if self.sacs_index is not None:
+            for sac_position in self.sacs_index.find(submission_info):
+                positions.update(self.acs_by_sac.get(self.sac_ids[sac_position], ()))
+        if self.pcs_index is not None:
+            for pc_position in self.pcs_index.find(submission_info):
+                positions.update(self.acs_by_pc.get(self.pc_ids[pc_position], ()))
+        return sorted(positions)
+
+    def details(self, submission_info, position):
+        user_info = self.users_index.users_info[position]
+        conflicts = get_conflict_details(submission_info, user_info, self.compare_emails)
+        assigned_sacs = self.sacs_by_ac.get(user_info['id'], [])
+        ## Transfer SAC conflicts
+        if not conflicts:
+            conflicts = sorted(set().union(*[get_conflict_details(submission_info, self.sac_info_by_id[sac], self.compare_emails) for sac in assigned_sacs if self.sac_info_by_id.get(sac)]))
+        ## Transfer PC conflicts
+        if not conflicts and self.pcs_by_sac:
+            assigned_pcs = [self.pcs_by_sac.get(sac) for sac in assigned_sacs]
+            conflicts = sorted(set().union(*[get_conflict_details(submission_info, self.pc_info_by_id[pc], self.compare_emails) for pc in assigned_pcs if self.pc_info_by_id.get(pc)]))
+        return conflicts
+
+    def find_all(self, submissions_info, with_details=False):
+        if with_details:
+            return [[(position, self.details(submission_info, position)) for position in self.find(submission_info)] for submission_info in submissions_info]
+        return [self.find(submission_info) for submission_info in submissions_info]
+
+
+def find_conflicts(submissions_info, users_info, sacs_by_ac=None, sac_info_by_id=None, pcs_by_sac=None, pc_info_by_id=None, compare_emails=False, with_details=False):
+    """
+    Finds the users in conflict with each submission.
+
+    When ``sacs_by_ac`` is passed the users are Area Chairs and the conflicts of their assigned Senior Area Chairs are
+    transferred to them. When ``pcs_by_sac`` is passed too, the conflicts of the Program Chairs assigned to those
+    Senior Area Chairs are also transferred.
+
+    :param submissions_info: Merged conflict info of the authors of each submission, as returned by :func:`merge_profile_info`
+    :type submissions_info: list[dict]
+    :param users_info: Conflict info of the users
+    :type users_info: list[dict]
+    :param sacs_by_ac: Senior Area Chair ids assigned to each Area Chair id
+    :type sacs_by_ac: dict, optional
+    :param sac_info_by_id: Conflict info of the Senior Area Chairs by id
+    :type sac_info_by_id: dict, optional
+    :param pcs_by_sac: Program Chair id assigned to each Senior Area Chair id
+    :type pcs_by_sac: dict, optional
+    :param pc_info_by_id: Conflict info of the Program Chairs by id
+    :type pc_info_by_id: dict, optional
+    :param compare_emails: If True, the users sharing an email with the authors are in conflict too
+    :type compare_emails: bool, optional
+    :param with_details: If True, each position is returned in a tuple with the list of conflicts, see :func:`get_conflict_details`
+    :type with_details: bool, optional
+
+    :return: Sorted positions of the users in conflict, for each submission
+    :rtype: list[list[int]]
+    """
+    finder = _ConflictFinder(users_info, sacs_by_ac=sacs_by_ac, sac_info_by_id=sac_info_by_id, pcs_by_sac=pcs_by_sac, pc_info_by_id=pc_info_by_id, compare_emails=compare_emails)
+    return finder.find_all(submissions_info, with_details=with_details)
+
+
+_worker_finder = None
+
+def _init_worker(finder):
+    global _worker_finder
+    _worker_finder = finder
+
+def _find_shard(args):
+    submissions_info, with_details = args
+    return _worker_finder.find_all(submissions_info, with_details=with_details)
+
+class _PublicationInfo(object):
+    ## Fields of a publication read by the conflict policies, see openreview.tools.CONFLICT_PUBLICATION_FIELDS
+    __slots__ = ('id', 'pdate', 'cdate', 'tcdate', 'content')
+
+    def __init__(self, publication):
+        content = getattr(publication, 'content', None) or {}
+        self.id = publication.id
+        self.pdate = getattr(publication, 'pdate', None)
+        self.cdate = getattr(publication, 'cdate', None)
+        self.tcdate = getattr(publication, 'tcdate', None)
+        self.content = { key: content[key] for key in ('year', 'venueid') if key in content }
+
+    def __getstate__(self):
+        return tuple(getattr(self, key) for key in self.__slots__)
+
+    def __setstate__(self, state):
+        for key, value in zip(self.__slots__, state):
+            setattr(self, key, value)
+
+def _compact_profile(profile):
+    ## Copy of the Profile sent to the workers, its publications only keep the fields read by the conflict policies
+    content = profile.content or {}
+    return openreview.Profile(id=profile.id, tmdate=profile.tmdate, content=dict(content, publications=[_PublicationInfo(publication) for publication in content.get('publications', [])]))
+
+def _get_info_chunk(args):
+    policy, n_years, submission_venueid, profiles = args
+    conflict_policy = get_conflict_policy(policy)
+    return [conflict_policy(profile, n_years, submission_venueid) for profile in profiles]
+
+
+class ConflictComputer(object):
+    """
+    Computes conflicts, optionally in a pool of processes. By default everything runs in the current process, which is
+    what process functions and web workers need. With ``max_workers`` greater than 1 the conflict info of the Profiles is
+    extracted in a pool of processes, and the submissions are split in shards that are matched against the users in the
+    same pool. The workers only receive the compact conflict info of the users, built once per worker, and the info of
+    their shard of submissions. The Profiles sent to the workers only keep the id, pdate, cdate, tcdate, year and venueid
+    of their publications, so custom policies run in a pool only see the ``year`` and ``venueid`` of the publication
+    content.
+
+    Small inputs, and policies that can not be sent to other processes like lambdas, are computed in the current process.
+
+    :param policy: Name of a registered policy like 'default', 'NeurIPS' or 'Comprehensive', a function with the same signature as :func:`openreview.tools.get_profile_info` or a :class:`ConflictPolicy`
+    :type policy: str or function or ConflictPolicy, optional
+    :param n_years: Number of years to consider when getting the conflict info of the Profiles
+    :type n_years: int, optional
+    :param max_workers: Number of processes, e.g. ``multiprocessing.cpu_count()``. Defaults to :data:`CONFLICT_WORKERS`, set with the ``OPENREVIEW_CONFLICT_WORKERS`` environment variable, which is 1 unless set: no processes are started.
+    :type max_workers: int, optional
+    :param chunksize: Number of Profiles or submissions sent to a process at a time
+    :type chunksize: int, optional
+    :param compare_emails: If True, the users sharing an email with the authors are in conflict too
+    :type compare_emails: bool, optional
+
+    Example:
+
+    >>> computer = openreview.tools.ConflictComputer(policy='NeurIPS', n_years=3, max_workers=multiprocessing.cpu_count())
+    >>> reviewers_info = computer.get_info(reviewer_profiles)
+    >>> submissions_info = [openreview.tools.merge_profile_info(computer.get_info(profiles)) for profiles in author_profiles]
+    >>> computer.compute(submissions_info, reviewers_info)
+    """
+    def __init__(self, policy='default', n_years=None, max_workers=None, chunksize=500, compare_emails=False):
+        self.policy = policy
+        self.n_years = n_years
+        self.max_workers = max_workers or CONFLICT_WORKERS
+        self.chunksize = chunksize
+        self.compare_emails = compare_emails
+
+    def _is_parallel(self, size, *payload):
+        if self.max_workers < 2 or size <= self.chunksize:
+            return False
+        try:
+            pickle.dumps(payload)
+        except Exception:
+            return False
+        return True
+
+    def get_info(self, profiles, submission_venueid=None):
+        """
+        Extracts the conflict info of each Profile with the policy of the computer.
+
+        :param profiles: Profiles loaded with their publications and relations
+        :type profiles: list[Profile]
+        :param submission_venueid: venue id passed to the policies that have a ``submission_venueid`` argument
+        :type submission_venueid: str, optional
+
+        :return: Compact conflict info of each Profile, see :func:`compact_profile_info`
+        :rtype: list[dict]
+        """
+        profiles = list(profiles)
+        if not self._is_parallel(len(profiles), self.policy):
+            return _get_info_chunk((self.policy, self.n_years, submission_venueid, profiles))
+
+        chunks = [(self.policy, self.n_years, submission_venueid, [_compact_profile(profile) for profile in profiles[i:i + self.chunksize]]) for i in range(0, len(profiles), self.chunksize)]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return [info for chunk in executor.map(_get_info_chunk, chunks) for info in chunk]
+
+    def compute(self, submissions_info, users_info, sacs_by_ac=None, sac_info_by_id=None, pcs_by_sac=None, pc_info_by_id=None, with_details=False):
+        """
+        Finds the users in conflict with each submission, see :func:`find_conflicts` for the description of the arguments.
+
+        :return: Sorted positions of the users in conflict, for each submission
+        :rtype: list[list[int]]
+        """
+        finder = _ConflictFinder(users_info, sacs_by_ac=sacs_by_ac, sac_info_by_id=sac_info_by_id, pcs_by_sac=pcs_by_sac, pc_info_by_id=pc_info_by_id, compare_emails=self.compare_emails)
+        submissions_info = list(submissions_info)
+        if not self._is_parallel(len(submissions_info)):
+            return finder.find_all(submissions_info, with_details=with_details)
+
+        shards = [(submissions_info[i:i + self.chunksize], with_details) for i in range(0, len(submissions_info), self.chunksize)]
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker, initargs=(finder,)) as executor:
+            return [conflicts for shard in executor.map(_find_shard, shards) for conflicts in shard]
@@ -26,17 +26,17 @@ class Assignment(object):
                 raise openreview.OpenReviewException(f'Failed during bulk post of {edges[0].invitation} edges! Edges found: {len(edges)}, Edges posted: {edges_posted}')
                
 
-    def setup_ae_assignment(self, note, job_id=None):
+    def setup_ae_assignment(self, note, job_id=None, conflict_workers=None):
         print('Start setup AE assignment...')
         venue_id=self.journal.venue_id
         action_editors_id=self.journal.get_action_editors_id()
         authors_id=self.journal.get_authors_id(number=note.number)
 
         action_editors = self.journal.get_action_editors()
-        action_editor_profiles = tools.get_profiles(self.client, action_editors, with_publications=True, with_relations=True)
+        action_editor_profiles = tools.get_profiles(self.client, action_editors, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
         authors = self.journal.get_authors(number=note.number)
-        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
+        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
         ## Create affinity scores
         affinity_score_edges = []
@@ -58,9 +58,7 @@ class Assignment(object):
 
         ## Create conflicts
         conflict_edges = []
-        for action_editor_profile in tqdm(action_editor_profiles):
-
-            conflicts = tools.get_conflicts(author_profiles, action_editor_profile, policy='NeurIPS', n_years=3)
+        for action_editor_profile, conflicts in tqdm(self.get_conflicts(author_profiles, action_editor_profiles, max_workers=conflict_workers)):
             if conflicts:
                 print('Compute AE conflict', note.id, action_editor_profile.id, conflicts)
                 edge = Edge(invitation = self.journal.get_ae_conflict_id(),
@@ -78,7 +76,7 @@ class Assignment(object):
         print('Finished setup AE assignment.')
         
 
-    def setup_reviewer_assignment(self, note, job_id=None):
+    def setup_reviewer_assignment(self, note, job_id=None, conflict_workers=None):
         print('Start setup Reviewer assignment...')
         
         venue_id=self.journal.venue_id
@@ -86,10 +84,10 @@ class Assignment(object):
         authors_id = self.journal.get_authors_id(number=note.number)
 
         reviewers = self.journal.get_reviewers()
-        reviewer_profiles = tools.get_profiles(self.client, reviewers, with_publications=True, with_relations=True)
+        reviewer_profiles = tools.get_profiles(self.client, reviewers, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
         authors = self.journal.get_authors(number=note.number)
-        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
+        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
         ## Create affinity scores
         affinity_score_edges = []
@@ -112,9 +110,7 @@ class Assignment(object):
 
         ## Create conflicts
         conflict_edges = []
-        for reviewer_profile in tqdm(reviewer_profiles):
-
-            conflicts = tools.get_conflicts(author_profiles, reviewer_profile, policy='NeurIPS', n_years=3)
+        for reviewer_profile, conflicts in tqdm(self.get_conflicts(author_profiles, reviewer_profiles, max_workers=conflict_workers)):
             if conflicts:
                 print('Compute Reviewer conflict', note.id, reviewer_profile.id, conflicts)
                 edge = Edge(invitation = self.journal.get_reviewer_conflict_id(),
@@ -132,12 +128,18 @@ class Assignment(object):
         self.post_submission_edges(conflict_edges)
         print('Finished setup Reviewer assignment.')
 
+    def get_conflicts(self, author_profiles, user_profiles, max_workers=None):
+        conflict_computer = tools.ConflictComputer(policy='NeurIPS', n_years=3, compare_emails=True, max_workers=max_workers)
+        submission_info = tools.merge_profile_info(conflict_computer.get_info(author_profiles))
+        conflicts = conflict_computer.compute([submission_info], conflict_computer.get_info(user_profiles), with_details=True)[0]
+        return [(user_profiles[position], details) for position, details in conflicts]
+
     def compute_conflicts(self, note, reviewer):
 
-        reviewer_profiles = tools.get_profiles(self.client, [reviewer], with_publications=True, with_relations=True)
+        reviewer_profiles = tools.get_profiles(self.client, [reviewer], with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
         authors = self.journal.get_authors(number=note.number)
-        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
+        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
         return tools.get_conflicts(author_profiles, reviewer_profiles[0], policy='NeurIPS', n_years=3)
 
@@ -123,30 +123,24 @@ class InvitationBuilder(object):
     
     def get_super_process_content(self, field_name):
         return '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content["''' + field_name + '''"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], "''' + field_name + '''", funcs, client, edit, invitation)
 '''
 
     def get_super_dateprocess_content(self, field_name, invitation_id=None, days_late_map={}):
-        meta_invitation = 'client.get_invitation("' + invitation_id + '")' if invitation_id else "client.get_invitation(invitation.invitations[0])"
+        meta_invitation_id = '"' + invitation_id + '"' if invitation_id else "invitation.invitations[0]"
 
         return '''def process(client, invitation):
-    meta_invitation = ''' + meta_invitation + '''
-    script = meta_invitation.content["''' + field_name + '''"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index,
         'days_late_map' : ''' + json.dumps(days_late_map) + '''
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, ''' + meta_invitation_id + ''', "''' + field_name + '''", funcs, client, invitation)
 '''
     
     def get_process_content(self, file_path):
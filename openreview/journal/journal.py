@@ -529,7 +529,7 @@ class Journal(object):
         """
         return self.client.get_group(self.get_authors_id(number=number)).members
 
-    def setup_ae_assignment(self, note):
+    def setup_ae_assignment(self, note, conflict_workers=None):
         """Compute affinity scores and conflict-of-interest edges for action editor assignment on a submission.
 
         Runs the expertise model to produce AE affinity score edges and computes
@@ -540,10 +540,12 @@ class Journal(object):
 
         :param note: The submission note to set up AE assignment for.
         :type note: openreview.api.Note
+        :param conflict_workers: Number of processes used to compute the conflicts, see :class:`openreview.tools.ConflictComputer`.
+        :type conflict_workers: int, optional
         """
-        return self.assignment.setup_ae_assignment(note)
+        return self.assignment.setup_ae_assignment(note, conflict_workers=conflict_workers)
 
-    def setup_reviewer_assignment(self, note):
+    def setup_reviewer_assignment(self, note, conflict_workers=None):
         """Compute affinity scores and conflict-of-interest edges for reviewer assignment on a submission.
 
         Runs the expertise model to produce reviewer affinity score edges and computes
@@ -554,8 +556,10 @@ class Journal(object):
 
         :param note: The submission note to set up reviewer assignment for.
         :type note: openreview.api.Note
+        :param conflict_workers: Number of processes used to compute the conflicts, see :class:`openreview.tools.ConflictComputer`.
+        :type conflict_workers: int, optional
         """
-        return self.assignment.setup_reviewer_assignment(note)
+        return self.assignment.setup_reviewer_assignment(note, conflict_workers=conflict_workers)
 
     def invite_action_editors(self, message, subject, invitees, invitee_names=None):
         """Send recruitment emails to invite people to serve as action editors.
@@ -46,6 +46,9 @@ The {journal.short_name} Editors-in-Chief
         sender=journal.get_message_sender()
     )
 
+    ## emails to the action editors and the editors in chief, a failed email does not stop the others
+    queue = openreview.tools.MessageQueue(client)
+
     ## send email to AE
     if date_index > 0:
         ## get preferred names
@@ -53,7 +56,7 @@ The {journal.short_name} Editors-in-Chief
         ## send email to action editors
         print('send email to action editors')
         for profile in profiles:
-            client.post_message(
+            queue.add(
                 invitation=journal.get_meta_invitation_id(),
                 recipients=[journal.get_action_editors_id(number=submission.number)],
                 subject=f'''[{journal.short_name}] Reviewer is late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
@@ -75,13 +78,13 @@ The {journal.short_name} Editors-in-Chief
                 replyTo=journal.contact_info,
                 signature=journal.venue_id,
                 sender=journal.get_message_sender()
-        )
+            )
 
     ## send email to EICs
     if date_index > 2 or days_late == 'one month':
         profiles = openreview.tools.get_profiles(client, late_invitees)
         for profile in profiles:
-            client.post_message(
+            queue.add(
                 invitation=journal.get_meta_invitation_id(),
                 recipients=[journal.get_editors_in_chief_id()],
                 ignoreRecipients=[journal.get_authors_id(number=submission.number)],
@@ -100,6 +103,6 @@ OpenReview Team
                 replyTo=journal.contact_info,
                 signature=journal.venue_id,
                 sender=journal.get_message_sender()
-        )        
+            )
 
-    
\ No newline at end of file
+    queue.close()
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import openreview
+
+
+def get_failures_exception(failures, total):
+    """
+    Builds the error raised when some messages of a batch could not be posted.
+
+    :param failures: Failed results, each one with the ``message`` and its ``error``
+    :type failures: list[dict]
+    :param total: Number of messages of the batch
+    :type total: int
+
+    :return: Exception listing the subject, the recipients and the error of every failed message
+    :rtype: OpenReviewException
+    """
+    lines = [f'{failure["message"]["subject"]} to {", ".join(failure["message"]["recipients"])}: {failure["error"]}' for failure in failures]
+    return openreview.OpenReviewException(f'Failed to post {len(failures)} of {total} messages:\n' + '\n'.join(lines))
+
+
+class MessageQueue(object):
+    """
+    Collects the messages of a process and posts them in batches with
+    :meth:`openreview.api.OpenReviewClient.post_messages_bulk`, so the messages are posted concurrently and the ones that
+    only differ in their recipients, e.g. the same reminder sent to every late reviewer, are posted once. A message that
+    fails does not stop the others, the failures are kept in :attr:`failures`.
+
+    The queue is flushed when it has ``batch_size`` messages and when it is closed, at the end of the ``with`` block.
+    Closing the queue raises an OpenReviewException that lists the failed messages, so the failures are not lost when
+    the queue is used in a process function.
+
+    :param client: Client used to post the messages
+    :type client: OpenReviewClient
+    :param batch_size: Number of queued messages that triggers a flush
+    :type batch_size: int, optional
+    :param max_workers: Maximum number of concurrent requests, defaults to min(16, cpu_count() * 5)
+    :type max_workers: int, optional
+    :param use_job: If set, whether the messages are sent using the job queue
+    :type use_job: bool, optional
+    :param raise_on_failure: Whether closing the queue raises an exception when some messages failed
+    :type raise_on_failure: bool, optional
+
+    Example:
+
+    >>> with openreview.tools.MessageQueue(client) as queue:
+    >>>     for profile in profiles:
+    >>>         queue.add(subject, [profile.id], f'Hi {profile.get_preferred_name(pretty=True)},...', invitation=meta_invitation_id)
+    """
+    def __init__(self, client, batch_size=100, max_workers=None, use_job=None, raise_on_failure=True):
+        self.client = client
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.use_job = use_job
+        self.raise_on_failure = raise_on_failure
+        self.pending = []
+        self.results = []
+
+    def add(self, subject, recipients, message, **kwargs):
+        """
+        Queues a message, the arguments are the ones of :meth:`openreview.api.OpenReviewClient.post_message`.
+
+        :param subject: Subject of the e-mail
+        :type subject: str
+        :param recipients: Recipients of the e-mail. Valid inputs would be tilde username or emails registered in OpenReview
+        :type recipients: list[str]
+        :param message: Message in the e-mail
+        :type message: str
+        """
+        self.pending.append(dict(kwargs, subject=subject, recipients=recipients, message=message))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Posts the queued messages.
+
+        :return: One result per posted message, with the ``response`` of the request that posted it or the ``error`` if it failed
+        :rtype: list[dict]
+        """
+        if not self.pending:
+            return []
+        messages, self.pending = self.pending, []
+        results = self.client.post_messages_bulk(messages, max_workers=self.max_workers, use_job=self.use_job)
+        for message, result in zip(messages, results):
+            self.results.append(dict(result, message=message))
+        return results
+
+    @property
+    def failures(self):
+        """Results of the posted messages that failed, each one with the ``message`` and its ``error``"""
+        return [result for result in self.results if result['error']]
+
+    def close(self):
+        """
+        Posts the queued messages and raises an OpenReviewException listing the failed messages, if any and
+        ``raise_on_failure`` is set.
+        """
+        self.flush()
+        failures = self.failures
+        if failures and self.raise_on_failure:
+            raise get_failures_exception(failures, len(self.results))
+
+    def __len__(self):
+        return len(self.pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        ## Messages queued before an exception are still sent, and the exception is not replaced
+        if exc_type is None:
+            self.close()
+        else:
+            self.flush()
+        return False
@@ -38,8 +38,15 @@ class MfaRequiredException(OpenReviewException):
 
 class LogRetry(Retry):
      
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, telemetry=None, **kwargs):
         super().__init__(*args, **kwargs)   
+        self.telemetry = telemetry
+
+    def new(self, **kwargs):
+        # Retry creates a new object on every increment, the telemetry has to be passed along
+        retry = super().new(**kwargs)
+        retry.telemetry = self.telemetry
+        return retry
 
     def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
         # Log retry information before calling the parent class method.
@@ -52,6 +59,9 @@ class LogRetry(Retry):
             cause = f"error {error}"
         print(f"Retrying request: {method} {url}, {cause}")
 
+        if self.telemetry is not None:
+            self.telemetry.record_retry(method, url, status=response.status if response is not None else None, retry_after=self.get_retry_after(response) if response is not None else None)
+
         # Call the parent class method to perform the actual retry increment
         return super().increment(method=method, url=url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
 
@@ -67,8 +77,14 @@ class Client(object):
     :type token: str, optional
     :param tokenExpiresIn: Time in seconds before the token expires. This parameter only works when providing a username and a password. If none is set, the value will be set automatically to one day. The max value that it can be set to is 1 week.
     :type expiresIn: number, optional
+    :param pool_connections: Number of connection pools to cache. If none is set, it defaults to :data:`openreview.tools.HTTP_POOL_CONNECTIONS`
+    :type pool_connections: int, optional
+    :param pool_maxsize: Maximum number of connections kept open per host, it should be at least the number of threads sharing the client. If none is set, it defaults to :data:`openreview.tools.HTTP_POOL_MAXSIZE`
+    :type pool_maxsize: int, optional
+    :param telemetry: Collects metrics of the requests sent by the client, see :meth:`set_telemetry`. If none is set and the environment variable `OPENREVIEW_TELEMETRY` is `1`, the shared :func:`openreview.tools.get_default_telemetry` is used
+    :type telemetry: RequestTelemetry, optional
     """
-    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None):
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, pool_connections=None, pool_maxsize=None, telemetry=None):
         self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_API_BASEURL', 'http://localhost:3000')
         if any(url in self.baseurl for url in tools.V2_REMOTE_URLS):
             correct_baseurl = tools.get_base_urls(self)[0]
@@ -134,9 +150,16 @@ class Client(object):
             respect_retry_after_header=True
         )
         self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_connections or tools.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or tools.HTTP_POOL_MAXSIZE
+        )
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
+        self._retry_strategy = retry_strategy
+        self.telemetry = None
+        self.set_telemetry(telemetry or tools.get_default_telemetry())
 
         if self.token:
             self.headers['Authorization'] = 'Bearer ' + self.token
@@ -258,6 +281,34 @@ class Client(object):
         self.__handle_token(json_response)
         return json_response
 
+    def set_telemetry(self, telemetry):
+        """
+        Records the latency, size, status and retries of every request sent by the client in the given telemetry. Pass None to stop recording.
+
+        :param telemetry: Request telemetry, e.g. :class:`openreview.tools.RequestTelemetry`
+        :type telemetry: RequestTelemetry
+
+        :return: The telemetry
+        :rtype: RequestTelemetry
+        """
+        hooks = self.session.hooks['response']
+        if self.telemetry is not None and self.telemetry.response_hook in hooks:
+            hooks.remove(self.telemetry.response_hook)
+        if telemetry is not None:
+            hooks.append(telemetry.response_hook)
+        self._retry_strategy.telemetry = telemetry
+        self.telemetry = telemetry
+        return telemetry
+
+    def get_telemetry(self):
+        """
+        Returns the telemetry used by the client, None if it is not enabled.
+
+        :return: Request telemetry
+        :rtype: RequestTelemetry
+        """
+        return self.telemetry
+
     def login_user(self,username=None, password=None, expiresIn=None):
         """
         Logs in a registered user. If MFA is enabled for the account, this method
@@ -1352,7 +1403,7 @@ class Client(object):
         if with_count:
             params['with_count'] = with_count
         
-        return list(tools.efficient_iterget(self.get_notes, desc='Getting V1 Notes', **params))
+        return tools.concurrent_cursor_get(self.get_notes, desc='Getting V1 Notes', **params)
 
     def get_reference(self, id):
         """
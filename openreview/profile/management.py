@@ -1913,13 +1913,10 @@ return {
                         'writers': [archive_group.id],
                         'invitees': ['everyone'],
                         'process': '''def process(client, edit, invitation):
-        meta_invitation = client.get_invitation(invitation.invitations[0])
-        script = meta_invitation.content['comment_process_script']['value']
         funcs = {
             'openreview': openreview
         }
-        exec(script, funcs)
-        funcs['process'](client, edit, invitation)
+        openreview.tools.run_process_script(client, invitation.invitations[0], 'comment_process_script', funcs, client, edit, invitation)
     ''',
                         'edit': {
                             'signatures': { 
@@ -2213,13 +2210,10 @@ return {
                         'writers': [anonymous_group_id],
                         'invitees': ['everyone'],
                         'process': '''def process(client, edit, invitation):
-        meta_invitation = client.get_invitation(invitation.invitations[0])
-        script = meta_invitation.content['comment_process_script']['value']
         funcs = {
             'openreview': openreview
         }
-        exec(script, funcs)
-        funcs['process'](client, edit, invitation)
+        openreview.tools.run_process_script(client, invitation.invitations[0], 'comment_process_script', funcs, client, edit, invitation)
     ''',
                         'edit': {
                             'signatures': { 
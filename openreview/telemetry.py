@@ -0,0 +1,262 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+from bisect import bisect_left
+import atexit
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse as urlparse
+
+## Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ID_SEGMENT = re.compile(r'[0-9~@]')
+
+def get_endpoint(url):
+    '''
+    Returns the path of a request URL without the query string. Path segments after the first one that look like ids,
+    e.g. they contain digits, ``~`` or ``@``, are replaced with ``:id`` so that the number of endpoints stays small.
+
+    :param url: URL or path of the request
+    :type url: str
+
+    :return: Endpoint, e.g. ``/notes`` or ``/pdf/:id``
+    :rtype: str
+    '''
+    path = urlparse.urlsplit(url).path or '/'
+    segments = path.split('/')
+    return '/'.join([segment if index < 2 or not _ID_SEGMENT.search(segment) else ':id' for index, segment in enumerate(segments)])
+
+
+class _EndpointStats(object):
+    __slots__ = ('requests', 'errors', 'statuses', 'seconds', 'bytes', 'buckets', 'retries', 'rate_limited', 'retry_after_seconds')
+
+    def __init__(self, buckets):
+        self.requests = 0
+        self.errors = 0
+        self.statuses = {}
+        self.seconds = 0.0
+        self.bytes = 0
+        self.buckets = [0] * (len(buckets) + 1)
+        self.retries = 0
+        self.rate_limited = 0
+        self.retry_after_seconds = 0.0
+
+
+class RequestTelemetry(object):
+    """
+    Collects per-endpoint metrics of the requests sent by :class:`openreview.Client` and :class:`openreview.api.OpenReviewClient`:
+    number of requests by status code, latency histogram, response bytes, retries, 429 responses and the time the server asked
+    to wait with ``Retry-After``. Endpoints are identified by the HTTP method and the path of the request, see :func:`get_endpoint`.
+
+    A client records its requests after :meth:`openreview.api.OpenReviewClient.set_telemetry` is called, or when the
+    environment variable ``OPENREVIEW_TELEMETRY`` is set to ``1``, in which case all the clients share :func:`get_default_telemetry`.
+    Subclasses can override :meth:`record_request` and :meth:`record_retry` to send the measurements to another system.
+
+    :param buckets: Upper bounds in seconds of the latency histogram buckets
+    :type buckets: tuple[float], optional
+
+    Example:
+
+    >>> telemetry = client.set_telemetry(openreview.tools.RequestTelemetry())
+    >>> venue.setup()
+    >>> telemetry.snapshot()['endpoints']['POST /invitations/edits']['requests']
+    42
+    >>> print(telemetry.to_prometheus())
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def __stats(self, method, url):
+        key = (method.upper(), get_endpoint(url))
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = _EndpointStats(self.buckets)
+        return stats
+
+    def record_request(self, method, url, status, seconds, response_bytes=0):
+        """
+        Records a request that received a response. Retried attempts are recorded with :meth:`record_retry` instead.
+
+        :param method: HTTP method
+        :type method: str
+        :param url: URL or path of the request
+        :type url: str
+        :param status: HTTP status code of the response
+        :type status: int
+        :param seconds: Time in seconds until the response headers were received
+        :type seconds: float
+        :param response_bytes: Size of the response body, 0 if unknown
+        :type response_bytes: int, optional
+        """
+        with self._lock:
+            stats = self.__stats(method, url)
+            stats.requests += 1
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if status >= 400:
+                stats.errors += 1
+            if status == 429:
+                stats.rate_limited += 1
+            stats.seconds += seconds
+            stats.bytes += response_bytes or 0
+            stats.buckets[bisect_left(self.buckets, seconds)] += 1
+
+    def record_retry(self, method, url, status=None, retry_after=None):
+        """
+        Records a retried attempt of a request.
+
+        :param method: HTTP method
+        :type method: str
+        :param url: URL or path of the request
+        :type url: str
+        :param status: HTTP status code of the retried response, None if the request failed without a response
+        :type status: int, optional
+        :param retry_after: Seconds to wait requested by the server with the ``Retry-After`` header
+        :type retry_after: float, optional
+        """
+        with self._lock:
+            stats = self.__stats(method or 'GET', url)
+            stats.retries += 1
+            if status == 429:
+                stats.rate_limited += 1
+            if retry_after:
+                stats.retry_after_seconds += retry_after
+
+    def response_hook(self, response, *args, **kwargs):
+        """
+        ``requests`` response hook that records the response with :meth:`record_request`. The size of streamed responses
+        is taken from the ``Content-Length`` header, as their body has not been read yet.
+        """
+        content_length = response.headers.get('Content-Length')
+        if content_length is not None and content_length.isdigit():
+            response_bytes = int(content_length)
+        elif not kwargs.get('stream'):
+            response_bytes = len(response.content or b'')
+        else:
+            response_bytes = 0
+        self.record_request(response.request.method, response.request.url, response.status_code, response.elapsed.total_seconds(), response_bytes)
+
+    def reset(self):
+        """
+        Removes all the recorded metrics.
+        """
+        with self._lock:
+            self._endpoints = {}
+            self.started = time.time()
+
+    def snapshot(self):
+        """
+        Returns the recorded metrics.
+
+        :return: Dictionary with the totals and the metrics of every endpoint keyed by ``'<METHOD> <path>'``, sorted by total latency
+        :rtype: dict
+        """
+        with self._lock:
+            items = [(key, stats, list(stats.buckets), dict(stats.statuses)) for key, stats in self._endpoints.items()]
+        endpoints = {}
+        for (method, endpoint), stats, buckets, statuses in sorted(items, key=lambda item: -item[1].seconds):
+            cumulative = 0
+            histogram = {}
+            for bound, count in zip(self.buckets + ('+Inf',), buckets):
+                cumulative += count
+                histogram[str(bound)] = cumulative
+            endpoints[f'{method} {endpoint}'] = {
+                'requests': stats.requests,
+                'errors': stats.errors,
+                'statuses': statuses,
+                'seconds': stats.seconds,
+                'mean_seconds': stats.seconds / stats.requests if stats.requests else 0.0,
+                'bytes': stats.bytes,
+                'retries': stats.retries,
+                'rate_limited': stats.rate_limited,
+                'retry_after_seconds': stats.retry_after_seconds,
+                'latency_histogram': histogram
+            }
+        totals = { name: sum(endpoint[name] for endpoint in endpoints.values()) for name in ('requests', 'errors', 'seconds', 'bytes', 'retries', 'rate_limited', 'retry_after_seconds') }
+        totals['elapsed_seconds'] = time.time() - self.started
+        return { 'totals': totals, 'endpoints': endpoints }
+
+    def to_prometheus(self, prefix='openreview_client'):
+        """
+        Returns the recorded metrics in the Prometheus text exposition format.
+
+        :param prefix: Prefix of the metric names
+        :type prefix: str, optional
+
+        :return: Metrics in Prometheus text format
+        :rtype: str
+        """
+        def labels(key, **extra):
+            method, endpoint = key.split(' ', 1)
+            pairs = [('method', method), ('endpoint', endpoint)] + list(extra.items())
+            return '{' + ','.join('%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"')) for name, value in pairs) + '}'
+
+        endpoints = self.snapshot()['endpoints']
+        lines = []
+        def counter(name, help_text, field, metric_type='counter'):
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} {metric_type}')
+            for key, stats in endpoints.items():
+                lines.append(f'{prefix}_{name}{labels(key)} {stats[field]}')
+
+        lines.append(f'# HELP {prefix}_requests_total Requests that received a response.')
+        lines.append(f'# TYPE {prefix}_requests_total counter')
+        for key, stats in endpoints.items():
+            for status, count in sorted(stats['statuses'].items()):
+                lines.append(f'{prefix}_requests_total{labels(key, status=status)} {count}')
+
+        lines.append(f'# HELP {prefix}_request_duration_seconds Time until the response headers were received.')
+        lines.append(f'# TYPE {prefix}_request_duration_seconds histogram')
+        for key, stats in endpoints.items():
+            for bound, count in stats['latency_histogram'].items():
+                lines.append(f'{prefix}_request_duration_seconds_bucket{labels(key, le=bound)} {count}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{labels(key)} {stats["seconds"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{labels(key)} {stats["requests"]}')
+
+        counter('response_bytes_total', 'Size of the response bodies.', 'bytes')
+        counter('retries_total', 'Retried attempts.', 'retries')
+        counter('rate_limited_total', 'Responses with status 429, including retried attempts.', 'rate_limited')
+        counter('retry_after_seconds_total', 'Time the server asked to wait with the Retry-After header.', 'retry_after_seconds')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """
+        Writes the metrics to a file, as JSON if the path ends with ``.json`` and in Prometheus text format otherwise.
+
+        :param path: Path of the file
+        :type path: str
+        """
+        with open(path, 'w') as f:
+            if path.endswith('.json'):
+                json.dump(self.snapshot(), f, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+
+_default_telemetry = None
+_default_telemetry_lock = threading.Lock()
+
+def get_default_telemetry():
+    '''
+    Returns the telemetry shared by the clients when the environment variable ``OPENREVIEW_TELEMETRY`` is set to ``1``,
+    or None if it is not set. If ``OPENREVIEW_TELEMETRY_FILE`` is also set, the metrics are written to that file when the process exits.
+
+    :return: Shared telemetry
+    :rtype: RequestTelemetry
+    '''
+    global _default_telemetry
+    if os.environ.get('OPENREVIEW_TELEMETRY', '').lower() not in ('1', 'true', 'yes'):
+        return None
+    with _default_telemetry_lock:
+        if _default_telemetry is None:
+            _default_telemetry = RequestTelemetry()
+            path = os.environ.get('OPENREVIEW_TELEMETRY_FILE')
+            if path:
+                atexit.register(_default_telemetry.write, path)
+    return _default_telemetry
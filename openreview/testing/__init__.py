@@ -0,0 +1,2 @@
+from .fake_api import FakeOpenReviewAPI, FakeAdapter, FakeAPIError
+from .synthetic import seed_venue, SyntheticVenue
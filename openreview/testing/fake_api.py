@@ -0,0 +1,835 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+from collections import Counter
+import copy
+import http.client
+import io
+import itertools
+import json
+import threading
+import time
+import urllib.parse as urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import openreview
+from openreview import tools
+
+DEFAULT_LIMIT = 1000
+
+def now():
+    return int(time.time() * 1000)
+
+
+class FakeAPIError(Exception):
+    """
+    Error returned by a route of :class:`FakeOpenReviewAPI`, it is sent to the client as a JSON error response.
+    """
+    def __init__(self, status, name, message):
+        super().__init__(message)
+        self.status = status
+        self.name = name
+        self.message = message
+
+def not_found(kind, id):
+    return FakeAPIError(404, 'NotFoundError', f'{kind} Not Found: {id}')
+
+
+class FakeRequest(object):
+    """
+    Request received by a route of :class:`FakeOpenReviewAPI`.
+    """
+    def __init__(self, method, url, body):
+        split_url = urlparse.urlsplit(url)
+        self.method = method.upper()
+        self.url = url
+        self.path = urlparse.unquote(split_url.path)
+        self.params = urlparse.parse_qs(split_url.query, keep_blank_values=True)
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        self.json = json.loads(body) if body else None
+
+    def get(self, name, default=None):
+        values = self.params.get(name)
+        return values[-1] if values else default
+
+    def get_bool(self, name):
+        return self.get(name, '').lower() == 'true'
+
+    def get_int(self, name, default=None):
+        value = self.get(name)
+        return int(value) if value not in (None, '') else default
+
+    def get_list(self, name):
+        ## Repeated parameters and comma separated values
+        return [value for values in self.params.get(name, []) for value in values.split(',') if value]
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    ``requests`` transport adapter that sends the requests of a session to a :class:`FakeOpenReviewAPI` instead of the network.
+    The session hooks, e.g. the request telemetry, run as usual, but the requests are not retried.
+
+    :param api: Fake API that handles the requests
+    :type api: FakeOpenReviewAPI
+    """
+    def __init__(self, api):
+        super().__init__()
+        self.api = api
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        status, body = self.api.handle(request.method, request.url, request.body)
+        content = json.dumps(body).encode('utf-8')
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.client.responses.get(status, '')
+        response.headers = CaseInsensitiveDict({ 'Content-Type': 'application/json; charset=utf-8', 'Content-Length': str(len(content)) })
+        response.raw = io.BytesIO(content)
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+class FakeOpenReviewAPI(object):
+    """
+    In-process stand-in of the API v2 to measure the client side of scripts without the API, MongoDB, Redis and Elasticsearch
+    services. It keeps Notes, Groups, Invitations, Edges, Tags, Profiles, edits and messages in memory and implements the
+    routes used by :class:`openreview.api.OpenReviewClient` to read and post them: ``/notes``, ``/notes/edits``, ``/groups``,
+    ``/groups/edits``, ``/invitations``, ``/invitations/edits``, ``/edges`` including ``/edges/bulk``, ``/edges/count`` and
+    grouped Edges, ``/profiles``, ``/profiles/search``, ``/tags`` and ``/messages``.
+
+    It is not a replacement of the API: permissions are not checked, the edits are not validated against their invitations
+    and process functions are not run. Requests to the API v1 of the same environment only return empty lists of Notes, so
+    :func:`openreview.tools.get_profiles` can load the publications of the Profiles.
+
+    :param baseurl: URL of the API v2 served by the fake, it defaults to the local API URL
+    :type baseurl: str, optional
+    :param latency: Seconds every request waits before being handled, to simulate the network round trip
+    :type latency: float, optional
+    :param discard_edges: Invitations whose new Edges are only counted and not kept, to post millions of Edges in
+        bounded memory. :meth:`get_edges_count` and :meth:`delete_edges` by invitation still take them into account.
+    :type discard_edges: list[str], optional
+
+    Example:
+
+    >>> from openreview.testing import FakeOpenReviewAPI, seed_venue
+    >>> api = FakeOpenReviewAPI(latency=0.005)
+    >>> venue = seed_venue(api, papers=1000, reviewers=3000)
+    >>> client = api.client()
+    >>> scores = client.get_all_edges(invitation=venue.affinity_score_id)
+    >>> api.requests
+    Counter({'GET /edges': 1, 'POST /login': 1})
+    """
+    def __init__(self, baseurl=tools.LOCAL_API_V2, latency=0, discard_edges=()):
+        self.baseurl = baseurl.rstrip('/')
+        self.latency = latency
+        self.discard_edges = set(discard_edges)
+        self.requests = Counter()
+        self.notes = {}
+        self.groups = {}
+        self.invitations = {}
+        self.edges = {}
+        self.tags = {}
+        self.profiles = {}
+        self.edits = { 'notes': [], 'groups': [], 'invitations': [] }
+        self.messages = []
+        self._profile_ids_by_email = {}
+        self._edge_ids_by_invitation = {}
+        self._discarded_edges = Counter()
+        self._note_ids_by_forum = {}
+        self._note_ids_by_authorid = {}
+        self._numbers = Counter()
+        self._counter = itertools.count(1)
+        self._lock = threading.RLock()
+        self.routes = {
+            ('POST', '/login'): self.login,
+            ('GET', '/notes'): self.get_notes,
+            ('DELETE', '/notes'): self.delete_note,
+            ('GET', '/notes/edits'): lambda request: self.get_edits(request, 'notes', 'note'),
+            ('POST', '/notes/edits'): self.post_note_edit,
+            ('GET', '/groups'): self.get_groups,
+            ('DELETE', '/groups'): self.delete_group,
+            ('GET', '/groups/edits'): lambda request: self.get_edits(request, 'groups', 'group'),
+            ('POST', '/groups/edits'): self.post_group_edit,
+            ('GET', '/invitations'): self.get_invitations,
+            ('DELETE', '/invitations'): self.delete_invitation,
+            ('GET', '/invitations/edits'): lambda request: self.get_edits(request, 'invitations', 'invitation'),
+            ('POST', '/invitations/edits'): self.post_invitation_edit,
+            ('GET', '/edges'): self.get_edges,
+            ('POST', '/edges'): lambda request: self.add_edges([request.json])[0],
+            ('DELETE', '/edges'): self.delete_edges,
+            ('POST', '/edges/bulk'): lambda request: self.add_edges(request.json),
+            ('GET', '/edges/count'): self.get_edges_count,
+            ('GET', '/edges/archive'): lambda request: { 'edges': [] },
+            ('GET', '/profiles'): self.get_profiles,
+            ('POST', '/profiles/search'): self.search_profiles,
+            ('GET', '/tags'): self.get_tags,
+            ('POST', '/tags'): lambda request: self.add_tags([request.json])[0],
+            ('POST', '/tags/bulk'): lambda request: self.add_tags(request.json),
+            ('DELETE', '/tags'): self.delete_tags,
+            ('GET', '/messages'): self.get_messages,
+            ('POST', '/messages/requests'): self.post_message_request,
+            ('POST', '/messages/direct'): self.post_direct_message,
+            ('GET', '/logs/process'): lambda request: { 'logs': [] }
+        }
+
+    ## CLIENTS
+
+    def mount(self, client):
+        """
+        Sends the requests of a client to the fake API.
+
+        :param client: Client whose session is redirected
+        :type client: OpenReviewClient | Client
+
+        :return: The client
+        :rtype: OpenReviewClient | Client
+        """
+        client.session.mount(client.baseurl, FakeAdapter(self))
+        return client
+
+    def client(self, username='openreview.net', password='1234'):
+        """
+        Returns a new :class:`openreview.api.OpenReviewClient` connected to the fake API and logged in as the given user.
+        The API v1 client that :func:`openreview.tools.get_shared_client` returns for it is also connected to the fake API.
+
+        :param username: Email or id of the user, the profile of the user is used if it exists
+        :type username: str, optional
+        :param password: Password, it is not checked
+        :type password: str, optional
+
+        :return: Client of the fake API
+        :rtype: OpenReviewClient
+        """
+        client = self.mount(openreview.api.OpenReviewClient(baseurl=self.baseurl))
+        client.login_user(username, password)
+        client_v1_baseurl = tools.get_base_urls(client)[0]
+        if client_v1_baseurl != client.baseurl:
+            client_v1 = self.mount(openreview.Client(baseurl=client_v1_baseurl))
+            client_v1.token = client.token
+            client_v1.headers['Authorization'] = 'Bearer ' + client.token
+            tools.register_shared_client(client_v1, api_version=1)
+        return client
+
+    ## DISPATCH
+
+    def handle(self, method, url, body=None):
+        """
+        Handles a request and returns its status code and JSON body.
+
+        :param method: HTTP method
+        :type method: str
+        :param url: URL of the request
+        :type url: str
+        :param body: JSON body of the request
+        :type body: str | bytes, optional
+
+        :return: Tuple ``(status, body)``
+        :rtype: tuple
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        request = FakeRequest(method, url, body)
+        if not url.startswith(self.baseurl):
+            ## API v1 of the same environment
+            self.requests[f'v1 {request.method} {request.path}'] += 1
+            if request.method == 'GET' and request.path == '/notes':
+                return 200, { 'notes': [], 'count': 0 }
+            return 404, { 'name': 'NotFoundError', 'message': f'Route Not Found: {request.path}' }
+
+        route = self.routes.get((request.method, request.path))
+        if route is None and request.path.startswith('/groups/members/cache/'):
+            route = lambda request: { 'status': 'ok' }
+        self.requests[f'{request.method} {request.path}'] += 1
+        if route is None:
+            return 404, { 'name': 'NotFoundError', 'message': f'Route Not Found: {request.path}' }
+        try:
+            with self._lock:
+                return 200, route(request)
+        except FakeAPIError as e:
+            return e.status, { 'name': e.name, 'message': e.message }
+
+    def new_id(self, prefix):
+        return f'{prefix}{next(self._counter):09d}'
+
+    ## HELPERS
+
+    @staticmethod
+    def merge(target, patch):
+        ## Applies an edit to a stored object, ``{'delete': True}`` removes a field and dictionaries are merged recursively
+        for key, value in patch.items():
+            if isinstance(value, dict) and value.get('delete') is True and len(value) == 1:
+                target.pop(key, None)
+            elif isinstance(value, dict) and isinstance(target.get(key), dict):
+                FakeOpenReviewAPI.merge(target[key], value)
+            else:
+                target[key] = copy.deepcopy(value)
+        return target
+
+    @staticmethod
+    def select(item, fields):
+        if not fields:
+            return item
+        selected = {}
+        for field in fields.split(','):
+            source, target = item, selected
+            keys = field.strip().split('.')
+            for key in keys[:-1]:
+                if not isinstance(source.get(key), dict):
+                    source = None
+                    break
+                source = source[key]
+                target = target.setdefault(key, {})
+            if source is not None and keys[-1] in source:
+                target[keys[-1]] = source[keys[-1]]
+        return selected
+
+    @staticmethod
+    def page(items, request, key, select=None):
+        ## Applies the sort, after, offset, limit, stream and count parameters
+        sort = request.get('sort')
+        if sort:
+            field, _, direction = sort.partition(':')
+            items = sorted(items, key=lambda item: (item.get(field) is None, item.get(field) or 0), reverse=direction == 'desc')
+        after = request.get('after')
+        if after:
+            items = [item for item in sorted(items, key=lambda item: item['id']) if item['id'] > after]
+        total = len(items)
+        if not request.get_bool('stream'):
+            offset = request.get_int('offset', 0)
+            items = items[offset:offset + request.get_int('limit', DEFAULT_LIMIT)]
+        result = { key: [FakeOpenReviewAPI.select(item, select) for item in items] }
+        if request.get_bool('count'):
+            result['count'] = total
+        return result
+
+    @staticmethod
+    def content_matches(item, request):
+        for name, values in request.params.items():
+            if not name.startswith('content.'):
+                continue
+            allowed = set(value for value in ','.join(values).split(','))
+            field = item.get('content', {}).get(name[len('content.'):])
+            value = field.get('value') if isinstance(field, dict) else field
+            values = value if isinstance(value, list) else [value]
+            if not any(str(value) in allowed for value in values):
+                return False
+        return True
+
+    def get_or_fail(self, store, kind, id):
+        item = store.get(id)
+        if item is None:
+            raise not_found(kind, id)
+        return item
+
+    def domain_of(self, invitation_id):
+        invitation = self.invitations.get(invitation_id)
+        if invitation and invitation.get('domain'):
+            return invitation['domain']
+        return self.domain_for(invitation_id.split('/-/')[0]) if invitation_id else None
+
+    def domain_for(self, object_id):
+        ## Domain of the closest existing ancestor Group, e.g. the venue of a committee invitation
+        path = object_id.split('/')
+        for index in range(len(path), 0, -1):
+            group = self.groups.get('/'.join(path[:index]))
+            if group is not None and group.get('domain'):
+                return group['domain']
+        return path[0]
+
+    ## SEEDING
+
+    def add_profile(self, id, fullname, emails, institution=None, relations=None):
+        """
+        Adds a Profile.
+
+        :param id: Tilde id of the Profile
+        :type id: str
+        :param fullname: Full name
+        :type fullname: str
+        :param emails: Confirmed emails, the first one is the preferred email
+        :type emails: list[str]
+        :param institution: Institution domain added to the Profile history, e.g. ``umass.edu``
+        :type institution: str, optional
+        :param relations: Relations of the Profile
+        :type relations: list[dict], optional
+
+        :return: Profile JSON
+        :rtype: dict
+        """
+        timestamp = now()
+        profile = {
+            'id': id,
+            'active': True,
+            'password': True,
+            'state': 'Active',
+            'tcdate': timestamp,
+            'tmdate': timestamp,
+            'content': {
+                'names': [{ 'fullname': fullname, 'username': id, 'preferred': True }],
+                'emails': list(emails),
+                'emailsConfirmed': list(emails),
+                'preferredEmail': emails[0] if emails else None,
+                'history': [{ 'position': 'Researcher', 'start': 2015, 'end': None, 'institution': { 'name': institution, 'domain': institution } }] if institution else [],
+                'relations': relations or [],
+                'expertise': []
+            }
+        }
+        with self._lock:
+            self.profiles[id] = profile
+            for email in emails:
+                self._profile_ids_by_email[email.lower()] = id
+        return profile
+
+    def add_group(self, group):
+        """
+        Adds or replaces a Group.
+
+        :param group: Group JSON, e.g. ``Group(...).to_json()``
+        :type group: dict
+
+        :return: Stored Group JSON
+        :rtype: dict
+        """
+        timestamp = now()
+        group = dict({
+            'members': [], 'readers': ['everyone'], 'writers': [], 'signatures': [], 'signatories': [group['id']],
+            'cdate': timestamp, 'tcdate': timestamp, 'tmdate': timestamp, 'domain': self.domain_for(group['id'])
+        }, **copy.deepcopy(group))
+        with self._lock:
+            self.groups[group['id']] = group
+        return group
+
+    def add_invitation(self, invitation):
+        """
+        Adds or replaces an Invitation.
+
+        :param invitation: Invitation JSON
+        :type invitation: dict
+
+        :return: Stored Invitation JSON
+        :rtype: dict
+        """
+        timestamp = now()
+        invitation = dict({
+            'readers': ['everyone'], 'writers': [], 'signatures': [], 'invitees': [],
+            'cdate': timestamp, 'tcdate': timestamp, 'tmdate': timestamp, 'domain': self.domain_for(invitation['id'].split('/-/')[0])
+        }, **copy.deepcopy(invitation))
+        with self._lock:
+            self.invitations[invitation['id']] = invitation
+        return invitation
+
+    def add_note(self, note, invitation=None):
+        """
+        Adds a Note, a number is assigned to Notes that are not replies.
+
+        :param note: Note JSON
+        :type note: dict
+        :param invitation: Invitation of the Note, if it is not in the Note ``invitations``
+        :type invitation: str, optional
+
+        :return: Stored Note JSON
+        :rtype: dict
+        """
+        timestamp = now()
+        note = copy.deepcopy(note)
+        with self._lock:
+            note.setdefault('id', self.new_id('N'))
+            invitations = note.setdefault('invitations', [])
+            if invitation and invitation not in invitations:
+                invitations.append(invitation)
+            replyto = note.get('replyto')
+            if replyto:
+                note.setdefault('forum', self.get_or_fail(self.notes, 'Note', replyto)['forum'])
+            else:
+                note.setdefault('forum', note['id'])
+                if 'number' not in note and invitations:
+                    self._numbers[invitations[0]] += 1
+                    note['number'] = self._numbers[invitations[0]]
+            for key, value in (('content', {}), ('readers', ['everyone']), ('writers', []), ('signatures', []), ('cdate', timestamp), ('tcdate', timestamp), ('tmdate', timestamp), ('mdate', timestamp)):
+                note.setdefault(key, value)
+            note.setdefault('domain', self.domain_of(invitations[0]) if invitations else None)
+            self.notes[note['id']] = note
+            self._note_ids_by_forum.setdefault(note['forum'], []).append(note['id'])
+            self.index_authorids(note)
+        return note
+
+    def index_authorids(self, note):
+        ## The index may keep removed authors, the content filter of get_notes checks the current ones
+        authorids = note['content'].get('authorids')
+        for authorid in (authorids.get('value') if isinstance(authorids, dict) else authorids) or []:
+            note_ids = self._note_ids_by_authorid.setdefault(authorid, [])
+            if note['id'] not in note_ids:
+                note_ids.append(note['id'])
+
+    def add_edges(self, edges):
+        """
+        Adds or updates Edges, Edges with ``ddate`` are deleted.
+
+        :param edges: Edge JSONs
+        :type edges: list[dict]
+
+        :return: Stored Edge JSONs
+        :rtype: list[dict]
+        """
+        timestamp = now()
+        posted = []
+        with self._lock:
+            for edge in edges:
+                if edge.get('invitation') in self.discard_edges and not edge.get('id'):
+                    self._discarded_edges[edge['invitation']] += 1
+                    posted.append(dict(edge, id=self.new_id('E')))
+                    continue
+                edge = copy.deepcopy(edge)
+                if edge.get('id') in self.edges:
+                    stored = self.edges[edge['id']]
+                    stored.update(edge)
+                    stored['tmdate'] = timestamp
+                    if stored.get('ddate'):
+                        del self.edges[stored['id']]
+                        self._edge_ids_by_invitation.get(stored['invitation'], {}).pop(stored['id'], None)
+                    posted.append(stored)
+                    continue
+                edge.setdefault('id', self.new_id('E'))
+                for key, value in (('cdate', timestamp), ('tcdate', timestamp), ('tmdate', timestamp), ('readers', ['everyone']), ('writers', []), ('signatures', [])):
+                    edge.setdefault(key, value)
+                edge.setdefault('domain', self.domain_of(edge.get('invitation')))
+                self.edges[edge['id']] = edge
+                self._edge_ids_by_invitation.setdefault(edge.get('invitation'), {})[edge['id']] = None
+                posted.append(edge)
+        return posted
+
+    def add_tags(self, tags):
+        """
+        Adds or updates Tags.
+
+        :param tags: Tag JSONs
+        :type tags: list[dict]
+
+        :return: Stored Tag JSONs
+        :rtype: list[dict]
+        """
+        timestamp = now()
+        posted = []
+        with self._lock:
+            for tag in tags:
+                tag = copy.deepcopy(tag)
+                tag.setdefault('id', self.new_id('T'))
+                tag.setdefault('cdate', timestamp)
+                tag['tmdate'] = timestamp
+                if tag.get('ddate'):
+                    self.tags.pop(tag['id'], None)
+                else:
+                    self.tags[tag['id']] = dict(self.tags.get(tag['id'], {}), **tag)
+                posted.append(tag)
+        return posted
+
+    ## ROUTES
+
+    def login(self, request):
+        username = request.json.get('id')
+        profile_id = username if username and username.startswith('~') else self._profile_ids_by_email.get((username or '').lower(), '~Super_User1')
+        return {
+            'token': 'fake-token-' + self.new_id(''),
+            'user': { 'id': username, 'profile': { 'id': profile_id, 'usernames': [profile_id], 'emails': [username] } }
+        }
+
+    def get_notes(self, request):
+        ids = request.get_list('id') or request.get_list('ids')
+        if ids:
+            notes = [self.notes[id] for id in ids if id in self.notes]
+            if len(ids) == 1 and not notes:
+                raise not_found('Note', ids[0])
+        elif request.get('forum'):
+            notes = [self.notes[id] for id in self._note_ids_by_forum.get(request.get('forum'), [])]
+        elif request.get('content.authorids'):
+            note_ids = dict.fromkeys(id for authorid in request.get_list('content.authorids') for id in self._note_ids_by_authorid.get(authorid, []))
+            notes = [self.notes[id] for id in note_ids]
+        else:
+            notes = list(self.notes.values())
+
+        filters = [(name, request.get_list(name)) for name in ('invitation', 'replyto', 'number', 'paperhash', 'signatures', 'signature', 'domain') if name in request.params]
+        trash = request.get_bool('trash')
+        def keep(note):
+            if note.get('ddate') and not trash:
+                return False
+            for name, values in filters:
+                if name == 'invitation':
+                    if not set(values) & set(note.get('invitations', [])):
+                        return False
+                elif name in ('signatures', 'signature'):
+                    if not set(values) & set(note.get('signatures', [])):
+                        return False
+                elif str(note.get(name)) not in values:
+                    return False
+            return self.content_matches(note, request)
+        notes = [note for note in notes if keep(note)]
+
+        details = request.get_list('details')
+        if details:
+            notes = [self.with_note_details(note, details) for note in notes]
+        return self.page(notes, request, 'notes', request.get('select'))
+
+    def with_note_details(self, note, details):
+        replies = [self.notes[id] for id in self._note_ids_by_forum.get(note['forum'], []) if id != note['id'] and not self.notes[id].get('ddate')]
+        note_details = {}
+        if 'directReplies' in details:
+            note_details['directReplies'] = [reply for reply in replies if reply.get('replyto') == note['id']]
+        if 'replies' in details:
+            note_details['replies'] = replies
+        if 'replyCount' in details:
+            note_details['replyCount'] = len(replies)
+        return dict(note, details=note_details)
+
+    def post_note_edit(self, request):
+        edit = request.json
+        note_json = edit.get('note') or {}
+        invitation = edit.get('invitation')
+        if note_json.get('id') in self.notes:
+            note = self.notes[note_json['id']]
+            self.merge(note, { key: value for key, value in note_json.items() if key != 'id' })
+            if invitation and invitation not in note['invitations']:
+                note['invitations'].append(invitation)
+            note['tmdate'] = note['mdate'] = now()
+            self.index_authorids(note)
+        else:
+            note = self.add_note(note_json, invitation=invitation)
+        return self.store_edit('notes', edit, 'note', note, note.get('domain'))
+
+    def store_edit(self, kind, edit, key, item, domain):
+        timestamp = now()
+        edit = dict(edit, **{
+            'id': self.new_id('D'),
+            key: copy.deepcopy(item) if kind != 'groups' else dict(edit.get('group', {}), id=item['id']),
+            'domain': domain,
+            'cdate': timestamp,
+            'tcdate': timestamp,
+            'tmdate': timestamp
+        })
+        self.edits[kind].append(edit)
+        return edit
+
+    def get_edits(self, request, kind, key):
+        object_id = request.get(f'{key}.id')
+        edit_id = request.get('id')
+        invitation = request.get('invitation')
+        edits = [edit for edit in self.edits[kind] if
+            (object_id is None or edit[key].get('id') == object_id) and
+            (edit_id is None or edit['id'] == edit_id) and
+            (invitation is None or edit.get('invitation') == invitation)]
+        return self.page(edits, request, 'edits')
+
+    def delete_note(self, request):
+        note = self.get_or_fail(self.notes, 'Note', request.json['id'])
+        note['ddate'] = now()
+        return { 'status': 'ok' }
+
+    def group_members(self, group_id):
+        group = self.groups.get(group_id)
+        return group.get('members', []) if group else []
+
+    def get_groups(self, request):
+        ids = request.get_list('id')
+        if ids:
+            groups = [self.groups[id] for id in ids if id in self.groups]
+            if len(ids) == 1 and not groups:
+                raise not_found('Group', ids[0])
+        else:
+            groups = list(self.groups.values())
+
+        prefix = request.get('prefix')
+        parent = request.get('parent')
+        member = request.get('member')
+        members = request.get('members')
+        signatory = request.get('signatory')
+        domain = request.get('domain')
+        invitation = request.get('invitation')
+
+        containing = None
+        if member:
+            ## Groups that have the member directly or through other groups
+            containing = set()
+            pending = [member] + [email for email in self.profiles.get(member, {}).get('content', {}).get('emails', [])]
+            while pending:
+                current = pending.pop()
+                for group in self.groups.values():
+                    if current in group.get('members', []) and group['id'] not in containing:
+                        containing.add(group['id'])
+                        pending.append(group['id'])
+
+        groups = [group for group in groups if
+            (not prefix or group['id'].startswith(prefix)) and
+            (not parent or group.get('parent') == parent) and
+            (containing is None or group['id'] in containing) and
+            (not members or members in group.get('members', [])) and
+            (not signatory or signatory in group.get('signatories', [])) and
+            (not domain or group.get('domain') == domain) and
+            (not invitation or invitation in group.get('invitations', [])) and
+            (not group.get('ddate') or request.get_bool('trash'))]
+        return self.page(groups, request, 'groups', request.get('select'))
+
+    def post_group_edit(self, request):
+        edit = request.json
+        group_json = copy.deepcopy(edit.get('group') or {})
+        invitation = edit.get('invitation')
+        members = group_json.pop('members', None)
+        group = self.groups.get(group_json.get('id'))
+        if group is None:
+            group = self.add_group(dict(group_json, domain=group_json.get('domain') or self.domain_of(invitation), invitations=[invitation] if invitation else []))
+        else:
+            self.merge(group, { key: value for key, value in group_json.items() if key != 'id' })
+            group['tmdate'] = now()
+        if isinstance(members, list):
+            group['members'] = list(members)
+        elif isinstance(members, dict):
+            current = group.setdefault('members', [])
+            remove = set(members.get('remove', []))
+            current[:] = [m for m in current if m not in remove]
+            present = set(current)
+            for member in members.get('add', []) + members.get('append', []):
+                if member not in present:
+                    current.append(member)
+                    present.add(member)
+        if invitation and invitation not in group.setdefault('invitations', []):
+            group['invitations'].append(invitation)
+        return self.store_edit('groups', edit, 'group', group, group.get('domain'))
+
+    def delete_group(self, request):
+        self.get_or_fail(self.groups, 'Group', request.json['id'])
+        del self.groups[request.json['id']]
+        return { 'status': 'ok' }
+
+    def get_invitations(self, request):
+        ids = request.get_list('id') or request.get_list('ids')
+        if ids:
+            invitations = [self.invitations[id] for id in ids if id in self.invitations]
+            if len(ids) == 1 and not invitations and request.get('id'):
+                raise not_found('Invitation', ids[0])
+        else:
+            invitations = list(self.invitations.values())
+        prefix = request.get('prefix')
+        domain = request.get('domain')
+        invitee = request.get('invitee')
+        invitations = [invitation for invitation in invitations if
+            (not prefix or invitation['id'].startswith(prefix)) and
+            (not domain or invitation.get('domain') == domain) and
+            (not invitee or invitee in invitation.get('invitees', [])) and
+            (not invitation.get('ddate') or request.get_bool('trash'))]
+        return self.page(invitations, request, 'invitations', request.get('select'))
+
+    def post_invitation_edit(self, request):
+        edit = request.json
+        invitation_json = edit.get('invitation') or {}
+        invitation = self.invitations.get(invitation_json.get('id'))
+        if invitation is None or edit.get('replacement'):
+            invitation = self.add_invitation(dict(invitation_json, domain=invitation_json.get('domain') or edit.get('domain') or self.domain_for(invitation_json['id'].split('/-/')[0])))
+        else:
+            self.merge(invitation, { key: value for key, value in invitation_json.items() if key != 'id' })
+            invitation['tmdate'] = now()
+        return self.store_edit('invitations', edit, 'invitation', invitation, invitation.get('domain'))
+
+    def delete_invitation(self, request):
+        self.get_or_fail(self.invitations, 'Invitation', request.json['id'])
+        del self.invitations[request.json['id']]
+        return { 'status': 'ok' }
+
+    def find_edges(self, query):
+        invitation = query.get('invitation')
+        edges = self.edges.values() if invitation is None else (self.edges[id] for id in self._edge_ids_by_invitation.get(invitation, {}))
+        filters = [(name, query[name]) for name in ('id', 'head', 'tail', 'label') if query.get(name) is not None]
+        return [edge for edge in edges if all(edge.get(name) == value for name, value in filters)]
+
+    def get_edges(self, request):
+        query = { name: request.get(name) for name in ('id', 'invitation', 'head', 'tail', 'label') }
+        edges = self.find_edges(query)
+        if query['id'] and not edges:
+            raise not_found('Edge', query['id'])
+        group_by = request.get('groupBy')
+        if not group_by:
+            return self.page(edges, request, 'edges', request.get('select'))
+
+        fields = group_by.split(',')
+        groups = {}
+        for edge in edges:
+            key = tuple(edge.get(field) for field in fields)
+            groups.setdefault(key, []).append(self.select(edge, request.get('select')))
+        grouped = [{ 'id': dict(zip(fields, key)), 'values': values, 'count': len(values) } for key, values in groups.items()]
+        offset = request.get_int('offset', 0)
+        limit = request.get_int('limit')
+        return { 'groupedEdges': grouped[offset:offset + limit] if limit else grouped[offset:] }
+
+    @staticmethod
+    def by_invitation_only(query):
+        return query.get('invitation') and not any(query.get(name) is not None for name in ('id', 'head', 'tail', 'label'))
+
+    def get_edges_count(self, request):
+        query = { name: request.get(name) for name in ('id', 'invitation', 'head', 'tail', 'label') }
+        discarded = self._discarded_edges[query['invitation']] if self.by_invitation_only(query) else 0
+        return { 'count': len(self.find_edges(query)) + discarded }
+
+    def delete_edges(self, request):
+        if self.by_invitation_only(request.json):
+            self._discarded_edges.pop(request.json['invitation'], None)
+        edges = self.find_edges(request.json)
+        for edge in edges:
+            del self.edges[edge['id']]
+            self._edge_ids_by_invitation.get(edge.get('invitation'), {}).pop(edge['id'], None)
+        return { 'status': 'ok', 'deleted': len(edges) }
+
+    def get_profiles(self, request):
+        ids = request.get_list('id') or request.get_list('ids')
+        emails = request.get_list('email') or request.get_list('emails')
+        if ids or emails:
+            profile_ids = ids + [self._profile_ids_by_email[email.lower()] for email in emails if email.lower() in self._profile_ids_by_email]
+            return { 'profiles': [self.profiles[id] for id in dict.fromkeys(profile_ids) if id in self.profiles] }
+        return self.page(list(self.profiles.values()), request, 'profiles')
+
+    def search_profiles(self, request):
+        query = request.json or {}
+        if 'ids' in query:
+            return { 'profiles': [self.profiles[id] for id in query['ids'] if id in self.profiles] }
+        emails = query.get('emails', query.get('confirmedEmails', []))
+        profiles = []
+        for email in emails:
+            profile_id = self._profile_ids_by_email.get(email.lower())
+            if profile_id:
+                profiles.append(dict(self.profiles[profile_id], email=email) if 'emails' in query else self.profiles[profile_id])
+        return { 'profiles': profiles }
+
+    def get_tags(self, request):
+        filters = [(name, request.get(name)) for name in ('id', 'invitation', 'note', 'forum', 'profile', 'signature', 'tag', 'label') if request.get(name) is not None]
+        tags = [tag for tag in self.tags.values() if all((value in tag.get('signatures', [])) if name == 'signature' else tag.get(name) == value for name, value in filters)]
+        return self.page(tags, request, 'tags')
+
+    def delete_tags(self, request):
+        query = request.json
+        tags = [tag for tag in self.tags.values() if all(tag.get(name) == query[name] for name in ('id', 'invitation', 'label') if query.get(name))]
+        for tag in tags:
+            del self.tags[tag['id']]
+        return { 'status': 'ok' }
+
+    def post_message_request(self, request):
+        message = dict(request.json, id=self.new_id('M'), status='queued', cdate=now())
+        self.messages.append(message)
+        return message
+
+    def post_direct_message(self, request):
+        message = dict(request.json, id=self.new_id('M'), status='queued', cdate=now())
+        self.messages.append(message)
+        return { 'groups': request.json.get('groups', []), 'status': 'ok' }
+
+    def get_messages(self, request):
+        to = request.get('to')
+        subject = request.get('subject')
+        messages = [message for message in self.messages if
+            (not to or to in message.get('groups', [])) and
+            (not subject or message.get('subject') == subject)]
+        return self.page(messages, request, 'messages')
@@ -0,0 +1,247 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+import datetime
+import random
+import string
+
+import openreview
+
+INSTITUTIONS = ('umass.edu', 'cmu.edu', 'mit.edu', 'stanford.edu', 'berkeley.edu', 'ox.ac.uk', 'ethz.ch', 'mila.quebec', 'tsinghua.edu.cn', 'google.com')
+
+BID_LABELS = ('Very High', 'High', 'Neutral', 'Low', 'Very Low')
+
+DAY = 24 * 60 * 60 * 1000
+
+def letters(index):
+    ## 0 -> A, 25 -> Z, 26 -> AA, names of the synthetic users can not contain digits
+    name = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = string.ascii_uppercase[remainder] + name
+    return name
+
+
+class SyntheticVenue(object):
+    """
+    Ids of the objects created by :func:`seed_venue`.
+    """
+    def __init__(self, venue_id, submission_name='Submission'):
+        self.venue_id = venue_id
+        self.submission_name = submission_name
+        self.submission_id = f'{venue_id}/-/{submission_name}'
+        self.submission_venue_id = f'{venue_id}/{submission_name}'
+        self.program_chairs_id = f'{venue_id}/Program_Chairs'
+        self.reviewers_id = f'{venue_id}/Reviewers'
+        self.area_chairs_id = f'{venue_id}/Area_Chairs'
+        self.authors_id = f'{venue_id}/Authors'
+        self.affinity_score_id = f'{self.reviewers_id}/-/Affinity_Score'
+        self.bid_id = f'{self.reviewers_id}/-/Bid'
+        self.proposed_assignment_id = f'{self.reviewers_id}/-/Proposed_Assignment'
+        self.assignment_id = f'{self.reviewers_id}/-/Assignment'
+        self.review_id = f'{venue_id}/-/Official_Review'
+        self.submissions = []
+        self.reviewers = []
+        self.area_chairs = []
+        self.authors = []
+
+    def get_venue(self, client, support_user='openreview.net/Support'):
+        """
+        Returns a :class:`openreview.venue.Venue` configured for the synthetic venue, e.g. to run
+        :meth:`~openreview.venue.Venue.setup_committee_matching` against the fake API.
+
+        :param client: Client of the fake API
+        :type client: OpenReviewClient
+        :param support_user: Id of the support group
+        :type support_user: str, optional
+
+        :return: Venue
+        :rtype: openreview.venue.Venue
+        """
+        venue = openreview.venue.Venue(client, self.venue_id, support_user)
+        venue.submission_stage = openreview.stages.SubmissionStage(name=self.submission_name)
+        venue.review_stage = openreview.stages.ReviewStage()
+        venue.decision_stage = openreview.stages.DecisionStage()
+        venue.bid_stages = [openreview.stages.BidStage(committee_id=self.reviewers_id)]
+        venue.use_area_chairs = bool(self.area_chairs)
+        venue.automatic_reviewer_assignment = True
+        return venue
+
+    def __repr__(self):
+        return f'SyntheticVenue(venue_id={self.venue_id!r}, submissions={len(self.submissions)}, reviewers={len(self.reviewers)}, area_chairs={len(self.area_chairs)}, authors={len(self.authors)})'
+
+
+def seed_venue(api, venue_id='Synthetic.cc/2025/Conference', papers=100, reviewers=300, area_chairs=0, authors_per_paper=3, scores_per_paper=None, bids_per_reviewer=0, proposed_assignments_per_paper=0, reviews_per_paper=0, decisions=False, institutions=INSTITUTIONS, seed=0):
+    """
+    Adds a synthetic venue to a :class:`FakeOpenReviewAPI`: the venue, committee and per paper Groups, the Profiles of the
+    committee members and authors, the submissions, and the affinity score, bid and proposed assignment Edges of the reviewers.
+    Reviews need the deployed assignments, the anonymous reviewer Groups and the review Invitation, all of them are
+    added when ``reviews_per_paper`` is set. The content is random but reproducible for the same ``seed``.
+
+    :param api: Fake API to seed
+    :type api: FakeOpenReviewAPI
+    :param venue_id: Id of the venue
+    :type venue_id: str, optional
+    :param papers: Number of submissions
+    :type papers: int, optional
+    :param reviewers: Number of reviewers
+    :type reviewers: int, optional
+    :param area_chairs: Number of area chairs, no area chairs group is created if it is 0
+    :type area_chairs: int, optional
+    :param authors_per_paper: Number of authors of every submission
+    :type authors_per_paper: int, optional
+    :param scores_per_paper: Number of reviewers with an affinity score for every submission, all the reviewers if None
+    :type scores_per_paper: int, optional
+    :param bids_per_reviewer: Number of bids of every reviewer
+    :type bids_per_reviewer: int, optional
+    :param proposed_assignments_per_paper: Number of proposed assignment Edges of every submission
+    :type proposed_assignments_per_paper: int, optional
+    :param reviews_per_paper: Number of reviewers assigned to every submission, each of them posts a review
+    :type reviews_per_paper: int, optional
+    :param decisions: Whether a decision is posted for every submission, about a third of them are accepted
+    :type decisions: bool, optional
+    :param institutions: Email domains of the users, the fewer domains the more conflicts between reviewers and authors
+    :type institutions: list[str], optional
+    :param seed: Seed of the random content
+    :type seed: int, optional
+
+    :return: Ids of the created objects
+    :rtype: SyntheticVenue
+    """
+    rng = random.Random(seed)
+    venue = SyntheticVenue(venue_id)
+    submission_name = venue.submission_name
+
+    def add_users(role, count):
+        ids = []
+        for index in range(count):
+            name = letters(index)
+            profile_id = f'~{role}_{name}1'
+            institution = rng.choice(institutions)
+            api.add_profile(profile_id, f'{role} {name}', [f'{role.lower()}{index}@{institution}'], institution=institution)
+            ids.append(profile_id)
+        return ids
+
+    venue.reviewers = add_users('Reviewer', reviewers)
+    venue.area_chairs = add_users('Area_Chair', area_chairs)
+    venue.authors = add_users('Author', papers * authors_per_paper)
+    api.add_profile('~Program_Chair1', 'Program Chair', ['pc@synthetic.cc'], institution='synthetic.cc')
+
+    path = venue_id.split('/')
+    for index in range(1, len(path)):
+        api.add_group({ 'id': '/'.join(path[:index]), 'domain': '/'.join(path[:index]) })
+    content = {
+        'submission_id': venue.submission_id,
+        'submission_name': submission_name,
+        'submission_venue_id': venue.submission_venue_id,
+        'rejected_venue_id': f'{venue_id}/Rejected_{submission_name}',
+        'program_chairs_id': venue.program_chairs_id,
+        'reviewers_id': venue.reviewers_id,
+        'reviewers_name': 'Reviewers',
+        'reviewers_anon_name': 'Reviewer_',
+        'reviewers_affinity_score_id': venue.affinity_score_id,
+        'reviewers_conflict_id': f'{venue.reviewers_id}/-/Conflict',
+        'reviewers_proposed_assignment_id': venue.proposed_assignment_id,
+        'reviewers_assignment_id': f'{venue.reviewers_id}/-/Assignment',
+        'authors_id': venue.authors_id,
+        'authors_name': 'Authors',
+        'review_name': 'Official_Review',
+        'decision_name': 'Decision',
+        'meta_invitation_id': f'{venue_id}/-/Edit'
+    }
+    if area_chairs:
+        content.update({ 'area_chairs_id': venue.area_chairs_id, 'area_chairs_name': 'Area_Chairs' })
+    api.add_group({ 'id': venue_id, 'domain': venue_id, 'signatures': ['~Super_User1'], 'content': { key: { 'value': value } for key, value in content.items() } })
+    committee = (('Program_Chairs', ['~Program_Chair1']), ('Reviewers', venue.reviewers), ('Authors', [f'{venue_id}/{submission_name}{number}/Authors' for number in range(1, papers + 1)]))
+    if area_chairs:
+        committee += (('Area_Chairs', venue.area_chairs),)
+    for name, members in committee:
+        api.add_group({ 'id': f'{venue_id}/{name}', 'domain': venue_id, 'members': members, 'signatures': [venue_id], 'readers': [venue_id, f'{venue_id}/{name}'] })
+
+    api.add_invitation({ 'id': f'{venue_id}/-/Edit', 'domain': venue_id, 'signatures': ['~Super_User1'] })
+    api.add_invitation({ 'id': venue.submission_id, 'domain': venue_id, 'signatures': [venue_id], 'edit': { 'note': { 'id': { 'param': { 'withInvitation': venue.submission_id, 'optional': True } } } } })
+    for invitation_id, tail_type in ((venue.affinity_score_id, 'profile'), (venue.bid_id, 'profile'), (venue.proposed_assignment_id, 'profile'), (venue.assignment_id, 'profile')):
+        api.add_invitation({ 'id': invitation_id, 'domain': venue_id, 'signatures': [venue_id], 'edge': { 'head': { 'param': { 'type': 'note', 'withInvitation': venue.submission_id } }, 'tail': { 'param': { 'type': tail_type } } } })
+
+    for number in range(1, papers + 1):
+        authorids = venue.authors[(number - 1) * authors_per_paper:number * authors_per_paper]
+        note = api.add_note({
+            'number': number,
+            'invitations': [venue.submission_id],
+            'readers': [venue_id, f'{venue_id}/{submission_name}{number}/Reviewers', f'{venue_id}/{submission_name}{number}/Authors'],
+            'writers': [venue_id, f'{venue_id}/{submission_name}{number}/Authors'],
+            'signatures': [f'{venue_id}/{submission_name}{number}/Authors'],
+            'content': {
+                'title': { 'value': f'Synthetic paper {number}' },
+                'abstract': { 'value': ' '.join(rng.choice(('graph', 'neural', 'learning', 'bayesian', 'optimization', 'language', 'vision', 'robust')) for _ in range(60)) },
+                'authors': { 'value': [api.profiles[id]['content']['names'][0]['fullname'] for id in authorids] },
+                'authorids': { 'value': authorids },
+                'keywords': { 'value': rng.sample(('graphs', 'transformers', 'theory', 'fairness', 'reinforcement learning', 'optimization'), 2) },
+                'pdf': { 'value': f'/pdf/{"%040x" % rng.getrandbits(160)}.pdf' },
+                'venue': { 'value': f'{venue_id} Submission' },
+                'venueid': { 'value': venue.submission_venue_id }
+            }
+        }, invitation=venue.submission_id)
+        venue.submissions.append(note['id'])
+        paper_prefix = f'{venue_id}/{submission_name}{number}'
+        api.add_group({ 'id': f'{paper_prefix}/Authors', 'domain': venue_id, 'members': authorids, 'signatures': [venue_id] })
+        api.add_group({ 'id': f'{paper_prefix}/Reviewers', 'domain': venue_id, 'members': [], 'signatures': [venue_id], 'anonids': True })
+        if area_chairs:
+            api.add_group({ 'id': f'{paper_prefix}/Area_Chairs', 'domain': venue_id, 'members': [], 'signatures': [venue_id], 'anonids': True })
+
+    edge_fields = { 'readers': [venue_id], 'writers': [venue_id], 'signatures': [venue_id] }
+    edges = []
+    for note_id in venue.submissions:
+        scored = venue.reviewers if scores_per_paper is None else rng.sample(venue.reviewers, min(scores_per_paper, len(venue.reviewers)))
+        edges.extend(dict(edge_fields, invitation=venue.affinity_score_id, head=note_id, tail=tail, weight=round(rng.random(), 4)) for tail in scored)
+        assigned = rng.sample(venue.reviewers, min(proposed_assignments_per_paper, len(venue.reviewers)))
+        edges.extend(dict(edge_fields, invitation=venue.proposed_assignment_id, head=note_id, tail=tail, weight=1, label='synthetic-matching') for tail in assigned)
+    for reviewer in venue.reviewers:
+        for note_id in rng.sample(venue.submissions, min(bids_per_reviewer, len(venue.submissions))):
+            edges.append(dict(edge_fields, invitation=venue.bid_id, head=note_id, tail=reviewer, label=rng.choice(BID_LABELS), signatures=[reviewer]))
+
+    if reviews_per_paper:
+        ## Reviews are due two weeks after the assignments, a quarter of them are late
+        assignment_cdate = openreview.tools.datetime_millis(datetime.datetime.now() - datetime.timedelta(days=30))
+        duedate = assignment_cdate + DAY * 14
+        api.add_invitation({ 'id': venue.review_id, 'domain': venue_id, 'signatures': [venue_id], 'edit': { 'invitation': { 'id': f'{venue.submission_venue_id}${{2/content/noteNumber/value}}/-/Official_Review', 'duedate': duedate } } })
+        for number, note_id in enumerate(venue.submissions, start=1):
+            paper_prefix = f'{venue_id}/{submission_name}{number}'
+            assigned = rng.sample(venue.reviewers, min(reviews_per_paper, len(venue.reviewers)))
+            api.groups[f'{paper_prefix}/Reviewers']['members'] = assigned
+            for reviewer in assigned:
+                edges.append(dict(edge_fields, invitation=venue.assignment_id, head=note_id, tail=reviewer, weight=1, cdate=assignment_cdate))
+                anon_group_id = f'{paper_prefix}/Reviewer_{"%04x" % rng.getrandbits(16)}'
+                while anon_group_id in api.groups:
+                    anon_group_id = f'{paper_prefix}/Reviewer_{"%04x" % rng.getrandbits(16)}'
+                api.add_group({ 'id': anon_group_id, 'domain': venue_id, 'members': [reviewer], 'signatures': [venue_id], 'signatories': [venue_id, anon_group_id] })
+                tcdate = duedate + DAY * rng.randint(-10, 3)
+                api.add_note({
+                    'invitations': [f'{paper_prefix}/-/Official_Review'],
+                    'replyto': note_id,
+                    'readers': [venue_id, f'{paper_prefix}/Reviewers'],
+                    'writers': [venue_id, anon_group_id],
+                    'signatures': [anon_group_id],
+                    'tcdate': tcdate,
+                    'cdate': tcdate,
+                    'content': {
+                        'rating': { 'value': rng.randint(1, 10) },
+                        'confidence': { 'value': rng.randint(1, 5) },
+                        'review': { 'value': ' '.join(rng.choice(('novel', 'unclear', 'strong', 'baseline', 'ablation', 'proof')) for _ in range(200)) }
+                    }
+                })
+
+    if decisions:
+        for number, note_id in enumerate(venue.submissions, start=1):
+            api.add_note({
+                'invitations': [f'{venue_id}/{submission_name}{number}/-/Decision'],
+                'replyto': note_id,
+                'readers': [venue.program_chairs_id],
+                'writers': [venue_id],
+                'signatures': [venue.program_chairs_id],
+                'content': { 'decision': { 'value': 'Accept (Poster)' if rng.random() < 0.33 else 'Reject' } }
+            })
+
+    api.add_edges(edges)
+    return venue
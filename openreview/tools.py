@@ -2,6 +2,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 import inspect
+import functools
+import threading
+import codecs
+import collections
+import gzip
+import io
+import itertools
+import mmap
 
 import json
 import os
@@ -18,11 +26,18 @@ from tqdm import tqdm
 import tld
 import urllib.parse as urlparse
 from tqdm import tqdm
+import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
+import requests
+import time
 import random
 import string
 from deprecated.sphinx import deprecated
 import jwt
+from .cache import ProfileCache, SQLiteProfileCache, ResponseCache, SingleFlight, ScriptCache
+from .telemetry import RequestTelemetry, get_default_telemetry
+from .messages import MessageQueue
+from .conflicts import ProfileInfo, ConflictPolicy, register_conflict_policy, get_conflict_policy, ConflictIndex, ConflictComputer, merge_profile_info, compact_profile_info, get_conflict_details, find_conflicts
 
 # --- URL Constants ---
 PROD_API_V1 = 'https://api.openreview.net'
@@ -41,6 +56,13 @@ LOCAL_SITE   = os.environ.get('OPENREVIEW_WEB_URL', 'http://localhost:3030')
 V1_REMOTE_URLS = [PROD_API_V1, DEV_API_V1]
 V2_REMOTE_URLS = [PROD_API_V2, DEV_API_V2]
 
+# --- HTTP connection pool defaults ---
+# The pool keeps more connections than the threads used by concurrent_requests, so connections are reused instead of reopened
+HTTP_POOL_CONNECTIONS = int(os.environ.get('OPENREVIEW_HTTP_POOL_CONNECTIONS', 10))
+HTTP_POOL_MAXSIZE = int(os.environ.get('OPENREVIEW_HTTP_POOL_MAXSIZE', 32))
+# Maximum number of clients kept by get_shared_client, the least recently used ones are dropped first
+SHARED_CLIENTS_MAXSIZE = int(os.environ.get('OPENREVIEW_SHARED_CLIENTS_MAXSIZE', 32))
+
 def _identify_environment(baseurl):
     """Return 'dev', 'prod', or 'local' based on baseurl."""
     if any(url in baseurl for url in [DEV_API_V1, DEV_API_V2]):
@@ -88,10 +110,13 @@ def run_once(f):
     Decorator to run a function only once and return its output for any subsequent call to the function without running
     it again
     """
+    lock = threading.Lock()
     def wrapper(*args, **kwargs):
         if not wrapper.has_run:
-            wrapper.has_run = True
-            wrapper.to_return = f(*args, **kwargs)
+            with lock:
+                if not wrapper.has_run:
+                    wrapper.to_return = f(*args, **kwargs)
+                    wrapper.has_run = True
         return wrapper.to_return
     wrapper.has_run = False
     return wrapper
@@ -165,10 +190,8 @@ def get_profile(client, value, with_publications=False):
     try:
         profile = client.get_profile(value)
         if with_publications:
-            baseurl_v1, baseurl_v2 = get_base_urls(client)
-
-            client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
-            #client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
+            client_v1 = get_shared_client(client, api_version=1)
+            #client_v2 = get_shared_client(client, api_version=2)
             notes_v1 = list(iterget_notes(client_v1, content={'authorids': profile.id}))
             #notes_v2 = list(iterget_notes(client_v2, content={'authorids': profile.id}))
             profile.content['publications'] = notes_v1 #+ notes_v2
@@ -179,14 +202,128 @@ def get_profile(client, value, with_publications=False):
     return profile
 
 
-def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, with_preferred_emails=None, as_dict=False):
+_profile_cache = None
+
+def set_profile_cache(cache):
+    '''
+    Sets the process-wide Profile cache used by :func:`get_profiles`. Pass None to disable it.
+
+    :param cache: Profile cache, e.g. :class:`ProfileCache` or :class:`SQLiteProfileCache`
+    :type cache: ProfileCache
+    '''
+    global _profile_cache
+    _profile_cache = cache
+
+def get_profile_cache():
+    '''
+    Returns the process-wide Profile cache used by :func:`get_profiles`, None if the cache is disabled.
+
+    :return: Profile cache
+    :rtype: ProfileCache
+    '''
+    return _profile_cache
+
+_script_cache = ScriptCache()
+
+def set_script_cache(cache):
+    '''
+    Sets the process-wide cache of the scripts run by :func:`run_process_script`.
+
+    :param cache: Script cache, e.g. ``ScriptCache(max_age=60)`` to also reuse the meta invitations for a minute
+    :type cache: ScriptCache
+    '''
+    global _script_cache
+    _script_cache = cache
+
+def get_script_cache():
+    '''
+    Returns the process-wide cache of the scripts run by :func:`run_process_script`.
+
+    :return: Script cache
+    :rtype: ScriptCache
+    '''
+    return _script_cache
+
+def run_process_script(client, meta_invitation_id, field_name, funcs, *args):
+    '''
+    Runs the script stored in a content field of a meta invitation, the way the process functions generated by the
+    invitation builders do. The script is compiled once per version and cached, see :class:`ScriptCache`, and is
+    executed in the ``funcs`` namespace before its ``process`` function is called. If the ``process`` function has a
+    ``context`` argument, it receives the :class:`openreview.api.DomainContext` of its edit or invitation.
+
+    :param client: Client used to fetch the meta invitation
+    :type client: OpenReviewClient
+    :param meta_invitation_id: Id of the meta invitation
+    :type meta_invitation_id: str
+    :param field_name: Content field of the meta invitation with the script, e.g. ``review_process_script``
+    :type field_name: str
+    :param funcs: Global names available to the script, e.g. ``{ 'openreview': openreview }``
+    :type funcs: dict
+    :param args: Arguments of the ``process`` function of the script
+
+    :return: Value returned by the ``process`` function
+    '''
+    meta_invitation = _script_cache.get_invitation(client, meta_invitation_id)
+    code = _script_cache.compile(meta_invitation.content[field_name]['value'], filename=f'{meta_invitation_id}:{field_name}', version=(client.baseurl, meta_invitation.id, meta_invitation.tmdate, field_name) if meta_invitation.tmdate else None)
+    exec(code, funcs)
+    process = funcs['process']
+    signature = inspect.signature(process)
+    if 'context' in signature.parameters and len(args) < len(signature.parameters):
+        arguments = signature.bind_partial(*args).arguments
+        ## The meta invitation is usually the parent invitation of the invitation, it is not fetched again
+        context = openreview.api.DomainContext.load(arguments.get('client', client), edit=arguments.get('edit'), invitation=arguments.get('invitation'), parent_invitation=meta_invitation)
+        return process(*args, context=context)
+    return process(*args)
+
+CONFLICT_PUBLICATION_FIELDS = 'id,pdate,cdate,tcdate,content.year,content.venueid'
+
+def get_publications(client_v1, client_v2, author_ids, select=None, max_workers=None):
+    '''
+    Gets the publications of several authors from both APIs. All the queries share a single thread pool instead of
+    opening one per author.
+
+    :param client_v1: Client used to get the API 1 publications
+    :type client_v1: Client
+    :param client_v2: Client used to get the API 2 publications
+    :type client_v2: OpenReviewClient
+    :param author_ids: Profile ids or emails of the authors
+    :type author_ids: list[str]
+    :param select: Comma separated list of fields to get for each publication, e.g. :data:`CONFLICT_PUBLICATION_FIELDS`
+        to get only the fields used by the conflict policies. If None, the complete Notes are returned.
+    :type select: str, optional
+    :param max_workers: number of workers to use in the ThreadPoolExecutor, default value is min(16, cpu_count() * 5).
+    :type max_workers: int, optional
+
+    :return: Dictionary of publications, API 1 publications first, by author id
+    :rtype: dict
+    '''
+    def get_author_publications(query):
+        api_client, author_id = query
+        return api_client.get_all_notes(content={'authorids': author_id}, select=select)
+
+    author_ids = list(dict.fromkeys(author_ids))
+    queries = [(api_client, author_id) for author_id in author_ids for api_client in [client_v1, client_v2]]
+    results = concurrent_requests(get_author_publications, queries, desc='Loading publications from both APIs', max_workers=max_workers)
+
+    publications_by_id = { author_id: [] for author_id in author_ids }
+    for (api_client, author_id), publications in zip(queries, results):
+        publications_by_id[author_id].extend(publications)
+    return publications_by_id
+
+def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, with_preferred_emails=None, as_dict=False, cache=None, publication_fields=None):
     '''
     Helper function that repeatedly queries for profiles, given IDs and emails.
     Useful for getting more Profiles than the server will return by default (1000)
 
     :param with_preferred_emails: invitation id to get the edges where the preferred emails are stored
     :type with_preferred_emails: str
+    :param publication_fields: Comma separated list of fields to get for each publication when ``with_publications`` is True, e.g. :data:`CONFLICT_PUBLICATION_FIELDS`. If None, the complete Notes are returned.
+    :type publication_fields: str, optional
+    :param cache: Profile cache to look up the Profiles before querying the server. Defaults to the cache set with :func:`set_profile_cache`.
+    :type cache: ProfileCache, optional
     '''
+    if cache is None:
+        cache = _profile_cache
     ids = []
     emails = []
     for member in ids_or_emails:
@@ -206,19 +343,33 @@ def get_profiles(client, ids_or_emails, with_publications=False, with_relations=
         if email:
             profile_by_id_or_email[email] = profile        
 
+    missing_ids = ids
+    missing_emails = emails
+    if cache is not None:
+        ## Only query the server for the profiles that are not in the cache
+        cached_profiles = cache.get_many(ids + emails)
+        for key, profile in cached_profiles.items():
+            process_profile(profile, None if key.startswith('~') else key)
+        missing_ids = [id for id in ids if id not in cached_profiles]
+        missing_emails = [email for email in emails if email not in cached_profiles]
+
     batch_size = 1000
     ## Get profiles by id and add them to the profiles list
-    for i in range(0, len(ids), batch_size):
-        batch_ids = ids[i:i+batch_size]
+    for i in range(0, len(missing_ids), batch_size):
+        batch_ids = missing_ids[i:i+batch_size]
         batch_profiles = client.search_profiles(ids=batch_ids)
         for profile in batch_profiles:
+            if cache is not None:
+                cache.put(profile)
             process_profile(profile)
 
     ## Get profiles by email and add them to the profiles list
-    for j in range(0, len(emails), batch_size):
-        batch_emails = emails[j:j+batch_size]
+    for j in range(0, len(missing_emails), batch_size):
+        batch_emails = missing_emails[j:j+batch_size]
         batch_profile_by_email = client.search_profiles(confirmedEmails=batch_emails)
         for email, profile in batch_profile_by_email.items():
+            if cache is not None:
+                cache.put(profile)
             process_profile(profile, email)            
 
     for email in emails:
@@ -238,25 +389,12 @@ def get_profiles(client, ids_or_emails, with_publications=False, with_relations=
     ## Get publications for all the profiles
     profiles = list(profile_by_id.values())
     if with_publications:
-        baseurl_v1, baseurl_v2 = get_base_urls(client)
-
-        client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
-        client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
-
-        # Fetch publications from both APIs in parallel per profile
-        from concurrent.futures import ThreadPoolExecutor
-
-        def get_publications(profile):
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                future_v1 = executor.submit(client_v1.get_all_notes, content={'authorids': profile.id})
-                future_v2 = executor.submit(client_v2.get_all_notes, content={'authorids': profile.id})
-                pubs_v1 = future_v1.result()
-                pubs_v2 = future_v2.result()
-                return pubs_v1 + pubs_v2
+        client_v1 = get_shared_client(client, api_version=1)
+        client_v2 = get_shared_client(client, api_version=2)
 
-        publications_all = concurrent_requests(get_publications, profiles, desc='Loading publications from both APIs')
-        for idx, publications in enumerate(publications_all):
-            profiles[idx].content['publications'] = publications
+        publications_by_id = get_publications(client_v1, client_v2, [profile.id for profile in profiles], select=publication_fields)
+        for profile in profiles:
+            profile.content['publications'] = publications_by_id[profile.id]
 
     if with_relations:
 
@@ -599,9 +737,26 @@ def load_duplicate_domains():
     return duplicate_domains
 
 
+@functools.lru_cache(maxsize=65536)
+def _is_tld(domain):
+    return tld.is_tld(domain)
+
+@functools.lru_cache(maxsize=65536)
+def _subdomains(domain):
+    duplicate_domains: dict = load_duplicate_domains()
+    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
+    valid_domains = set()
+    for d in domains:
+        if not _is_tld(d):
+            valid_domains.add(duplicate_domains.get(d, d))
+
+    return tuple(sorted(valid_domains))
+
 def subdomains(domain):
     """
     Given an email address, returns a list with the domains and subdomains.
+    The results are kept in a bounded LRU cache, so repeated domains are only expanded once.
 
     :param domain: e-mail address or domain of the e-mail address
     :type domain: str
@@ -614,15 +769,26 @@ def subdomains(domain):
     >>> subdomains('johnsmith@iesl.cs.umass.edu')
     [u'iesl.cs.umass.edu', u'cs.umass.edu', u'umass.edu']
     """
+    return list(_subdomains(domain))
 
-    duplicate_domains: dict = load_duplicate_domains()
-    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
-    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
-    valid_domains = set()
-    for d in domains:
-        if not tld.is_tld(d):
-            valid_domains.add(duplicate_domains.get(d, d))
+def subdomains_many(domains):
+    """
+    Given a list of email addresses or domains, returns a list with all their domains and subdomains.
 
+    :param domains: e-mail addresses or domains of the e-mail addresses
+    :type domains: list[str]
+
+    :return: Sorted list of unique domains and subdomains
+    :rtype: list[str]
+
+    Example:
+
+    >>> subdomains_many(['iesl.cs.umass.edu', 'mit.edu'])
+    [u'cs.umass.edu', u'iesl.cs.umass.edu', u'mit.edu', u'umass.edu']
+    """
+    valid_domains = set()
+    for domain in set(domains):
+        valid_domains.update(_subdomains(domain))
     return sorted(valid_domains)
 
 def get_paperhash(first_author, title):
@@ -895,6 +1061,250 @@ class efficient_iterget:
     next = __next__
 
 
+def concurrent_cursor_get(get_function, desc='Gathering Responses', max_workers=None, **params):
+    """
+    Returns the list of all the objects returned by a getter method that supports ``after`` cursors, fetching several
+    cursor ranges in parallel. The id space is partitioned by sampling the ids found at evenly spaced positions of the
+    result set, then each range is walked with ``after=<last id>`` cursors in its own worker. The result has the same
+    order as :class:`efficient_iterget`.
+
+    :param get_function: Getter method that accepts ``after``, ``sort``, ``limit``, ``offset`` and ``with_count``, e.g. :meth:`openreview.api.OpenReviewClient.get_notes`
+    :type get_function: function
+    :param desc: description to show in the progress bar.
+    :type desc: str
+    :param max_workers: number of workers to use in the ThreadPoolExecutor, default value is min(16, cpu_count() * 5).
+    :type max_workers: int
+    :param params: Dictionary containing parameters for the getter method
+    :type params: dict
+
+    :return: List of all the objects sorted by id
+    :rtype: list
+    """
+    if params.get('sort') and params['sort'] != 'id':
+        return list(efficient_iterget(get_function, desc=desc, **params))
+
+    if max_workers is None:
+        max_workers = min(16, (cpu_count() or 1) * 5)
+
+    limit = params.get('limit') or 1000
+    params.update({
+        'sort': 'id',
+        'limit': limit,
+        'with_count': True
+    })
+    first_batch, total = get_function(**params)
+    params['with_count'] = False
+
+    if len(first_batch) < limit or total <= limit:
+        return first_batch
+
+    partitions = min(max_workers, -(-total // limit))
+
+    ## Sample the last id of every partition but the last one, it is used as the cursor of the next partition
+    def get_boundary(offset):
+        batch = get_function(**{ **params, 'offset': offset, 'limit': 1 })
+        return batch[0].id if batch else None
+
+    boundary_offsets = [(total * index) // partitions - 1 for index in range(1, partitions)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        boundaries = list(executor.map(get_boundary, boundary_offsets))
+    boundaries = sorted(set([b for b in boundaries if b is not None and b > first_batch[-1].id]))
+
+    gathering_responses = tqdm(total=total, desc=desc)
+    gathering_responses.update(len(first_batch))
+
+    def get_partition(index):
+        after = first_batch[-1].id if index == 0 else boundaries[index - 1]
+        last = boundaries[index] if index < len(boundaries) else None
+        results = []
+        while True:
+            batch = get_function(**{ **params, 'after': after })
+            for obj in batch:
+                if last is not None and obj.id > last:
+                    return results
+                results.append(obj)
+                if obj.id == last:
+                    return results
+            gathering_responses.update(len(batch))
+            if len(batch) < limit:
+                return results
+            after = batch[-1].id
+
+    docs = list(first_batch)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for partition in executor.map(get_partition, range(len(boundaries) + 1)):
+            docs.extend(partition)
+
+    gathering_responses.close()
+    return docs
+
+
+def iter_csv_rows(source, use_mmap=True, line_numbers=False):
+    """
+    Reads the rows of a CSV file or stream one at a time, so large files like affinity scores can be processed in
+    bounded memory. Gzip compressed input is detected from its header and decompressed on the fly. Uncompressed files
+    are memory-mapped, so their pages are read on demand and shared with other processes reading the same file.
+
+    :param source: Path to the CSV file, CSV content as ``bytes``, or a binary file object
+    :type source: str or bytes or file
+    :param use_mmap: Memory-map uncompressed files instead of reading them with buffered IO
+    :type use_mmap: bool, optional
+    :param line_numbers: Yield ``(line_number, row)`` pairs, where the line number is the line of the file where the row ends
+    :type line_numbers: bool, optional
+
+    :return: Iterator over the rows, each row is a list of str. Empty lines are skipped.
+    :rtype: iterator
+
+    Example:
+
+    >>> list(iter_csv_rows(b'paper1,~User_11,0.5\npaper2,~User_11,0.9\n'))
+    [['paper1', '~User_11', '0.5'], ['paper2', '~User_11', '0.9']]
+    """
+    def iter_lines(binary_file):
+        for line in binary_file:
+            yield line.decode('utf-8')
+
+    def iter_rows(lines):
+        reader = csv.reader(lines)
+        for row in reader:
+            if row:
+                yield (reader.line_num, row) if line_numbers else row
+
+    if isinstance(source, str):
+        with open(source, 'rb') as file_handle:
+            is_gzip = file_handle.read(2) == b'\x1f\x8b'
+            file_handle.seek(0)
+            if is_gzip:
+                with gzip.GzipFile(fileobj=file_handle) as gzip_file:
+                    yield from iter_rows(iter_lines(gzip_file))
+            elif use_mmap and os.path.getsize(source) > 0:
+                with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                    yield from iter_rows(iter_lines(iter(mapped_file.readline, b'')))
+            else:
+                yield from iter_rows(iter_lines(file_handle))
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    header = source.peek(2)[:2] if hasattr(source, 'peek') else b''
+    if not header and hasattr(source, 'seek'):
+        header = source.read(2)
+        source.seek(-len(header), io.SEEK_CUR)
+    if header == b'\x1f\x8b':
+        source = gzip.GzipFile(fileobj=source)
+    yield from iter_rows(iter_lines(source))
+
+
+def iter_json_array(chunks, key, raw=False):
+    """
+    Incrementally parses a JSON object received in chunks and yields, one at a time, the items of the array stored
+    under its top-level ``key``. Only the item being decoded and a small read buffer are kept in memory, which
+    makes it possible to consume streamed responses like ``{"edges": [...]}`` in bounded memory.
+
+    :param chunks: Iterable of ``bytes`` or ``str`` pieces of the JSON document, e.g. ``response.iter_content()``
+    :type chunks: iterable
+    :param key: Name of the top-level array whose items will be yielded
+    :type key: str
+    :param raw: If True, the JSON text of each item is yielded instead of the decoded item, e.g. to decode it later with :class:`openreview.api.LazyNote`
+    :type raw: bool, optional
+
+    :return: Iterator over the decoded items of the array. Nothing is yielded if the key is not present.
+    :rtype: iterator
+
+    Example:
+
+    >>> list(iter_json_array([b'{"count": 2, "edges": [{"id"', b': "e1"}, {"id": "e2"}]}'], 'edges'))
+    [{'id': 'e1'}, {'id': 'e2'}]
+    """
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    state = { 'buffer': '', 'position': 0, 'exhausted': False }
+
+    def read_more(min_size=1):
+        ## Append at least min_size characters to the buffer, returns False when the stream is exhausted
+        read = 0
+        while read < min_size and not state['exhausted']:
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                state['exhausted'] = True
+                chunk = utf8_decoder.decode(b'', final=True)
+            else:
+                if isinstance(chunk, bytes):
+                    chunk = utf8_decoder.decode(chunk)
+            if chunk:
+                ## drop the consumed prefix so the buffer does not grow with the response size
+                if state['position']:
+                    state['buffer'] = state['buffer'][state['position']:]
+                    state['position'] = 0
+                state['buffer'] += chunk
+                read += len(chunk)
+        return read > 0
+
+    def peek():
+        ## Skip whitespace and return the next significant character, or None at the end of the stream
+        while True:
+            buffer = state['buffer']
+            position = state['position']
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            state['position'] = position
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                return None
+
+    def expect(characters):
+        character = peek()
+        if character is None or character not in characters:
+            raise json.JSONDecodeError(f'Expecting one of {characters!r}', state['buffer'], state['position'])
+        state['position'] += 1
+        return character
+
+    def decode_value(as_text=False):
+        peek()
+        attempted_size = 0
+        while True:
+            buffer = state['buffer']
+            position = state['position']
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if state['exhausted']:
+                    raise
+                ## grow the buffer geometrically so large values are not re-parsed once per chunk
+                attempted_size = max(len(buffer) - position, attempted_size)
+                read_more(attempted_size)
+                continue
+            ## a value ending exactly at the end of the buffer may be a truncated number or literal
+            if end == len(buffer) and not state['exhausted'] and read_more():
+                continue
+            state['position'] = end
+            return buffer[position:end] if as_text else value
+
+    if peek() is None:
+        return
+    expect('{')
+    if peek() == '}':
+        return
+    while True:
+        name = decode_value()
+        expect(':')
+        if name == key:
+            expect('[')
+            if peek() == ']':
+                return
+            while True:
+                yield decode_value(as_text=raw)
+                if expect(',]') == ']':
+                    return
+        decode_value()
+        if expect(',}') == '}':
+            return
+
+
 def iterget_messages(client, to = None, subject = None, status = None):
     """
     Returns an iterator over Messages ignoring API limit.
@@ -1471,29 +1881,20 @@ def get_all_venues(client):
     return client.get_group("host").members
 
 def info_function_builder(policy_function):
+    """
+    Builds a function that gets the conflict info of a Profile with the passed policy. The info is a new dictionary
+    with all the keys returned by the policy and the domains expanded with their subdomains, see :class:`ConflictPolicy`
+    to get cached immutable info instead.
+
+    :param policy_function: Policy function, e.g. :func:`get_profile_info`
+    :type policy_function: function
+
+    :return: Function that receives the Profile, the number of years and optionally the submission venue id
+    :rtype: function
+    """
+    policy = get_conflict_policy(policy_function)
     def inner(profile, n_years=None, submission_venueid=None):
-        common_domains = ['gmail.com', 'qq.com', '126.com', '163.com',
-                    'outlook.com', 'hotmail.com', 'yahoo.com', 'foxmail.com', 'aol.com', 'msn.com', 'ymail.com', 'googlemail.com', 'live.com',
-                    'independent-researcher.org']
-        argspec = inspect.getfullargspec(policy_function)
-        if 'submission_venueid' in argspec.args:
-            result = policy_function(profile, n_years, submission_venueid)
-        else:
-            result = policy_function(profile, n_years)
-        domains = set()
-        subdomains_dict = {}
-        for domain in result['domains']:
-            if domain not in subdomains_dict:
-                subdomains = openreview.tools.subdomains(domain)
-                subdomains_dict[domain] = subdomains
-            domains.update(subdomains_dict[domain])
-
-        # Filter common domains
-        for common_domain in common_domains:
-            domains.discard(common_domain)
-
-        result['domains'] = list(domains)
-        return result
+        return policy.run(profile, n_years, submission_venueid)
     return inner
 
 def get_conflicts(author_profiles, user_profile, policy='default', n_years=None):
@@ -1519,14 +1920,7 @@ def get_conflicts(author_profiles, user_profile, policy='default', n_years=None)
     author_relations = set()
     author_publications = set()
 
-    if callable(policy):
-        info_function = info_function_builder(policy)
-    elif policy == 'NeurIPS':
-        info_function = info_function_builder(get_neurips_profile_info)
-    elif policy == 'Comprehensive':
-        info_function = info_function_builder(get_comprehensive_profile_info)
-    else:
-        info_function = info_function_builder(get_profile_info)
+    info_function = get_conflict_policy(policy)
 
     for profile in author_profiles:
         author_info = info_function(profile, n_years)
@@ -1763,7 +2157,7 @@ def get_current_submissions_profile_info(profile, n_years=None, submission_venue
 
     ## Get publications
     for publication in profile.content.get('publications', []):
-        if isinstance(publication.content.get('venueid'), dict) and publication.content['venueid']['value'] == submission_venueid:
+        if publication.content and isinstance(publication.content.get('venueid'), dict) and publication.content['venueid']['value'] == submission_venueid:
             publications.add(publication.id)
 
     return {
@@ -1794,7 +2188,7 @@ def filter_publications_by_year(publications, cut_off_year):
         if publication.pdate:
             year = extract_year(publication.id, publication.pdate)
 
-        if not year and 'year' in publication.content:
+        if not year and publication.content and 'year' in publication.content:
             unformatted_year = None
             if isinstance(publication.content['year'], dict) and 'value' in publication.content['year']:
                 unformatted_year = publication.content['year']['value']
@@ -1834,29 +2228,138 @@ def filter_relations_by_year(relations, cut_off_year, only_relations=None):
 
     return filtered_relations
 
-def post_bulk_edges(client, edges, batch_size = 50000):
+def _is_transient_error(error, idempotent=True):
+    ## A request that is not idempotent, e.g. a bulk POST, is only sent again when the server did not process it
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError)):
+        return idempotent
+    if isinstance(error, openreview.OpenReviewException):
+        details = error.args[0] if error.args and isinstance(error.args[0], dict) else {}
+        status = details.get('status')
+        if status is None:
+            return False
+        return status in (429, 503) or (idempotent and status >= 500)
+    return False
+
+def _load_checkpoint(checkpoint, batch_size):
+    committed = set()
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint) as file_handle:
+            for line in file_handle:
+                if line.strip():
+                    entry = json.loads(line)
+                    if entry['end'] - entry['start'] != batch_size and 'last' not in entry:
+                        raise openreview.OpenReviewException(f'The checkpoint {checkpoint} was created with a different batch size')
+                    committed.add(entry['start'])
+    return committed
+
+def post_bulk_edges(client, edges, batch_size = 50000, return_edges = True, max_in_flight = 4, retries = 3, backoff = 2, checkpoint = None):
     """Post a large list of Edges in batches with a progress bar.
 
     Splits the edge list into chunks of ``batch_size`` and posts each chunk
     via ``client.post_edges()``. Returns all posted Edge objects.
 
+    Up to ``max_in_flight`` chunks are posted at the same time. A chunk that
+    fails before the server processes it, because the connection could not be
+    established, the request was rate limited or the service was unavailable,
+    is retried with exponential backoff. Read timeouts and other server errors
+    are not retried because the chunk may have been posted, use a checkpoint
+    to resume the upload instead. When the upload finishes the number of Edges
+    posted per second is printed.
+
+    The Edges can also be passed as an iterator, e.g. a generator that reads
+    them from a file. Only the chunks in flight are built at a time, and with
+    ``return_edges=False`` the posted Edges are not kept either, so very
+    large lists can be posted in bounded memory.
+
+    If a ``checkpoint`` file is passed, the range of every committed chunk is
+    appended to it. Calling the function again with the same Edges, batch
+    size and checkpoint skips the committed chunks, so a failed upload
+    resumes where it stopped. The checkpoint file is removed once all the
+    chunks are posted.
+
     :param client: Client used to post the Edges.
     :type client: Client
-    :param edges: List of Edge objects to post.
+    :param edges: List or iterator of Edge objects to post.
     :type edges: list[Edge]
     :param batch_size: Number of edges per batch. Default: 50000.
     :type batch_size: int, optional
+    :param return_edges: If False, the number of posted Edges is returned instead of the Edges. Default: True.
+    :type return_edges: bool, optional
+    :param max_in_flight: Maximum number of chunks posted at the same time. Default: 4.
+    :type max_in_flight: int, optional
+    :param retries: Number of times a chunk is retried after a transient error. Default: 3.
+    :type retries: int, optional
+    :param backoff: Seconds to wait before the first retry, doubled after each retry. Default: 2.
+    :type backoff: float, optional
+    :param checkpoint: Path to the file where the committed chunks are recorded.
+    :type checkpoint: str, optional
+
+    :return: List of all posted Edge objects across all batches, or their number if ``return_edges`` is False.
+        Chunks skipped because of the checkpoint are not included.
+    :rtype: list[Edge] or int
+    """
+    total = (len(edges) // batch_size + 1) if isinstance(edges, (list, tuple)) else None
+    edges = iter(edges)
+    committed = _load_checkpoint(checkpoint, batch_size)
+    checkpoint_lock = threading.Lock()
+    results = {}
+    posted = 0
+    start_time = time.time()
+
+    def post_chunk(start, batch):
+        for attempt in range(retries + 1):
+            try:
+                posted_batch = client.post_edges(batch)
+                break
+            except Exception as error:
+                if attempt == retries or not _is_transient_error(error, idempotent=False):
+                    raise
+                wait = backoff * 2 ** attempt
+                print(f'Error posting edges {start}-{start + len(batch)}, retrying in {wait} seconds: {error}')
+                time.sleep(wait)
+        if checkpoint:
+            with checkpoint_lock, open(checkpoint, 'a') as file_handle:
+                entry = { 'start': start, 'end': start + len(batch) }
+                if len(batch) < batch_size:
+                    entry['last'] = True
+                file_handle.write(json.dumps(entry) + '\n')
+        return posted_batch
+
+    def collect(future):
+        nonlocal posted
+        start, posted_batch = futures.pop(future), future.result()
+        posted += len(posted_batch)
+        if return_edges:
+            results[start] = posted_batch
+        progress.update(1)
+
+    futures = {}
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor, tqdm(total=total) as progress:
+        start = 0
+        for batch in iter(lambda: list(itertools.islice(edges, batch_size)), []):
+            if start in committed:
+                progress.update(1)
+            else:
+                if len(futures) >= max_in_flight:
+                    done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+                futures[executor.submit(post_chunk, start, batch)] = start
+            start += len(batch)
+        for future in concurrent.futures.as_completed(list(futures)):
+            collect(future)
 
-    :return: List of all posted Edge objects across all batches.
-    :rtype: list[Edge]
-    """
-    num_edges = len(edges)
-    result = []
-    for i in tqdm(range(0, num_edges, batch_size), total=(num_edges // batch_size + 1)):
-        end = min(i + batch_size, num_edges)
-        batch = client.post_edges(edges[i:end])
-        result += batch
-    return result
+    if checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    elapsed = time.time() - start_time
+    print(f'Posted {posted} edges in {elapsed:.1f} seconds ({posted / elapsed if elapsed else 0:.0f} edges/s)')
+
+    if return_edges:
+        return [edge for start in sorted(results) for edge in results[start]]
+    return posted
 
 def post_bulk_tags(client, tags, batch_size = 50000):
     """Post a large list of Tags in batches with a progress bar.
@@ -1943,9 +2446,8 @@ def export_committee(client, committee_id, file_name):
             s = csvwriter.writerow([profile.get_preferred_email(), profile.get_preferred_name(pretty=True)])
 
 def get_own_reviews(client):
-    baseurl_v1, baseurl_v2 = get_base_urls(client)
-    client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
-    client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
+    client_v1 = get_shared_client(client, api_version=1)
+    client_v2 = get_shared_client(client, api_version=2)
 
     # Get all the reviews from v1
     notes_v1 = client_v1.get_all_notes(tauthor=True)
@@ -2033,6 +2535,83 @@ def get_base_urls(client):
         return [PROD_API_V1, PROD_API_V2]
     return [LOCAL_API_V1, LOCAL_API_V2]
 
+_shared_clients = collections.OrderedDict()
+_shared_clients_lock = threading.Lock()
+
+def get_shared_client(client, api_version=2):
+    '''
+    Returns a client for the API v1 or v2 of the same environment as the passed client, authenticated with the same token.
+    The clients are kept in a process-wide registry keyed by (baseurl, token), so helpers that need the other API version
+    reuse the same client and its warm connection pool instead of creating a new session, and profile request, on every call.
+    The registry keeps the :data:`SHARED_CLIENTS_MAXSIZE` most recently used clients.
+    If the passed client already points to the requested API version it is returned as is.
+
+    The shared clients must not be used to log in or to impersonate other users, as that changes their token.
+
+    :param client: Client or OpenReviewClient whose environment and token are used
+    :type client: Client | OpenReviewClient
+    :param api_version: Version of the API of the returned client, 1 or 2
+    :type api_version: int, optional
+
+    :return: Client for API v1 or OpenReviewClient for API v2
+    :rtype: Client | OpenReviewClient
+
+    Example:
+
+    >>> client_v1 = openreview.tools.get_shared_client(client_v2, api_version=1)
+    '''
+    baseurl = get_base_urls(client)[0 if api_version == 1 else 1]
+    if client.baseurl == baseurl:
+        return client
+
+    key = (baseurl, client.token)
+    with _shared_clients_lock:
+        shared_client = _shared_clients.get(key)
+        if shared_client is not None:
+            _shared_clients.move_to_end(key)
+            return shared_client
+    client_class = openreview.Client if api_version == 1 else openreview.api.OpenReviewClient
+    shared_client = client_class(baseurl=baseurl, token=client.token, telemetry=getattr(client, 'telemetry', None))
+    return _add_shared_client(key, shared_client, replace=False)
+
+def register_shared_client(client, api_version=2):
+    '''
+    Adds a client to the registry of :func:`get_shared_client`, so it is returned for the clients of the same environment
+    and token that request its API version, e.g. a client whose session is mounted on a fake or recorded API.
+    A client already registered for the same API version and token is replaced.
+
+    :param client: Client or OpenReviewClient to share, it must be logged in
+    :type client: Client | OpenReviewClient
+    :param api_version: Version of the API of the client, 1 or 2
+    :type api_version: int, optional
+
+    :return: The registered client
+    :rtype: Client | OpenReviewClient
+    '''
+    baseurl = get_base_urls(client)[0 if api_version == 1 else 1]
+    return _add_shared_client((baseurl, client.token), client, replace=True)
+
+def _add_shared_client(key, shared_client, replace):
+    with _shared_clients_lock:
+        if replace:
+            _shared_clients[key] = shared_client
+        else:
+            shared_client = _shared_clients.setdefault(key, shared_client)
+        _shared_clients.move_to_end(key)
+        ## The dropped clients are not closed, they may still be in use
+        while len(_shared_clients) > SHARED_CLIENTS_MAXSIZE:
+            _shared_clients.popitem(last=False)
+    return shared_client
+
+def clear_shared_clients():
+    '''
+    Closes the sessions of the clients created by :func:`get_shared_client` and empties the registry.
+    '''
+    with _shared_clients_lock:
+        for shared_client in _shared_clients.values():
+            shared_client.session.close()
+        _shared_clients.clear()
+
 def get_site_url(client):
     env = _identify_environment(client.baseurl)
     if env == 'dev':
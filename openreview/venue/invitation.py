@@ -25,27 +25,21 @@ class InvitationBuilder(object):
         self.spleep_time_for_logs = 0.5 if 'localhost' in venue.client.baseurl else 10
         self.update_date_string = "#{4/mdate} + " + str(self.update_wait_time)
         self.invitation_edit_process = '''def process(client, invitation):
-    meta_invitation = client.get_invitation("''' + self.venue.get_meta_invitation_id() + '''")
-    script = meta_invitation.content["invitation_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, "''' + self.venue.get_meta_invitation_id() + '''", "invitation_edit_script", funcs, client, invitation)
 '''
 
         self.group_edit_process = '''def process(client, invitation):
-    meta_invitation = client.get_invitation("''' + self.venue.get_meta_invitation_id() + '''")
-    script = meta_invitation.content["group_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, "''' + self.venue.get_meta_invitation_id() + '''", "group_edit_script", funcs, client, invitation)
 '''
 
     def _should_update_meta_invitation(self, invitation):
@@ -323,14 +317,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'invitees': [venue_id, self.venue.get_authors_id(number='${3/content/noteNumber/value}')],
                     'cdate': deletion_cdate,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['deletion_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'deletion_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'ddate': {
@@ -666,13 +657,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                'value': self.get_process_content(review_stage.process_path)
             }
             invitation.edit['invitation']['process'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['review_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'review_process_script', funcs, client, edit, invitation)
 '''
 
         if review_stage.preprocess_path:
@@ -680,13 +668,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                 'value': self.get_process_content(review_stage.preprocess_path)
             }
             invitation.edit['invitation']['preprocess'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['review_preprocess_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'review_preprocess_script', funcs, client, edit, invitation)
 '''
 
         if review_duedate:
@@ -969,13 +954,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'invitees': [venue_id, self.venue.get_authors_id(number='${3/content/noteNumber/value}')],
                     'cdate': review_rebuttal_cdate,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['review_rebuttal_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'review_rebuttal_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': {
@@ -1165,13 +1147,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                'value': self.get_process_content(meta_review_stage.process_path)
             }
             invitation.edit['invitation']['process'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['metareview_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'metareview_process_script', funcs, client, edit, invitation)
 '''
 
         if meta_review_stage.preprocess_path:
@@ -1179,13 +1158,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                 'value': self.get_process_content(meta_review_stage.preprocess_path)
             }
             invitation.edit['invitation']['preprocess'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['metareview_preprocess_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'metareview_preprocess_script', funcs, client, edit, invitation)
 '''
 
         if meta_review_duedate:
@@ -1679,13 +1655,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
   await process(client, edit, invitation);
 }''' if comment_stage.check_mandatory_readers and comment_stage.reader_selection else '',
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['comment_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'comment_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': {
@@ -1841,13 +1814,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'noninvitees': self.venue.get_committee('${3/content/noteNumber/value}', with_authors = True),
                     'cdate': comment_cdate,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['comment_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'comment_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': {
@@ -1993,13 +1963,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                         'script': self.get_process_content('process/chat_date_comment_process.py')
                     }],
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['chat_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'chat_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': {
@@ -2246,14 +2213,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'minReplies': 1,
                     'cdate': decision_cdate,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['decision_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'decision_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': [self.venue.get_program_chairs_id()],
@@ -2366,14 +2330,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'signatures': [venue_id],
                     'maxReplies': 1,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)''',
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'process_script', funcs, client, edit, invitation)''',
                     'edit': {
                         'signatures': {
                             'param': {
@@ -2562,14 +2523,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'signatures': [venue_id],
                     'maxReplies': 1,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)''',
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'process_script', funcs, client, edit, invitation)''',
                     'edit': {
                         'signatures': [self.venue.get_program_chairs_id()],
                         'readers': submission_stage.get_withdrawal_readers(self.venue, '${{4/content/noteId/value}/number}'),
@@ -2679,14 +2637,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'signatures': [venue_id],
                     'maxReplies': 1,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)''',
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'process_script', funcs, client, edit, invitation)''',
                     'edit': {
                         'signatures': [self.venue.get_program_chairs_id()],
                         'readers': submission_stage.get_desk_rejection_readers(self.venue, '${4/content/noteNumber/value}'),
@@ -2872,14 +2827,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'signatures': [venue_id],
                     'maxReplies': 1,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)''',
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'process_script', funcs, client, edit, invitation)''',
                     'edit': {
                         'signatures': [self.venue.get_program_chairs_id()],
                         'readers': submission_stage.get_desk_rejection_readers(self.venue, '${{4/content/noteId/value}/number}'),
@@ -2968,14 +2920,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'invitees': [venue_id, self.venue.get_authors_id(number='${3/content/noteNumber/value}')],
                     'cdate': revision_cdate,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['revision_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'revision_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'ddate': {
@@ -3011,13 +2960,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
 
         if revision_stage.preprocess_path:
             invitation.edit['invitation']['preprocess'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['revision_preprocess_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'revision_preprocess_script', funcs, client, edit, invitation)
 '''
             invitation.content['revision_preprocess_script'] = {'value': self.get_process_content(revision_stage.preprocess_path)}
 
@@ -3194,14 +3140,11 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                     'noninvitees': noninvitees,
                     'cdate': custom_stage_cdate,
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['custom_stage_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'custom_stage_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': {
@@ -4145,13 +4088,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                'value': self.get_process_content(ethics_review_stage.process_path)
             }
             invitation.edit['invitation']['process'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['ethics_review_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'ethics_review_process_script', funcs, client, edit, invitation)
 '''
 
         if ethics_review_stage.preprocess_path:
@@ -4159,13 +4099,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                 'value': self.get_process_content(ethics_review_stage.preprocess_path)
             }
             invitation.edit['invitation']['preprocess'] = '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['ethics_review_preprocess_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'ethics_review_preprocess_script', funcs, client, edit, invitation)
 '''
 
         if ethics_review_duedate:
@@ -4301,13 +4238,10 @@ To view your submission, click here: https://openreview.net/forum?id={{{{note_fo
                             'maxReplies': 1,
                             'cdate': cdate,
                             'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['sac_ethics_flag_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'sac_ethics_flag_script', funcs, client, edit, invitation)
 ''',
                             'edit': {
                                 'signatures': {
@@ -1,4 +1,3 @@
-import csv
 import datetime
 import os
 import openreview
@@ -317,112 +316,88 @@ class Matching(object):
         invitation = self.venue.invitation_builder.save_invitation(invitation, replacement=True)
         return invitation
 
-    def _build_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years):
+    def _build_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years, max_workers=None):
         if self.alternate_matching_group:
             return
-        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years)
+        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years, max_workers=max_workers)
 
-    def _build_note_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years):
+    def _build_note_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years, max_workers=None):
         invitation = self._create_edge_invitation(self.venue.get_conflict_score_id(self.match_group.id))
         invitation_id = invitation.id
         print(invitation_id)
         # Get profile info from the match group
-        info_function = tools.info_function_builder(get_profile_info)
-        user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
+        conflict_computer = tools.ConflictComputer(policy=get_profile_info, n_years=compute_conflicts_n_years, max_workers=max_workers)
+        user_profiles_info = conflict_computer.get_info(user_profiles)
         # Get profile info from all the authors
         all_authorids = []
         for submission in submissions:
             authorids = submission.authorids
             all_authorids = all_authorids + authorids
 
-        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True)
+        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
         ## for AC conflicts, check SAC conflicts too
+        sacs_by_ac = {}
         sac_user_info_by_id = {}
+        pcs_by_sac = {}
+        pc_user_info_by_id = {}
         if self.is_area_chair:
             sacs_by_ac =  { g['id']['head']: [v['tail'] for v in g['values']] for g in self.client.get_grouped_edges(invitation=self.venue.get_assignment_id(self.senior_area_chairs_id, deployed=True), groupby='head', select=None, domain=self.venue.venue_id) }
             if sacs_by_ac:
-                sac_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.senior_area_chairs_id).members, with_publications=True, with_relations=True)
+                sac_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.senior_area_chairs_id).members, with_publications=True, with_relations=True, publication_fields=None if self.sac_profile_info else tools.CONFLICT_PUBLICATION_FIELDS)
                 if self.sac_profile_info:
-                    info_funcion = tools.info_function_builder(self.sac_profile_info)
-                    sac_user_info_by_id = { p.id: info_funcion(p, self.sac_n_years, self.venue.get_submission_venue_id()) for p in sac_user_profiles }
+                    sac_conflict_computer = tools.ConflictComputer(policy=self.sac_profile_info, n_years=self.sac_n_years, max_workers=max_workers)
+                    sac_user_info_by_id = dict(zip([p.id for p in sac_user_profiles], sac_conflict_computer.get_info(sac_user_profiles, submission_venueid=self.venue.get_submission_venue_id())))
                 else:
-                    sac_user_info_by_id = { p.id: info_function(p, compute_conflicts_n_years) for p in sac_user_profiles }
+                    sac_user_info_by_id = dict(zip([p.id for p in sac_user_profiles], conflict_computer.get_info(sac_user_profiles)))
 
             pcs_by_sac = { g['id']['head']: g['values'][0]['tail'] for g in self.client.get_grouped_edges(invitation=self.venue.get_assignment_id(self.venue.get_program_chairs_id(), deployed=True), groupby='head', select=None, domain=self.venue.venue_id) }
             if pcs_by_sac:
-                pc_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.venue.get_program_chairs_id()).members, with_publications=True, with_relations=True)   
-                pc_user_info_by_id = { p.id: info_function(p, compute_conflicts_n_years) for p in pc_user_profiles }
-
-        edges = []
-
-        for submission in tqdm(submissions, total=len(submissions), desc='_build_conflicts'):
-            # Get author profiles
-            authorids = submission.authorids
-
-            # Extract domains from each authorprofile
-            author_ids = set()
-            author_domains = set()
-            author_relations = set()
-            author_publications = set()
-            for authorid in authorids:
-                if author_profile_by_id.get(authorid):
-                    author_info = info_function(author_profile_by_id[authorid], compute_conflicts_n_years)
-                    author_ids.add(author_info['id'])
-                    author_domains.update(author_info['domains'])
-                    author_relations.update(author_info['relations'])
-                    author_publications.update(author_info['publications'])
+                pc_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.venue.get_program_chairs_id()).members, with_publications=True, with_relations=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)   
+                pc_user_info_by_id = dict(zip([p.id for p in pc_user_profiles], conflict_computer.get_info(pc_user_profiles)))
+
+        # Compute the info of each author once and merge it per submission
+        author_profiles = { profile.id: profile for profile in author_profile_by_id.values() if profile }
+        author_info_by_profile_id = dict(zip(author_profiles.keys(), conflict_computer.get_info(author_profiles.values())))
+        author_info_by_id = { authorid: author_info_by_profile_id[profile.id] for authorid, profile in author_profile_by_id.items() if profile }
+        submissions_info = []
+        for submission in submissions:
+            authors_info = []
+            for authorid in submission.authorids:
+                if author_info_by_id.get(authorid):
+                    authors_info.append(author_info_by_id[authorid])
                 else:
                     print(f'Profile not found: {authorid}')
+            submissions_info.append(tools.merge_profile_info(authors_info))
+
+        conflicts_by_submission = conflict_computer.compute(
+            submissions_info,
+            user_profiles_info,
+            sacs_by_ac=sacs_by_ac,
+            sac_info_by_id=sac_user_info_by_id,
+            pcs_by_sac=pcs_by_sac,
+            pc_info_by_id=pc_user_info_by_id
+        )
 
-            # Compute conflicts for each user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_ids.intersection(set([user_info['id']])))
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection([user_info['id']]))
-                conflicts.update(author_ids.intersection(user_info['relations']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
-
-                ## Transfer SAC conflicts
-                if len(conflicts) == 0 and self.is_area_chair:
-                    assigned_sacs = sacs_by_ac.get(user_info['id'], [])
-                    for sac in assigned_sacs:
-                        sac_info = sac_user_info_by_id.get(sac)
-                        if sac_info:
-                            conflicts.update(author_ids.intersection(set([sac_info['id']])))
-                            conflicts.update(author_domains.intersection(sac_info['domains']))
-                            conflicts.update(author_relations.intersection([sac_info['id']]))
-                            conflicts.update(author_ids.intersection(sac_info['relations']))
-                            conflicts.update(author_publications.intersection(sac_info['publications']))
-
-                ## Transfer PC conflicts
-                if len(conflicts) == 0 and self.is_area_chair and pcs_by_sac:
-                    assigned_pcs = [pcs_by_sac.get(sac) for sac in assigned_sacs]
-                    for pc in assigned_pcs:
-                        pc_info = pc_user_info_by_id.get(pc)
-                        if pc_info:
-                            conflicts.update(author_ids.intersection(set([pc_info['id']])))                            
-                            conflicts.update(author_domains.intersection(pc_info['domains']))
-                            conflicts.update(author_relations.intersection([pc_info['id']]))
-                            conflicts.update(author_ids.intersection(pc_info['relations']))
-                            conflicts.update(author_publications.intersection(pc_info['publications']))
-
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation_id,
-                        head=submission.id,
+        edges = []
+
+        for submission, positions in tqdm(zip(submissions, conflicts_by_submission), total=len(submissions), desc='_build_conflicts'):
+            for position in positions:
+                user_info = user_profiles_info[position]
+                edges.append(Edge(
+                    invitation=invitation_id,
+                    head=submission.id,
+                    tail=user_info['id'],
+                    weight=-1,
+                    label='Conflict',
+                    readers=self._get_edge_readers(
+                        invitation=invitation,
                         tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(
-                            invitation=invitation,
-                            tail=user_info['id'],
-                            number=submission.number
-                        ),
-                        writers=[self.venue.id],
-                        signatures=[self.venue.id]
-                    ))
+                        number=submission.number
+                    ),
+                    writers=[self.venue.id],
+                    signatures=[self.venue.id]
+                ))
 
         ## Delete previous conflicts
         self.client.delete_edges(invitation_id, wait_to_finish=True)
@@ -487,82 +462,105 @@ class Matching(object):
 
         return invitation
 
-    def _build_scores_from_file(self, score_invitation_id, score_file, submissions):
+    def _build_scores_from_file(self, score_invitation_id, score_file, submissions, checkpoint=None):
         if self.alternate_matching_group:
-            return self._build_profile_scores(score_invitation_id, score_file=score_file)
-        scores = []
-        with open(score_file) as file_handle:
-            scores = [row for row in csv.reader(file_handle)]
-        return self._build_note_scores(score_invitation_id, scores, submissions)
-
-    def _build_scores_from_stream(self, score_invitation_id, scores_stream, submissions):
-        scores = [input_line.split(',') for input_line in scores_stream.decode().strip().split('\n')]
+            return self._build_profile_scores(score_invitation_id, score_file=score_file, checkpoint=checkpoint)
+        return self._build_note_scores(score_invitation_id, None, submissions, score_file=score_file, checkpoint=checkpoint)
+
+    def _build_scores_from_stream(self, score_invitation_id, scores_stream, submissions, checkpoint=None):
         if self.alternate_matching_group:
-            return self._build_profile_scores(score_invitation_id, scores=scores)
-        return self._build_note_scores(score_invitation_id, scores, submissions)
+            return self._build_profile_scores(score_invitation_id, scores=scores_stream, checkpoint=checkpoint)
+        return self._build_note_scores(score_invitation_id, scores_stream, submissions, checkpoint=checkpoint)
+
+    def _get_score_rows(self, scores=None, score_file=None):
+        # Returns a function that reads the scores again on every call, so they can be validated before posting them.
+        # The rows are returned as (line_number, row) pairs.
+        if score_file:
+            return lambda: tools.iter_csv_rows(score_file, line_numbers=True)
+        if isinstance(scores, (bytes, bytearray, memoryview)):
+            return lambda: tools.iter_csv_rows(scores, line_numbers=True)
+        if callable(scores):
+            return lambda: enumerate(scores(), start=1)
+        if iter(scores) is scores:
+            scores = list(scores)
+        return lambda: enumerate(scores, start=1)
+
+    def _iter_scores(self, score_rows):
+        # Validate the rows and yield (head, tail, weight) tuples
+        for line_number, row in score_rows:
+            if not row:
+                continue
+            try:
+                weight = max(round(float(row[2]), 4), 0)
+            except (IndexError, ValueError):
+                raise openreview.OpenReviewException(f'Invalid score in line {line_number}: {row}')
+            yield row[0], row[1], float(str(weight))
+
+    def _post_score_edges(self, invitation, score_rows, build_edges, checkpoint=None):
+        ## Read all the scores once so an invalid row fails before the previous scores are deleted
+        for _ in self._iter_scores(score_rows()):
+            pass
+
+        ## Delete previous scores, unless a failed post of the same scores is resumed from its checkpoint
+        if checkpoint and os.path.exists(checkpoint):
+            print(f'Resuming the post of {invitation.id} from {checkpoint}')
+        else:
+            self.client.delete_edges(invitation.id, wait_to_finish=True)
+
+        return openreview.tools.post_bulk_edges(client=self.client, edges=build_edges(tqdm(self._iter_scores(score_rows()), desc='_build_scores')), return_edges=False, checkpoint=checkpoint)
 
-    def _build_profile_scores(self, score_invitation_id, score_file=None, scores=None):
+    def _build_profile_scores(self, score_invitation_id, score_file=None, scores=None, checkpoint=None):
 
         invitation = self._create_edge_invitation(score_invitation_id)
         invitation_id = invitation.id
-        edges = []
 
         # Validate and select scores
         if not scores and not score_file:
             raise openreview.OpenReviewException('No profile scores provided')
-        if scores:
-            score_handle = scores
-        elif score_file:
-            score_handle = csv.reader(open(score_file))
-
-        for row in tqdm(score_handle, desc='_build_scores'):
+        score_rows = self._get_score_rows(scores=scores, score_file=None if scores else score_file)
 
-            score = str(max(round(float(row[2]), 4), 0))
-            edges.append(Edge(
+        def build_edges(scores):
+            for head, tail, weight in scores:
+                yield Edge(
                     invitation=invitation_id,
-                    head=row[0],
-                    tail=row[1],
-                    weight=float(score),
+                    head=head,
+                    tail=tail,
+                    weight=weight,
                     readers=self._get_edge_readers(
                         invitation=invitation,
-                        tail=row[1],
-                        head=row[0],
+                        tail=tail,
+                        head=head,
                     ),
                     writers=[self.venue.id],
                     signatures=[self.venue.id]
-                ))
-
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+                )
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        edges_found = self._post_score_edges(invitation, score_rows, build_edges, checkpoint=checkpoint)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id, domain=self.venue.venue_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_found:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, edges_found, edges_posted))
         return invitation
 
-    def _build_note_scores(self, score_invitation_id, scores, submissions):
+    def _build_note_scores(self, score_invitation_id, scores, submissions, score_file=None, checkpoint=None):
 
         invitation = self._create_edge_invitation(score_invitation_id)
         invitation_id = invitation.id
 
         submissions_per_id = {note.id: note.number for note in submissions}
+        score_rows = self._get_score_rows(scores=scores, score_file=score_file)
 
-        edges = []
         deleted_papers = set()
-        for score_line in tqdm(scores, desc='_build_scores'):
-            if score_line:
-                paper_note_id = score_line[0]
+
+        def build_edges(scores):
+            for paper_note_id, profile_id, weight in scores:
                 paper_number = submissions_per_id.get(paper_note_id)
                 if paper_number:
-                    profile_id = score_line[1]
-                    score = str(max(round(float(score_line[2]), 4), 0))
-                    edges.append(openreview.Edge(
+                    yield openreview.Edge(
                         invitation=invitation_id,
                         head=paper_note_id,
                         tail=profile_id,
-                        weight=float(score),
+                        weight=weight,
                         readers=self._get_edge_readers(
                             invitation=invitation,
                             tail=profile_id,
@@ -570,20 +568,18 @@ class Matching(object):
                         # nonreaders=[self.venue.get_authors_id(number=paper_number)],
                         writers=[self.venue.id],
                         signatures=[self.venue.id]
-                    ))
+                    )
                 else:
                     deleted_papers.add(paper_note_id)
 
-        print('deleted papers', deleted_papers)
+        edges_found = self._post_score_edges(invitation, score_rows, build_edges, checkpoint=checkpoint)
 
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+        print('deleted papers', deleted_papers)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id, domain=self.venue.venue_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_found:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, edges_found, edges_posted))
         return invitation
 
     def _compute_scores(self, score_invitation_id, submissions, model='specter2+scincl', percentile_selection=None):
@@ -990,7 +986,7 @@ class Matching(object):
 
         invitation = venue.invitation_builder.save_invitation(config_inv)
 
-    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None):
+    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, affinity_scores_checkpoint=None, conflict_workers=None):
 
         venue = self.venue
         client = self.client
@@ -1008,7 +1004,7 @@ class Matching(object):
                 'WARNING: not all reviewers have been converted to profile IDs.',
                 'Members without profiles will not have metadata created.')
 
-        user_profiles = openreview.tools.get_profiles(client, self.match_group.members, with_publications=compute_conflicts, with_relations=compute_conflicts)
+        user_profiles = openreview.tools.get_profiles(client, self.match_group.members, with_publications=compute_conflicts, with_relations=compute_conflicts, publication_fields=openreview.tools.CONFLICT_PUBLICATION_FIELDS)
 
         submissions = self._get_submissions()
 
@@ -1044,14 +1040,16 @@ class Matching(object):
                 self._build_scores_from_file(
                     venue.get_affinity_score_id(self.match_group.id),
                     compute_affinity_scores,
-                    submissions
+                    submissions,
+                    checkpoint=affinity_scores_checkpoint
                 )
 
         if type_affinity_scores == bytes:
             self._build_scores_from_stream(
                 venue.get_affinity_score_id(self.match_group.id),
                 compute_affinity_scores,
-                submissions
+                submissions,
+                checkpoint=affinity_scores_checkpoint
             )
 
         if compute_affinity_scores == True:
@@ -1062,7 +1060,7 @@ class Matching(object):
 
         if compute_conflicts:
             func_to_get_profile = openreview.tools.get_neurips_profile_info if compute_conflicts == 'NeurIPS' else openreview.tools.get_comprehensive_profile_info if compute_conflicts == 'Comprehensive' else openreview.tools.get_profile_info
-            self._build_conflicts(submissions, user_profiles, func_to_get_profile, compute_conflicts_n_years)
+            self._build_conflicts(submissions, user_profiles, func_to_get_profile, compute_conflicts_n_years, max_workers=conflict_workers)
 
         if venue.automatic_reviewer_assignment:
             invitation = self._create_edge_invitation(venue.get_assignment_id(self.match_group.id))
@@ -1196,6 +1194,13 @@ class Matching(object):
 
         return invite_assignment_invitation
 
+    def _update_memberships(self, memberships, groups=None):
+        results = self.client.bulk_update_memberships(memberships, groups=groups)
+        errors = { group_id: result['error'] for group_id, result in results.items() if result['error'] }
+        if errors:
+            raise openreview.OpenReviewException(f'Failed to update the members of {len(errors)} groups: {errors}')
+        return results
+
     def deploy_assignments(self, assignment_title, overwrite):
 
         venue = self.venue
@@ -1219,7 +1224,8 @@ class Matching(object):
             label=assignment_title, groupby='head', select=None)}
         assignment_invitation_id = venue.get_assignment_id(self.match_group.id, deployed=True)
         submission_group_invitation_id = venue.get_invitation_id(f'{venue.submission_stage.name}_Group', prefix=self.match_group.id)
-        existing_paper_committee_ids = { g.id for g in client.get_all_groups(prefix=venue.get_paper_group_prefix(), domain=venue.id) if g.id.endswith(f'/{reviewer_name}') }
+        existing_paper_committees = [g for g in client.get_all_groups(prefix=venue.get_paper_group_prefix(), domain=venue.id) if g.id.endswith(f'/{reviewer_name}')]
+        existing_paper_committee_ids = { g.id for g in existing_paper_committees }
         current_assignment_edges =  { g['id']['head']: g['values'] for g in client.get_grouped_edges(invitation=assignment_invitation_id, groupby='head', select=None, domain=venue.id)}
 
         print('Check if there are reviews posted')
@@ -1232,17 +1238,19 @@ class Matching(object):
             if reviews:
                 raise openreview.OpenReviewException('Can not overwrite assignments when there are reviews posted.')
             ## Remove the members from the groups based on the current assignments
-            for paper in tqdm(papers, total=len(papers)):
+            memberships = {}
+            for paper in papers:
                 if paper.id in current_assignment_edges:
                     paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
-                    current_edges=current_assignment_edges[paper.id]
-                    for current_edge in current_edges:
-                        client.remove_members_from_group(paper_committee_id, current_edge['tail'])
+                    memberships[paper_committee_id] = { 'remove': [current_edge['tail'] for current_edge in current_assignment_edges[paper.id]] }
                 else:
                     print('assignment not found', paper.id)
+            self._update_memberships(memberships, existing_paper_committees)
             ## Delete current assignment edges with a ddate in case we need to do rollback
             client.delete_edges(invitation=assignment_invitation_id, wait_to_finish=True, soft_delete=True)
 
+        memberships = {}
+
         def process_paper_assignments(paper):
             paper_assignment_edges = []
             if paper.id in proposed_assignment_edges:
@@ -1286,13 +1294,15 @@ class Matching(object):
                         },
                         group=openreview.api.Group()
                     )
-                client.add_members_to_group(paper_committee_id, assigned_users)
+                memberships[paper_committee_id] = { 'add': assigned_users }
                 return paper_assignment_edges
             else:
                 print('assignment not found', paper.id)
                 return []
 
-        assignment_edges = reduce(concat,tools.concurrent_requests(process_paper_assignments, papers))
+        with client.deferred_cache_flush():
+            assignment_edges = reduce(concat,tools.concurrent_requests(process_paper_assignments, papers))
+        self._update_memberships(memberships, existing_paper_committees)
 
         print('Posting assignment edges', len(assignment_edges))
         openreview.tools.post_bulk_edges(client=client, edges=assignment_edges)
@@ -1388,28 +1398,32 @@ class Matching(object):
             if reviews:
                 raise openreview.OpenReviewException('Can not delete assignments when there are reviews posted.')
 
+        memberships = {}
+
         def process_paper_assignments(paper):
             if paper.id in proposed_assignment_edges:
                 paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
                 proposed_edges=proposed_assignment_edges[paper.id]
                 assigned_users = []
+                assigned_sacs = []
                 for proposed_edge in proposed_edges:
                     assigned_user = proposed_edge['tail']
                     if self.is_area_chair and sac_assignment_edges:
                         sac_assignments = sac_assignment_edges.get(assigned_user, [])
                         for sac_assignment in sac_assignments:
-                            assigned_sac = sac_assignment['tail']
-                            sac_group_id = venue.get_senior_area_chairs_id(number=paper.number)
-                            client.remove_members_from_group(sac_group_id,[assigned_sac])
+                            assigned_sacs.append(sac_assignment['tail'])
                     assigned_users.append(assigned_user)
                     assignment_edge_id = current_assignment_edges.get(paper.id, {}).get(assigned_user)
                     if assignment_edge_id:
                         client.delete_edges(id=assignment_edge_id, invitation=assignment_invitation_id, wait_to_finish=True, soft_delete=True)
-                client.remove_members_from_group(paper_committee_id, assigned_users)
+                if assigned_sacs:
+                    memberships[venue.get_senior_area_chairs_id(number=paper.number)] = { 'remove': assigned_sacs }
+                memberships[paper_committee_id] = { 'remove': assigned_users }
             else:
                 print('assignment not found', paper.id)
 
         tools.concurrent_requests(process_paper_assignments, papers, desc='undeploy_assignments')
+        self._update_memberships(memberships)
     
     def deploy(self, assignment_title, overwrite=False, enable_reviewer_reassignment=False):
 
@@ -1,6 +1,7 @@
-def process(client, edit, invitation):
+def process(client, edit, invitation, context=None):
 
-    domain = client.get_group(edit.domain)
+    context = context or openreview.api.DomainContext.load(client, edit, invitation)
+    domain = context.domain
     venue_id = domain.id
     meta_invitation_id = domain.get_content_value('meta_invitation_id')
     short_name = domain.get_content_value('subtitle')
@@ -12,11 +13,11 @@ def process(client, edit, invitation):
     reviewers_submitted_name = domain.get_content_value('reviewers_submitted_name')
     sender = domain.get_content_value('message_sender')
 
-    submission = client.get_note(edit.note.forum)
+    submission = context.forum
     comment = client.get_note(edit.note.id)
     paper_group_id=f'{venue_id}/{submission_name}{submission.number}'
 
-    parent_invitation = client.get_invitation(invitation.invitations[0])
+    parent_invitation = context.parent_invitation
     users_to_notify = parent_invitation.get_content_value('users_to_notify', [])
     email_pcs = parent_invitation.get_content_value('email_program_chairs') or 'program_chairs' in users_to_notify
     email_area_chairs = parent_invitation.get_content_value('email_area_chairs') or 'submission_area_chairs' in users_to_notify
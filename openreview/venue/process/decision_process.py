@@ -1,6 +1,7 @@
-def process(client, edit, invitation):
+def process(client, edit, invitation, context=None):
 
-    domain = client.get_group(edit.domain)
+    context = context or openreview.api.DomainContext.load(client, edit, invitation)
+    domain = context.domain
     venue_id = domain.id
     meta_invitation_id = domain.get_content_value('meta_invitation_id')
     short_name = domain.get_content_value('subtitle')
@@ -11,10 +12,10 @@ def process(client, edit, invitation):
     decision_field_name = domain.content.get('decision_field_name', {}).get('value', 'decision')
     accept_options = domain.get_content_value('accept_decision_options')
     sender = domain.get_content_value('message_sender')   
-    super_invitation = client.get_invitation(invitation.invitations[0])
+    super_invitation = context.parent_invitation
     email_authors = super_invitation.get_content_value('email_authors', domain.get_content_value('decision_email_authors'))
 
-    submission = client.get_note(edit.note.forum)
+    submission = context.forum
     decision = client.get_note(edit.note.id)
 
     action = 'posted to' if decision.tcdate == decision.tmdate else 'edited on'
@@ -1,6 +1,7 @@
-def process(client, edit, invitation):
+def process(client, edit, invitation, context=None):
 
-    domain = client.get_group(edit.domain)
+    context = context or openreview.api.DomainContext.load(client, edit, invitation)
+    domain = context.domain
     venue_id = domain.id
     meta_invitation_id = domain.content['meta_invitation_id']['value']
     short_name = domain.get_content_value('subtitle')
@@ -14,7 +15,7 @@ def process(client, edit, invitation):
     review_name = domain.get_content_value('review_name')
     sender = domain.get_content_value('message_sender')
 
-    parent_invitation = client.get_invitation(invitation.invitations[0])
+    parent_invitation = context.parent_invitation
 
     users_to_notify = parent_invitation.get_content_value('users_to_notify', [])
     email_pcs = parent_invitation.get_content_value('email_program_chairs') or 'program_chairs' in users_to_notify
@@ -22,7 +23,7 @@ def process(client, edit, invitation):
     email_reviewers = parent_invitation.get_content_value('email_reviewers') or 'submission_reviewers' in users_to_notify
     email_authors = parent_invitation.get_content_value('email_authors') or 'submission_authors' in users_to_notify
 
-    submission = client.get_note(edit.note.forum)
+    submission = context.forum
     paper_group_id=f'{venue_id}/{submission_name}{submission.number}'
     paper_reviewers_id = f'{paper_group_id}/{reviewers_name}'
     paper_reviewers_submitted_id = f'{paper_reviewers_id}/{reviewers_submitted_name}'
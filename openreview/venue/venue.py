@@ -17,6 +17,7 @@ from .invitation import InvitationBuilder
 from .group import GroupBuilder
 from openreview.api import Group
 from openreview.api import Note
+from openreview.api import LazyNote
 from .recruitment import Recruitment
 from . import matching
 
@@ -511,7 +512,7 @@ class Venue(object):
     def get_preferred_emails_invitation_id(self):
         return f'{self.venue_id}/-/Preferred_Emails' 
 
-    def get_submissions(self, venueid=None, accepted=False, sort=None, details=None):
+    def get_submissions(self, venueid=None, accepted=False, sort=None, details=None, lazy=False):
         """Retrieve venue submissions, optionally filtered by acceptance status or venue ID.
 
         When ``accepted=True``, returns only accepted submissions by checking
@@ -527,24 +528,25 @@ class Venue(object):
         :type sort: str, optional
         :param details: Comma-separated detail fields to include (e.g. ``'directReplies'``).
         :type details: str, optional
+        :param lazy: If True, return :class:`openreview.api.LazyNote` views whose replies are indexed by invitation.
+        :type lazy: bool, optional
         :return: List of submission notes matching the query.
         :rtype: list[openreview.api.Note]
         """
         if accepted:
-            accepted_notes = self.client.get_all_notes(content={ 'venueid': self.venue_id}, sort=sort, details=details, domain=self.venue_id)
+            accepted_notes = self.client.get_all_notes(content={ 'venueid': self.venue_id}, sort=sort, details=details, domain=self.venue_id, lazy=lazy)
             if len(accepted_notes) == 0:
                 accepted_notes = []
-                notes = self.client.get_all_notes(content={ 'venueid': f'{self.get_submission_venue_id()}'}, sort=sort, details='directReplies', domain=self.venue_id)
+                notes = self.client.get_all_notes(content={ 'venueid': f'{self.get_submission_venue_id()}'}, sort=sort, details='directReplies', domain=self.venue_id, lazy=True)
                 for note in notes:
-                    for reply in note.details['directReplies']:
-                        if f'{self.venue_id}/{self.submission_stage.name}{note.number}/-/{self.decision_stage.name}' in reply['invitations']:
-                            decision = reply['content']['decision']['value']
-                            if openreview.tools.is_accept_decision(decision, self.decision_stage.accept_options):
-                                accepted_notes.append(note)
+                    for reply in note.get_replies(f'{self.venue_id}/{self.submission_stage.name}{note.number}/-/{self.decision_stage.name}'):
+                        decision = reply['content']['decision']['value']
+                        if openreview.tools.is_accept_decision(decision, self.decision_stage.accept_options):
+                            accepted_notes.append(note if lazy else note.to_note())
             return accepted_notes
 
         if venueid:
-            return self.client.get_all_notes(content={ 'venueid': venueid}, sort=sort, details=details, domain=self.venue_id)
+            return self.client.get_all_notes(content={ 'venueid': venueid}, sort=sort, details=details, domain=self.venue_id, lazy=lazy)
         
         venueids = [
             self.get_submission_venue_id(),
@@ -552,7 +554,7 @@ class Venue(object):
             self.get_rejected_submission_venue_id()
         ]
 
-        return self.client.get_all_notes(content={ 'venueid': ','.join(venueids)}, sort=sort, details=details, domain=self.venue_id)
+        return self.client.get_all_notes(content={ 'venueid': ','.join(venueids)}, sort=sort, details=details, domain=self.venue_id, lazy=lazy)
 
     #use to expire revision invitations from request form
     def expire_invitation(self, invitation_id):
@@ -957,7 +959,7 @@ class Venue(object):
         """
         decisions_data = list(csv.reader(StringIO(decisions_file.decode()), delimiter=","))
 
-        paper_notes = {n.number: n for n in self.get_submissions(details='directReplies')}
+        paper_notes = {n.number: n for n in self.get_submissions(details='directReplies', lazy=True)}
 
         domain_content = self.client.get_group(self.venue_id).content
         submission_name = self.submission_stage.name
@@ -986,12 +988,7 @@ class Venue(object):
                     f"Paper {paper_number} not found. Please check the submitted paper numbers."
                 )
 
-            paper_decision_note = None
-            if paper_note.details:
-                for reply in paper_note.details['directReplies']:
-                    if f'{self.venue_id}/{submission_name}{paper_note.number}/-/{decision_name}' in reply['invitations']:
-                        paper_decision_note = reply
-                        break
+            paper_decision_note = paper_note.get_reply(f'{self.venue_id}/{submission_name}{paper_note.number}/-/{decision_name}')
 
             content = {
                 'title': {'value': 'Paper Decision'},
@@ -1067,6 +1064,10 @@ Total Errors: {len(errors)}
 
     def get_decision_note(self, submission):
 
+        if isinstance(submission, LazyNote):
+            reply = submission.get_reply(self.get_invitation_id(name = self.decision_stage.name, number = submission.number))
+            return Note.from_json(reply) if reply else None
+
         if submission.details:
             for reply in submission.details.get('directReplies', submission.details.get('replies', [])):
                 if self.get_invitation_id(name = self.decision_stage.name, number = submission.number) in reply['invitations']:
@@ -1097,7 +1098,7 @@ Total Errors: {len(errors)}
         :type hide_fields: list[str], optional
         """
         venue_id = self.venue_id
-        submissions = self.get_submissions(sort='number:asc', details='directReplies')
+        submissions = self.get_submissions(sort='number:asc', details='directReplies', lazy=True)
         post_endorsment_tag = self.get_article_endorsement_id() and openreview.tools.get_invitation(self.client, self.get_article_endorsement_id())
 
         def is_release_authors(is_note_accepted):
@@ -1200,7 +1201,10 @@ Total Errors: {len(errors)}
         placeholders ``{{submission_title}}`` and ``{{forum_url}}`` in the
         message body are replaced with actual values.
 
-        Runs concurrently across all submissions.
+        The notifications are built concurrently across all submissions and posted with
+        :meth:`~openreview.api.OpenReviewClient.post_messages_bulk`, so a notification that
+        fails does not stop the others. Once all the notifications are posted, an
+        OpenReviewException listing the failed ones is raised.
 
         :param decision_options: List of possible decision values (currently unused for filtering, all decisions are notified).
         :type decision_options: list[str]
@@ -1210,8 +1214,8 @@ Total Errors: {len(errors)}
         print('send_decision_notifications')
         paper_notes = self.get_submissions(details='directReplies')
 
-        def send_notification(note):
-            
+        def get_notification(note):
+
             decision_note = self.get_decision_note(note)
             print(f'send_notification: {note.number} {note.content["title"]["value"]} {decision_note}')
             if not decision_note:
@@ -1226,16 +1230,19 @@ Total Errors: {len(errors)}
                 message = messages[decision_note.content['decision']['value']]
                 final_message = message.replace("{{submission_title}}", note.content['title']['value'])
                 final_message = final_message.replace("{{forum_url}}", f'https://openreview.net/forum?id={note.id}')
-                self.client.post_message(subject, 
-                                         recipients=[self.get_authors_id(note.number)], 
-                                         message=final_message, 
-                                         parentGroup=self.get_authors_id(), 
-                                         replyTo=self.contact, 
-                                         invitation=self.get_meta_invitation_id(), 
-                                         signature=self.venue_id,
-                                         sender=self.get_message_sender())
+                return {
+                    'subject': subject,
+                    'recipients': [self.get_authors_id(note.number)],
+                    'message': final_message,
+                    'parentGroup': self.get_authors_id(),
+                    'replyTo': self.contact,
+                    'invitation': self.get_meta_invitation_id(),
+                    'signature': self.venue_id,
+                    'sender': self.get_message_sender()
+                }
 
-        tools.concurrent_requests(send_notification, paper_notes)
+        notifications = [notification for notification in tools.concurrent_requests(get_notification, paper_notes) if notification]
+        self.client.post_messages_bulk(notifications, raise_on_error=True)
 
     def set_assignment_invitations(self, submission_deadline):
         """Create assignment and deployment invitations for reviewers (and area chairs if enabled).
@@ -1334,7 +1341,7 @@ Total Errors: {len(errors)}
         venue_matching = matching.Matching(self, self.client.get_group(self.get_reviewers_id()))
         venue_matching.setup()
 
-    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None):
+    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None, affinity_scores_checkpoint=None, conflict_workers=None):
         """Set up paper matching for a specific committee, optionally computing affinity scores and conflicts.
 
         Creates matching invitations (proposed assignments, affinity scores,
@@ -1355,6 +1362,10 @@ Total Errors: {len(errors)}
         :type alternate_matching_group: str, optional
         :param submission_track: Filter submissions to a specific track for matching.
         :type submission_track: str, optional
+        :param affinity_scores_checkpoint: File where the posted chunks of an affinity score file are recorded. If the post fails, calling the method again with the same file and checkpoint resumes it.
+        :type affinity_scores_checkpoint: str, optional
+        :param conflict_workers: Number of processes used to compute the conflicts, see :class:`openreview.tools.ConflictComputer`.
+        :type conflict_workers: int, optional
         :return: The configured Matching object after setup.
         :rtype: openreview.venue.matching.Matching
         """
@@ -1364,7 +1375,7 @@ Total Errors: {len(errors)}
             alternate_matching_group = self.get_area_chairs_id()
         venue_matching = matching.Matching(self, self.client.get_group(committee_id), alternate_matching_group, { 'track': submission_track } if submission_track else None)
 
-        return venue_matching.setup(compute_affinity_scores, compute_conflicts, compute_conflicts_n_years)
+        return venue_matching.setup(compute_affinity_scores, compute_conflicts, compute_conflicts_n_years, affinity_scores_checkpoint=affinity_scores_checkpoint, conflict_workers=conflict_workers)
 
     def set_assignments(self, assignment_title, committee_id, enable_reviewer_reassignment=False, overwrite=False):
         """Deploy proposed assignments as official assignments for a committee.
@@ -1434,7 +1445,7 @@ Total Errors: {len(errors)}
         conference_matching = matching.Matching(self, match_group)
         return conference_matching.setup_invite_assignment(hash_seed, assignment_title, due_date, invitation_labels=invitation_labels, email_template=email_template)
     
-    def set_track_sac_assignments(self, track_sac_file, conflict_policy=None, conflict_n_years=None, track_ac_file=None):
+    def set_track_sac_assignments(self, track_sac_file, conflict_policy=None, conflict_n_years=None, track_ac_file=None, conflict_workers=None):
         """Assign senior area chairs to submissions by track, with optional conflict detection.
 
         Reads a CSV mapping tracks to SAC groups, resolves SAC profiles, and
@@ -1454,6 +1465,8 @@ Total Errors: {len(errors)}
         :type conflict_n_years: int, optional
         :param track_ac_file: Path to a CSV file with rows of ``track,AC_role_name`` for AC-to-SAC assignment.
         :type track_ac_file: str, optional
+        :param conflict_workers: Number of processes used to compute the conflicts, see :class:`openreview.tools.ConflictComputer`.
+        :type conflict_workers: int, optional
         """
         if not self.use_senior_area_chairs:
             raise openreview.OpenReviewException('The venue does not have senior area chairs enabled. Please enable senior area chairs in the venue.')
@@ -1494,41 +1507,40 @@ Total Errors: {len(errors)}
             authorids = submission.authorids
             all_authorids = all_authorids + authorids
 
-        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True)
-        sac_profile_by_id = tools.get_profiles(self.client, list(set(all_sacs)), with_publications=True, with_relations=True, as_dict=True)
+        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
+        sac_profile_by_id = tools.get_profiles(self.client, list(set(all_sacs)), with_publications=True, with_relations=True, as_dict=True, publication_fields=tools.CONFLICT_PUBLICATION_FIELDS)
 
-        info_function = tools.info_function_builder(openreview.tools.get_neurips_profile_info if conflict_policy == 'NeurIPS' else openreview.tools.get_profile_info)
+        conflict_computer = tools.ConflictComputer(policy='NeurIPS' if conflict_policy == 'NeurIPS' else 'default', n_years=conflict_n_years, max_workers=conflict_workers)
 
-        for submission in submissions:
-            authorids = submission.authorids
+        author_profiles = { profile.id: profile for profile in author_profile_by_id.values() if profile }
+        author_info_by_profile_id = dict(zip(author_profiles.keys(), conflict_computer.get_info(author_profiles.values())))
+        sacs_without_profile = [sac for sac in dict.fromkeys(all_sacs) if not sac_profile_by_id.get(sac)]
+        if sacs_without_profile:
+            raise openreview.OpenReviewException(f'Profiles not found for the senior area chairs: {", ".join(sacs_without_profile)}')
+        sac_profiles = { sac: sac_profile_by_id[sac] for sac in dict.fromkeys(all_sacs) }
+        sacs_info = conflict_computer.get_info(sac_profiles.values())
+        sac_ids = list(sac_profiles.keys())
 
-            # Extract domains from each authorprofile
-            author_ids = set()
-            author_domains = set()
-            author_emails = set()
-            author_relations = set()
-            author_publications = set()            
-            for authorid in authorids:
+        submissions_info = []
+        for submission in submissions:
+            # Merge the info of the author profiles
+            authors_info = []
+            for authorid in submission.authorids:
                 if author_profile_by_id.get(authorid):
-                    author_info = info_function(author_profile_by_id[authorid], conflict_n_years)
-                    author_ids.add(author_info['id'])
-                    author_domains.update(author_info['domains'])
-                    author_emails.update(author_info['emails'])
-                    author_relations.update(author_info['relations'])
-                    author_publications.update(author_info['publications'])
+                    authors_info.append(author_info_by_profile_id[author_profile_by_id[authorid].id])
                 else:
                     print(f'Profile not found: {authorid}')
+            submissions_info.append(tools.merge_profile_info(authors_info))
+
+        conflicts_by_submission = conflict_computer.compute(submissions_info, sacs_info, with_details=True)
+
+        for submission, submission_conflicts in zip(submissions, conflicts_by_submission):
+            conflicts_by_sac = { sac_ids[position]: conflicts for position, conflicts in submission_conflicts }
 
             if submission.content['track']['value'] in sac_tracks:
                 sacs = sac_tracks[submission.content['track']['value']]
                 for sac in sacs:
-                    sac_info = info_function(sac_profile_by_id.get(sac), conflict_n_years)
-                    conflicts = set()
-                    conflicts.update(author_ids.intersection(set([sac_info['id']])))
-                    conflicts.update(author_domains.intersection(sac_info['domains']))
-                    conflicts.update(author_relations.intersection([sac_info['id']]))
-                    conflicts.update(author_ids.intersection(sac_info['relations']))
-                    conflicts.update(author_publications.intersection(sac_info['publications']))
+                    conflicts = conflicts_by_sac.get(sac, [])
 
                     if not conflict_policy or not conflicts:                
                         sac_group_id = self.get_senior_area_chairs_id(submission.number)
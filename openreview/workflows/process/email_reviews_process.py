@@ -47,7 +47,7 @@ def process(client, invitation):
     active_submissions = client.get_notes(content={'venueid': submission_venue_id}, details='directReplies')
     print('# active submissions:', len(active_submissions))
 
-    def send_reviews_email(submission):
+    def get_reviews_email(submission):
         subject = email_subject.format(
             submission_number=submission.number,
             submission_title=submission.content['title']['value']
@@ -72,16 +72,18 @@ def process(client, invitation):
                 submission_forum=submission.id
             )
 
-            client.post_message(
-                subject=subject,
-                recipients=[f'{venue_id}/{submission_name}{submission.number}/{authors_name}'],
-                message=message,
-                invitation=invitation.id,
-                replyTo=contact_email
-            )
+            return {
+                'subject': subject,
+                'recipients': [f'{venue_id}/{submission_name}{submission.number}/{authors_name}'],
+                'message': message,
+                'invitation': invitation.id,
+                'replyTo': contact_email
+            }
 
     if fields_to_include:
-        openreview.tools.concurrent_requests(send_reviews_email, active_submissions)
+        messages = [message for message in map(get_reviews_email, active_submissions) if message]
+        ## All the emails are sent before the failed ones are reported
+        client.post_messages_bulk(messages, raise_on_error=True)
         print('Review emails sent to authors')
     else:
         print('No fields were selected; please set the review fields to include in the email to be sent to authors')
\ No newline at end of file
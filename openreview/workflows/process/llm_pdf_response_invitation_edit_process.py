@@ -6,17 +6,14 @@ def process(client, invitation):
         return
 
     domain = client.get_group(invitation.domain)
-    meta_invitation = client.get_invitation(domain.content['meta_invitation_id']['value'])
     submission_venue_id = domain.content['submission_venue_id']['value']
     submission_name = domain.content['submission_name']['value']
-    script = meta_invitation.content["invitation_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, domain.content['meta_invitation_id']['value'], 'invitation_edit_script', funcs, client, invitation)
 
     model = invitation.get_content_value('model', 'gemini/gemini-2.0-flash')
     prompt = invitation.get_content_value('prompt')
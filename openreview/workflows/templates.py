@@ -15,27 +15,21 @@ class Templates():
         self.update_date_string = "#{4/mdate} + " + str(self.update_wait_time)
         self.invitation_edit_process = '''def process(client, invitation):
     domain = client.get_group(invitation.domain)
-    meta_invitation = client.get_invitation(domain.content['meta_invitation_id']['value'])
-    script = meta_invitation.content["invitation_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, domain.content['meta_invitation_id']['value'], "invitation_edit_script", funcs, client, invitation)
 '''
         self.group_edit_process = '''def process(client, invitation):
     domain = client.get_group(invitation.domain)
-    meta_invitation = client.get_invitation(domain.content['meta_invitation_id']['value'])
-    script = meta_invitation.content["group_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, domain.content['meta_invitation_id']['value'], "group_edit_script", funcs, client, invitation)
 '''
 
     def setup(self):
@@ -713,27 +707,21 @@ class Templates():
                     'instructions': 'Configure the timeframe Program Chairs can send ${2/content/committee_pretty_name/value} recruitment invitations and customize the recruitment email sent to users. Go to the **[${2/content/committee_pretty_name/value} group](/group/edit?id=${2/content/committee_id/value})** to recruit ${2/content/committee_pretty_name/value}.',
                     'preprocess': self.get_process_content('process/committee_recruitment_request_pre_process.js'),
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['recruitment_request_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         're': re
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'recruitment_request_process_script', funcs, client, edit, invitation)
 ''' ,
                     'postprocesses': [
                         {
                             'script': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['recruitment_request_edit_reminder_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'recruitment_request_edit_reminder_process_script', funcs, client, edit, invitation)
 ''',
                             'delay': '${4/content/reminder_delay/value}'
                         }
@@ -2019,14 +2007,11 @@ If you would like to change your decision, please follow the link in the previou
                     'dateprocesses': [{
                         'dates': ["#{4/cdate}", self.update_date_string],
                         'script': '''def process(client, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['date_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'date_process_script', funcs, client, invitation)
 ''' 
                     }],
                     'tag': {
@@ -2137,14 +2122,11 @@ If you would like to change your decision, please follow the link in the previou
                     'dateprocesses': [{
                         'dates': ["#{4/cdate}", self.update_date_string],
                         'script': '''def process(client, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['date_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'date_process_script', funcs, client, invitation)
 ''' 
                     }],
                     'tag': {
@@ -2256,14 +2238,11 @@ If you would like to change your decision, please follow the link in the previou
                     'dateprocesses': [{
                         'dates': ["#{4/cdate}", self.update_date_string],
                         'script': '''def process(client, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['date_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'date_process_script', funcs, client, invitation)
 ''' 
                     }],
                     'tag': {
@@ -2376,14 +2355,11 @@ If you would like to change your decision, please follow the link in the previou
                         'dateprocesses': [{
                             'dates': ["#{4/cdate}", self.update_date_string],
                             'script': '''def process(client, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['role_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'role_process_script', funcs, client, invitation)
 ''' 
                         }],
                         'tag': {
@@ -2573,13 +2549,10 @@ If you would like to change your decision, please follow the link in the previou
                             'maxReplies': 1,
                             'cdate': '${4/content/activation_date/value}',
                             'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['llm_pdf_response_process_script']['value']
     funcs = {
         'openreview': openreview
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)''',
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'llm_pdf_response_process_script', funcs, client, edit, invitation)''',
                             'edit': {
                                 'signatures': {
                                     'param': {
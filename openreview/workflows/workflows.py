@@ -15,27 +15,21 @@ class Workflows():
         self.update_date_string = "#{4/mdate} + " + str(self.update_wait_time)
         self.invitation_edit_process = '''def process(client, invitation):
     domain = client.get_group(invitation.domain)
-    meta_invitation = client.get_invitation(domain.content['meta_invitation_id']['value'])
-    script = meta_invitation.content["invitation_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, domain.content['meta_invitation_id']['value'], "invitation_edit_script", funcs, client, invitation)
 '''
         self.group_edit_process = '''def process(client, invitation):
     domain = client.get_group(invitation.domain)
-    meta_invitation = client.get_invitation(domain.content['meta_invitation_id']['value'])
-    script = meta_invitation.content["group_edit_script"]['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime,
         'date_index': date_index
     }
-    exec(script, funcs)
-    funcs['process'](client, invitation)
+    openreview.tools.run_process_script(client, domain.content['meta_invitation_id']['value'], "group_edit_script", funcs, client, invitation)
 '''
 
     def setup(self):
@@ -507,14 +501,11 @@ class Workflows():
                     'writers': [support_group_id],
                     'invitees': ['everyone'],
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['comment_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'comment_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': {
@@ -803,14 +794,11 @@ class Workflows():
                     'maxReplies': 1,
                     'description': 'We would love to hear your feedback about your experience managing your venue on OpenReview. Please share any comments, suggestions, or feedback you have about your experience, including any features you found particularly helpful, any parts of the process you found frustrating or unclear, and any other thoughts you have about how we can improve the OpenReview experience for venue organizers in the future.',
                     'process': '''def process(client, edit, invitation):
-    meta_invitation = client.get_invitation(invitation.invitations[0])
-    script = meta_invitation.content['comment_process_script']['value']
     funcs = {
         'openreview': openreview,
         'datetime': datetime
     }
-    exec(script, funcs)
-    funcs['process'](client, edit, invitation)
+    openreview.tools.run_process_script(client, invitation.invitations[0], 'comment_process_script', funcs, client, edit, invitation)
 ''',
                     'edit': {
                         'signatures': {
@@ -0,0 +1,51 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+import openreview
+
+
+def build_response(body=None, status=200, headers=None):
+    response = MagicMock()
+    response.status_code = status
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    else:
+        response.raise_for_status.return_value = None
+    response.headers = { 'Content-Type': 'application/json' } if headers is None else headers
+    response.content = json.dumps(body).encode('utf-8') if body is not None else b''
+    response.json.side_effect = lambda: json.loads(response.content)
+    return response
+
+
+@pytest.fixture
+def mock_response():
+    """Builds a response of the mocked session with a JSON body, an HTTPError is raised for the error statuses"""
+    return build_response
+
+
+@pytest.fixture
+def mock_stream_response():
+    """Builds a response of the mocked session whose JSON body is streamed in chunks of ``chunk_size`` bytes"""
+    def build(body, chunk_size=64):
+        encoded = json.dumps(body).encode('utf-8')
+        chunks = [encoded[i:i + chunk_size] for i in range(0, len(encoded), chunk_size)]
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        response.iter_content.side_effect = lambda *args, **kwargs: iter(chunks)
+        return response
+    return build
+
+
+@pytest.fixture
+def mock_client():
+    """Builds an OpenReviewClient whose session sends the GET, POST and DELETE requests to the passed functions"""
+    def build(get=None, post=None, delete=None):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        for method, handler in (('get', get), ('post', post), ('delete', delete)):
+            if handler:
+                setattr(client.session, method, MagicMock(side_effect=handler))
+        return client
+    return build
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+import openreview
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+def run(handlers, scenario):
+    async def main():
+        app = web.Application()
+        for method, path, handler in handlers:
+            app.router.add_route(method, path, handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with openreview.api.AsyncOpenReviewClient(baseurl=str(server.make_url('')).rstrip('/'), token='token', max_concurrency=4) as client:
+                client.backoff_factor = 0
+                return await scenario(client)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+class TestAsyncOpenReviewClient:
+
+    def test_get_notes_params_and_pagination(self):
+        seen = []
+        notes = [{ 'id': f'note{index:04d}', 'invitation': 'Venue/-/Submission', 'content': {} } for index in range(2500)]
+
+        async def get_notes(request):
+            seen.append(list(request.query.items()))
+            query = request.query
+            if 'after' in query or query.get('sort') == 'id':
+                start = next((i + 1 for i, n in enumerate(notes) if n['id'] == query.get('after')), 0)
+                return web.json_response({ 'notes': notes[start:start + int(query['limit'])] })
+            return web.json_response({ 'notes': notes[:2], 'count': len(notes) })
+
+        async def scenario(client):
+            first, count = await client.get_notes(invitation='Venue/-/Submission', content={ 'venueid': 'Venue' }, signatures=['~A1', '~B1'], with_count=True, trash=True)
+            assert [n.id for n in first] == ['note0000', 'note0001']
+            assert count == 2500
+            return [note.id async for note in client.iter_notes(invitation='Venue/-/Submission')]
+
+        ids = run([('GET', '/notes', get_notes)], scenario)
+
+        assert ids == [n['id'] for n in notes]
+        assert seen[0] == [('invitation', 'Venue/-/Submission'), ('signatures', '~A1'), ('signatures', '~B1'), ('trash', 'true'), ('content.venueid', 'Venue'), ('count', 'true')]
+        assert [dict(query).get('after') for query in seen[1:]] == [None, 'note0999', 'note1999']
+
+    def test_concurrency_is_bounded_and_profiles_are_batched(self):
+        state = { 'in_flight': 0, 'max_in_flight': 0, 'batches': [] }
+
+        async def search(request):
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+            await asyncio.sleep(0.01)
+            state['in_flight'] -= 1
+            ids = (await request.json())['ids']
+            state['batches'].append(len(ids))
+            return web.json_response({ 'profiles': [{ 'id': i, 'content': {} } for i in ids] })
+
+        async def scenario(client):
+            ids = [f'~User_{index}1' for index in range(2500)]
+            results = await asyncio.gather(*[client.search_profiles(ids=ids) for _ in range(5)])
+            return [[p.id for p in profiles] for profiles in results]
+
+        results = run([('POST', '/profiles/search', search)], scenario)
+
+        assert all(len(profiles) == 2500 for profiles in results)
+        assert sorted(state['batches']) == sorted([1000, 1000, 500] * 5)
+        assert state['max_in_flight'] <= 4
+
+    def test_retries_and_errors(self):
+        attempts = { 'edges': 0, 'bulk': 0 }
+
+        async def get_edges(request):
+            attempts['edges'] += 1
+            if attempts['edges'] < 3:
+                return web.json_response({ 'name': 'RateLimitError' }, status=429, headers={ 'Retry-After': '0' })
+            return web.json_response({ 'edges': [{ 'id': 'e1', 'head': 'note1', 'tail': '~User1', 'invitation': 'Venue/-/Bid', 'weight': 1 }] })
+
+        async def post_bulk(request):
+            attempts['bulk'] += 1
+            return web.json_response({ 'name': 'Error', 'message': 'Internal' }, status=500)
+
+        async def scenario(client):
+            edges = await client.get_all_edges(invitation='Venue/-/Bid')
+            with pytest.raises(openreview.OpenReviewException, match='Internal'):
+                await client.post_edges([openreview.api.Edge(head='note1', tail='~User1', invitation='Venue/-/Bid')])
+            return edges
+
+        edges = run([('GET', '/edges', get_edges), ('POST', '/edges/bulk', post_bulk)], scenario)
+
+        assert [(e.id, e.head, e.tail) for e in edges] == [('e1', 'note1', '~User1')]
+        assert attempts == { 'edges': 3, 'bulk': 1 }
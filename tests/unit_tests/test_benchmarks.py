@@ -0,0 +1,42 @@
+import json
+
+from benchmarks import WORKFLOWS, compare_results, format_comparison, run_benchmarks
+from benchmarks.__main__ import main
+
+
+class TestBenchmarks:
+
+    def test_run_all_workflows(self):
+        results = run_benchmarks(scale='tiny', papers=10, reviewers=30, score_rows=500, allocations=True, log=None)
+
+        assert results['metadata']['parameters'] == { 'papers': 10, 'reviewers': 30, 'reviews_per_paper': 3, 'score_rows': 500 }
+        assert list(results['results']) == list(WORKFLOWS)
+        for name, result in results['results'].items():
+            assert result['wall_seconds'] > 0
+            assert result['requests'] > 0 or name in ('find_conflicts', 'load_models', 'load_compact_models')
+            assert result['peak_rss_mb'] > 0
+            assert result['allocated_peak_mb'] > 0
+        assert results['results']['build_note_scores']['requests_by_endpoint']['POST /edges/bulk'] == 1
+        assert results['results']['post_decision_stage']['requests_by_endpoint']['POST /notes/edits'] == 10
+        assert results['results']['load_compact_models']['allocated_peak_mb'] < results['results']['load_models']['allocated_peak_mb']
+
+    def test_compare(self, tmp_path, capsys):
+        base = { 'metadata': { 'commit': 'a', 'date': '2025-01-01', 'scale': 'tiny', 'parameters': {} }, 'results': {
+            'get_profiles': { 'wall_seconds': 1.0, 'requests': 100, 'peak_rss_mb': 100 },
+            'post_decision_stage': { 'wall_seconds': 0.01, 'requests': 10, 'peak_rss_mb': 100 }
+        }}
+        head = { 'metadata': { 'commit': 'b', 'date': '2025-01-02', 'scale': 'tiny', 'parameters': {} }, 'results': {
+            'get_profiles': { 'wall_seconds': 1.5, 'requests': 100, 'peak_rss_mb': 90 },
+            'post_decision_stage': { 'wall_seconds': 0.02, 'requests': 10, 'peak_rss_mb': 100 }
+        }}
+
+        rows = compare_results(base, head)
+        assert [(row['workflow'], row['metric']) for row in rows if row['regression']] == [('get_profiles', 'wall_seconds')]
+        assert '+50.0% REGRESSION' in format_comparison(rows)
+
+        base_path, head_path = tmp_path / 'base.json', tmp_path / 'head.json'
+        base_path.write_text(json.dumps(base))
+        head_path.write_text(json.dumps(head))
+        assert main(['compare', str(base_path), str(head_path)]) == 0
+        assert main(['compare', str(base_path), str(head_path), '--fail-on-regression']) == 1
+        assert 'get_profiles' in capsys.readouterr().out
@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+import requests
+
+import openreview
+from openreview import tools
+
+
+class FakeEdgesEndpoint:
+
+    def __init__(self, failures=None):
+        self.failures = failures or {}
+        self.posted = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def post_edges(self, edges):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            error = self.failures.get(edges[0]).pop(0) if self.failures.get(edges[0]) else None
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+            if error:
+                raise error
+            self.posted.extend(edges)
+        return edges
+
+
+class TestPostBulkEdges:
+
+    def test_chunks_are_posted_concurrently_in_order(self):
+        client = FakeEdgesEndpoint()
+
+        result = tools.post_bulk_edges(client, (i for i in range(1050)), batch_size=100, max_in_flight=3)
+
+        assert result == list(range(1050))
+        assert 1 < client.max_in_flight <= 3
+
+    def test_transient_errors_are_retried(self):
+        client = FakeEdgesEndpoint(failures={ 200: [openreview.OpenReviewException({ 'name': 'Error', 'status': 503 }), requests.exceptions.ConnectTimeout()] })
+
+        posted = tools.post_bulk_edges(client, list(range(500)), batch_size=100, return_edges=False, backoff=0)
+
+        assert posted == 500
+        assert sorted(client.posted) == list(range(500))
+
+    @pytest.mark.parametrize('error', [
+        openreview.OpenReviewException({ 'name': 'ValidationError', 'status': 400 }),
+        openreview.OpenReviewException(['Not Found']),
+        ## The server may have posted the chunk
+        requests.exceptions.ReadTimeout(),
+        openreview.OpenReviewException({ 'name': 'Error', 'status': 500 })
+    ])
+    def test_errors_that_are_not_retried(self, error):
+        client = FakeEdgesEndpoint(failures={ 200: [error, None] })
+
+        with pytest.raises(type(error)):
+            tools.post_bulk_edges(client, list(range(500)), batch_size=100, backoff=0)
+        assert 200 not in client.posted
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        checkpoint = str(tmp_path / 'edges.checkpoint')
+        error = openreview.OpenReviewException({ 'name': 'Error', 'status': 503 })
+        client = FakeEdgesEndpoint(failures={ 300: [error, error] })
+
+        with pytest.raises(openreview.OpenReviewException):
+            tools.post_bulk_edges(client, list(range(550)), batch_size=100, max_in_flight=1, retries=1, backoff=0, checkpoint=checkpoint)
+        assert client.posted == list(range(300))
+
+        client.posted = []
+        result = tools.post_bulk_edges(client, list(range(550)), batch_size=100, max_in_flight=1, backoff=0, checkpoint=checkpoint)
+
+        assert result == list(range(300, 550))
+        assert client.posted == list(range(300, 550))
+        assert not (tmp_path / 'edges.checkpoint').exists()
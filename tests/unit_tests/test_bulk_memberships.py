@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+import openreview
+
+
+@pytest.fixture
+def build_client(mock_client, mock_response):
+    def build(groups):
+        edits = []
+        lock = threading.Lock()
+
+        def get(url, params=None, headers=None):
+            group = groups.get(params['id'])
+            if not group:
+                return mock_response({ 'name': 'NotFoundError', 'status': 404 }, 404)
+            return mock_response({ 'groups': [group] })
+
+        def post(url, json=None, headers=None):
+            with lock:
+                edits.append(json)
+            return mock_response({ 'id': 'edit', 'domain': 'Venue', 'signatures': json['signatures'], 'group': json['group'] })
+
+        def delete(url, params=None, json=None, headers=None):
+            return mock_response({})
+
+        return mock_client(get=get, post=post, delete=delete), edits
+    return build
+
+
+def build_group(group_id, members=None):
+    return { 'id': group_id, 'domain': 'Venue', 'signatures': ['Venue'], 'members': members or [] }
+
+
+class TestBulkUpdateMemberships:
+
+    def test_add_and_remove(self, build_client):
+        client, edits = build_client({
+            'Venue/Paper1/Reviewers': build_group('Venue/Paper1/Reviewers', ['~User_31']),
+            'Venue/Paper2/Reviewers': build_group('Venue/Paper2/Reviewers')
+        })
+
+        results = client.bulk_update_memberships({
+            'Venue/Paper1/Reviewers': { 'add': ['~User_11', '~User_11'], 'remove': ['~User_31'] },
+            'Venue/Paper2/Reviewers': { 'add': ['~User_21'] }
+        })
+
+        assert results['Venue/Paper1/Reviewers'] == { 'added': ['~User_11'], 'removed': ['~User_31'], 'group': None, 'error': None }
+        assert results['Venue/Paper2/Reviewers']['added'] == ['~User_21']
+        paper1_edits = [e['group']['members'] for e in edits if e['group']['id'] == 'Venue/Paper1/Reviewers']
+        assert paper1_edits == [{ 'remove': ['~User_31'] }, { 'add': ['~User_11'] }]
+        assert all(e['invitation'] == 'Venue/-/Edit' and e['signatures'] == ['Venue'] for e in edits)
+
+        ## group metadata is cached
+        client.session.get.reset_mock()
+        client.bulk_update_memberships({ 'Venue/Paper2/Reviewers': { 'add': ['~User_41'] } })
+        client.session.get.assert_not_called()
+
+        ## other edits of the group and deletions invalidate its metadata
+        client.post_group_edit('Venue/-/Edit', signatures=['Venue'], group=openreview.api.Group(id='Venue/Paper2/Reviewers', signatures=['Venue/Program_Chairs']))
+        client.delete_group('Venue/Paper1/Reviewers')
+        client.bulk_update_memberships({ 'Venue/Paper1/Reviewers': { 'add': ['~User_41'] }, 'Venue/Paper2/Reviewers': { 'add': ['~User_51'] } })
+        assert client.session.get.call_count == 2
+
+    def test_preloaded_groups_refetch_and_errors(self, build_client):
+        client, edits = build_client({ 'Venue/Paper1/Reviewers': build_group('Venue/Paper1/Reviewers') })
+        preloaded = openreview.api.Group(id='Venue/Paper1/Reviewers', domain='Venue', signatures=['Venue'])
+
+        results = client.bulk_update_memberships({
+            'Venue/Paper1/Reviewers': { 'add': ['~User_11'] },
+            'Venue/Paper9/Reviewers': { 'add': ['~User_11'] }
+        }, groups=[preloaded], refetch=True)
+
+        assert results['Venue/Paper1/Reviewers']['group'].id == 'Venue/Paper1/Reviewers'
+        assert results['Venue/Paper9/Reviewers']['error']
+        assert results['Venue/Paper9/Reviewers']['added'] == []
+        assert client.session.get.call_count == 2
@@ -0,0 +1,75 @@
+import json
+from unittest.mock import MagicMock
+
+import openreview
+from openreview.tools import iter_json_array
+
+
+class TestIterJsonArray:
+
+    def test_items_split_across_chunks(self):
+        body = {
+            'count': 123456,
+            'edges': [{ 'id': f'e{i}', 'weight': i / 3, 'label': 'Ünïcode ✓' * i } for i in range(40)],
+            'after': [1, 2, 3]
+        }
+        encoded = json.dumps(body).encode('utf-8')
+        for chunk_size in [1, 2, 5, 64, len(encoded)]:
+            chunks = [encoded[i:i + chunk_size] for i in range(0, len(encoded), chunk_size)]
+            assert list(iter_json_array(chunks, 'edges')) == body['edges']
+
+    def test_missing_or_empty_array(self):
+        assert list(iter_json_array([b'{"count": 0, "edges": []}'], 'edges')) == []
+        assert list(iter_json_array([b'{"count": 0}'], 'edges')) == []
+        assert list(iter_json_array([b''], 'edges')) == []
+
+    def test_items_are_yielded_lazily(self):
+        def chunks():
+            yield b'{"notes": [{"id": "n1"},'
+            yield b' {"id": "n2"}'
+            raise AssertionError('the stream should not be read past the requested items')
+
+        iterator = iter_json_array(chunks(), 'notes')
+        assert next(iterator) == { 'id': 'n1' }
+
+
+class TestClientIterators:
+
+    def test_iter_edges(self, mock_stream_response):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        body = { 'edges': [{ 'id': f'e{i}', 'invitation': 'Venue/-/Affinity_Score', 'head': f'paper{i}', 'tail': '~Reviewer1', 'weight': 0.5 } for i in range(10)] }
+        client.session.get = MagicMock(return_value=mock_stream_response(body, chunk_size=7))
+
+        edges = client.iter_edges(invitation='Venue/-/Affinity_Score')
+        client.session.get.assert_not_called()
+
+        edges = list(edges)
+        assert [e.id for e in edges] == [f'e{i}' for i in range(10)]
+        assert all(isinstance(e, openreview.api.Edge) for e in edges)
+
+        _, kwargs = client.session.get.call_args
+        assert kwargs['stream'] == True
+        assert kwargs['params']['stream'] == 'true'
+        assert kwargs['params']['invitation'] == 'Venue/-/Affinity_Score'
+        client.session.get.return_value.close.assert_called_once()
+
+    def test_iter_notes_with_details_paginates(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        client.limit = 2
+        pages = [
+            { 'notes': [{ 'id': 'a' }, { 'id': 'b' }] },
+            { 'notes': [{ 'id': 'c' }] }
+        ]
+        responses = []
+        for page in pages:
+            response = MagicMock()
+            response.raise_for_status.return_value = None
+            response.json.return_value = page
+            responses.append(response)
+        client.session.get = MagicMock(side_effect=responses)
+
+        notes = list(client.iter_notes(invitation='Venue/-/Submission', details='replies'))
+
+        assert [n.id for n in notes] == ['a', 'b', 'c']
+        assert client.session.get.call_count == 2
+        assert client.session.get.call_args_list[1][1]['params']['after'] == 'b'
@@ -0,0 +1,54 @@
+import pickle
+from unittest.mock import MagicMock
+
+import openreview
+from openreview.api import CompactNote, CompactEdge, CompactTag, CompactGroup, CompactProfile
+
+
+def edge_json(index):
+    return { 'id': f'edge{index}', 'invitation': 'Venue/Reviewers/-/Affinity_Score', 'domain': 'Venue', 'head': f'paper{index % 5000}', 'tail': f'~Reviewer_{index % 2000}1',
+        'weight': (index % 100) / 100, 'readers': ['Venue'], 'writers': ['Venue'], 'signatures': ['Venue'], 'nonreaders': [], 'cdate': 1700000000000, 'tcdate': 1700000000000, 'tmdate': 1700000000000 }
+
+
+def note_json(index):
+    return { 'id': f'note{index}', 'number': index, 'invitations': ['Venue/-/Submission'], 'domain': 'Venue', 'forum': f'note{index}', 'readers': ['everyone'], 'writers': ['Venue'],
+        'signatures': ['Venue'], 'content': { 'title': { 'value': f'Paper {index}' } }, 'cdate': 1700000000000, 'tcdate': 1700000000000, 'tmdate': 1700000000000 }
+
+
+class TestCompactModels:
+
+    def test_round_trip(self):
+        samples = [
+            (openreview.api.Note, CompactNote, note_json(1)),
+            (openreview.api.Edge, CompactEdge, edge_json(1)),
+            (openreview.api.Tag, CompactTag, { 'id': 'tag1', 'invitation': 'Venue/-/Tag', 'profile': '~User1', 'weight': 2, 'readers': ['Venue'], 'signature': 'Venue' }),
+            (openreview.api.Group, CompactGroup, { 'id': 'Venue/Reviewers', 'members': ['~User1'], 'readers': ['Venue'], 'domain': 'Venue', 'content': { 'key': { 'value': 1 } } }),
+            (openreview.Profile, CompactProfile, { 'id': '~User1', 'content': { 'names': [{ 'fullname': 'User', 'username': '~User1' }], 'emailsConfirmed': ['user@mail.com'] }, 'tauthor': 'OpenReview.net' })
+        ]
+        for model_class, compact_class, item in samples:
+            regular = model_class.from_json(item)
+            compact = compact_class.from_json(item)
+            assert not hasattr(compact, '__dict__')
+            assert compact.to_json() == regular.to_json()
+            assert compact_class.from_json(compact.to_json()).to_json() == regular.to_json()
+            assert pickle.loads(pickle.dumps(compact)).to_json() == regular.to_json()
+            assert repr(compact).startswith(compact_class.__name__)
+
+        profile = CompactProfile.from_json(samples[-1][2])
+        assert profile.get_preferred_name() == '~User1'
+        cache = openreview.tools.ProfileCache()
+        cache.put(profile)
+        assert cache.get('user@mail.com').id == '~User1'
+
+    def test_client_switch(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = { 'notes': [note_json(1), note_json(2)] }
+        client.session.get = MagicMock(return_value=response)
+
+        assert type(client.get_notes(invitation='Venue/-/Submission')[0]) is openreview.api.Note
+        client.use_compact_models()
+        assert all(type(note) is CompactNote for note in client.get_notes(invitation='Venue/-/Submission'))
+        client.use_compact_models(False)
+        assert type(client.get_notes(invitation='Venue/-/Submission')[0]) is openreview.api.Note
@@ -0,0 +1,236 @@
+import pickle
+import random
+
+import pytest
+
+import openreview
+from openreview import conflicts, tools
+
+
+def build_info(rng, profile_id, ids, domains, publications):
+    return {
+        'id': profile_id,
+        'domains': rng.sample(domains, rng.randint(0, 2)),
+        'emails': [],
+        'relations': set(rng.sample(ids, rng.randint(0, 2))),
+        'publications': set(rng.sample(publications, rng.randint(0, 3)))
+    }
+
+
+def build_dataset(seed, n_submissions, n_users, n_sacs, n_pcs):
+    rng = random.Random(seed)
+    domains = [f'domain{i}.edu' for i in range(n_users * 2)]
+    publications = [f'pub{i}' for i in range(n_users * 10)]
+    users = [f'~User_{i}1' for i in range(n_users)]
+    sacs = [f'~SAC_{i}1' for i in range(n_sacs)]
+    pcs = [f'~PC_{i}1' for i in range(n_pcs)]
+    authors = [f'~Author_{i}1' for i in range(n_submissions)] + users[:n_users // 10] + sacs[:1]
+    all_ids = users + sacs + pcs + authors
+
+    users_info = [build_info(rng, user, all_ids, domains, publications) for user in users]
+    sac_info_by_id = { sac: build_info(rng, sac, all_ids, domains, publications) for sac in sacs }
+    pc_info_by_id = { pc: build_info(rng, pc, all_ids, domains, publications) for pc in pcs }
+    author_info_by_id = { author: build_info(rng, author, all_ids, domains, publications) for author in authors }
+    submissions = [rng.sample(authors, rng.randint(1, 4)) for _ in range(n_submissions)]
+    sacs_by_ac = { user: rng.sample(sacs, 1) for user in users if rng.random() < 0.8 }
+    pcs_by_sac = { sac: rng.choice(pcs) for sac in sacs }
+    return submissions, author_info_by_id, users_info, sacs_by_ac, sac_info_by_id, pcs_by_sac, pc_info_by_id
+
+
+def pairwise_conflicts(submissions, author_info_by_id, users_info, sacs_by_ac, sac_info_by_id, pcs_by_sac, pc_info_by_id):
+    ## Reference implementation: one set intersection per submission and user
+    def intersect(author_ids, author_domains, author_relations, author_publications, info):
+        conflicts = set()
+        conflicts.update(author_ids.intersection(set([info['id']])))
+        conflicts.update(author_domains.intersection(info['domains']))
+        conflicts.update(author_relations.intersection([info['id']]))
+        conflicts.update(author_ids.intersection(info['relations']))
+        conflicts.update(author_publications.intersection(info['publications']))
+        return conflicts
+
+    result = []
+    for authorids in submissions:
+        author_ids, author_domains, author_relations, author_publications = set(), set(), set(), set()
+        for authorid in authorids:
+            author_info = author_info_by_id[authorid]
+            author_ids.add(author_info['id'])
+            author_domains.update(author_info['domains'])
+            author_relations.update(author_info['relations'])
+            author_publications.update(author_info['publications'])
+        positions = []
+        for position, user_info in enumerate(users_info):
+            conflicts = intersect(author_ids, author_domains, author_relations, author_publications, user_info)
+            assigned_sacs = sacs_by_ac.get(user_info['id'], [])
+            if not conflicts:
+                for sac in assigned_sacs:
+                    if sac_info_by_id.get(sac):
+                        conflicts.update(intersect(author_ids, author_domains, author_relations, author_publications, sac_info_by_id[sac]))
+            if not conflicts and pcs_by_sac:
+                for pc in [pcs_by_sac.get(sac) for sac in assigned_sacs]:
+                    if pc_info_by_id.get(pc):
+                        conflicts.update(intersect(author_ids, author_domains, author_relations, author_publications, pc_info_by_id[pc]))
+            if conflicts:
+                positions.append(position)
+        result.append(positions)
+    return result
+
+
+def indexed_conflicts(submissions, author_info_by_id, users_info, sacs_by_ac, sac_info_by_id, pcs_by_sac, pc_info_by_id):
+    submissions_info = [tools.merge_profile_info([author_info_by_id[a] for a in authorids]) for authorids in submissions]
+    return tools.find_conflicts(submissions_info, users_info, sacs_by_ac=sacs_by_ac, sac_info_by_id=sac_info_by_id, pcs_by_sac=pcs_by_sac, pc_info_by_id=pc_info_by_id)
+
+
+class TestConflictIndex:
+
+    def test_conflict_rules(self):
+        index = tools.ConflictIndex([
+            { 'id': '~Same_1', 'domains': [], 'relations': set(), 'publications': set() },
+            { 'id': '~Domain_1', 'domains': ['umass.edu'], 'relations': set(), 'publications': set() },
+            { 'id': '~Relation_1', 'domains': [], 'relations': set(), 'publications': set() },
+            { 'id': '~Reverse_1', 'domains': [], 'relations': { '~Author_1' }, 'publications': set() },
+            { 'id': '~Coauthor_1', 'domains': [], 'relations': set(), 'publications': { 'paper1' } },
+            { 'id': '~None_1', 'domains': ['mit.edu'], 'relations': { '~Other_1' }, 'publications': { 'paper2' } }
+        ])
+        authors_info = tools.merge_profile_info([
+            { 'id': '~Author_1', 'domains': ['umass.edu'], 'relations': { '~Relation_1' }, 'publications': { 'paper1' } },
+            { 'id': '~Same_1', 'domains': [], 'relations': set(), 'publications': set() }
+        ])
+
+        assert index.find(authors_info) == [0, 1, 2, 3, 4]
+
+    def test_transfer_rules(self):
+        users_info = [{ 'id': '~AC_1', 'domains': [], 'relations': set(), 'publications': set() }]
+        submissions_info = [tools.merge_profile_info([{ 'id': '~Author_1', 'domains': ['umass.edu'], 'relations': set(), 'publications': set() }])]
+        sac_info_by_id = { '~SAC_1': { 'id': '~SAC_1', 'domains': [], 'relations': set(), 'publications': set() } }
+        pc_info_by_id = { '~PC_1': { 'id': '~PC_1', 'domains': ['umass.edu'], 'relations': set(), 'publications': set() } }
+
+        assert tools.find_conflicts(submissions_info, users_info, sacs_by_ac={ '~AC_1': ['~SAC_1'] }, sac_info_by_id=sac_info_by_id) == [[]]
+        assert tools.find_conflicts(submissions_info, users_info, sacs_by_ac={ '~AC_1': ['~SAC_1'] }, sac_info_by_id=sac_info_by_id, pcs_by_sac={ '~SAC_1': '~PC_1' }, pc_info_by_id=pc_info_by_id) == [[0]]
+        assert tools.find_conflicts(submissions_info, users_info, pcs_by_sac={ '~SAC_1': '~PC_1' }, pc_info_by_id=pc_info_by_id) == [[]]
+
+    def test_same_output_as_pairwise_intersections(self):
+        for seed in range(5):
+            dataset = build_dataset(seed, n_submissions=200, n_users=150, n_sacs=10, n_pcs=3)
+            assert indexed_conflicts(*dataset) == pairwise_conflicts(*dataset)
+
+
+def build_profile(rng, index, ids):
+    publications = [openreview.api.Note(id=f'pub{rng.randint(0, 300)}', pdate=1700000000000, content={ 'title': { 'value': 'Title' } }) for _ in range(rng.randint(0, 3))]
+    return openreview.Profile(
+        id=f'~User_{index}1',
+        content={
+            'emails': [f'user{index}@domain{rng.randint(0, 60)}.edu'],
+            'history': [{ 'institution': { 'domain': f'domain{rng.randint(0, 60)}.edu' } }],
+            'relations': [{ 'username': rng.choice(ids), 'relation': 'Coauthor' } for _ in range(rng.randint(0, 2))],
+            'publications': publications
+        }
+    )
+
+
+class TestConflictComputer:
+
+    def test_parallel_output_matches_serial(self):
+        dataset = build_dataset(7, n_submissions=300, n_users=200, n_sacs=10, n_pcs=3)
+        submissions, author_info_by_id, users_info, sacs_by_ac, sac_info_by_id, pcs_by_sac, pc_info_by_id = dataset
+        submissions_info = [tools.merge_profile_info([author_info_by_id[a] for a in authorids]) for authorids in submissions]
+        users_info = [tools.compact_profile_info(info) for info in users_info]
+
+        computer = tools.ConflictComputer(max_workers=2, chunksize=50)
+        parallel = computer.compute(submissions_info, users_info, sacs_by_ac=sacs_by_ac, sac_info_by_id=sac_info_by_id, pcs_by_sac=pcs_by_sac, pc_info_by_id=pc_info_by_id)
+
+        assert parallel == pairwise_conflicts(*dataset)
+
+    def test_get_info_with_builtin_and_custom_policies(self, monkeypatch):
+        rng = random.Random(3)
+        profiles = [build_profile(rng, index, [f'~User_{i}1' for i in range(120)]) for index in range(120)]
+
+        serial = tools.ConflictComputer(policy='NeurIPS', n_years=3, max_workers=1).get_info(profiles)
+        parallel = tools.ConflictComputer(policy='NeurIPS', n_years=3, max_workers=2, chunksize=40).get_info(profiles)
+        assert parallel == serial
+        assert serial[0]['id'] == '~User_01'
+
+        ## The workers receive the Profiles without the fields of the publications the policies do not read
+        profile = next(profile for profile in profiles if profile.content['publications'])
+        compact = pickle.loads(pickle.dumps(openreview.conflicts._compact_profile(profile)))
+        assert [publication.id for publication in compact.content['publications']] == [publication.id for publication in profile.content['publications']]
+        assert all(publication.content == {} and publication.pdate == 1700000000000 for publication in compact.content['publications'])
+        assert tools.ConflictComputer().max_workers == 1
+        monkeypatch.setattr(openreview.conflicts, 'CONFLICT_WORKERS', 4)
+        assert tools.ConflictComputer().max_workers == 4
+
+        custom = tools.ConflictComputer(policy=lambda profile, n_years: { 'id': profile.id, 'domains': ['custom.org'], 'relations': [], 'publications': [] }, max_workers=2, chunksize=40)
+        assert all(info['domains'] == frozenset(['custom.org']) for info in custom.get_info(profiles))
+
+    def test_details_match_get_conflicts(self):
+        rng = random.Random(5)
+        ids = [f'~User_{i}1' for i in range(80)]
+        profiles = [build_profile(rng, index, ids) for index in range(80)]
+        authors, users = profiles[:3], profiles[3:]
+
+        computer = tools.ConflictComputer(policy='NeurIPS', n_years=3, compare_emails=True)
+        submission_info = tools.merge_profile_info(computer.get_info(authors))
+        details = dict(computer.compute([submission_info], computer.get_info(users), with_details=True)[0])
+
+        for position, user in enumerate(users):
+            assert details.get(position, []) == sorted(tools.get_conflicts(authors, user, policy='NeurIPS', n_years=3))
+
+
+class TestConflictPolicy:
+
+    def test_profile_info_is_immutable_and_dict_like(self):
+        info = tools.ProfileInfo('~User_11', domains=['umass.edu'], relations=['~User_21'])
+
+        assert info['id'] == '~User_11'
+        assert info['domains'] == frozenset(['umass.edu'])
+        assert info.get('emails') == frozenset()
+        assert info.get('other', 'missing') == 'missing'
+        with pytest.raises(AttributeError):
+            info.domains = frozenset()
+        assert pickle.loads(pickle.dumps(info)) == info
+
+    def test_results_are_cached_per_profile_version(self):
+        calls = []
+
+        def get_info(profile, n_years=None):
+            calls.append(profile.id)
+            return { 'id': profile.id, 'domains': ['cs.umass.edu', 'gmail.com'], 'relations': [], 'publications': [] }
+
+        policy = tools.register_conflict_policy('Counting', get_info)
+        profile = openreview.Profile(id='~User_11', tmdate=1, content={})
+
+        assert policy(profile, 3)['domains'] == frozenset(['cs.umass.edu', 'umass.edu'])
+        assert policy(openreview.Profile(id='~User_11', tmdate=1, content={}), 3) is policy(profile, 3)
+        assert calls == ['~User_11']
+
+        policy(profile, 5)
+        policy(openreview.Profile(id='~User_11', tmdate=2, content={}), 3)
+        assert len(calls) == 3
+
+        ## Profiles without a version are not cached
+        policy(openreview.Profile(id='~User_11', content={}), 3)
+        policy(openreview.Profile(id='~User_11', content={}), 3)
+        assert len(calls) == 5
+
+        assert tools.get_conflict_policy('Counting') is policy
+        assert tools.get_conflict_policy(get_info) is policy
+
+        ## Functions that are not registered are not kept
+        get_other_info = lambda profile, n_years=None: get_info(profile, n_years)
+        assert tools.get_conflict_policy(get_other_info) is not tools.get_conflict_policy(get_other_info)
+        assert get_other_info not in conflicts._policies
+
+    def test_submission_venueid_is_passed_when_declared(self):
+        def get_info(profile, n_years=None, submission_venueid=None):
+            return { 'id': profile.id, 'domains': [], 'relations': [], 'publications': [submission_venueid] }
+
+        info = tools.get_conflict_policy(get_info)(openreview.Profile(id='~User_11', content={}), None, 'Venue/Submission')
+        assert info['publications'] == frozenset(['Venue/Submission'])
+
+    def test_info_function_builder_returns_dicts(self):
+        def get_info(profile, n_years=None):
+            return { 'id': profile.id, 'domains': ['cs.umass.edu', 'gmail.com'], 'relations': set(), 'publications': set(), 'extra': 1 }
+
+        info = tools.info_function_builder(get_info)(openreview.Profile(id='~User_11', tmdate=1, content={}), 3)
+        assert sorted(info['domains']) == ['cs.umass.edu', 'umass.edu']
+        assert info['extra'] == 1
+        info['relations'].add('~User_21')
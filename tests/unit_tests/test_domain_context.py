@@ -0,0 +1,68 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+import openreview
+from openreview import tools
+from openreview.api import DomainContext, Edit, Group, Invitation, Note
+
+
+def domain_group():
+    return Group(id='ICML.cc/2025/Conference', content={
+        'meta_invitation_id': { 'value': 'ICML.cc/2025/Conference/-/Edit' },
+        'subtitle': { 'value': 'ICML 2025' },
+        'submission_name': { 'value': 'Submission' },
+        'reviewers_name': { 'value': 'Reviewers' }
+    })
+
+
+class TestDomainContext:
+
+    def test_load_fetches_concurrently(self):
+        client = MagicMock()
+        barrier = threading.Barrier(3, timeout=5)
+        def fetch(value):
+            ## Every request waits for the other two, so they must be in flight at the same time
+            def get(id):
+                barrier.wait()
+                return value
+            return get
+        client.get_group.side_effect = fetch(domain_group())
+        client.get_invitation.side_effect = fetch(Invitation(id='ICML.cc/2025/Conference/-/Official_Review', content={ 'email_authors': { 'value': True } }))
+        client.get_note.side_effect = fetch(Note(id='paper1', number=5))
+
+        edit = Edit(domain='ICML.cc/2025/Conference', note=Note(id='review1', forum='paper1'))
+        invitation = Invitation(id='ICML.cc/2025/Conference/Submission5/-/Official_Review', invitations=['ICML.cc/2025/Conference/-/Official_Review'])
+        context = DomainContext.load(client, edit, invitation)
+
+        client.get_group.assert_called_once_with('ICML.cc/2025/Conference')
+        client.get_invitation.assert_called_once_with('ICML.cc/2025/Conference/-/Official_Review')
+        client.get_note.assert_called_once_with('paper1')
+        assert context.venue_id == 'ICML.cc/2025/Conference'
+        assert context.meta_invitation_id == 'ICML.cc/2025/Conference/-/Edit'
+        assert context.short_name == 'ICML 2025'
+        assert context.area_chairs_name is None
+        assert context.get('area_chairs_name', 'Area_Chairs') == 'Area_Chairs'
+        assert context.parent_invitation.get_content_value('email_authors')
+        assert context.get_committee_id(context.reviewers_name, context.forum.number) == 'ICML.cc/2025/Conference/Submission5/Reviewers'
+        assert context.get_committee_id('Program_Chairs') == 'ICML.cc/2025/Conference/Program_Chairs'
+
+    def test_date_process_and_injection(self):
+        client = MagicMock(baseurl='http://localhost:3001')
+        client.get_group.return_value = domain_group()
+        context = DomainContext.load(client, invitation=Invitation(id='ICML.cc/2025/Conference/-/Review_Reminder', domain='ICML.cc/2025/Conference'))
+        assert context.parent_invitation is None and context.forum is None
+        with pytest.raises(ValueError):
+            DomainContext.load(client, invitation=Invitation(id='Missing/-/Domain'))
+
+        client.get_invitation.return_value = Invitation(id='ICML.cc/2025/Conference/-/Edit', tmdate=1, content={ 'process_script': { 'value': '''def process(client, edit, invitation, context=None):
+    return context.venue_id, context.forum.id
+''' } })
+        client.get_note.return_value = Note(id='paper1')
+        edit = Edit(domain='ICML.cc/2025/Conference', note=Note(id='paper1'))
+        invitation = Invitation(id='ICML.cc/2025/Conference/-/Withdrawal', invitations=['ICML.cc/2025/Conference/-/Edit'])
+
+        assert tools.run_process_script(client, 'ICML.cc/2025/Conference/-/Edit', 'process_script', { 'openreview': openreview }, client, edit, invitation) == ('ICML.cc/2025/Conference', 'paper1')
+        ## The meta invitation is the parent invitation, it is fetched once
+        client.get_invitation.assert_called_once_with('ICML.cc/2025/Conference/-/Edit')
@@ -0,0 +1,40 @@
+import tld
+
+from openreview import tools
+
+
+def uncached_subdomains(domain):
+    ## Previous implementation, without caches
+    duplicate_domains = tools.load_duplicate_domains()
+    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
+    return sorted(set(duplicate_domains.get(d, d) for d in domains if not tld.is_tld(d)))
+
+
+class TestSubdomains:
+
+    def test_subdomains(self):
+        assert tools.subdomains('iesl.cs.umass.edu') == ['cs.umass.edu', 'iesl.cs.umass.edu', 'umass.edu']
+        assert tools.subdomains('mail.tsinghua.edu.cn') == uncached_subdomains('mail.tsinghua.edu.cn')
+
+        ## callers get their own list
+        tools.subdomains('cs.umass.edu').append('other.edu')
+        assert tools.subdomains('cs.umass.edu') == ['cs.umass.edu', 'umass.edu']
+
+    def test_subdomains_many(self):
+        assert tools.subdomains_many(['iesl.cs.umass.edu', 'mit.edu', 'cs.umass.edu']) == ['cs.umass.edu', 'iesl.cs.umass.edu', 'mit.edu', 'umass.edu']
+        assert tools.subdomains_many([]) == []
+
+    def test_load_duplicate_domains_once(self):
+        assert tools.load_duplicate_domains() is tools.load_duplicate_domains()
+
+    def test_repeated_domains_are_cached(self):
+        domains = [f'dept{i % 7}.university{i}.edu' for i in range(500)] * 40
+        tools._subdomains.cache_clear()
+
+        result = [tools.subdomains(domain) for domain in domains]
+
+        assert result == [uncached_subdomains(domain) for domain in domains[:500]] * 40
+        cache_info = tools._subdomains.cache_info()
+        assert cache_info.misses == 500
+        assert cache_info.hits == 500 * 39
@@ -0,0 +1,68 @@
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+import openreview
+from openreview.api import EdgeFrame
+
+
+def build_frame():
+    edges = [
+        { 'head': 'paper1', 'tail': '~A1', 'weight': 0.9 },
+        { 'head': 'paper1', 'tail': '~B1', 'weight': 0.2, 'label': 'Conflict' },
+        { 'head': 'paper2', 'tail': '~A1', 'weight': 0.5 },
+        { 'head': 'paper3', 'tail': '~C1' }
+    ]
+    return EdgeFrame.from_json(edges, invitation='Venue/-/Affinity_Score')
+
+
+class TestEdgeFrame:
+
+    def test_get_edges_frame_streams_into_columns(self, mock_stream_response):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        body = { 'edges': [{ 'head': f'paper{i % 3}', 'tail': f'~User_{i}1', 'weight': i / 10 } for i in range(30)] }
+        client.session.get = MagicMock(return_value=mock_stream_response(body))
+
+        frame = client.get_edges_frame(invitation='Venue/-/Affinity_Score')
+
+        params = client.session.get.call_args.kwargs['params']
+        assert params['select'] == 'head,tail,weight,label'
+        assert params['stream'] == 'true'
+        assert len(frame) == 30
+        assert frame.count_by('head') == { 'paper0': 10, 'paper1': 10, 'paper2': 10 }
+        assert frame.heads()[:3] == ['paper0', 'paper1', 'paper2']
+        assert list(frame.weights())[:2] == [0.0, 0.1]
+
+    def test_groupby_filter_and_aggregations(self):
+        frame = build_frame()
+
+        groups = frame.groupby('head')
+        assert list(groups) == ['paper1', 'paper2', 'paper3']
+        assert groups['paper1'].tails() == ['~A1', '~B1']
+        assert frame.groupby('tail')['~A1'].heads() == ['paper1', 'paper2']
+
+        assert list(frame.filter(min_weight=0.5).rows()) == [('paper1', '~A1', 0.9, None), ('paper2', '~A1', 0.5, None)]
+        assert frame.filter(tail=['~A1', '~Z1'], head='paper2').heads() == ['paper2']
+        assert frame.filter(label='Conflict').tails() == ['~B1']
+        assert frame.filter(predicate=lambda head, tail, weight, label: weight is None).heads() == ['paper3']
+
+        assert frame.sum_by('tail') == { '~A1': pytest.approx(1.4), '~B1': 0.2 }
+        assert frame.count_by('label') == { None: 3, 'Conflict': 1 }
+        assert math.isnan(frame.weights()[3])
+
+    def test_to_edges(self):
+        frame = build_frame()
+
+        edges = list(frame.to_edges(readers=['Venue'], signatures=['Venue']))
+
+        assert [(e.invitation, e.head, e.tail, e.weight, e.label) for e in edges] == [
+            ('Venue/-/Affinity_Score', 'paper1', '~A1', 0.9, None),
+            ('Venue/-/Affinity_Score', 'paper1', '~B1', 0.2, 'Conflict'),
+            ('Venue/-/Affinity_Score', 'paper2', '~A1', 0.5, None),
+            ('Venue/-/Affinity_Score', 'paper3', '~C1', None, None)
+        ]
+        assert all(e.readers == ['Venue'] and e.signatures == ['Venue'] for e in edges)
+
+        round_trip = EdgeFrame.from_edges(edges)
+        assert list(round_trip.rows()) == list(frame.rows())
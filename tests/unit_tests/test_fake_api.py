@@ -0,0 +1,78 @@
+import pytest
+
+import openreview
+from openreview import tools
+from openreview.testing import FakeOpenReviewAPI, seed_venue
+
+
+@pytest.fixture
+def api():
+    yield FakeOpenReviewAPI()
+    tools.clear_shared_clients()
+
+
+class TestFakeOpenReviewAPI:
+
+    def test_seeded_venue_is_served(self, api):
+        venue = seed_venue(api, papers=20, reviewers=30, scores_per_paper=10, bids_per_reviewer=2, proposed_assignments_per_paper=3)
+        client = api.client()
+
+        assert client.profile.id == '~Super_User1'
+        submissions = client.get_all_notes(content={ 'venueid': venue.submission_venue_id }, sort='number:asc')
+        assert [note.number for note in submissions] == list(range(1, 21))
+        assert submissions[0].content['authorids']['value'] == venue.authors[:3]
+
+        assert len(client.get_all_edges(invitation=venue.affinity_score_id)) == 200
+        assert client.get_edges_count(invitation=venue.bid_id) == 60
+        grouped = client.get_grouped_edges(invitation=venue.proposed_assignment_id, groupby='head', select='tail')
+        assert sorted(g['id']['head'] for g in grouped) == sorted(venue.submissions)
+        assert all(len(g['values']) == 3 and list(g['values'][0]) == ['tail'] for g in grouped)
+
+        assert client.get_group(venue.reviewers_id).members == venue.reviewers
+        assert [g.id for g in client.get_all_groups(member=venue.authors[0])] == [venue.authors_id, f'{venue.venue_id}/Submission1/Authors']
+        assert tools.get_group(client, f'{venue.venue_id}/Missing') is None
+
+        profiles = tools.get_profiles(client, venue.reviewers[:2] + ['reviewer2@' + api.profiles[venue.reviewers[2]]['content']['history'][0]['institution']['domain']], with_publications=True, as_dict=True)
+        assert all(profile.content['publications'] == [] for profile in profiles.values())
+        assert profiles[venue.reviewers[0]].id == venue.reviewers[0]
+
+    def test_edits_edges_and_messages(self, api):
+        venue = seed_venue(api, papers=2, reviewers=3)
+        client = api.client()
+
+        edit = client.post_note_edit(invitation=f'{venue.venue_id}/Submission1/-/Decision', signatures=[venue.program_chairs_id],
+            note=openreview.api.Note(replyto=venue.submissions[0], content={ 'decision': { 'value': 'Accept' } }))
+        assert edit['note']['forum'] == venue.submissions[0]
+        submission = client.get_notes(id=venue.submissions[0], details='directReplies')[0]
+        assert submission.details['directReplies'][0]['content']['decision']['value'] == 'Accept'
+
+        client.post_note_edit(invitation=venue.submission_id, signatures=[venue.program_chairs_id], note=openreview.api.Note(id=venue.submissions[0], content={ 'title': { 'value': 'New title' }, 'keywords': { 'delete': True } }))
+        note = client.get_note(venue.submissions[0])
+        assert note.content['title']['value'] == 'New title'
+        assert 'keywords' not in note.content
+        assert len(client.get_note_edits(note_id=venue.submissions[0])) == 1
+
+        group = client.add_members_to_group(f'{venue.venue_id}/Submission1/Reviewers', venue.reviewers[:2])
+        assert sorted(group.members) == sorted(venue.reviewers[:2])
+        assert client.remove_members_from_group(group, venue.reviewers[0]).members == [venue.reviewers[1]]
+
+        edges = client.post_edges([openreview.api.Edge(invitation=venue.proposed_assignment_id, head=venue.submissions[1], tail=tail, weight=1, readers=[venue.venue_id], writers=[venue.venue_id], signatures=[venue.venue_id]) for tail in venue.reviewers])
+        assert all(edge.id for edge in edges)
+        client.delete_edges(invitation=venue.proposed_assignment_id, tail=venue.reviewers[0], wait_to_finish=True)
+        assert client.get_edges_count(invitation=venue.proposed_assignment_id) == 2
+
+        client.post_message('Subject', [venue.reviewers_id], 'Message')
+        assert api.messages[0]['groups'] == [venue.reviewers_id]
+
+        with pytest.raises(openreview.OpenReviewException, match='Route Not Found'):
+            client.get_venues()
+        assert api.requests['POST /notes/edits'] == 2
+
+    def test_matching_setup(self, api):
+        venue = seed_venue(api, papers=10, reviewers=20, scores_per_paper=5, bids_per_reviewer=2)
+        client = api.client()
+
+        venue.get_venue(client).setup_committee_matching(compute_conflicts=True)
+
+        assert client.get_invitation(f'{venue.reviewers_id}/-/Custom_Max_Papers').domain == venue.venue_id
+        assert client.get_edges_count(invitation=f'{venue.reviewers_id}/-/Conflict') > 0
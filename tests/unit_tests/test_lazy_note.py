@@ -0,0 +1,81 @@
+import json
+import pickle
+from unittest.mock import MagicMock
+
+import openreview
+from openreview.api import LazyNote, Note
+
+
+def submission_json(number, decision=None):
+    replies = [{ 'id': f'review{number}', 'invitations': [f'Venue/Submission{number}/-/Official_Review'], 'content': {} }]
+    if decision:
+        replies.append({ 'id': f'decision{number}', 'invitations': [f'Venue/Submission{number}/-/Decision', 'Venue/-/Edit'], 'content': { 'decision': { 'value': decision } } })
+    return {
+        'id': f'paper{number}',
+        'number': number,
+        'forum': f'paper{number}',
+        'invitations': ['Venue/-/Submission'],
+        'parentInvitations': 'Venue/-/Submission',
+        'content': { 'title': { 'value': f'Paper {number}' } },
+        'readers': ['everyone'],
+        'details': { 'directReplies': replies }
+    }
+
+
+class TestLazyNote:
+
+    def test_attributes_match_note(self):
+        note_json = submission_json(1, decision='Accept')
+        lazy_note = LazyNote.from_raw(json.dumps(note_json))
+        note = Note.from_json(note_json)
+
+        assert lazy_note.id == 'paper1'
+        assert lazy_note.number == 1
+        assert lazy_note.content['title']['value'] == 'Paper 1'
+        assert lazy_note.parent_invitations == 'Venue/-/Submission'
+        assert lazy_note.pdate is None
+        assert lazy_note.to_json() == note.to_json()
+        assert lazy_note.to_note().to_json() == note.to_json()
+
+        lazy_note.content = { 'title': { 'value': 'New title' } }
+        assert lazy_note.to_json()['content'] == { 'title': { 'value': 'New title' } }
+        assert pickle.loads(pickle.dumps(lazy_note)).to_json() == lazy_note.to_json()
+
+    def test_replies_by_invitation(self):
+        lazy_note = LazyNote.from_json(submission_json(2, decision='Reject'))
+
+        assert lazy_note.get_reply('Venue/Submission2/-/Decision')['id'] == 'decision2'
+        assert [r['id'] for r in lazy_note.get_replies('Venue/-/Edit')] == ['decision2']
+        assert len(lazy_note.get_replies()) == 2
+        assert lazy_note.get_reply('Venue/Submission2/-/Meta_Review') is None
+        assert LazyNote.from_json({ 'id': 'paper3' }).get_reply('Venue/Submission3/-/Decision') is None
+
+        lazy_note.details = { 'directReplies': [] }
+        assert lazy_note.get_reply('Venue/Submission2/-/Decision') is None
+
+    def test_client_returns_lazy_notes(self, mock_stream_response):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        body = { 'notes': [submission_json(number) for number in range(1, 4)] }
+        client.session.get = MagicMock(return_value=mock_stream_response(body))
+
+        notes = list(client.iter_notes(invitation='Venue/-/Submission', lazy=True))
+        assert all(isinstance(note, LazyNote) for note in notes)
+        assert all(note._raw is not None for note in notes)
+        assert [note.number for note in notes] == [1, 2, 3]
+
+        client.session.get = MagicMock(return_value=MagicMock(json=MagicMock(return_value=body)))
+        notes = client.get_all_notes(invitation='Venue/-/Submission', sort='number:desc', lazy=True)
+        assert [note.number for note in notes] == [3, 2, 1]
+        assert all(isinstance(note, LazyNote) for note in notes)
+
+    def test_get_decision_note_uses_index(self):
+        venue = openreview.venue.Venue(MagicMock(), 'Venue', 'openreview.net/Support')
+        venue.decision_stage = openreview.stages.DecisionStage()
+        venue.submission_stage = openreview.stages.SubmissionStage()
+        submission = LazyNote.from_json(submission_json(4, decision='Accept'))
+
+        decision = venue.get_decision_note(submission)
+        assert isinstance(decision, Note)
+        assert decision.content['decision']['value'] == 'Accept'
+        assert venue.get_decision_note(LazyNote.from_json(submission_json(5))) is None
+        assert venue.get_decision_note(Note.from_json(submission_json(6, decision='Reject'))).id == 'decision6'
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+import openreview
+
+
+@pytest.fixture
+def build_client(mock_client, mock_response):
+    def build():
+        flushed = []
+        lock = threading.Lock()
+
+        def post(url, json=None, headers=None):
+            return mock_response({ 'id': 'edit', 'domain': 'Venue', 'signatures': json['signatures'], 'group': json['group'] })
+
+        def delete(url, params=None, headers=None):
+            with lock:
+                flushed.append(url.split('/')[-1])
+            return mock_response({})
+
+        return mock_client(post=post, delete=delete), flushed
+    return build
+
+
+def add_members(client, group_id, add=None, remove=None):
+    members = {}
+    if add:
+        members['add'] = add
+    if remove:
+        members['remove'] = remove
+    client.post_group_edit(invitation='Venue/-/Edit', signatures=['Venue'], group=openreview.api.Group(id=group_id, members=members))
+
+
+class TestMembersCacheFlush:
+
+    def test_added_and_removed_members_are_flushed(self, build_client):
+        client, flushed = build_client()
+
+        add_members(client, 'Venue/Paper1/Reviewers', add=['~User_11', '~User_21'], remove=['~User_31'])
+
+        assert sorted(flushed) == ['~User_11', '~User_21', '~User_31']
+
+    def test_deferred_flush(self, build_client):
+        client, flushed = build_client()
+
+        with client.deferred_cache_flush():
+            with client.deferred_cache_flush():
+                add_members(client, 'Venue/Paper1/Reviewers', add=['~User_11', '~User_21'])
+            threads = [threading.Thread(target=add_members, args=(client, f'Venue/Paper{i}/Reviewers', ['~User_11', '~User_31'])) for i in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert flushed == []
+
+        assert sorted(flushed) == ['~User_11', '~User_21', '~User_31']
+
+        add_members(client, 'Venue/Paper1/Reviewers', add=['~User_41'])
+        assert flushed[-1] == '~User_41'
+
+    def test_deferred_flush_on_error(self, build_client):
+        client, flushed = build_client()
+
+        try:
+            with client.deferred_cache_flush():
+                add_members(client, 'Venue/Paper1/Reviewers', add=['~User_11'])
+                raise ValueError()
+        except ValueError:
+            pass
+
+        assert flushed == ['~User_11']
@@ -0,0 +1,60 @@
+import pytest
+
+import openreview
+from openreview import tools
+from openreview.testing import FakeOpenReviewAPI
+
+
+@pytest.fixture
+def api():
+    yield FakeOpenReviewAPI()
+    tools.clear_shared_clients()
+
+
+class TestMessageQueue:
+
+    def test_post_messages_bulk(self, api):
+        api.add_group({ 'id': 'Venue/Authors' })
+        client = api.client()
+
+        messages = [{ 'subject': 'Reminder', 'recipients': [f'~Reviewer{index}'], 'message': 'Hi {{fullname}}', 'invitation': 'Venue/-/Edit' } for index in range(3)]
+        messages.append({ 'subject': 'Decision', 'recipients': ['Venue/Submission1/Authors'], 'message': 'Accept', 'parentGroup': 'Venue/Authors' })
+        messages.append({ 'subject': 'Decision', 'recipients': ['Venue/Submission2/Authors'], 'message': 'Reject', 'parentGroup': 'Venue/Authors' })
+        messages.append({ 'subject': 'Decision', 'recipients': ['Venue/Submission3/Authors'], 'message': 'Reject', 'parentGroup': 'Missing/Authors' })
+        results = client.post_messages_bulk(messages, use_job=True)
+
+        ## The reminders are merged in one request and the parent group is fetched once
+        assert [result['error'] is None for result in results] == [True] * 5 + [False]
+        assert results[0]['response'] == results[2]['response']
+        assert api.requests['POST /messages/requests'] == 3
+        assert api.requests['GET /groups'] == 2
+        assert api.messages[0]['groups'] == ['~Reviewer0', '~Reviewer1', '~Reviewer2']
+        assert all(message['useJob'] for message in api.messages)
+        assert 'Missing/Authors' in results[5]['error']
+
+        ## The failures are raised together once all the messages are posted
+        with pytest.raises(openreview.OpenReviewException, match='Failed to post 1 of 2 messages:\nDecision to Venue/Submission3/Authors'):
+            client.post_messages_bulk([messages[0], messages[5]], raise_on_error=True)
+        assert api.requests['POST /messages/requests'] == 4
+
+    def test_queue_flushes_in_batches(self, api):
+        client = api.client()
+
+        with tools.MessageQueue(client, batch_size=2) as queue:
+            for index in range(3):
+                queue.add(f'Subject {index}', [f'~User{index}'], 'Message', replyTo='pc@venue.org')
+            assert len(api.messages) == 2 and len(queue) == 1
+        assert [message['subject'] for message in api.messages] == ['Subject 0', 'Subject 1', 'Subject 2']
+        assert len(queue.results) == 3 and queue.failures == []
+
+        with pytest.raises(RuntimeError):
+            with tools.MessageQueue(client) as queue:
+                queue.add('Missing parent', ['~User1'], 'Message', parentGroup='Missing/Authors')
+                raise RuntimeError('process failed')
+        assert queue.failures[0]['message']['subject'] == 'Missing parent'
+
+        with pytest.raises(openreview.OpenReviewException, match='Failed to post 1 of 2 messages'):
+            with tools.MessageQueue(client, batch_size=1) as queue:
+                queue.add('Missing parent', ['~User1'], 'Message', parentGroup='Missing/Authors')
+                queue.add('Sent', ['~User1'], 'Message')
+        assert api.messages[-1]['subject'] == 'Sent'
@@ -0,0 +1,56 @@
+import threading
+from types import SimpleNamespace
+
+from openreview import tools
+
+
+class FakeNotesEndpoint:
+
+    def __init__(self, ids):
+        self.docs = [SimpleNamespace(id=i) for i in sorted(ids)]
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_notes(self, sort=None, limit=None, offset=None, after=None, with_count=None, details=None):
+        with self.lock:
+            self.calls.append({ 'offset': offset, 'after': after, 'limit': limit })
+        assert sort == 'id'
+        docs = self.docs
+        if after is not None:
+            docs = [d for d in docs if d.id > after]
+        if offset is not None:
+            docs = docs[offset:]
+        batch = docs[:limit]
+        if with_count:
+            return batch, len(self.docs)
+        return batch
+
+
+class TestConcurrentCursorGet:
+
+    def test_returns_all_docs_in_id_order(self):
+        ids = [f'{i:06d}' for i in range(0, 10537, 1)]
+        endpoint = FakeNotesEndpoint(ids)
+
+        docs = tools.concurrent_cursor_get(endpoint.get_notes, details='replies', limit=100, max_workers=8)
+
+        assert [d.id for d in docs] == sorted(ids)
+        cursor_calls = [c for c in endpoint.calls if c['after'] is not None]
+        ## every page is fetched once, plus one last short page per partition
+        assert len(cursor_calls) <= len(ids) // 100 + 8
+
+    def test_single_page(self):
+        endpoint = FakeNotesEndpoint(['a', 'b', 'c'])
+
+        docs = tools.concurrent_cursor_get(endpoint.get_notes, limit=100)
+
+        assert [d.id for d in docs] == ['a', 'b', 'c']
+        assert len(endpoint.calls) == 1
+
+    def test_exact_multiple_of_limit(self):
+        ids = [f'id{i:04d}' for i in range(400)]
+        endpoint = FakeNotesEndpoint(ids)
+
+        docs = tools.concurrent_cursor_get(endpoint.get_notes, limit=100, max_workers=3)
+
+        assert [d.id for d in docs] == ids
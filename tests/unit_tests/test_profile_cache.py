@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, patch
+
+import openreview
+from openreview import tools
+
+
+def build_profile(index):
+    return openreview.Profile(
+        id=f'~User_{index}1',
+        content={
+            'names': [{ 'fullname': f'User {index}', 'username': f'~User_{index}1' }, { 'fullname': f'Alt {index}', 'username': f'~Alt_{index}1' }],
+            'emails': [f'user{index}@mail.com'],
+            'emailsConfirmed': [f'user{index}@mail.com']
+        }
+    )
+
+
+def build_client(profiles):
+    client = MagicMock()
+    profiles_by_key = {}
+    for profile in profiles:
+        for key in openreview.tools.ProfileCache.get_keys(profile):
+            profiles_by_key[key] = profile
+
+    def search_profiles(ids=None, confirmedEmails=None):
+        if ids:
+            return [openreview.Profile.from_json(profiles_by_key[i].to_json()) for i in ids if i in profiles_by_key]
+        return { e: openreview.Profile.from_json(profiles_by_key[e].to_json()) for e in confirmedEmails if e in profiles_by_key }
+
+    client.search_profiles.side_effect = search_profiles
+    return client
+
+
+class TestProfileCache:
+
+    def test_lookup_by_alias_and_email(self):
+        cache = tools.ProfileCache()
+        cache.put(build_profile(1))
+
+        by_alias = cache.get('~Alt_11')
+        by_email = cache.get('User1@mail.com')
+
+        assert by_alias.id == '~User_11'
+        assert by_email.id == '~User_11'
+        assert by_alias is not by_email
+        assert cache.stats() == { 'hits': 2, 'misses': 0, 'size': 1 }
+
+    def test_returned_profiles_are_copies(self):
+        cache = tools.ProfileCache()
+        cache.put(build_profile(1))
+
+        cache.get('~User_11').content['publications'] = ['note']
+
+        assert 'publications' not in cache.get('~User_11').content
+
+    def test_lru_eviction_and_ttl(self):
+        cache = tools.ProfileCache(maxsize=2, ttl=60)
+        for index in range(3):
+            cache.put(build_profile(index))
+
+        assert cache.get('~User_01') is None
+        assert cache.get('~User_21') is not None
+
+        with patch('openreview.cache.time.time', return_value=10 ** 12):
+            assert cache.get('~User_21') is None
+
+    def test_sqlite_backend(self, tmp_path):
+        path = str(tmp_path / 'profiles.db')
+        cache = tools.SQLiteProfileCache(path, maxsize=2)
+        for index in range(3):
+            cache.put(build_profile(index))
+        cache.close()
+
+        cache = tools.SQLiteProfileCache(path, maxsize=2)
+        assert cache.get('~User_01') is None
+        assert cache.get('user2@mail.com').id == '~User_21'
+        assert cache.stats()['size'] == 2
+        cache.close()
+
+
+class TestGetProfilesWithCache:
+
+    def test_only_misses_are_fetched(self):
+        profiles = [build_profile(index) for index in range(5)]
+        client = build_client(profiles)
+        cache = tools.ProfileCache()
+
+        first = tools.get_profiles(client, ['~User_01', '~User_11', 'user2@mail.com'], cache=cache)
+        assert sorted(p.id for p in first) == ['~User_01', '~User_11', '~User_21']
+        assert client.search_profiles.call_count == 2
+
+        client.search_profiles.reset_mock()
+        second = tools.get_profiles(client, ['~Alt_11', 'user2@mail.com', '~User_31', 'unknown@mail.com'], cache=cache, as_dict=True)
+
+        assert second['~Alt_11'].id == '~User_11'
+        assert second['user2@mail.com'].id == '~User_21'
+        assert second['~User_31'].id == '~User_31'
+        assert second['unknown@mail.com'].id == 'unknown@mail.com'
+        client.search_profiles.assert_any_call(ids=['~User_31'])
+        client.search_profiles.assert_any_call(confirmedEmails=['unknown@mail.com'])
+        assert cache.stats()['hits'] == 2
+
+    def test_process_wide_cache(self):
+        client = build_client([build_profile(1)])
+        tools.set_profile_cache(tools.ProfileCache())
+        try:
+            tools.get_profiles(client, ['~User_11'])
+            tools.get_profiles(client, ['~User_11'])
+            assert client.search_profiles.call_count == 1
+            assert tools.get_profile_cache().stats()['hits'] == 1
+        finally:
+            tools.set_profile_cache(None)
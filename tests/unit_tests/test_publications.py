@@ -0,0 +1,39 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from openreview import tools
+
+
+def build_api_client(prefix, calls):
+    client = MagicMock()
+    lock = threading.Lock()
+
+    def get_all_notes(content=None, select=None):
+        with lock:
+            calls.append((prefix, content['authorids'], select))
+        return [SimpleNamespace(id=f'{prefix}-{content["authorids"]}')]
+
+    client.get_all_notes.side_effect = get_all_notes
+    return client
+
+
+class TestGetPublications:
+
+    def test_publications_from_both_apis(self):
+        calls = []
+        client_v1 = build_api_client('v1', calls)
+        client_v2 = build_api_client('v2', calls)
+
+        publications = tools.get_publications(client_v1, client_v2, ['~A_1', '~B_1', '~A_1'], select=tools.CONFLICT_PUBLICATION_FIELDS, max_workers=4)
+
+        assert list(publications.keys()) == ['~A_1', '~B_1']
+        assert [p.id for p in publications['~A_1']] == ['v1-~A_1', 'v2-~A_1']
+        assert [p.id for p in publications['~B_1']] == ['v1-~B_1', 'v2-~B_1']
+        assert len(calls) == 4
+        assert all(select == tools.CONFLICT_PUBLICATION_FIELDS for _, _, select in calls)
+
+    def test_no_authors(self):
+        calls = []
+        assert tools.get_publications(build_api_client('v1', calls), build_api_client('v2', calls), []) == {}
+        assert calls == []
@@ -0,0 +1,85 @@
+import pytest
+
+import openreview
+from openreview import tools
+
+
+@pytest.fixture
+def build_client(mock_client, mock_response):
+    def build(cache):
+        state = { 'tmdate': 1, 'requests': [] }
+
+        def get(url, params=None, headers=None):
+            etag = f'W/"{state["tmdate"]}"'
+            state['requests'].append(headers.get('If-None-Match'))
+            if headers.get('If-None-Match') == etag:
+                return mock_response(status=304, headers={})
+            invitation = { 'id': params['id'], 'domain': 'Venue', 'tmdate': state['tmdate'] }
+            return mock_response({ 'invitations': [invitation] }, headers={ 'ETag': etag })
+
+        def post(url, json=None, headers=None):
+            state['tmdate'] += 1
+            return mock_response({ 'id': 'edit', 'invitation': { 'id': json['invitation']['id'] } }, headers={})
+
+        client = mock_client(get=get, post=post)
+        client.set_response_cache(cache)
+        return client, state
+    return build
+
+
+class TestResponseCache:
+
+    def test_conditional_get_and_invalidation(self, build_client):
+        cache = tools.ResponseCache()
+        client, state = build_client(cache)
+
+        first = client.get_invitation('Venue/-/Submission')
+        first.domain = 'Modified'
+        second = client.get_invitation('Venue/-/Submission')
+
+        assert second.domain == 'Venue'
+        assert state['requests'] == [None, 'W/"1"']
+        assert cache.stats()['revalidated'] == 1
+
+        client.post_invitation_edit(invitations='Venue/-/Edit', invitation=openreview.api.Invitation(id='Venue/-/Submission'))
+        assert cache.stats()['invalidated'] == 1
+
+        third = client.get_invitation('Venue/-/Submission')
+        assert third.tmdate == 2
+        assert state['requests'][-1] is None
+        assert cache.stats() == { 'hits': 0, 'revalidated': 1, 'misses': 2, 'invalidated': 1, 'size': 1, 'hit_rate': 1 / 3 }
+
+    def test_max_age_serves_without_requests(self, build_client):
+        cache = tools.ResponseCache(max_age=60)
+        client, state = build_client(cache)
+
+        for _ in range(3):
+            assert client.get_invitation('Venue/-/Submission').tmdate == 1
+
+        assert len(state['requests']) == 1
+        assert cache.stats()['hits'] == 2
+
+    def test_stale_responses_are_not_stored(self):
+        cache = tools.ResponseCache()
+        key = ('invitations', 'Venue/-/Submission', None, None)
+        _, _, generation = cache.lookup(key)
+        cache.invalidate(['Venue/-/Submission'])
+        cache.store(key, b'{}', tmdate=1, generation=generation)
+        assert cache.lookup(key)[0] is None
+
+        _, _, generation = cache.lookup(key)
+        cache.store(key, b'{"new": true}', tmdate=2, generation=generation)
+        cache.store(key, b'{"old": true}', tmdate=1, generation=generation)
+        assert cache.lookup(key)[0]['body'] == b'{"new": true}'
+
+    def test_generations_are_bounded(self):
+        cache = tools.ResponseCache(maxsize=2)
+        key = ('invitations', 'Venue/-/Submission', None, None)
+        _, _, generation = cache.lookup(key)
+        cache.invalidate(['Venue/-/Submission'])
+        cache.invalidate([f'Venue/-/Invitation{index}' for index in range(5)])
+        assert len(cache._generations) == 2
+
+        ## The generation of the dropped invalidation is still newer than the one of the request in flight
+        cache.store(key, b'{}', tmdate=1, generation=generation)
+        assert cache.lookup(key)[0] is None
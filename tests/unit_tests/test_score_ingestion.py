@@ -0,0 +1,103 @@
+import gzip
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import openreview
+from openreview import tools
+from openreview.venue.matching import Matching
+
+
+def build_matching(posted_batches):
+    venue = MagicMock()
+    venue.id = 'Venue'
+    venue.venue_id = 'Venue'
+    venue.client.post_edges.side_effect = lambda edges: posted_batches.append(edges) or edges
+    venue.client.get_edges_count.side_effect = lambda **kwargs: sum(len(batch) for batch in posted_batches)
+    matching = Matching.__new__(Matching)
+    matching.venue = venue
+    matching.client = venue.client
+    matching.alternate_matching_group = None
+    invitation = SimpleNamespace(id='Venue/Reviewers/-/Affinity_Score', edit={ 'readers': ['Venue', '${2/tail}'] })
+    matching._create_edge_invitation = MagicMock(return_value=invitation)
+    return matching
+
+
+class TestIterCsvRows:
+
+    def test_plain_gzip_and_bytes(self, tmp_path):
+        content = b'paper1,~User_11,0.5\n\npaper2,"~User_21",0.25\n'
+        expected = [['paper1', '~User_11', '0.5'], ['paper2', '~User_21', '0.25']]
+
+        plain = tmp_path / 'scores.csv'
+        plain.write_bytes(content)
+        compressed = tmp_path / 'scores.csv.gz'
+        compressed.write_bytes(gzip.compress(content))
+
+        assert list(tools.iter_csv_rows(str(plain))) == expected
+        assert list(tools.iter_csv_rows(str(plain), use_mmap=False)) == expected
+        assert list(tools.iter_csv_rows(str(compressed))) == expected
+        assert list(tools.iter_csv_rows(content)) == expected
+        assert list(tools.iter_csv_rows(gzip.compress(content))) == expected
+        assert [line for line, row in tools.iter_csv_rows(str(compressed), line_numbers=True)] == [1, 3]
+
+
+class TestStreamingScores:
+
+    def test_scores_are_posted_in_batches(self, tmp_path, monkeypatch):
+        rows = ''.join(f'paper{i % 10},~User_{i}1,{i / 1000}\n' for i in range(2500))
+        score_file = tmp_path / 'scores.csv.gz'
+        score_file.write_bytes(gzip.compress(rows.encode()))
+        submissions = [SimpleNamespace(id=f'paper{i}', number=i + 1) for i in range(9)]
+
+        posted_batches = []
+        matching = build_matching(posted_batches)
+        post_bulk_edges = tools.post_bulk_edges
+        monkeypatch.setattr(tools, 'post_bulk_edges', lambda client, edges, return_edges=True, checkpoint=None: post_bulk_edges(client, edges, batch_size=1000, return_edges=return_edges, checkpoint=checkpoint))
+        matching._build_scores_from_file('Venue/Reviewers/-/Affinity_Score', str(score_file), submissions)
+
+        ## paper9 is not a submission
+        assert [len(batch) for batch in posted_batches] == [1000, 1000, 250]
+        edge = posted_batches[0][1]
+        assert (edge.head, edge.tail, edge.weight, edge.readers) == ('paper1', '~User_11', 0.001, ['Venue', '~User_11'])
+        matching.client.delete_edges.assert_called_once_with('Venue/Reviewers/-/Affinity_Score', wait_to_finish=True)
+
+    def test_invalid_score(self, tmp_path):
+        matching = build_matching([])
+        with pytest.raises(openreview.OpenReviewException, match='Invalid score in line 2'):
+            matching._build_scores_from_stream('Venue/Reviewers/-/Affinity_Score', b'paper0,~User_11,0.5\npaper0,~User_21,high\n', [SimpleNamespace(id='paper0', number=1)])
+
+        ## The whole file is validated before the previous scores are deleted, blank lines count in the line number
+        score_file = tmp_path / 'scores.csv'
+        score_file.write_bytes(b'paper0,~User_11,0.5\n\n\npaper0,~User_21,0.7\npaper0,~User_31\n')
+        with pytest.raises(openreview.OpenReviewException, match='Invalid score in line 5'):
+            matching._build_scores_from_file('Venue/Reviewers/-/Affinity_Score', str(score_file), [SimpleNamespace(id='paper0', number=1)])
+        matching.client.delete_edges.assert_not_called()
+        matching.client.post_edges.assert_not_called()
+
+    def test_resume_from_checkpoint(self, tmp_path, monkeypatch):
+        score_file = tmp_path / 'scores.csv'
+        score_file.write_text(''.join(f'paper0,~User_{i}1,0.5\n' for i in range(250)))
+        checkpoint = str(tmp_path / 'scores.checkpoint')
+        submissions = [SimpleNamespace(id='paper0', number=1)]
+
+        posted_batches = []
+        matching = build_matching(posted_batches)
+        post_edges = matching.client.post_edges.side_effect
+        def fail_third_batch(edges):
+            if len(posted_batches) == 2 and not getattr(fail_third_batch, 'failed', False):
+                fail_third_batch.failed = True
+                raise openreview.OpenReviewException({ 'name': 'Error', 'status': 500 })
+            return post_edges(edges)
+        matching.client.post_edges.side_effect = fail_third_batch
+        post_bulk_edges = tools.post_bulk_edges
+        monkeypatch.setattr(tools, 'post_bulk_edges', lambda client, edges, return_edges=True, checkpoint=None: post_bulk_edges(client, edges, batch_size=100, max_in_flight=1, return_edges=return_edges, checkpoint=checkpoint))
+
+        with pytest.raises(openreview.OpenReviewException):
+            matching._build_scores_from_file('Venue/Reviewers/-/Affinity_Score', str(score_file), submissions, checkpoint=checkpoint)
+        matching._build_scores_from_file('Venue/Reviewers/-/Affinity_Score', str(score_file), submissions, checkpoint=checkpoint)
+
+        ## The second call does not delete the posted scores and only posts the last batch
+        matching.client.delete_edges.assert_called_once()
+        assert [len(batch) for batch in posted_batches] == [100, 100, 50]
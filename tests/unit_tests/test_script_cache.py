@@ -0,0 +1,94 @@
+import datetime
+import linecache
+import traceback
+from unittest.mock import MagicMock
+
+import pytest
+
+import openreview
+from openreview import tools
+from openreview.api import Invitation
+
+
+SCRIPT = '''def process(client, edit, invitation):
+    client.post_note_edit(invitation=invitation.id, edit=edit)
+    return 'done'
+'''
+
+FAILING_SCRIPT = '''def process(client, edit, invitation):
+    raise ValueError('broken script')
+'''
+
+
+@pytest.fixture
+def cache():
+    previous = tools.get_script_cache()
+    cache = tools.ScriptCache()
+    tools.set_script_cache(cache)
+    yield cache
+    tools.set_script_cache(previous)
+
+
+def meta_invitation(script, tmdate):
+    return Invitation(id='Venue/-/Edit', tmdate=tmdate, content={ 'review_process_script': { 'value': script } })
+
+
+class TestScriptCache:
+
+    def test_run_process_script_compiles_once(self, cache):
+        client = MagicMock(baseurl='http://localhost:3001')
+        client.get_invitation.return_value = meta_invitation(SCRIPT, 1)
+        invitation = Invitation(id='Venue/Submission1/-/Official_Review', invitations=['Venue/-/Edit'])
+
+        for _ in range(3):
+            assert tools.run_process_script(client, 'Venue/-/Edit', 'review_process_script', { 'openreview': openreview }, client, 'edit', invitation) == 'done'
+        assert client.post_note_edit.call_count == 3
+        assert client.get_invitation.call_count == 3
+        assert cache.stats() == { 'hits': 2, 'misses': 1, 'invitation_hits': 0, 'size': 1, 'hit_rate': 2 / 3 }
+
+        ## An updated script is compiled again, the same script posted again is not
+        client.get_invitation.return_value = meta_invitation(SCRIPT.replace('done', 'updated'), 2)
+        assert tools.run_process_script(client, 'Venue/-/Edit', 'review_process_script', {}, client, 'edit', invitation) == 'updated'
+        client.get_invitation.return_value = meta_invitation(SCRIPT, 3)
+        assert tools.run_process_script(client, 'Venue/-/Edit', 'review_process_script', {}, client, 'edit', invitation) == 'done'
+        assert cache.stats()['misses'] == 2
+
+    def test_max_age_and_tracebacks(self, cache):
+        cache.max_age = 60
+        client = MagicMock(baseurl='http://localhost:3001')
+        client.get_invitation.return_value = meta_invitation(FAILING_SCRIPT, 1)
+
+        for _ in range(2):
+            with pytest.raises(ValueError) as error:
+                tools.run_process_script(client, 'Venue/-/Edit', 'review_process_script', {}, client, 'edit', None)
+        assert client.get_invitation.call_count == 1
+        assert cache.stats()['invitation_hits'] == 1
+        assert "raise ValueError('broken script')" in ''.join(traceback.format_exception(error.value))
+
+        cache.clear()
+        assert cache.stats()['size'] == 0
+
+    def test_evicted_scripts_leave_linecache(self, cache):
+        cache.maxsize = 2
+        codes = [cache.compile(SCRIPT.replace('done', f'done {index}'), version=('Venue/-/Edit', index)) for index in range(3)]
+        assert [code.co_filename in linecache.cache for code in codes] == [False, True, True]
+
+        cache.clear()
+        assert not any(code.co_filename in linecache.cache for code in codes)
+
+    def test_generated_process_function(self, cache):
+        venue = MagicMock(venue_id='Venue')
+        venue.client.baseurl = 'http://localhost:3001'
+        venue.get_meta_invitation_id.return_value = 'Venue/-/Edit'
+        builder = openreview.venue.invitation.InvitationBuilder(venue)
+
+        client = MagicMock(baseurl='http://localhost:3001')
+        client.get_invitation.return_value = Invitation(id='Venue/-/Edit', tmdate=1, content={
+            'invitation_edit_script': { 'value': 'def process(client, invitation):\n    client.post_invitation_edit(invitation.id, date_index)\n' }
+        })
+        funcs = { 'openreview': openreview, 'datetime': datetime, 'date_index': 0 }
+        exec(builder.invitation_edit_process, funcs)
+        funcs['process'](client, Invitation(id='Venue/-/Review'))
+
+        client.get_invitation.assert_called_once_with('Venue/-/Edit')
+        client.post_invitation_edit.assert_called_once_with('Venue/-/Review', 0)
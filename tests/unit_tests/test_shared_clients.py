@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import openreview
+from openreview import tools
+
+
+class TestSharedClients:
+
+    def test_pool_sizing(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        adapter = client.session.get_adapter('http://localhost:3001')
+        assert adapter._pool_maxsize == tools.HTTP_POOL_MAXSIZE
+        assert adapter._pool_connections == tools.HTTP_POOL_CONNECTIONS
+
+        client = openreview.Client(baseurl='http://localhost:3000', pool_connections=2, pool_maxsize=64)
+        adapter = client.session.get_adapter('https://api.openreview.net')
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_connections == 2
+        assert adapter.max_retries.total == 8
+
+    def test_clients_are_reused_by_baseurl_and_token(self):
+        tools.clear_shared_clients()
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        try:
+            assert tools.get_shared_client(client, api_version=2) is client
+
+            client_v1 = tools.get_shared_client(client, api_version=1)
+            assert isinstance(client_v1, openreview.Client)
+            assert client_v1.baseurl == 'http://localhost:3000'
+            assert tools.get_shared_client(client, api_version=1) is client_v1
+            assert tools.get_shared_client(client_v1, api_version=2) is not client
+
+            client.token = 'other-token'
+            with patch.object(openreview.Client, 'get_profile'):
+                assert tools.get_shared_client(client, api_version=1) is not client_v1
+        finally:
+            tools.clear_shared_clients()
+
+    def test_registry_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(tools, 'SHARED_CLIENTS_MAXSIZE', 2)
+        clients = [openreview.api.OpenReviewClient(baseurl='http://localhost:3000', token=f'token-{index}') for index in range(3)]
+        try:
+            shared = [tools.get_shared_client(client) for client in clients]
+            assert list(tools._shared_clients) == [('http://localhost:3001', 'token-1'), ('http://localhost:3001', 'token-2')]
+            assert tools.get_shared_client(clients[2]) is shared[2]
+            assert tools.get_shared_client(clients[0]) is not shared[0]
+        finally:
+            tools.clear_shared_clients()
+
+    def test_register_shared_client(self):
+        client = openreview.api.OpenReviewClient(baseurl='http://localhost:3001', token='token')
+        client_v1 = openreview.Client(baseurl='http://localhost:3000', token='token')
+        try:
+            assert tools.register_shared_client(client_v1, api_version=1) is client_v1
+            assert tools.get_shared_client(client, api_version=1) is client_v1
+        finally:
+            tools.clear_shared_clients()
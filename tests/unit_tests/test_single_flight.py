@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+import openreview
+from openreview import tools
+
+
+@pytest.fixture
+def build_client(mock_client, mock_response):
+    def build(delay=0.2, status=200):
+        calls = []
+
+        def get(url, params=None, headers=None):
+            calls.append(params)
+            time.sleep(delay)
+            return mock_response({ 'groups': [{ 'id': params['id'], 'members': ['~User_11'] }], 'name': 'NotFoundError' }, status)
+
+        client = mock_client(get=get)
+        client.coalesce_requests = True
+        return client, calls
+    return build
+
+
+def run_threads(target, count=8):
+    results = [None] * count
+    errors = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as error:
+            errors[index] = error
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+class TestSingleFlight:
+
+    def test_concurrent_identical_gets_share_one_request(self, build_client):
+        client, calls = build_client()
+
+        groups, _ = run_threads(lambda: client.get_group('Venue'))
+
+        assert len(calls) == 1
+        assert all(group.id == 'Venue' for group in groups)
+        groups[0].members.append('~User_21')
+        assert all(group.members == ['~User_11'] for group in groups[1:])
+        assert client.single_flight.stats() == { 'calls': 8, 'coalesced': 7, 'in_flight': 0 }
+
+        client.get_group('Venue')
+        assert len(calls) == 2
+
+    def test_errors_are_shared_and_coalescing_is_opt_in(self, build_client):
+        client, calls = build_client(status=404)
+
+        _, errors = run_threads(lambda: client.get_group('Venue'))
+        assert len(calls) == 1
+        assert all(isinstance(error, openreview.OpenReviewException) for error in errors)
+
+        assert openreview.api.OpenReviewClient(baseurl='http://localhost:3001').coalesce_requests is False
+        client, calls = build_client()
+        client.coalesce_requests = False
+        run_threads(lambda: client.get_group('Venue'), count=3)
+        assert len(calls) == 3
+
+    def test_different_keys_are_not_coalesced(self):
+        single_flight = tools.SingleFlight()
+        results, _ = run_threads(lambda: single_flight.do((threading.get_ident(),), lambda: time.sleep(0.01) or 1), count=4)
+        assert results == [1, 1, 1, 1]
+        assert single_flight.stats()['coalesced'] == 0
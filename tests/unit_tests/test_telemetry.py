@@ -0,0 +1,105 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+import openreview
+from openreview import tools
+from openreview.telemetry import get_endpoint
+
+
+class Handler(BaseHTTPRequestHandler):
+    attempts = {}
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        Handler.attempts[path] = Handler.attempts.get(path, 0) + 1
+        if path == '/edges' and Handler.attempts[path] < 3:
+            self.send_response(429)
+            self.send_header('Retry-After', '2')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if path == '/groups':
+            body = json.dumps({ 'name': 'NotFoundError', 'message': 'Group Not Found' }).encode()
+            self.send_response(404)
+        else:
+            body = json.dumps({ 'edges': [{ 'id': 'e1', 'head': 'paper1', 'tail': '~User1', 'invitation': 'Venue/-/Bid' }], 'notes': [], 'count': 0 }).encode()
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def baseurl():
+    Handler.attempts = {}
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestRequestTelemetry:
+
+    def test_get_endpoint(self):
+        assert get_endpoint('https://api2.openreview.net/notes?invitation=Venue/-/Submission') == '/notes'
+        assert get_endpoint('/pdf/aBc123xYz?x=1') == '/pdf/:id'
+        assert get_endpoint('/groups/members/cache') == '/groups/members/cache'
+
+    def test_client_records_requests_and_retries(self, baseurl):
+        telemetry = tools.RequestTelemetry(buckets=(0.5, 10))
+        client = openreview.api.OpenReviewClient(baseurl=baseurl, telemetry=telemetry)
+
+        with patch('urllib3.util.retry.time.sleep') as sleep:
+            edges = client.get_edges(invitation='Venue/-/Bid')
+        assert [e.id for e in edges] == ['e1']
+        assert [c.args[0] for c in sleep.call_args_list] == [2, 2]
+        client.get_notes(invitation='Venue/-/Submission')
+        with pytest.raises(openreview.OpenReviewException, match='Group Not Found'):
+            client.get_groups(id='Venue/Missing')
+
+        snapshot = telemetry.snapshot()
+        edges_stats = snapshot['endpoints']['GET /edges']
+        assert edges_stats['requests'] == 1
+        assert edges_stats['retries'] == 2
+        assert edges_stats['rate_limited'] == 2
+        assert edges_stats['retry_after_seconds'] == 4
+        assert edges_stats['bytes'] > 0
+        assert edges_stats['latency_histogram']['+Inf'] == 1
+        assert snapshot['endpoints']['GET /groups']['statuses'] == { 404: 1 }
+        assert snapshot['totals']['requests'] == 3
+        assert snapshot['totals']['errors'] == 1
+
+        text = telemetry.to_prometheus()
+        assert 'openreview_client_requests_total{method="GET",endpoint="/groups",status="404"} 1' in text
+        assert 'openreview_client_retries_total{method="GET",endpoint="/edges"} 2' in text
+        assert 'openreview_client_request_duration_seconds_count{method="GET",endpoint="/notes"} 1' in text
+        assert 'openreview_client_request_duration_seconds_bucket{method="GET",endpoint="/notes",le="+Inf"} 1' in text
+
+        client.set_telemetry(None)
+        client.get_notes(invitation='Venue/-/Submission')
+        assert telemetry.snapshot()['endpoints']['GET /notes']['requests'] == 1
+
+    def test_enabled_with_environment_variable(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(openreview.telemetry, '_default_telemetry', None)
+        monkeypatch.delenv('OPENREVIEW_TELEMETRY', raising=False)
+        assert openreview.Client(baseurl='http://localhost:3000').get_telemetry() is None
+
+        monkeypatch.setenv('OPENREVIEW_TELEMETRY', '1')
+        client_v1 = openreview.Client(baseurl='http://localhost:3000')
+        client_v2 = openreview.api.OpenReviewClient(baseurl='http://localhost:3001')
+        assert client_v1.get_telemetry() is client_v2.get_telemetry() is tools.get_default_telemetry()
+
+        path = tmp_path / 'metrics.json'
+        client_v2.telemetry.record_request('POST', '/notes/edits', 200, 0.2, 10)
+        client_v2.telemetry.write(str(path))
+        assert json.loads(path.read_text())['endpoints']['POST /notes/edits']['bytes'] == 10